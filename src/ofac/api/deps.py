@@ -1,7 +1,16 @@
 """Dependency injection for FastAPI endpoints.
 
 This module provides dependency functions for accessing OFAC data
-and other shared resources in API endpoints.
+and other shared resources in API endpoints, including the shared
+screening result cache. Each request leases the published data from the
+versioned data holder, so a refresh never swaps data mid-request.
+
+The holder builds one EntityMatcher per published dataset, shared by
+every request, instead of a matcher per request. Matching itself runs on
+the shared MatchExecutor so it never blocks the event loop, and large
+batches are sharded across the worker processes of a BatchScreeningEngine.
+Asynchronous batch jobs run on the app's ScreeningJobRunner, which leases
+the same batch engine for each job.
 
 Usage:
     from ofac.api.deps import get_ofac_data, get_matcher
@@ -14,11 +23,20 @@ Usage:
         ...
 """
 
-from typing import TYPE_CHECKING
+import functools
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
 
-from fastapi import HTTPException, status
+from fastapi import Depends, HTTPException, status
 
+from ofac.core.batch import BatchEnginePool, BatchScreeningEngine
+from ofac.core.cache import MatchCache
+from ofac.core.executor import MatchExecutor
+from ofac.core.jobs import ScreeningJobRunner, ScreeningJobStore
 from ofac.core.matcher import EntityMatcher
+from ofac.data.holder import OFACDataHolder
 from ofac.data.loader import OFACData
 
 if TYPE_CHECKING:
@@ -26,20 +44,72 @@ if TYPE_CHECKING:
 else:
     from fastapi import Request
 
+# Serializes creating the app's batch engine pool
+_batch_engine_lock = threading.Lock()
+
+
+def create_data_holder(cache: MatchCache | None = None) -> OFACDataHolder:
+    """Create a data holder that builds a shared matcher per dataset.
+
+    Args:
+        cache: Result cache used by every matcher the holder builds.
+
+    Returns:
+        Empty OFACDataHolder.
+    """
+    return OFACDataHolder(
+        matcher_factory=lambda data: EntityMatcher(data, cache=cache).prepare()
+    )
+
+
+def get_data_holder(request: Request) -> OFACDataHolder:
+    """Get the versioned OFAC data holder from application state.
 
-def get_ofac_data(request: Request) -> OFACData:
-    """Get OFAC data from application state.
+    Data assigned directly to ``app.state.ofac_data`` (for example by tests
+    or applications embedding the API) is published if the holder has no
+    data yet.
 
     Args:
         request: FastAPI request object.
 
     Returns:
+        OFACDataHolder instance.
+    """
+    return _state_data_holder(request.app.state)
+
+
+def _state_data_holder(state: Any) -> OFACDataHolder:
+    """Get (or create) the data holder stored in application state."""
+    holder: OFACDataHolder | None = getattr(state, "data_holder", None)
+    if holder is None:
+        holder = create_data_holder(getattr(state, "match_cache", None))
+        state.data_holder = holder
+    ofac_data = getattr(state, "ofac_data", None)
+    if holder.current is None and ofac_data is not None:
+        with holder.building():
+            if holder.current is None:
+                holder.publish(ofac_data)
+    return holder
+
+
+def get_ofac_data(request: Request) -> Iterator[OFACData]:
+    """Lease the published OFAC data for the duration of a request.
+
+    A refresh that publishes new data while the request runs does not
+    affect it; the old data is released once its last request finishes.
+
+    Args:
+        request: FastAPI request object.
+
+    Yields:
         OFACData instance.
 
     Raises:
         HTTPException: If OFAC data is not loaded.
     """
-    if not hasattr(request.app.state, "ofac_data") or request.app.state.ofac_data is None:
+    holder = get_data_holder(request)
+    # Published data is only ever replaced, never withdrawn
+    if holder.current is None:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail={
@@ -47,25 +117,164 @@ def get_ofac_data(request: Request) -> OFACData:
                 "message": "OFAC data is not loaded. Please wait for startup to complete.",
             },
         )
-    ofac_data: OFACData = request.app.state.ofac_data
-    return ofac_data
+    with holder.lease() as ofac_data:
+        yield ofac_data
 
 
-def get_matcher(request: Request) -> EntityMatcher:
-    """Get EntityMatcher instance.
+def get_match_cache(request: Request) -> MatchCache | None:
+    """Get the shared screening result cache from application state.
 
     Args:
         request: FastAPI request object.
 
     Returns:
+        MatchCache instance, or None if caching is not configured.
+    """
+    return getattr(request.app.state, "match_cache", None)
+
+
+def get_match_executor(request: Request) -> MatchExecutor:
+    """Get the shared screening worker pool from application state.
+
+    Args:
+        request: FastAPI request object.
+
+    Returns:
+        MatchExecutor instance (created on first use if missing).
+    """
+    state = request.app.state
+    executor: MatchExecutor | None = getattr(state, "match_executor", None)
+    if executor is None:
+        executor = MatchExecutor()
+        state.match_executor = executor
+    return executor
+
+
+def get_client_id(request: Request) -> str:
+    """Identify the caller for per-client screening limits.
+
+    Args:
+        request: FastAPI request object.
+
+    Returns:
+        Client host address, or "unknown" if the server did not report one.
+    """
+    return request.client.host if request.client else "unknown"
+
+
+def get_matcher(request: Request) -> Iterator[EntityMatcher]:
+    """Lease the shared EntityMatcher of the published OFAC data.
+
+    The matcher is built once per dataset version when the data is
+    published and is safe to use from concurrent requests. Its data
+    (``matcher.data``) stays leased for the duration of the request.
+
+    Args:
+        request: FastAPI request object.
+
+    Yields:
         EntityMatcher instance.
 
     Raises:
         HTTPException: If OFAC data is not loaded.
     """
-    ofac_data = get_ofac_data(request)
-    return EntityMatcher(ofac_data)
+    holder = get_data_holder(request)
+    if holder.current is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "code": "OFAC_DATA_NOT_LOADED",
+                "message": "OFAC data is not loaded. Please wait for startup to complete.",
+            },
+        )
+    with holder.lease_matcher() as matcher:
+        yield matcher
+
+
+def get_batch_engine(
+    request: Request, matcher: EntityMatcher = Depends(get_matcher)
+) -> Iterator[BatchScreeningEngine]:
+    """Lease the batch screening engine of the leased matcher.
+
+    One engine, with its worker processes, is kept per dataset version.
+    A version's engine is shut down once it is no longer current and its
+    last lease (request or job) has ended.
+
+    Args:
+        request: FastAPI request object.
+        matcher: Shared EntityMatcher leased for this request.
+
+    Yields:
+        BatchScreeningEngine for the matcher.
+    """
+    with _state_batch_engines(request.app.state).lease(matcher) as engine:
+        yield engine
+
+
+def _state_batch_engines(state: Any) -> BatchEnginePool:
+    """Get the batch engine pool from application state."""
+    with _batch_engine_lock:
+        engines: BatchEnginePool | None = getattr(state, "batch_engines", None)
+        if engines is None:
+            holder = _state_data_holder(state)
+            engines = BatchEnginePool(lambda: holder.matcher)
+            state.batch_engines = engines
+        return engines
+
+
+@contextmanager
+def _lease_batch_engine(state: Any) -> Iterator[BatchScreeningEngine]:
+    """Lease the current matcher's batch engine outside of a request."""
+    with (
+        _state_data_holder(state).lease_matcher() as matcher,
+        _state_batch_engines(state).lease(matcher) as engine,
+    ):
+        yield engine
+
+
+def create_job_runner(state: Any) -> ScreeningJobRunner:
+    """Create the batch job runner for an application.
+
+    Each job leases the batch engine of the data published when it starts.
+
+    Args:
+        state: Application state (``app.state``).
+
+    Returns:
+        ScreeningJobRunner using the store at settings.job_store_path.
+    """
+    return ScreeningJobRunner(
+        ScreeningJobStore(), functools.partial(_lease_batch_engine, state)
+    )
+
+
+def get_job_runner(request: Request) -> ScreeningJobRunner:
+    """Get the batch job runner from application state.
+
+    Args:
+        request: FastAPI request object.
+
+    Returns:
+        ScreeningJobRunner instance (created on first use if missing).
+    """
+    state = request.app.state
+    runner: ScreeningJobRunner | None = getattr(state, "job_runner", None)
+    if runner is None:
+        runner = create_job_runner(state)
+        state.job_runner = runner
+    return runner
 
 
-__all__ = ["get_ofac_data", "get_matcher"]
+__all__ = [
+    "create_data_holder",
+    "create_job_runner",
+    "get_batch_engine",
+    "get_client_id",
+    "get_data_holder",
+    "get_job_runner",
+    "get_ofac_data",
+    "get_match_cache",
+    "get_match_executor",
+    "get_matcher",
+]
 
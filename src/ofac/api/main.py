@@ -3,6 +3,11 @@
 This module provides:
 - FastAPI app factory with lifespan events
 - OFAC data loading on startup
+- Shared screening result cache
+- Bounded worker pool running matching off the event loop
+- Worker processes for sharded batch screening (stopped on shutdown)
+- Batch job runner with SQLite-backed job state
+- Versioned data holder for refreshes without a serving gap
 - CORS middleware configuration
 - Router registration
 
@@ -19,7 +24,10 @@ from typing import AsyncGenerator
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from ofac.api.deps import create_data_holder, create_job_runner
+from ofac.core.cache import MatchCache
 from ofac.core.config import settings
+from ofac.core.executor import MatchExecutor
 from ofac.data.loader import OFACDataLoader
 
 # Global OFAC data loader instance
@@ -41,6 +49,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     _ofac_loader = OFACDataLoader()
     try:
         _ofac_loader.load()
+        app.state.data_holder.publish(_ofac_loader.data)
         app.state.ofac_data = _ofac_loader.data
         app.state.ofac_loader = _ofac_loader
     except Exception as e:
@@ -49,9 +58,21 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app.state.ofac_data = None
         app.state.ofac_loader = None
 
+    # Jobs left unfinished by a stopped server will never complete
+    try:
+        app.state.job_runner.store.fail_orphaned()
+    except Exception as e:
+        app.state.job_store_error = str(e)
+
     yield
 
     # Shutdown: Cleanup (if needed)
+    app.state.match_executor.shutdown(wait=False)
+    app.state.job_runner.shutdown(wait=False)
+    app.state.job_runner.store.close()
+    batch_engines = getattr(app.state, "batch_engines", None)
+    if batch_engines is not None:
+        batch_engines.shutdown()
     if _ofac_loader:
         _ofac_loader.clear_cache()
 
@@ -81,6 +102,18 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Screening result cache shared by all requests
+    app.state.match_cache = MatchCache()
+
+    # Versioned OFAC data and its shared matcher, swapped atomically on refresh
+    app.state.data_holder = create_data_holder(app.state.match_cache)
+
+    # Worker threads for matching, with bounded queueing (429/503 beyond it)
+    app.state.match_executor = MatchExecutor()
+
+    # Asynchronous batch jobs, state kept in SQLite (opened on first use)
+    app.state.job_runner = create_job_runner(app.state)
+
     # Register routers
     from ofac.api.routes import data, health, screening
 
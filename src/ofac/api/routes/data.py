@@ -3,17 +3,24 @@
 This module provides API endpoints for:
 - GET /data/status: Get OFAC data freshness status
 - POST /data/refresh: Trigger OFAC data update
+- GET /data/cache: Get screening result cache statistics
 
 Usage:
     from ofac.api.routes.data import router
     app.include_router(router)
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import asyncio
+from typing import Any
 
-from ofac.api.deps import get_matcher
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+
+from ofac.api.deps import get_data_holder, get_match_cache, get_matcher
+from ofac.core.config import settings
 from ofac.core.exceptions import OFACNotLoadedError
 from ofac.core.matcher import EntityMatcher
+from ofac.data.delta import OFACChangeSet
+from ofac.data.loader import OFACData
 from ofac.data.status import calculate_freshness
 from ofac.data.updater import OFACUpdater
 
@@ -61,17 +68,39 @@ async def get_data_status(
         ) from e
 
 
+@router.get("/cache")
+async def get_cache_stats(request: Request) -> dict[str, Any]:
+    """Get screening result cache statistics.
+
+    Returns:
+        Dictionary with:
+        - enabled: Whether results are cached
+        - size / max_size: Current and maximum number of cached entries
+        - ttl_seconds: Entry lifetime (0 means never expires)
+        - hits / misses / evictions: Counters since startup
+        - hit_rate: hits / (hits + misses)
+    """
+    cache = get_match_cache(request)
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": cache.enabled, **cache.stats()}
+
+
 @router.post("/refresh")
-async def refresh_data() -> dict:
+async def refresh_data(request: Request) -> dict:
     """Trigger OFAC data update.
 
-    Downloads and updates OFAC data from official sources.
+    Downloads and updates OFAC data from official sources and applies the
+    changed entities to the loaded data in a worker thread, then publishes
+    the new data with one reference swap. Requests in flight finish on the
+    previous data. The screening result cache is cleared if anything changed.
 
     Returns:
         Dictionary with:
         - version: New OFAC data version/date
         - last_updated: ISO timestamp of update
         - record_count: Total number of SDN entries
+        - changes: Counts of added, modified and removed entities
         - status: "success" or "error"
 
     Raises:
@@ -94,14 +123,31 @@ async def refresh_data() -> dict:
         # Trigger update
         data_path = loader.data_path
         updater = OFACUpdater(data_path=data_path)
+        holder = get_data_holder(request)
+
+        def download_and_publish() -> tuple[OFACData, OFACChangeSet]:
+            # Build the new dataset, then publish it with one reference swap;
+            # requests keep screening against the current data meanwhile
+            with holder.building():
+                updater.download_sdn_files()
+                if settings.consolidated_enabled:
+                    updater.download_consolidated_files()
+                # Apply only what changed since the loaded data
+                new_data, changes = loader.refresh()
+                if new_data is not holder.current:
+                    holder.publish(new_data)
+                return new_data, changes
+
         try:
-            updater.download_sdn_files()
-            # Reload data after successful update
-            loader.clear_cache()
-            loader.load()
+            new_data, changes = await asyncio.to_thread(download_and_publish)
+
+            # Drop results computed against the old list
+            request.app.state.ofac_data = new_data
+            cache = get_match_cache(request)
+            if cache is not None and not changes.is_empty:
+                cache.clear()
 
             # Get new version info
-            new_data = loader.data
             version_info = new_data.version
             freshness_status, age_days = calculate_freshness(version_info)
 
@@ -113,6 +159,7 @@ async def refresh_data() -> dict:
                 "age_days": age_days,
                 "freshness_status": freshness_status.value,
                 "record_count": version_info.sdn_count,
+                "changes": changes.summary(),
                 "status": "success",
             }
         except Exception as e:
@@ -1,49 +1,117 @@
-"""Screening endpoints for single and batch entity screening."""
+"""Screening endpoints for single and batch entity screening.
 
+Matching runs on the shared screening worker pool, never on the event
+loop. When the pool and its queue are full the endpoints answer 503, and
+a client with too many screenings pending gets 429; both carry a
+Retry-After header.
+
+Batch jobs (/screenings/jobs) return a job id right away and are screened
+in the background; clients poll the job for progress and page through its
+results.
+
+/screenings/batch/stream screens a file in chunks and streams each result
+(NDJSON lines or server-sent events) as soon as it is classified, followed
+by a summary record with the OK/REVIEW/NOK counts.
+"""
+
+import asyncio
+import json
 import time
+from collections.abc import AsyncIterator, Sequence
 from datetime import UTC, datetime
+from typing import Literal
 from uuid import uuid4
 
-import pandas as pd
-from fastapi import APIRouter, Depends, File, HTTPException, UploadFile, status
-
-from ofac.api.deps import get_matcher
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
+
+from ofac.api.deps import (
+    get_batch_engine,
+    get_client_id,
+    get_data_holder,
+    get_job_runner,
+    get_match_executor,
+    get_matcher,
+)
 from ofac.api.schemas import SingleScreeningRequest, SingleScreeningResponse
+from ofac.core.batch import BatchScreeningEngine, screen_entities
 from ofac.core.classifier import classify_with_gl_context
+from ofac.core.config import settings
 from ofac.core.exceptions import (
     ColumnMappingError,
     FileFormatError,
     FileParseError,
     FileTooLargeError,
+    FileValidationError,
+    ScreeningBusyError,
+    ScreeningRateLimitError,
 )
-from ofac.core.file_parser import detect_columns, parse_file
+from ofac.core.executor import MatchExecutor
+from ofac.core.file_parser import read_entity_inputs
+from ofac.core.jobs import ScreeningJobRunner
 from ofac.core.matcher import EntityMatcher
 from ofac.core.models import (
     BatchScreeningResponse,
+    BatchScreeningSummary,
     EntityInput,
     MatchStatus,
+    ScreeningJob,
+    ScreeningJobResults,
     ScreeningResult,
 )
 
 router = APIRouter(prefix="/screenings", tags=["Screening"])
 
+# Seconds clients are asked to wait after a 429/503
+_RETRY_AFTER_SECONDS = 1
+
+# Media types of the streamed batch formats
+_STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
+
+def _backpressure_error(
+    error: ScreeningBusyError | ScreeningRateLimitError,
+) -> HTTPException:
+    """Translate a rejected screening job into a 429/503 response."""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS
+        if isinstance(error, ScreeningRateLimitError)
+        else status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=error.to_dict(),
+        headers={"Retry-After": str(_RETRY_AFTER_SECONDS)},
+    )
+
 
 @router.post("/single", response_model=SingleScreeningResponse)
 async def screen_single_entity(
     request: SingleScreeningRequest,
     matcher: EntityMatcher = Depends(get_matcher),
+    executor: MatchExecutor = Depends(get_match_executor),
+    client_id: str = Depends(get_client_id),
 ) -> SingleScreeningResponse:
     """Screen a single entity against OFAC lists.
 
     Args:
         request: SingleScreeningRequest with entity details.
         matcher: EntityMatcher instance (injected).
+        executor: Screening worker pool (injected).
+        client_id: Caller identity for per-client limits (injected).
 
     Returns:
         SingleScreeningResponse with screening results and metadata.
 
     Raises:
-        HTTPException: If screening fails or OFAC data not available.
+        HTTPException: If screening fails or OFAC data not available, or
+            with 429/503 when the worker pool is saturated.
     """
     start_time = time.time()
 
@@ -51,11 +119,13 @@ async def screen_single_entity(
         # Convert request to EntityInput
         entity_input = request.to_entity_input()
 
-        # Perform matching
-        matches = matcher.match(
+        # Perform matching on the worker pool
+        matches = await executor.run(
+            matcher.match,
             entity_name=entity_input.entity_name,
             country=entity_input.country,
             max_results=10,
+            client=client_id,
         )
 
         # Classify result with GL context (OK/REVIEW/NOK)
@@ -93,6 +163,8 @@ async def screen_single_entity(
             },
         )
 
+    except (ScreeningBusyError, ScreeningRateLimitError) as e:
+        raise _backpressure_error(e) from e
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -103,22 +175,78 @@ async def screen_single_entity(
         ) from e
 
 
+def _screen_file(
+    engine: BatchScreeningEngine,
+    file_content: bytes,
+    filename: str,
+    screening_id: str,
+    start_time: float,
+) -> BatchScreeningResponse:
+    """Parse an uploaded file and screen every named row.
+
+    Runs in a screening worker thread; parsing and matching are CPU-bound.
+
+    Args:
+        engine: Batch engine screening with the leased matcher.
+        file_content: Raw bytes of the uploaded file.
+        filename: Name of the uploaded file (selects the parser).
+        screening_id: Identifier shared by every result of the batch.
+        start_time: time.time() when the request started.
+
+    Returns:
+        BatchScreeningResponse with results for all entities.
+    """
+    # Parse file into one entity input per named row
+    entity_inputs = read_entity_inputs(file_content, filename)
+
+    # Screen in-process, or in shards across worker processes when large
+    results = engine.screen(entity_inputs, screening_id, max_results=10)
+    ofac_version = engine.matcher.data.version.loaded_at or "unknown"
+
+    # Count by status
+    ok_count = sum(result.match_status == MatchStatus.OK for result in results)
+    review_count = sum(result.match_status == MatchStatus.REVIEW for result in results)
+    nok_count = sum(result.match_status == MatchStatus.NOK for result in results)
+
+    # Calculate duration
+    duration_ms = int((time.time() - start_time) * 1000)
+
+    return BatchScreeningResponse(
+        results=results,
+        total_screened=len(results),
+        ok_count=ok_count,
+        review_count=review_count,
+        nok_count=nok_count,
+        ofac_version=ofac_version,
+        processing_time_ms=duration_ms,
+    )
+
+
 @router.post("/batch", response_model=BatchScreeningResponse)
 async def screen_batch(
     file: UploadFile = File(...),
-    matcher: EntityMatcher = Depends(get_matcher),
+    engine: BatchScreeningEngine = Depends(get_batch_engine),
+    executor: MatchExecutor = Depends(get_match_executor),
+    client_id: str = Depends(get_client_id),
 ) -> BatchScreeningResponse:
     """Screen multiple entities from uploaded file.
 
+    Parsing and matching run on the screening worker pool, so a large
+    upload does not block other requests. Large batches are sharded across
+    worker processes by the batch engine.
+
     Args:
         file: Uploaded Excel or CSV file.
-        matcher: EntityMatcher instance (injected).
+        engine: Batch screening engine for the current data (injected).
+        executor: Screening worker pool (injected).
+        client_id: Caller identity for per-client limits (injected).
 
     Returns:
         BatchScreeningResponse with results for all entities.
 
     Raises:
-        HTTPException: If file processing or screening fails.
+        HTTPException: If file processing or screening fails, or with 429/503
+            when the worker pool is saturated.
     """
     start_time = time.time()
     screening_id = str(uuid4())
@@ -128,98 +256,20 @@ async def screen_batch(
         file_content = await file.read()
         filename = file.filename or "uploaded_file"
 
-        # Parse file
-        df = parse_file(file_content, filename)
-
-        # Detect columns
-        column_mapping = detect_columns(df)
-
-        # Process each row
-        results: list[ScreeningResult] = []
-        ok_count = 0
-        review_count = 0
-        nok_count = 0
-
-        for _, row in df.iterrows():
-            entity_name = str(row[column_mapping.entity_name_column]).strip()
-            if not entity_name or entity_name == "nan":
-                continue
-
-            # Extract optional fields
-            country = None
-            if column_mapping.country_column:
-                country_val = row.get(column_mapping.country_column)
-                if pd.notna(country_val):
-                    country = str(country_val).strip()
-
-            description = None
-            if column_mapping.description_column:
-                desc_val = row.get(column_mapping.description_column)
-                if pd.notna(desc_val):
-                    description = str(desc_val).strip()
-
-            # Create entity input
-            entity_input = EntityInput(
-                entity_name=entity_name,
-                country=country,
-                description=description,
-            )
-
-            # Perform matching
-            matches = matcher.match(
-                entity_name=entity_input.entity_name,
-                country=entity_input.country,
-                max_results=10,
-            )
-
-            # Classify result with GL context
-            highest_score = matches[0].match_score if matches else 0
-            match_status, is_humanitarian, gl_note = classify_with_gl_context(
-                highest_score=highest_score,
-                matches=matches,
-                entity_country=entity_input.country,
-                description=entity_input.description,
-            )
-
-            # Count by status
-            if match_status == MatchStatus.OK:
-                ok_count += 1
-            elif match_status == MatchStatus.REVIEW:
-                review_count += 1
-            elif match_status == MatchStatus.NOK:
-                nok_count += 1
-
-            # Create screening result
-            ofac_version = matcher.data.version.loaded_at or "unknown"
-            screening_result = ScreeningResult(
-                screening_id=screening_id,
-                entity_input=entity_input,
-                match_status=match_status,
-                matches=matches,
-                highest_score=highest_score,
-                ofac_version=ofac_version,
-                timestamp=datetime.now(UTC),
-                humanitarian_flag=is_humanitarian,
-                general_license_note=gl_note,
-            )
-            results.append(screening_result)
-
-        # Calculate duration
-        duration_ms = int((time.time() - start_time) * 1000)
-        ofac_version = matcher.data.version.loaded_at or "unknown"
-
-        return BatchScreeningResponse(
-            results=results,
-            total_screened=len(results),
-            ok_count=ok_count,
-            review_count=review_count,
-            nok_count=nok_count,
-            ofac_version=ofac_version,
-            processing_time_ms=duration_ms,
+        return await executor.run(
+            _screen_file,
+            engine,
+            file_content,
+            filename,
+            screening_id,
+            start_time,
+            client=client_id,
         )
 
     except HTTPException:
         raise
+    except (ScreeningBusyError, ScreeningRateLimitError) as e:
+        raise _backpressure_error(e) from e
     except ColumnMappingError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -266,4 +316,280 @@ async def screen_batch(
         ) from e
 
 
+def _stream_record(kind: str, payload: str, stream_format: str) -> str:
+    """Encode one streamed record as an NDJSON line or a server-sent event."""
+    if stream_format == "sse":
+        return f"event: {kind}\ndata: {payload}\n\n"
+    return f'{{"type":"{kind}","data":{payload}}}\n'
+
+
+async def _screen_chunk(
+    executor: MatchExecutor,
+    matcher: EntityMatcher,
+    entity_inputs: Sequence[EntityInput],
+    screening_id: str,
+    client_id: str,
+) -> list[ScreeningResult]:
+    """Screen one chunk of a stream, waiting while the worker pool is full.
+
+    The stream has already started, so a saturated pool can no longer be
+    reported with a status code; the chunk is retried instead.
+    """
+    while True:
+        try:
+            return await executor.run(
+                screen_entities,
+                matcher,
+                entity_inputs,
+                screening_id,
+                client=client_id,
+            )
+        except (ScreeningBusyError, ScreeningRateLimitError):
+            await asyncio.sleep(_RETRY_AFTER_SECONDS)
+
+
+async def _stream_results(
+    first_results: list[ScreeningResult],
+    entity_inputs: list[EntityInput],
+    matcher: EntityMatcher,
+    executor: MatchExecutor,
+    screening_id: str,
+    client_id: str,
+    stream_format: str,
+    start_time: float,
+) -> AsyncIterator[str]:
+    """Yield result records chunk by chunk, then the summary record."""
+    counts = dict.fromkeys(MatchStatus, 0)
+    results = first_results
+    position = len(first_results)
+    chunk_rows = settings.stream_chunk_rows
+    try:
+        while True:
+            for result in results:
+                counts[result.match_status] += 1
+                yield _stream_record("result", result.model_dump_json(), stream_format)
+            if position >= len(entity_inputs):
+                break
+            chunk = entity_inputs[position : position + chunk_rows]
+            position += len(chunk)
+            results = await _screen_chunk(
+                executor, matcher, chunk, screening_id, client_id
+            )
+    except Exception as e:
+        # Headers are sent; report the failure as the final record instead
+        error = {"code": "SCREENING_ERROR", "message": f"Batch screening failed: {e}"}
+        yield _stream_record("error", json.dumps(error), stream_format)
+        return
+
+    summary = BatchScreeningSummary(
+        screening_id=screening_id,
+        total_screened=len(entity_inputs),
+        ok_count=counts[MatchStatus.OK],
+        review_count=counts[MatchStatus.REVIEW],
+        nok_count=counts[MatchStatus.NOK],
+        ofac_version=matcher.data.version.loaded_at or "unknown",
+        processing_time_ms=int((time.time() - start_time) * 1000),
+    )
+    yield _stream_record("summary", summary.model_dump_json(), stream_format)
+
+
+@router.post("/batch/stream", response_class=StreamingResponse)
+async def screen_batch_stream(
+    file: UploadFile = File(...),
+    stream_format: Literal["ndjson", "sse"] = Query(
+        default="ndjson",
+        alias="format",
+        description="ndjson (one JSON record per line) or sse (server-sent events)",
+    ),
+    matcher: EntityMatcher = Depends(get_matcher),
+    executor: MatchExecutor = Depends(get_match_executor),
+    client_id: str = Depends(get_client_id),
+) -> StreamingResponse:
+    """Screen entities from an uploaded file, streaming results as they finish.
+
+    The file is screened in chunks of settings.stream_chunk_rows rows on the
+    screening worker pool. Each ScreeningResult is sent as a "result"
+    record as soon as its chunk is classified, in input order; a final
+    "summary" record carries the OK/REVIEW/NOK counts. A failure after the
+    stream started ends it with an "error" record. NDJSON records look like
+    ``{"type": "result", "data": {...}}``; SSE events use the record type
+    as the event name.
+
+    File errors and a saturated pool are detected before streaming starts
+    and answered with the same status codes as POST /screenings/batch.
+
+    Args:
+        file: Uploaded Excel or CSV file.
+        stream_format: "ndjson" or "sse" (query parameter ``format``).
+        matcher: EntityMatcher instance, leased until the stream ends (injected).
+        executor: Screening worker pool (injected).
+        client_id: Caller identity for per-client limits (injected).
+
+    Returns:
+        StreamingResponse of result records followed by a summary record.
+
+    Raises:
+        HTTPException: 400/413 if the file is invalid, 429/503 when the
+            worker pool is saturated, or 500 if screening fails.
+    """
+    start_time = time.time()
+    screening_id = str(uuid4())
+
+    try:
+        file_content = await file.read()
+        entity_inputs = await executor.run(
+            read_entity_inputs,
+            file_content,
+            file.filename or "uploaded_file",
+            client=client_id,
+        )
+        # Screen the first chunk up front so admission errors keep their status
+        first_results = await executor.run(
+            screen_entities,
+            matcher,
+            entity_inputs[: settings.stream_chunk_rows],
+            screening_id,
+            client=client_id,
+        )
+    except (ScreeningBusyError, ScreeningRateLimitError) as e:
+        raise _backpressure_error(e) from e
+    except FileValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE
+            if isinstance(e, FileTooLargeError)
+            else status.HTTP_400_BAD_REQUEST,
+            detail={
+                "code": e.code,
+                "message": str(e),
+                "details": e.details,
+            },
+        ) from e
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "code": "SCREENING_ERROR",
+                "message": f"Batch screening failed: {str(e)}",
+            },
+        ) from e
+
+    return StreamingResponse(
+        _stream_results(
+            first_results,
+            entity_inputs,
+            matcher,
+            executor,
+            screening_id,
+            client_id,
+            stream_format,
+            start_time,
+        ),
+        media_type=_STREAM_MEDIA_TYPES[stream_format],
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+def _job_not_found(job_id: str) -> HTTPException:
+    """Build the 404 response for an unknown job id."""
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail={
+            "code": "JOB_NOT_FOUND",
+            "message": f"Screening job {job_id} not found",
+        },
+    )
+
+
+@router.post("/jobs", response_model=ScreeningJob, status_code=status.HTTP_202_ACCEPTED)
+async def submit_screening_job(
+    request: Request,
+    file: UploadFile = File(...),
+    runner: ScreeningJobRunner = Depends(get_job_runner),
+) -> ScreeningJob:
+    """Queue an uploaded file for background batch screening.
+
+    Returns immediately; poll GET /screenings/jobs/{job_id} for progress and
+    fetch results from GET /screenings/jobs/{job_id}/results. File errors
+    (format, size, columns) are reported as a FAILED job.
+
+    Args:
+        request: FastAPI request object.
+        file: Uploaded Excel or CSV file.
+        runner: Batch job runner (injected).
+
+    Returns:
+        The queued ScreeningJob.
+
+    Raises:
+        HTTPException: 503 if OFAC data is not loaded or too many jobs are
+            in progress.
+    """
+    if get_data_holder(request).current is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail={
+                "code": "OFAC_DATA_NOT_LOADED",
+                "message": "OFAC data is not loaded. Please wait for startup to complete.",
+            },
+        )
+
+    file_content = await file.read()
+    try:
+        return runner.submit(file_content, file.filename or "uploaded_file")
+    except ScreeningBusyError as e:
+        raise _backpressure_error(e) from e
+
+
+@router.get("/jobs/{job_id}", response_model=ScreeningJob)
+async def get_screening_job(
+    job_id: str,
+    runner: ScreeningJobRunner = Depends(get_job_runner),
+) -> ScreeningJob:
+    """Get a batch job's status, progress (rows done / total) and ETA.
+
+    Args:
+        job_id: Job identifier returned on submission.
+        runner: Batch job runner (injected).
+
+    Returns:
+        ScreeningJob with current progress.
+
+    Raises:
+        HTTPException: 404 if the job does not exist (or was purged).
+    """
+    job = runner.store.get(job_id)
+    if job is None:
+        raise _job_not_found(job_id)
+    return job
+
+
+@router.get("/jobs/{job_id}/results", response_model=ScreeningJobResults)
+async def get_screening_job_results(
+    job_id: str,
+    offset: int = Query(default=0, ge=0, description="First result position"),
+    limit: int = Query(default=100, ge=1, le=1000, description="Page size"),
+    runner: ScreeningJobRunner = Depends(get_job_runner),
+) -> ScreeningJobResults:
+    """Get one page of a batch job's results, in input order.
+
+    Results screened so far are available while the job is running.
+
+    Args:
+        job_id: Job identifier returned on submission.
+        offset: Position of the first result.
+        limit: Maximum results in the page (1-1000).
+        runner: Batch job runner (injected).
+
+    Returns:
+        ScreeningJobResults page with the offset of the next page.
+
+    Raises:
+        HTTPException: 404 if the job does not exist (or was purged).
+    """
+    page = runner.store.results(job_id, offset=offset, limit=limit)
+    if page is None:
+        raise _job_not_found(job_id)
+    return page
+
+
 __all__ = ["router"]
@@ -5,10 +5,21 @@ This module contains:
 - models: Pydantic data models
 - exceptions: Custom exception hierarchy
 - matcher: Fuzzy matching engine
+- normalize: Name normalization pipeline
+- scoring: Weighted scorer ensemble
+- idf: IDF-weighted token scoring
+- buckets: Length-bucketed corpus partitions for score bound pruning
 - classifier: OK/REVIEW/NOK classification
 - reporter: Report generation
+
+EntityMatcher is imported on first access: the matcher imports ofac.data,
+whose modules import ofac.core submodules, so an eager import would make
+the two packages depend on which one is imported first.
 """
 
+from typing import TYPE_CHECKING, Any
+
+from ofac.core.buckets import LengthBuckets
 from ofac.core.classifier import ScreeningClassifier, classify_screening_result
 from ofac.core.config import Settings, settings
 from ofac.core.countries import (
@@ -17,6 +28,7 @@ from ofac.core.countries import (
     get_countries_with_gl,
     get_general_license,
     is_sanctioned_country,
+    normalize_country_code,
 )
 from ofac.core.exceptions import (
     BatchTooLargeError,
@@ -35,21 +47,42 @@ from ofac.core.exceptions import (
     OFACNotLoadedError,
     OFACParseError,
     OFACStaleDataError,
+    ScreeningBusyError,
     ScreeningError,
     ScreeningInputError,
+    ScreeningRateLimitError,
     ScreeningTimeoutError,
 )
-from ofac.core.matcher import EntityMatcher
+from ofac.core.idf import IdfScorer, TokenStatistics
 from ofac.core.models import (
     BatchScreeningRequest,
     BatchScreeningResponse,
+    BatchScreeningSummary,
     EntityInput,
+    JobStatus,
     MatchResult,
     MatchStatus,
     MatchType,
     OFACList,
+    ScreeningJob,
+    ScreeningJobResults,
     ScreeningResult,
 )
+from ofac.core.normalize import NamePipeline
+from ofac.core.scoring import EnsembleScorer
+
+if TYPE_CHECKING:
+    from ofac.core.matcher import EntityMatcher
+
+
+def __getattr__(name: str) -> Any:
+    """Import EntityMatcher on first access (see the module docstring)."""
+    if name == "EntityMatcher":
+        from ofac.core.matcher import EntityMatcher
+
+        return EntityMatcher
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # Config
@@ -68,9 +101,15 @@ __all__ = [
     "get_general_license",
     "get_all_sanctioned_countries",
     "get_countries_with_gl",
+    "normalize_country_code",
     "GeneralLicense",
     # Matcher
     "EntityMatcher",
+    "NamePipeline",
+    "EnsembleScorer",
+    "IdfScorer",
+    "TokenStatistics",
+    "LengthBuckets",
     # Models
     "MatchStatus",
     "MatchType",
@@ -80,6 +119,10 @@ __all__ = [
     "ScreeningResult",
     "BatchScreeningRequest",
     "BatchScreeningResponse",
+    "BatchScreeningSummary",
+    "JobStatus",
+    "ScreeningJob",
+    "ScreeningJobResults",
     # Exceptions
     "OFACError",
     "FileValidationError",
@@ -98,6 +141,8 @@ __all__ = [
     "ScreeningInputError",
     "ScreeningTimeoutError",
     "BatchTooLargeError",
+    "ScreeningBusyError",
+    "ScreeningRateLimitError",
     "ConfigurationError",
     "InvalidThresholdError",
 ]
@@ -0,0 +1,367 @@
+"""Sharded batch screening across worker processes.
+
+This module provides batch screening helpers for:
+- Screening entity inputs into classified ScreeningResult objects
+- Splitting large batches into shards screened by a process pool
+- Worker processes initialized once with the shared matching data
+- Merging shard results back in input order
+- Yielding results shard by shard for progress reporting (iter_screen)
+- One engine per dataset version, shut down after its last lease
+  (BatchEnginePool)
+
+Fuzzy scoring runs outside the GIL, but building result models,
+classification and country logic are Python work capped at one core per
+process. Batches larger than settings.batch_shard_size rows are split
+into shards and screened by settings.batch_workers processes; smaller
+batches are screened in-process. Workers receive the entity table and
+name corpus once, when they start; a corpus read from a snapshot is sent
+by file reference, so workers map the same name and id arrays instead of
+copying them (each worker still decodes the names and builds its own
+matcher state).
+
+Usage:
+    from ofac.core.batch import BatchScreeningEngine
+
+    engine = BatchScreeningEngine(matcher)
+    results = engine.screen(entity_inputs, screening_id)
+    engine.shutdown()
+"""
+
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from itertools import chain, repeat
+from typing import TYPE_CHECKING
+
+from ofac.core.classifier import classify_with_gl_context
+from ofac.core.config import settings
+from ofac.core.matcher import EntityMatcher, MatcherEngine, MatchScorer
+from ofac.core.models import EntityInput, ScreeningResult
+
+if TYPE_CHECKING:
+    from ofac.data.loader import OFACData
+
+# Matcher of a worker process, built once by _init_worker
+_worker_matcher: EntityMatcher | None = None
+
+
+def screen_entities(
+    matcher: EntityMatcher,
+    entity_inputs: Sequence[EntityInput],
+    screening_id: str,
+    max_results: int = 10,
+) -> list[ScreeningResult]:
+    """Match and classify entity inputs.
+
+    Args:
+        matcher: EntityMatcher to screen with.
+        entity_inputs: Entities to screen.
+        screening_id: Identifier shared by every result of the batch.
+        max_results: Maximum matches kept per entity.
+
+    Returns:
+        One ScreeningResult per input, in input order.
+    """
+    # Score the whole column against the OFAC corpus in one pass
+    all_matches = matcher.match_many(
+        [entity_input.entity_name for entity_input in entity_inputs],
+        [entity_input.country for entity_input in entity_inputs],
+        max_results=max_results,
+    )
+    ofac_version = matcher.data.version.loaded_at or "unknown"
+
+    results: list[ScreeningResult] = []
+    for entity_input, matches in zip(entity_inputs, all_matches, strict=True):
+        # Classify result with GL context
+        highest_score = matches[0].match_score if matches else 0
+        match_status, is_humanitarian, gl_note = classify_with_gl_context(
+            highest_score=highest_score,
+            matches=matches,
+            entity_country=entity_input.country,
+            description=entity_input.description,
+        )
+        results.append(
+            ScreeningResult(
+                screening_id=screening_id,
+                entity_input=entity_input,
+                match_status=match_status,
+                matches=matches,
+                highest_score=highest_score,
+                ofac_version=ofac_version,
+                timestamp=datetime.now(UTC),
+                humanitarian_flag=is_humanitarian,
+                general_license_note=gl_note,
+            )
+        )
+    return results
+
+
+def _matching_data(matcher: EntityMatcher) -> "OFACData":
+    """Strip the raw frames a worker never reads from the matcher's data."""
+    data = matcher.data
+    consolidated = data.consolidated
+    if consolidated is not None:
+        consolidated = consolidated._replace(
+            prim_df=consolidated.prim_df.iloc[0:0],
+            alt_df=consolidated.alt_df.iloc[0:0],
+            add_df=consolidated.add_df.iloc[0:0],
+        )
+    return data._replace(
+        sdn_df=data.sdn_df.iloc[0:0],
+        alt_df=data.alt_df.iloc[0:0],
+        add_df=data.add_df.iloc[0:0],
+        entities=matcher.entities,
+        corpus=matcher.corpus,
+        consolidated=consolidated,
+    )
+
+
+def _init_worker(
+    data: "OFACData",
+    min_score: int,
+    engine: MatcherEngine,
+    normalization: tuple[str, ...],
+    scorer: MatchScorer,
+    stop_at_exact_nok: bool,
+) -> None:
+    """Build the worker's matcher once, when the process starts."""
+    global _worker_matcher
+    _worker_matcher = EntityMatcher(
+        data,
+        min_score=min_score,
+        engine=engine,
+        normalization=normalization,
+        scorer=scorer,
+        stop_at_exact_nok=stop_at_exact_nok,
+    ).prepare()
+
+
+def _screen_shard(
+    entity_inputs: Sequence[EntityInput], screening_id: str, max_results: int
+) -> list[ScreeningResult]:
+    """Screen one shard with the worker's matcher."""
+    if _worker_matcher is None:
+        raise RuntimeError("Batch worker was not initialized")
+    return screen_entities(_worker_matcher, entity_inputs, screening_id, max_results)
+
+
+class BatchScreeningEngine:
+    """Screens batches in shards across a pool of worker processes.
+
+    The pool is started on the first sharded batch and reused for every
+    later one, so workers load the matching data once per engine.
+
+    Attributes:
+        matcher: EntityMatcher whose data the workers screen against
+        workers: Number of worker processes
+        shard_size: Rows per shard
+    """
+
+    def __init__(
+        self,
+        matcher: EntityMatcher,
+        workers: int | None = None,
+        shard_size: int | None = None,
+    ) -> None:
+        """Initialize the engine without starting any process.
+
+        Args:
+            matcher: EntityMatcher to screen with.
+            workers: Worker processes. Defaults to settings.batch_workers;
+                0 means one per CPU core.
+            shard_size: Rows per shard. Defaults to settings.batch_shard_size.
+        """
+        self.matcher = matcher
+        workers = workers if workers is not None else settings.batch_workers
+        self.workers = workers or os.cpu_count() or 1
+        self.shard_size = (
+            shard_size if shard_size is not None else settings.batch_shard_size
+        )
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def screen(
+        self,
+        entity_inputs: Sequence[EntityInput],
+        screening_id: str,
+        max_results: int = 10,
+    ) -> list[ScreeningResult]:
+        """Screen a batch, sharding it across workers when it is large.
+
+        Args:
+            entity_inputs: Entities to screen.
+            screening_id: Identifier shared by every result of the batch.
+            max_results: Maximum matches kept per entity.
+
+        Returns:
+            One ScreeningResult per input, in input order.
+        """
+        return list(
+            chain.from_iterable(
+                results
+                for _, results in self.iter_screen(
+                    entity_inputs, screening_id, max_results
+                )
+            )
+        )
+
+    def iter_screen(
+        self,
+        entity_inputs: Sequence[EntityInput],
+        screening_id: str,
+        max_results: int = 10,
+        chunk_rows: int | None = None,
+    ) -> Iterator[tuple[int, list[ScreeningResult]]]:
+        """Screen a batch like screen(), yielding results part by part.
+
+        Large batches are sharded across the workers as in screen(), and
+        each shard's results are yielded as soon as it and every earlier
+        shard are done. Batches screened in-process are yielded every
+        chunk_rows rows.
+
+        Args:
+            entity_inputs: Entities to screen.
+            screening_id: Identifier shared by every result of the batch.
+            max_results: Maximum matches kept per entity.
+            chunk_rows: Rows per part when screening in-process. Defaults
+                to the whole batch.
+
+        Yields:
+            (offset, results) with the results of the inputs starting at
+            offset, in input order.
+        """
+        if self.workers <= 1 or len(entity_inputs) <= self.shard_size:
+            step = chunk_rows or max(len(entity_inputs), 1)
+            for offset in range(0, len(entity_inputs), step):
+                yield (
+                    offset,
+                    screen_entities(
+                        self.matcher,
+                        entity_inputs[offset : offset + step],
+                        screening_id,
+                        max_results,
+                    ),
+                )
+            return
+
+        offsets = range(0, len(entity_inputs), self.shard_size)
+        shards = [entity_inputs[start : start + self.shard_size] for start in offsets]
+        # map() yields shard results in submission order
+        shard_results = self._get_pool().map(
+            _screen_shard, shards, repeat(screening_id), repeat(max_results)
+        )
+        yield from zip(offsets, shard_results, strict=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes, if they were started.
+
+        Args:
+            wait: Whether to wait for submitted shards to finish.
+        """
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use."""
+        with self._lock:
+            if self._pool is None:
+                # Spawned workers: forking a threaded server is unsafe
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(
+                        _matching_data(self.matcher),
+                        self.matcher.min_score,
+                        self.matcher.engine,
+                        self.matcher.normalizer.steps,
+                        self.matcher.scorer,
+                        self.matcher.stop_at_exact_nok,
+                    ),
+                )
+            return self._pool
+
+
+class BatchEnginePool:
+    """Batch engines of each dataset version, with reference-counted leases.
+
+    The data holder builds one matcher per published dataset version, so
+    engines are keyed by matcher. Jobs and requests screening different
+    versions each use their own engine; an engine is shut down only once
+    its last lease has ended and its matcher is no longer current.
+
+    Attributes:
+        current_matcher: Returns the matcher of the published version
+    """
+
+    def __init__(self, current_matcher: Callable[[], EntityMatcher | None]) -> None:
+        """Initialize an empty pool.
+
+        Args:
+            current_matcher: Returns the matcher of the published version,
+                whose engine is kept for reuse when idle.
+        """
+        self.current_matcher = current_matcher
+        self._engines: dict[EntityMatcher, BatchScreeningEngine] = {}
+        self._leases: dict[EntityMatcher, int] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def lease(self, matcher: EntityMatcher) -> Iterator[BatchScreeningEngine]:
+        """Use the engine of a matcher until the block exits.
+
+        Args:
+            matcher: Leased matcher of the version to screen against.
+
+        Yields:
+            BatchScreeningEngine for the matcher, created on first use.
+        """
+        with self._lock:
+            engine = self._engines.get(matcher)
+            if engine is None:
+                engine = self._engines[matcher] = BatchScreeningEngine(matcher)
+            self._leases[matcher] = self._leases.get(matcher, 0) + 1
+            stale = self._pop_stale()
+        self._shutdown(stale)
+        try:
+            yield engine
+        finally:
+            with self._lock:
+                self._leases[matcher] -= 1
+                stale = self._pop_stale()
+            self._shutdown(stale)
+
+    def shutdown(self) -> None:
+        """Stop every engine, without waiting for submitted shards."""
+        with self._lock:
+            engines = list(self._engines.values())
+            self._engines.clear()
+            self._leases.clear()
+        self._shutdown(engines)
+
+    def _pop_stale(self) -> list[BatchScreeningEngine]:
+        """Remove idle engines of replaced versions (lock held)."""
+        current = self.current_matcher()
+        stale = [
+            matcher
+            for matcher, leases in self._leases.items()
+            if not leases and matcher is not current
+        ]
+        for matcher in stale:
+            del self._leases[matcher]
+        return [self._engines.pop(matcher) for matcher in stale]
+
+    @staticmethod
+    def _shutdown(engines: list[BatchScreeningEngine]) -> None:
+        """Stop engines outside the lock."""
+        for engine in engines:
+            engine.shutdown(wait=False)
+
+
+__all__ = ["BatchEnginePool", "BatchScreeningEngine", "screen_entities"]
@@ -0,0 +1,136 @@
+"""Length-bucketed corpus partitions for score upper-bound pruning.
+
+This module provides the LengthBuckets class for:
+- Grouping normalized corpus names by length, stored in length order
+- Bounding the best ratio score any name of a bucket can reach
+- Selecting the contiguous window of buckets that can reach a score
+
+RapidFuzz's ratio is a normalized Indel similarity,
+100 * (1 - distance / (len(a) + len(b))). The distance is at least the
+length difference, so no name of length b can score more than
+100 * 2 * min(a, b) / (a + b) against a query of length a. The bound
+peaks at b = a and falls on both sides, so the buckets able to reach a
+score always form one contiguous run of lengths: one slice of the names
+in length order.
+
+Usage:
+    from ofac.core.buckets import LengthBuckets
+
+    buckets = LengthBuckets.build(name_keys)
+    bounds = buckets.bounds(len(query_key))
+    start, stop = buckets.window(bounds, min_score=80)
+    names = buckets.names[start:stop]  # corpus positions: buckets.order[start:stop]
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+# Tolerance for float rounding between the bound and RapidFuzz's score
+_BOUND_EPSILON = 1e-9
+
+
+def ratio_upper_bound(query_length: int, name_lengths: np.ndarray) -> np.ndarray:
+    """Compute the best ratio score possible for each name length.
+
+    Args:
+        query_length: Length of the normalized query.
+        name_lengths: Lengths of normalized names.
+
+    Returns:
+        Float array of upper bounds on the 0-100 scale.
+    """
+    totals = query_length + name_lengths
+    shortest = np.minimum(query_length, name_lengths)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(totals > 0, 200.0 * shortest / np.maximum(totals, 1), 100.0)
+
+
+class LengthBuckets:
+    """Normalized corpus names partitioned by length.
+
+    Attributes:
+        lengths: Distinct name lengths, ascending (one per bucket)
+        starts: Offset of each bucket in order, plus the total count
+        order: Corpus positions sorted by name length (stable)
+        ranks: Index in order of each corpus position (inverse of order)
+        names: Normalized names in the same order as order
+    """
+
+    def __init__(self, names: Sequence[str]) -> None:
+        """Partition names by length.
+
+        Args:
+            names: Normalized corpus names.
+        """
+        name_lengths = np.fromiter(map(len, names), dtype=np.int32, count=len(names))
+        self.order = np.argsort(name_lengths, kind="stable")
+        self.ranks = np.empty_like(self.order)
+        self.ranks[self.order] = np.arange(len(self.order))
+        self.names = [names[pos] for pos in self.order.tolist()]
+        self.lengths, first = np.unique(name_lengths[self.order], return_index=True)
+        self.starts = np.append(first, len(names))
+
+    @classmethod
+    def build(cls, names: Sequence[str]) -> "LengthBuckets":
+        """Partition normalized corpus names by length.
+
+        Args:
+            names: Normalized corpus names.
+
+        Returns:
+            LengthBuckets for the names.
+        """
+        return cls(names)
+
+    def __len__(self) -> int:
+        """Return the number of buckets."""
+        return len(self.lengths)
+
+    def bounds(self, query_length: int) -> np.ndarray:
+        """Upper-bound the ratio score of every bucket for a query.
+
+        Args:
+            query_length: Length of the normalized query.
+
+        Returns:
+            Float bound per bucket, padded for float rounding so that no
+            name ever scores above its bucket's bound.
+        """
+        return ratio_upper_bound(query_length, self.lengths) + _BOUND_EPSILON
+
+    def window(self, bounds: np.ndarray, min_score: float) -> tuple[int, int]:
+        """Find the names whose bucket bound reaches a score.
+
+        Args:
+            bounds: Bucket bounds from bounds().
+            min_score: Score a name must be able to reach.
+
+        Returns:
+            (start, stop) slice of order and names; empty if none can.
+        """
+        kept = np.flatnonzero(bounds >= min_score)
+        if not kept.size:
+            return 0, 0
+        return int(self.starts[kept[0]]), int(self.starts[kept[-1] + 1])
+
+    def bound_for_size(self, bounds: np.ndarray, size: int) -> float:
+        """Find the highest score whose window still holds size names.
+
+        Args:
+            bounds: Bucket bounds from bounds().
+            size: Minimum number of names wanted in the window.
+
+        Returns:
+            Bound of the last bucket needed, best buckets first (0.0 if
+            the whole corpus is smaller than size).
+        """
+        ranked = np.argsort(-bounds, kind="stable")
+        counts = np.cumsum(np.diff(self.starts)[ranked])
+        needed = int(np.searchsorted(counts, size))
+        if needed >= len(ranked):
+            return 0.0
+        return float(bounds[ranked[needed]])
+
+
+__all__ = ["LengthBuckets", "ratio_upper_bound"]
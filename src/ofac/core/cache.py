@@ -0,0 +1,136 @@
+"""Screening result cache with LRU and TTL eviction.
+
+This module provides the MatchCache class for:
+- Reusing match results for organizations screened repeatedly
+- Bounded size with least-recently-used eviction
+- Optional time-to-live expiry
+- Hit/miss counters for monitoring
+
+Keys include the loaded dataset version, so results computed against an
+older OFAC list are never served after a refresh.
+
+Usage:
+    from ofac.core.cache import MatchCache
+
+    cache = MatchCache(max_size=1024, ttl_seconds=3600)
+    matcher = EntityMatcher(data, cache=cache)
+    print(cache.stats())
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+from ofac.core.config import settings
+from ofac.core.models import MatchResult
+
+
+class MatchCache:
+    """Thread-safe LRU/TTL cache of match results.
+
+    Attributes:
+        max_size: Maximum number of cached entries (0 disables caching)
+        ttl_seconds: Seconds before an entry expires (0 means never)
+        hits: Number of lookups served from the cache
+        misses: Number of lookups not found or expired
+        evictions: Number of entries dropped for size or age
+    """
+
+    def __init__(
+        self, max_size: int | None = None, ttl_seconds: int | None = None
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum entries. Defaults to settings.match_cache_size.
+            ttl_seconds: Entry lifetime. Defaults to settings.match_cache_ttl_seconds.
+        """
+        self.max_size = max_size if max_size is not None else settings.match_cache_size
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None else settings.match_cache_ttl_seconds
+        )
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[Hashable, tuple[float, list[MatchResult]]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache stores anything."""
+        return self.max_size > 0
+
+    def __len__(self) -> int:
+        """Return the number of cached entries."""
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> list[MatchResult] | None:
+        """Look up cached results and mark them recently used.
+
+        Args:
+            key: Cache key built by the matcher.
+
+        Returns:
+            Copy of the cached result list, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, results = entry
+            if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.evictions += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(results)
+
+    def put(self, key: Hashable, results: list[MatchResult]) -> None:
+        """Store results, evicting the least recently used entries if full.
+
+        Args:
+            key: Cache key built by the matcher.
+            results: Match results to cache.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), list(results))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all cached entries. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Get cache counters for monitoring.
+
+        Returns:
+            Dictionary with size, max_size, ttl_seconds, hits, misses,
+            evictions and hit_rate.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+__all__ = ["MatchCache"]
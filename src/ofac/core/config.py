@@ -20,6 +20,26 @@ from typing import Literal
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+NormalizationStepName = Literal[
+    "strip_diacritics",
+    "strip_punctuation",
+    "legal_suffixes",
+    "casefold",
+    "token_sort",
+]
+EnsembleScorerName = Literal["jaro_winkler", "ratio", "token_set", "partial", "wratio"]
+
+# Default normalization steps applied before scoring
+DEFAULT_NAME_NORMALIZATION: list[NormalizationStepName] = ["token_sort"]
+
+# Default weight of each scorer in the ensemble score
+DEFAULT_ENSEMBLE_WEIGHTS: dict[EnsembleScorerName, float] = {
+    "jaro_winkler": 0.2,
+    "ratio": 0.2,
+    "token_set": 0.4,
+    "partial": 0.2,
+}
+
 
 class Settings(BaseSettings):
     """Application settings with environment variable support.
@@ -50,6 +70,43 @@ class Settings(BaseSettings):
         le=50,
         description="Score boost when entity country matches OFAC entry country",
     )
+    matcher_engine: Literal["scan", "vectorized"] = Field(
+        default="vectorized",
+        description="Matching engine: per-row scan or batched scoring over the name corpus",
+    )
+    name_normalization: list[NormalizationStepName] = Field(
+        default_factory=DEFAULT_NAME_NORMALIZATION.copy,
+        description="Normalization steps applied to OFAC names (once per dataset) and queries before scoring",
+    )
+    match_scorer: Literal["ratio", "ensemble", "idf"] = Field(
+        default="ratio",
+        description="Scoring: plain ratio of normalized names, a weighted ensemble of scorers, or IDF-weighted tokens",
+    )
+    ensemble_weights: dict[EnsembleScorerName, float] = Field(
+        default_factory=DEFAULT_ENSEMBLE_WEIGHTS.copy,
+        description="Weight of each scorer in the ensemble score",
+    )
+    ensemble_max_candidates: int = Field(
+        default=20000,
+        ge=1,
+        description="Memory guard on names per query passed to each costly ensemble scorer (token_set, partial, wratio); a warning is logged when it truncates",
+    )
+    idf_token_cutoff: int = Field(
+        default=75,
+        ge=0,
+        le=100,
+        description="Token ratio (0-100) two tokens need to be aligned by the IDF scorer",
+    )
+    idf_stop_token_fraction: float = Field(
+        default=0.01,
+        gt=0,
+        le=1,
+        description="Tokens in at least this share of corpus names are stop tokens for the IDF scorer",
+    )
+    match_stop_at_exact_nok: bool = Field(
+        default=False,
+        description="Return only the exact name hits, skipping fuzzy scoring, when a query exactly matches a listed name (a certain NOK)",
+    )
     
     # OFAC data settings
     ofac_data_path: Path = Field(
@@ -65,6 +122,14 @@ class Settings(BaseSettings):
         ge=1,
         description="Hours between automatic update checks",
     )
+    snapshot_enabled: bool = Field(
+        default=True,
+        description="Reuse an Arrow snapshot of parsed OFAC data instead of re-parsing CSVs",
+    )
+    consolidated_enabled: bool = Field(
+        default=True,
+        description="Load and screen the Consolidated (non-SDN) list when its files are present",
+    )
     
     # Performance settings
     batch_size: int = Field(
@@ -79,6 +144,107 @@ class Settings(BaseSettings):
         le=100000,
         description="Maximum rows allowed in uploaded file",
     )
+    load_chunk_rows: int = Field(
+        default=50000,
+        ge=1,
+        description="Rows parsed per chunk when reading OFAC CSV files",
+    )
+    keep_raw_frames: bool = Field(
+        default=True,
+        description="Keep full OFAC DataFrames in memory (False keeps only matching columns)",
+    )
+
+    # Candidate index settings
+    candidate_index_enabled: bool = Field(
+        default=False,
+        description="Build a trigram candidate index to narrow fuzzy scoring",
+    )
+    candidate_max_count: int = Field(
+        default=500,
+        ge=1,
+        description="Maximum candidates fuzzy-scored per query when the index is used",
+    )
+    candidate_min_count: int = Field(
+        default=20,
+        ge=0,
+        description="Fall back to a full scan when fewer candidates share a trigram",
+    )
+    phonetic_index_enabled: bool = Field(
+        default=True,
+        description="Add exact phonetic-key hits to the trigram candidates of each query",
+    )
+
+    # Result cache settings
+    match_cache_size: int = Field(
+        default=4096,
+        ge=0,
+        description="Maximum cached screening results (0 disables the cache)",
+    )
+    match_cache_ttl_seconds: int = Field(
+        default=3600,
+        ge=0,
+        description="Seconds before a cached result expires (0 means never)",
+    )
+
+    # Screening worker pool settings
+    match_workers: int = Field(
+        default=4,
+        ge=1,
+        description="Worker threads running fuzzy matching off the event loop",
+    )
+    match_queue_depth: int = Field(
+        default=16,
+        ge=0,
+        description="Screenings allowed to wait for a worker before returning 503",
+    )
+    match_client_max_pending: int = Field(
+        default=4,
+        ge=0,
+        description="Screenings one client may have pending before 429 (0 means no limit)",
+    )
+
+    # Sharded batch screening settings
+    batch_workers: int = Field(
+        default=0,
+        ge=0,
+        description="Worker processes for sharded batch screening (0 uses every CPU core, 1 screens in-process)",
+    )
+    batch_shard_size: int = Field(
+        default=2000,
+        ge=1,
+        description="Rows per shard sent to a batch worker process",
+    )
+    stream_chunk_rows: int = Field(
+        default=100,
+        ge=1,
+        description="Rows screened per chunk of a streamed batch screening",
+    )
+
+    # Batch job settings
+    job_store_path: Path = Field(
+        default=Path("./data/jobs/jobs.db"),
+        description="SQLite database holding batch job state and results",
+    )
+    job_workers: int = Field(
+        default=2,
+        ge=1,
+        description="Batch jobs screened at the same time",
+    )
+    job_queue_depth: int = Field(
+        default=32,
+        ge=0,
+        description="Batch jobs allowed to wait for a job worker before returning 503",
+    )
+    job_chunk_rows: int = Field(
+        default=500,
+        ge=1,
+        description="Rows screened between progress updates of in-process jobs (sharded jobs update per shard)",
+    )
+    job_retention_hours: int = Field(
+        default=24,
+        ge=1,
+        description="Hours finished jobs and their results are kept",
+    )
     
     # Logging settings
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(
@@ -122,7 +288,7 @@ class Settings(BaseSettings):
         extra="ignore",
     )
     
-    @field_validator("ofac_data_path", "log_path", mode="before")
+    @field_validator("ofac_data_path", "log_path", "job_store_path", mode="before")
     @classmethod
     def convert_to_path(cls, v: str | Path) -> Path:
         """Convert string paths to Path objects."""
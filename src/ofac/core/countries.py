@@ -1,7 +1,8 @@
 """Sanctioned countries registry and General License mappings.
 
-This module provides utilities for checking if countries are OFAC-sanctioned
-and retrieving applicable General Licenses for humanitarian operations.
+This module provides utilities for checking if countries are OFAC-sanctioned,
+retrieving applicable General Licenses for humanitarian operations, and
+normalizing country names to ISO 3166-1 alpha-2 codes.
 
 Usage:
     from ofac.core.countries import is_sanctioned_country, get_general_license
@@ -10,6 +11,8 @@ Usage:
         gl = get_general_license("SY")  # Returns GL-21 info
 """
 
+import re
+import unicodedata
 from typing import NamedTuple
 
 
@@ -65,6 +68,273 @@ GENERAL_LICENSES: dict[str, GeneralLicense] = {
     ),
 }
 
+# ISO 3166-1 alpha-2 codes with the English names and variants used in
+# OFAC address data (e.g., "Korea, North", "Burma", "Congo, Democratic
+# Republic of the"). The first name is the canonical short name.
+COUNTRY_NAMES: dict[str, tuple[str, ...]] = {
+    "AD": ("Andorra",),
+    "AE": ("United Arab Emirates", "UAE", "U.A.E."),
+    "AF": ("Afghanistan",),
+    "AG": ("Antigua and Barbuda",),
+    "AI": ("Anguilla",),
+    "AL": ("Albania",),
+    "AM": ("Armenia",),
+    "AN": ("Netherlands Antilles",),
+    "AO": ("Angola",),
+    "AQ": ("Antarctica",),
+    "AR": ("Argentina",),
+    "AS": ("American Samoa",),
+    "AT": ("Austria",),
+    "AU": ("Australia",),
+    "AW": ("Aruba",),
+    "AX": ("Aland Islands",),
+    "AZ": ("Azerbaijan",),
+    "BA": ("Bosnia and Herzegovina", "Bosnia-Herzegovina", "Bosnia"),
+    "BB": ("Barbados",),
+    "BD": ("Bangladesh",),
+    "BE": ("Belgium",),
+    "BF": ("Burkina Faso",),
+    "BG": ("Bulgaria",),
+    "BH": ("Bahrain",),
+    "BI": ("Burundi",),
+    "BJ": ("Benin",),
+    "BL": ("Saint Barthelemy",),
+    "BM": ("Bermuda",),
+    "BN": ("Brunei", "Brunei Darussalam"),
+    "BO": ("Bolivia", "Bolivia, Plurinational State of"),
+    "BQ": ("Bonaire, Sint Eustatius and Saba", "Caribbean Netherlands"),
+    "BR": ("Brazil",),
+    "BS": ("Bahamas", "Bahamas, The", "The Bahamas"),
+    "BT": ("Bhutan",),
+    "BW": ("Botswana",),
+    "BY": ("Belarus",),
+    "BZ": ("Belize",),
+    "CA": ("Canada",),
+    "CD": (
+        "Congo, Democratic Republic of the",
+        "Democratic Republic of the Congo",
+        "DR Congo",
+        "DRC",
+        "Congo (Kinshasa)",
+    ),
+    "CF": ("Central African Republic", "CAR"),
+    "CG": ("Congo, Republic of the", "Republic of the Congo", "Congo (Brazzaville)"),
+    "CH": ("Switzerland",),
+    "CI": ("Cote d'Ivoire", "Cote d Ivoire", "Ivory Coast"),
+    "CK": ("Cook Islands",),
+    "CL": ("Chile",),
+    "CM": ("Cameroon",),
+    "CN": ("China", "People's Republic of China", "PRC"),
+    "CO": ("Colombia",),
+    "CR": ("Costa Rica",),
+    "CU": ("Cuba",),
+    "CV": ("Cabo Verde", "Cape Verde"),
+    "CW": ("Curacao",),
+    "CY": ("Cyprus",),
+    "CZ": ("Czechia", "Czech Republic"),
+    "DE": ("Germany",),
+    "DJ": ("Djibouti",),
+    "DK": ("Denmark",),
+    "DM": ("Dominica",),
+    "DO": ("Dominican Republic",),
+    "DZ": ("Algeria",),
+    "EC": ("Ecuador",),
+    "EE": ("Estonia",),
+    "EG": ("Egypt",),
+    "EH": ("Western Sahara",),
+    "ER": ("Eritrea",),
+    "ES": ("Spain",),
+    "ET": ("Ethiopia",),
+    "FI": ("Finland",),
+    "FJ": ("Fiji",),
+    "FK": ("Falkland Islands",),
+    "FM": ("Micronesia", "Micronesia, Federated States of"),
+    "FO": ("Faroe Islands",),
+    "FR": ("France",),
+    "GA": ("Gabon",),
+    "GB": ("United Kingdom", "UK", "U.K.", "Great Britain", "Britain"),
+    "GD": ("Grenada",),
+    "GE": ("Georgia",),
+    "GF": ("French Guiana",),
+    "GG": ("Guernsey",),
+    "GH": ("Ghana",),
+    "GI": ("Gibraltar",),
+    "GL": ("Greenland",),
+    "GM": ("Gambia", "Gambia, The", "The Gambia"),
+    "GN": ("Guinea",),
+    "GP": ("Guadeloupe",),
+    "GQ": ("Equatorial Guinea",),
+    "GR": ("Greece",),
+    "GT": ("Guatemala",),
+    "GU": ("Guam",),
+    "GW": ("Guinea-Bissau",),
+    "GY": ("Guyana",),
+    "HK": ("Hong Kong",),
+    "HN": ("Honduras",),
+    "HR": ("Croatia",),
+    "HT": ("Haiti",),
+    "HU": ("Hungary",),
+    "ID": ("Indonesia",),
+    "IE": ("Ireland",),
+    "IL": ("Israel",),
+    "IM": ("Isle of Man",),
+    "IN": ("India",),
+    "IQ": ("Iraq",),
+    "IR": ("Iran", "Iran, Islamic Republic of", "Islamic Republic of Iran"),
+    "IS": ("Iceland",),
+    "IT": ("Italy",),
+    "JE": ("Jersey",),
+    "JM": ("Jamaica",),
+    "JO": ("Jordan",),
+    "JP": ("Japan",),
+    "KE": ("Kenya",),
+    "KG": ("Kyrgyzstan",),
+    "KH": ("Cambodia",),
+    "KI": ("Kiribati",),
+    "KM": ("Comoros",),
+    "KN": ("Saint Kitts and Nevis", "St. Kitts and Nevis"),
+    "KP": (
+        "North Korea",
+        "Korea, North",
+        "Korea, Democratic People's Republic of",
+        "Democratic People's Republic of Korea",
+        "DPRK",
+    ),
+    "KR": ("South Korea", "Korea, South", "Korea, Republic of", "Republic of Korea"),
+    "KW": ("Kuwait",),
+    "KY": ("Cayman Islands",),
+    "KZ": ("Kazakhstan",),
+    "LA": ("Laos", "Lao People's Democratic Republic"),
+    "LB": ("Lebanon",),
+    "LC": ("Saint Lucia", "St. Lucia"),
+    "LI": ("Liechtenstein",),
+    "LK": ("Sri Lanka",),
+    "LR": ("Liberia",),
+    "LS": ("Lesotho",),
+    "LT": ("Lithuania",),
+    "LU": ("Luxembourg",),
+    "LV": ("Latvia",),
+    "LY": ("Libya",),
+    "MA": ("Morocco",),
+    "MC": ("Monaco",),
+    "MD": ("Moldova", "Moldova, Republic of"),
+    "ME": ("Montenegro",),
+    "MF": ("Saint Martin",),
+    "MG": ("Madagascar",),
+    "MH": ("Marshall Islands",),
+    "MK": ("North Macedonia", "Macedonia", "The Former Yugoslav Republic of Macedonia"),
+    "ML": ("Mali",),
+    "MM": ("Burma", "Myanmar"),
+    "MN": ("Mongolia",),
+    "MO": ("Macau", "Macao"),
+    "MP": ("Northern Mariana Islands",),
+    "MQ": ("Martinique",),
+    "MR": ("Mauritania",),
+    "MS": ("Montserrat",),
+    "MT": ("Malta",),
+    "MU": ("Mauritius",),
+    "MV": ("Maldives",),
+    "MW": ("Malawi",),
+    "MX": ("Mexico",),
+    "MY": ("Malaysia",),
+    "MZ": ("Mozambique",),
+    "NA": ("Namibia",),
+    "NC": ("New Caledonia",),
+    "NE": ("Niger",),
+    "NG": ("Nigeria",),
+    "NI": ("Nicaragua",),
+    "NL": ("Netherlands", "The Netherlands", "Holland"),
+    "NO": ("Norway",),
+    "NP": ("Nepal",),
+    "NR": ("Nauru",),
+    "NZ": ("New Zealand",),
+    "OM": ("Oman",),
+    "PA": ("Panama",),
+    "PE": ("Peru",),
+    "PF": ("French Polynesia",),
+    "PG": ("Papua New Guinea",),
+    "PH": ("Philippines",),
+    "PK": ("Pakistan",),
+    "PL": ("Poland",),
+    "PR": ("Puerto Rico",),
+    "PS": ("Palestine", "Palestinian Territories", "West Bank", "Gaza", "Gaza Strip"),
+    "PT": ("Portugal",),
+    "PW": ("Palau",),
+    "PY": ("Paraguay",),
+    "QA": ("Qatar",),
+    "RE": ("Reunion",),
+    "RO": ("Romania",),
+    "RS": ("Serbia",),
+    "RU": ("Russia", "Russian Federation"),
+    "RW": ("Rwanda",),
+    "SA": ("Saudi Arabia",),
+    "SB": ("Solomon Islands",),
+    "SC": ("Seychelles",),
+    "SD": ("Sudan",),
+    "SE": ("Sweden",),
+    "SG": ("Singapore",),
+    "SI": ("Slovenia",),
+    "SK": ("Slovakia",),
+    "SL": ("Sierra Leone",),
+    "SM": ("San Marino",),
+    "SN": ("Senegal",),
+    "SO": ("Somalia",),
+    "SR": ("Suriname",),
+    "SS": ("South Sudan",),
+    "ST": ("Sao Tome and Principe",),
+    "SV": ("El Salvador",),
+    "SX": ("Sint Maarten",),
+    "SY": ("Syria", "Syrian Arab Republic"),
+    "SZ": ("Eswatini", "Swaziland"),
+    "TC": ("Turks and Caicos Islands",),
+    "TD": ("Chad",),
+    "TG": ("Togo",),
+    "TH": ("Thailand",),
+    "TJ": ("Tajikistan",),
+    "TL": ("Timor-Leste", "East Timor"),
+    "TM": ("Turkmenistan",),
+    "TN": ("Tunisia",),
+    "TO": ("Tonga",),
+    "TR": ("Turkey", "Turkiye"),
+    "TT": ("Trinidad and Tobago",),
+    "TV": ("Tuvalu",),
+    "TW": ("Taiwan",),
+    "TZ": ("Tanzania", "Tanzania, United Republic of"),
+    "UA": ("Ukraine",),
+    "UG": ("Uganda",),
+    "US": ("United States", "United States of America", "USA", "U.S.A.", "U.S."),
+    "UY": ("Uruguay",),
+    "UZ": ("Uzbekistan",),
+    "VA": ("Holy See", "Vatican City"),
+    "VC": ("Saint Vincent and the Grenadines", "St. Vincent and the Grenadines"),
+    "VE": ("Venezuela", "Venezuela, Bolivarian Republic of"),
+    "VG": ("Virgin Islands, British", "British Virgin Islands"),
+    "VI": ("Virgin Islands, U.S.", "U.S. Virgin Islands"),
+    "VN": ("Vietnam", "Viet Nam"),
+    "VU": ("Vanuatu",),
+    "WS": ("Samoa",),
+    "XK": ("Kosovo",),
+    "YE": ("Yemen",),
+    "YT": ("Mayotte",),
+    "ZA": ("South Africa",),
+    "ZM": ("Zambia",),
+    "ZW": ("Zimbabwe",),
+}
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def _country_key(value: str) -> str:
+    """Normalize a country name for lookup (casefold, ASCII, no punctuation)."""
+    decomposed = unicodedata.normalize("NFKD", value.casefold())
+    unaccented = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(_NON_ALNUM.sub(" ", unaccented).split())
+
+
+_COUNTRY_KEYS: dict[str, str] = {
+    _country_key(name): code for code, names in COUNTRY_NAMES.items() for name in names
+}
+
 
 def is_sanctioned_country(country_code: str) -> bool:
     """Check if a country is OFAC-sanctioned.
@@ -102,6 +372,30 @@ def get_general_license(country_code: str) -> GeneralLicense | None:
     return GENERAL_LICENSES.get(country_code.upper())
 
 
+def normalize_country_code(country: str) -> str | None:
+    """Resolve a country name or ISO code to an ISO 3166-1 alpha-2 code.
+
+    Accepts ISO codes in any case and the English names and variants used
+    in OFAC address data. Accents, punctuation and case are ignored.
+
+    Args:
+        country: Country name or ISO code (e.g., "SY", "Syria", "Korea, North").
+
+    Returns:
+        Upper-case ISO code, or None if the country is not recognized.
+
+    Example:
+        normalize_country_code("Syrian Arab Republic")  # Returns "SY"
+        normalize_country_code("Atlantis")  # Returns None
+    """
+    if not country:
+        return None
+    stripped = country.strip()
+    if len(stripped) == 2 and stripped.upper() in COUNTRY_NAMES:
+        return stripped.upper()
+    return _COUNTRY_KEYS.get(_country_key(stripped))
+
+
 def get_all_sanctioned_countries() -> set[str]:
     """Get all sanctioned country codes.
 
@@ -125,6 +419,8 @@ __all__ = [
     "get_general_license",
     "get_all_sanctioned_countries",
     "get_countries_with_gl",
+    "normalize_country_code",
     "GeneralLicense",
     "SANCTIONED_COUNTRIES",
+    "COUNTRY_NAMES",
 ]
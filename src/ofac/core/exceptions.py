@@ -184,6 +184,18 @@ class BatchTooLargeError(ScreeningError):
     code = "SCREEN_BATCH_TOO_LARGE"
 
 
+class ScreeningBusyError(ScreeningError):
+    """Raised when the screening workers and their queue are at capacity."""
+
+    code = "SCREEN_BUSY"
+
+
+class ScreeningRateLimitError(ScreeningError):
+    """Raised when a client has too many screenings pending."""
+
+    code = "SCREEN_RATE_LIMITED"
+
+
 # =============================================================================
 # Configuration Errors (CONFIG_*)
 # =============================================================================
@@ -223,6 +235,8 @@ __all__ = [
     "ScreeningInputError",
     "ScreeningTimeoutError",
     "BatchTooLargeError",
+    "ScreeningBusyError",
+    "ScreeningRateLimitError",
     # Config errors
     "ConfigurationError",
     "InvalidThresholdError",
@@ -0,0 +1,186 @@
+"""Bounded worker pool for CPU-bound screening work.
+
+This module provides the MatchExecutor class for:
+- Running fuzzy matching in worker threads instead of on the event loop
+- Bounding the number of running plus queued jobs
+- Limiting how many jobs a single client may have pending
+- Counters for monitoring admitted and rejected jobs
+
+RapidFuzz releases the GIL inside its batch scorers, so worker threads
+score in parallel while the event loop keeps serving other requests
+(including /health). Work beyond the bound is rejected immediately
+instead of queueing without limit, so every caller sees fair latency.
+
+Usage:
+    from ofac.core.executor import MatchExecutor
+
+    executor = MatchExecutor(max_workers=4, max_queue=16)
+    matches = await executor.run(matcher.match, "BANCO NACIONAL", client="10.0.0.1")
+    print(executor.stats())
+"""
+
+import asyncio
+import functools
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from ofac.core.config import settings
+from ofac.core.exceptions import ScreeningBusyError, ScreeningRateLimitError
+
+T = TypeVar("T")
+
+
+class MatchExecutor:
+    """Thread pool with admission control for screening jobs.
+
+    A job holds its slot from admission until its worker finishes, even if
+    the awaiting request is cancelled, so the bound reflects real load.
+
+    Attributes:
+        max_workers: Number of worker threads
+        max_queue: Jobs allowed to wait for a free worker
+        max_per_client: Jobs one client may have pending (0 means no limit)
+        completed: Number of jobs that finished
+        rejected_busy: Jobs rejected because the queue was full
+        rejected_client: Jobs rejected by the per-client limit
+    """
+
+    def __init__(
+        self,
+        max_workers: int | None = None,
+        max_queue: int | None = None,
+        max_per_client: int | None = None,
+    ) -> None:
+        """Initialize the pool.
+
+        Args:
+            max_workers: Worker threads. Defaults to settings.match_workers.
+            max_queue: Waiting jobs. Defaults to settings.match_queue_depth.
+            max_per_client: Pending jobs per client. Defaults to
+                settings.match_client_max_pending.
+        """
+        self.max_workers = (
+            max_workers if max_workers is not None else settings.match_workers
+        )
+        self.max_queue = (
+            max_queue if max_queue is not None else settings.match_queue_depth
+        )
+        self.max_per_client = (
+            max_per_client
+            if max_per_client is not None
+            else settings.match_client_max_pending
+        )
+        self.completed = 0
+        self.rejected_busy = 0
+        self.rejected_client = 0
+        self._pending = 0
+        self._per_client: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ofac-match"
+        )
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of running plus queued jobs."""
+        return self.max_workers + self.max_queue
+
+    async def run(
+        self,
+        func: Callable[..., T],
+        /,
+        *args: Any,
+        client: str | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Run a function in a worker thread once admitted.
+
+        Args:
+            func: Blocking function to run.
+            *args: Positional arguments for func.
+            client: Caller identity for the per-client limit.
+            **kwargs: Keyword arguments for func.
+
+        Returns:
+            The function's return value.
+
+        Raises:
+            ScreeningBusyError: If running and queued jobs are at capacity.
+            ScreeningRateLimitError: If the client has too many jobs pending.
+        """
+        self._admit(client)
+        try:
+            future = self._pool.submit(functools.partial(func, *args, **kwargs))
+        except BaseException:
+            self._finish(client)
+            raise
+        future.add_done_callback(functools.partial(self._on_done, client))
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict[str, Any]:
+        """Get pool load and counters.
+
+        Returns:
+            Dictionary with workers, capacity, pending, clients, completed,
+            rejected_busy and rejected_client.
+        """
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "capacity": self.capacity,
+                "pending": self._pending,
+                "clients": len(self._per_client),
+                "completed": self.completed,
+                "rejected_busy": self.rejected_busy,
+                "rejected_client": self.rejected_client,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker threads.
+
+        Args:
+            wait: Whether to wait for running jobs to finish.
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def _admit(self, client: str | None) -> None:
+        """Reserve a slot for a job, or reject it."""
+        with self._lock:
+            if self._pending >= self.capacity:
+                self.rejected_busy += 1
+                raise ScreeningBusyError(
+                    "Screening capacity exhausted, retry shortly",
+                    details={"capacity": self.capacity},
+                )
+            if client is not None and self.max_per_client:
+                client_pending = self._per_client.get(client, 0)
+                if client_pending >= self.max_per_client:
+                    self.rejected_client += 1
+                    raise ScreeningRateLimitError(
+                        "Too many screenings pending for this client",
+                        details={"max_pending": self.max_per_client},
+                    )
+                self._per_client[client] = client_pending + 1
+            self._pending += 1
+
+    def _finish(self, client: str | None) -> None:
+        """Release the slot of a finished or unsubmitted job."""
+        with self._lock:
+            self._pending -= 1
+            if client is not None and client in self._per_client:
+                remaining = self._per_client[client] - 1
+                if remaining:
+                    self._per_client[client] = remaining
+                else:
+                    del self._per_client[client]
+
+    def _on_done(self, client: str | None, _future: Future[Any]) -> None:
+        """Count a finished job and release its slot."""
+        with self._lock:
+            self.completed += 1
+        self._finish(client)
+
+
+__all__ = ["MatchExecutor"]
@@ -4,6 +4,7 @@ This module provides utilities for:
 - Parsing Excel and CSV files
 - Auto-detecting relevant columns (name, country, description)
 - Creating column mappings
+- Reading uploaded files into EntityInput objects
 
 Usage:
     from ofac.core.file_parser import parse_file, detect_columns
@@ -19,6 +20,7 @@ import pandas as pd
 
 from ofac.core.config import settings
 from ofac.core.exceptions import FileFormatError, FileParseError, FileTooLargeError
+from ofac.core.models import EntityInput
 
 
 class ColumnMapping(NamedTuple):
@@ -235,5 +237,61 @@ def get_column_suggestions(df: pd.DataFrame) -> dict[str, list[str]]:
     }
 
 
-__all__ = ["parse_file", "detect_columns", "get_column_suggestions", "ColumnMapping"]
+def read_entity_inputs(file_content: bytes, filename: str) -> list[EntityInput]:
+    """Parse an uploaded file into one EntityInput per named row.
+
+    Columns are auto-detected; rows without an entity name are skipped.
+
+    Args:
+        file_content: Raw file bytes.
+        filename: Original filename (for format detection).
+
+    Returns:
+        List of EntityInput objects in file order.
+
+    Raises:
+        FileFormatError: If file format is not supported.
+        FileTooLargeError: If file exceeds max rows.
+        FileParseError: If file cannot be parsed.
+        ColumnMappingError: If entity name column cannot be detected.
+    """
+    df = parse_file(file_content, filename)
+    column_mapping = detect_columns(df)
+
+    entity_inputs: list[EntityInput] = []
+    for _, row in df.iterrows():
+        entity_name = str(row[column_mapping.entity_name_column]).strip()
+        if not entity_name or entity_name == "nan":
+            continue
+
+        # Extract optional fields
+        country = None
+        if column_mapping.country_column:
+            country_val = row.get(column_mapping.country_column)
+            if pd.notna(country_val):
+                country = str(country_val).strip()
+
+        description = None
+        if column_mapping.description_column:
+            desc_val = row.get(column_mapping.description_column)
+            if pd.notna(desc_val):
+                description = str(desc_val).strip()
+
+        entity_inputs.append(
+            EntityInput(
+                entity_name=entity_name,
+                country=country,
+                description=description,
+            )
+        )
+    return entity_inputs
+
+
+__all__ = [
+    "parse_file",
+    "detect_columns",
+    "get_column_suggestions",
+    "read_entity_inputs",
+    "ColumnMapping",
+]
 
@@ -0,0 +1,294 @@
+"""IDF-weighted token scoring for fuzzy name matching.
+
+This module provides:
+- TokenStatistics: token document frequencies over every corpus name and
+  alias, with each name's tokens and a token -> names inverted index
+- IdfScorer: a token-weighted similarity that down-weights frequent tokens
+  and skips names sharing only stop tokens with the query
+
+Frequent tokens such as "COMPANY", "TRADING", "AL" or "INTERNATIONAL"
+make token_sort_ratio score unrelated names in the REVIEW band
+("ACME TRADING COMPANY" vs "ZETA TRADING COMPANY"). The IDF scorer aligns
+each token with its most similar token on the other side (RapidFuzz ratio
+at or above a token cutoff) and averages the similarities weighted by
+inverse document frequency, so agreement on rare tokens dominates. Names
+whose only similar tokens are stop tokens are never scored at all.
+
+Usage:
+    from ofac.core.idf import IdfScorer, TokenStatistics
+
+    stats = TokenStatistics.build(corpus_keys)
+    scores = IdfScorer().score_matrix(["ACME TRADING"], stats, None, 0)
+"""
+
+import math
+import re
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from ofac.core.config import settings
+
+# Letters and digits; punctuation and underscores separate tokens
+_TOKEN = re.compile(r"[^\W_]+")
+
+
+def name_tokens(name: str) -> list[str]:
+    """Split a name into distinct casefolded tokens, in order.
+
+    Args:
+        name: Normalized name or query.
+
+    Returns:
+        Tokens without duplicates.
+    """
+    return list(dict.fromkeys(_TOKEN.findall(name.casefold())))
+
+
+class TokenStatistics:
+    """Token document frequencies over a name corpus.
+
+    Attributes:
+        vocabulary: Distinct tokens, indexed by token id
+        token_ids: Dict mapping token to token id
+        document_frequency: Number of names containing each token
+        idf: Smoothed inverse document frequency of each token
+        unknown_idf: IDF of a token absent from the corpus
+        name_tokens: Token ids of each name, padded with -1 (names x width)
+        corpus_size: Number of names
+    """
+
+    def __init__(self, vocabulary: list[str], rows: Sequence[Sequence[int]]) -> None:
+        """Initialize the statistics from tokenized names.
+
+        Args:
+            vocabulary: Distinct tokens, indexed by token id.
+            rows: Distinct token ids of each name, in corpus order.
+        """
+        self.vocabulary = vocabulary
+        self.token_ids = {token: idx for idx, token in enumerate(vocabulary)}
+        self.corpus_size = len(rows)
+
+        width = max((len(row) for row in rows), default=0) or 1
+        self.name_tokens = np.full((len(rows), width), -1, dtype=np.int32)
+        for position, row in enumerate(rows):
+            self.name_tokens[position, : len(row)] = row
+
+        flat = self.name_tokens.ravel()
+        present = flat >= 0
+        ids = flat[present]
+        owners = np.repeat(np.arange(len(rows), dtype=np.int32), width)[present]
+        order = np.argsort(ids, kind="stable")
+        self._posting_rows = owners[order]
+        self.document_frequency = np.bincount(ids, minlength=len(vocabulary))
+        self._posting_starts = np.concatenate(([0], np.cumsum(self.document_frequency)))
+
+        self.idf = np.log((self.corpus_size + 1) / (self.document_frequency + 1)) + 1
+        self.unknown_idf = math.log(self.corpus_size + 1) + 1
+
+    @classmethod
+    def build(cls, names: Sequence[str]) -> "TokenStatistics":
+        """Tokenize and count every name of a corpus.
+
+        Args:
+            names: Normalized corpus names (primary names and aliases).
+
+        Returns:
+            TokenStatistics for the names.
+        """
+        token_ids: dict[str, int] = {}
+        rows = [
+            [token_ids.setdefault(token, len(token_ids)) for token in name_tokens(name)]
+            for name in names
+        ]
+        return cls(list(token_ids), rows)
+
+    def rows_with(self, token_ids: np.ndarray) -> np.ndarray:
+        """Return the names containing any of the given tokens.
+
+        Args:
+            token_ids: Token ids to look up.
+
+        Returns:
+            Sorted, distinct corpus positions.
+        """
+        if not token_ids.size:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(
+            np.concatenate(
+                [
+                    self._posting_rows[
+                        self._posting_starts[idx] : self._posting_starts[idx + 1]
+                    ]
+                    for idx in token_ids.tolist()
+                ]
+            )
+        )
+
+
+class IdfScorer:
+    """Soft TF-IDF name similarity with stop-token candidate skipping.
+
+    Every query token is aligned with its most similar token of a name and
+    every name token with its most similar query token; similarities below
+    token_cutoff count as 0. The score is the IDF-weighted mean of those
+    similarities on the 0-100 scale, rounded to 6 decimals so identical
+    token sets score exactly 100.
+
+    Tokens found in at least stop_token_fraction of the corpus names are
+    stop tokens. A name is only scored when it has a non-stop token similar
+    to a non-stop query token; other names score 0. Queries made only of
+    stop tokens are matched on any similar token.
+
+    Attributes:
+        token_cutoff: Token ratio (0-100) two tokens need to be aligned
+        stop_token_fraction: Share of corpus names making a token a stop token
+    """
+
+    def __init__(
+        self,
+        token_cutoff: int | None = None,
+        stop_token_fraction: float | None = None,
+    ) -> None:
+        """Initialize the scorer.
+
+        Args:
+            token_cutoff: Token alignment threshold. Defaults to
+                settings.idf_token_cutoff.
+            stop_token_fraction: Stop token threshold. Defaults to
+                settings.idf_stop_token_fraction.
+        """
+        self.token_cutoff = (
+            token_cutoff if token_cutoff is not None else settings.idf_token_cutoff
+        )
+        self.stop_token_fraction = (
+            stop_token_fraction
+            if stop_token_fraction is not None
+            else settings.idf_stop_token_fraction
+        )
+
+    @property
+    def key(self) -> tuple[Any, ...]:
+        """Hashable description of the configuration, for cache keys."""
+        return ("idf", self.token_cutoff, self.stop_token_fraction)
+
+    def stop_tokens(self, stats: TokenStatistics) -> np.ndarray:
+        """Flag the stop tokens of a corpus.
+
+        Args:
+            stats: Token statistics of the corpus.
+
+        Returns:
+            Boolean array indexed by token id.
+        """
+        return stats.document_frequency >= self.stop_token_fraction * max(
+            1, stats.corpus_size
+        )
+
+    def score_matrix(
+        self,
+        queries: Sequence[str],
+        stats: TokenStatistics,
+        positions: np.ndarray | None,
+        score_cutoff: float,
+        workers: int = 1,
+    ) -> np.ndarray:
+        """Score queries against corpus names.
+
+        Args:
+            queries: Normalized query names.
+            stats: Token statistics of the normalized corpus names.
+            positions: Corpus positions to score, or None for every name.
+            score_cutoff: Scores below this are returned as 0.
+            workers: RapidFuzz worker threads for token alignment.
+
+        Returns:
+            Float matrix (queries x positions) of scores.
+        """
+        size = stats.corpus_size if positions is None else len(positions)
+        scores = np.zeros((len(queries), size), dtype=np.float64)
+        if not size or not stats.vocabulary:
+            return scores
+
+        stop = self.stop_tokens(stats)
+        for row, query in enumerate(queries):
+            self._score_query(
+                query, stats, stop, positions, score_cutoff, workers, scores[row]
+            )
+        return scores
+
+    def _score_query(
+        self,
+        query: str,
+        stats: TokenStatistics,
+        stop: np.ndarray,
+        positions: np.ndarray | None,
+        score_cutoff: float,
+        workers: int,
+        out: np.ndarray,
+    ) -> None:
+        """Score one query, writing into its row of the score matrix."""
+        tokens = name_tokens(query)
+        if not tokens:
+            return
+
+        ids = [stats.token_ids.get(token, -1) for token in tokens]
+        query_idf = np.array(
+            [stats.idf[idx] if idx >= 0 else stats.unknown_idf for idx in ids]
+        )
+        # Similarity (0-1) of each query token to each corpus token
+        similarity = (
+            process.cdist(
+                tokens,
+                stats.vocabulary,
+                scorer=fuzz.ratio,
+                score_cutoff=self.token_cutoff,
+                dtype=np.float32,
+                workers=workers,
+            )
+            / 100
+        )
+
+        # Names sharing only stop tokens with the query are skipped
+        informative = np.array([idx < 0 or not stop[idx] for idx in ids])
+        if informative.any():
+            shared = (similarity[informative] > 0).any(axis=0) & ~stop
+        else:
+            shared = (similarity > 0).any(axis=0)
+        rows = stats.rows_with(np.flatnonzero(shared))
+        if positions is None:
+            targets = rows
+        else:
+            wanted = np.zeros(stats.corpus_size, dtype=bool)
+            wanted[rows] = True
+            targets = np.flatnonzero(wanted[positions])
+            rows = positions[targets]
+        if not rows.size:
+            return
+
+        name_ids = stats.name_tokens[rows]
+        valid = name_ids >= 0
+        name_ids = np.where(valid, name_ids, 0)
+        # pairwise[q, name, t]: similarity of query token q to name token t
+        pairwise = similarity[:, name_ids] * valid
+        name_idf = stats.idf[name_ids] * valid
+        weighted = query_idf @ pairwise.max(axis=2) + (
+            name_idf * pairwise.max(axis=0)
+        ).sum(axis=1)
+        combined = np.round(
+            100 * weighted / (query_idf.sum() + name_idf.sum(axis=1)), 6
+        )
+        combined[combined < score_cutoff] = 0
+        out[targets] = combined
+
+    def __repr__(self) -> str:
+        """Return the scorer with its thresholds."""
+        return (
+            f"IdfScorer(token_cutoff={self.token_cutoff}, "
+            f"stop_token_fraction={self.stop_token_fraction})"
+        )
+
+
+__all__ = ["IdfScorer", "TokenStatistics", "name_tokens"]
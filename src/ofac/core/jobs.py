@@ -0,0 +1,508 @@
+"""Asynchronous batch screening jobs backed by SQLite.
+
+This module provides job helpers for:
+- Persisting job state, progress and results in a local SQLite database
+- Running submitted files on a bounded pool of job workers
+- Progress (rows done / total) and ETA from the screening rate so far
+- Paging through results in input order, also while a job is running
+- Purging finished jobs after settings.job_retention_hours
+- Failing jobs left unfinished by an earlier server process
+
+A job leases the shared matcher for its whole run, so every row of a file
+is screened against the same OFAC data version even if a refresh is
+published meanwhile. The whole file goes to the leased
+BatchScreeningEngine, the same one /screenings/batch uses, so large files
+are sharded across its worker processes. Results are stored as they are
+produced: one shard (settings.batch_shard_size rows) at a time when
+sharded, otherwise one chunk of settings.job_chunk_rows rows at a time.
+
+Usage:
+    from ofac.core.jobs import ScreeningJobRunner, ScreeningJobStore
+
+    runner = ScreeningJobRunner(ScreeningJobStore(), lease_engine)
+    job = runner.submit(file_content, "partners.xlsx")
+    job = runner.store.get(job.job_id)
+    page = runner.store.results(job.job_id, offset=0, limit=100)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager, contextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from uuid import uuid4
+
+from ofac.core.batch import BatchScreeningEngine
+from ofac.core.config import settings
+from ofac.core.exceptions import OFACError, ScreeningBusyError
+from ofac.core.file_parser import read_entity_inputs
+from ofac.core.models import (
+    JobStatus,
+    MatchStatus,
+    ScreeningJob,
+    ScreeningJobResults,
+    ScreeningResult,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    rows_total INTEGER NOT NULL DEFAULT 0,
+    rows_done INTEGER NOT NULL DEFAULT 0,
+    ok_count INTEGER NOT NULL DEFAULT 0,
+    review_count INTEGER NOT NULL DEFAULT 0,
+    nok_count INTEGER NOT NULL DEFAULT 0,
+    ofac_version TEXT NOT NULL DEFAULT '',
+    error TEXT,
+    owner_pid INTEGER NOT NULL,
+    owner_token TEXT NOT NULL DEFAULT '',
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT
+);
+CREATE TABLE IF NOT EXISTS job_results (
+    job_id TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    result TEXT NOT NULL,
+    PRIMARY KEY (job_id, position)
+);
+"""
+
+_UNFINISHED = (JobStatus.QUEUED.value, JobStatus.RUNNING.value)
+
+
+def _timestamp(value: str | None) -> datetime | None:
+    """Parse a stored ISO timestamp."""
+    return datetime.fromisoformat(value) if value else None
+
+
+def _migrate(connection: sqlite3.Connection) -> None:
+    """Add columns missing from a database created by an older version."""
+    columns = {row["name"] for row in connection.execute("PRAGMA table_info(jobs)")}
+    if "owner_token" not in columns:
+        connection.execute(
+            "ALTER TABLE jobs ADD COLUMN owner_token TEXT NOT NULL DEFAULT ''"
+        )
+
+
+class ScreeningJobStore:
+    """SQLite store of batch job state and results.
+
+    The database is opened on first use, so creating a store never
+    touches the filesystem. One connection is shared by all threads and
+    serialized with a lock.
+
+    Each store gets a random instance token, recorded with every job it
+    creates. Unlike the owner PID, which the OS may hand to a new process,
+    the token identifies the store that owns a job, so jobs of any other
+    token were left behind by an earlier server process.
+
+    Attributes:
+        path: Database file, or None to use settings.job_store_path
+        instance_token: Token of the jobs created by this store
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        """Initialize the store without opening the database.
+
+        Args:
+            path: Database file. Defaults to settings.job_store_path.
+        """
+        self.path = path
+        self.instance_token = uuid4().hex
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run statements in one transaction on the shared connection."""
+        with self._lock:
+            if self._connection is None:
+                path = self.path or settings.job_store_path
+                path.parent.mkdir(parents=True, exist_ok=True)
+                connection = sqlite3.connect(path, check_same_thread=False)
+                connection.row_factory = sqlite3.Row
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(_SCHEMA)
+                _migrate(connection)
+                self._connection = connection
+            with self._connection:
+                yield self._connection
+
+    def create(self, filename: str) -> ScreeningJob:
+        """Record a new queued job.
+
+        Args:
+            filename: Name of the uploaded file.
+
+        Returns:
+            The queued ScreeningJob.
+        """
+        job = ScreeningJob(
+            job_id=str(uuid4()),
+            status=JobStatus.QUEUED,
+            filename=filename,
+            created_at=datetime.now(UTC),
+        )
+        with self._transaction() as connection:
+            connection.execute(
+                "INSERT INTO jobs (job_id, status, filename, owner_pid, owner_token,"
+                " created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    job.job_id,
+                    job.status.value,
+                    filename,
+                    os.getpid(),
+                    self.instance_token,
+                    job.created_at.isoformat(),
+                ),
+            )
+        return job
+
+    def get(self, job_id: str) -> ScreeningJob | None:
+        """Get a job's state, progress and ETA.
+
+        Args:
+            job_id: Job identifier.
+
+        Returns:
+            ScreeningJob, or None if no such job exists.
+        """
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT * FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        status = JobStatus(row["status"])
+        started_at = _timestamp(row["started_at"])
+        eta_seconds: float | None = None
+        if status is JobStatus.COMPLETED:
+            eta_seconds = 0.0
+        elif status is JobStatus.RUNNING and started_at and row["rows_done"]:
+            elapsed = (datetime.now(UTC) - started_at).total_seconds()
+            remaining = row["rows_total"] - row["rows_done"]
+            eta_seconds = max(0.0, remaining * elapsed / row["rows_done"])
+
+        return ScreeningJob(
+            job_id=row["job_id"],
+            status=status,
+            filename=row["filename"],
+            rows_total=row["rows_total"],
+            rows_done=row["rows_done"],
+            ok_count=row["ok_count"],
+            review_count=row["review_count"],
+            nok_count=row["nok_count"],
+            ofac_version=row["ofac_version"],
+            error=json.loads(row["error"]) if row["error"] else None,
+            created_at=datetime.fromisoformat(row["created_at"]),
+            started_at=started_at,
+            finished_at=_timestamp(row["finished_at"]),
+            eta_seconds=eta_seconds,
+        )
+
+    def start(self, job_id: str, rows_total: int, ofac_version: str) -> None:
+        """Mark a job running once its file is parsed.
+
+        Args:
+            job_id: Job identifier.
+            rows_total: Entities to screen.
+            ofac_version: OFAC data version the job screens against.
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, rows_total = ?, ofac_version = ?,"
+                " started_at = ? WHERE job_id = ?",
+                (
+                    JobStatus.RUNNING.value,
+                    rows_total,
+                    ofac_version,
+                    datetime.now(UTC).isoformat(),
+                    job_id,
+                ),
+            )
+
+    def add_results(
+        self, job_id: str, offset: int, results: Sequence[ScreeningResult]
+    ) -> None:
+        """Store a chunk of results and advance the job's progress.
+
+        Args:
+            job_id: Job identifier.
+            offset: Input position of the first result.
+            results: Screening results of consecutive input rows.
+        """
+        counts = dict.fromkeys(MatchStatus, 0)
+        for result in results:
+            counts[result.match_status] += 1
+        with self._transaction() as connection:
+            connection.executemany(
+                "INSERT INTO job_results (job_id, position, result) VALUES (?, ?, ?)",
+                (
+                    (job_id, offset + index, result.model_dump_json())
+                    for index, result in enumerate(results)
+                ),
+            )
+            connection.execute(
+                "UPDATE jobs SET rows_done = rows_done + ?, ok_count = ok_count + ?,"
+                " review_count = review_count + ?, nok_count = nok_count + ?"
+                " WHERE job_id = ?",
+                (
+                    len(results),
+                    counts[MatchStatus.OK],
+                    counts[MatchStatus.REVIEW],
+                    counts[MatchStatus.NOK],
+                    job_id,
+                ),
+            )
+
+    def finish(self, job_id: str, error: dict[str, str] | None = None) -> None:
+        """Mark a job completed, or failed with an error.
+
+        Args:
+            job_id: Job identifier.
+            error: Error code and message if the job failed.
+        """
+        status = JobStatus.FAILED if error is not None else JobStatus.COMPLETED
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE job_id = ?",
+                (
+                    status.value,
+                    json.dumps(error) if error is not None else None,
+                    datetime.now(UTC).isoformat(),
+                    job_id,
+                ),
+            )
+
+    def results(
+        self, job_id: str, offset: int = 0, limit: int = 100
+    ) -> ScreeningJobResults | None:
+        """Read one page of a job's results in input order.
+
+        Args:
+            job_id: Job identifier.
+            offset: Position of the first result.
+            limit: Maximum results in the page.
+
+        Returns:
+            ScreeningJobResults, or None if no such job exists.
+        """
+        job = self.get(job_id)
+        if job is None:
+            return None
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT result FROM job_results WHERE job_id = ? AND position >= ?"
+                " ORDER BY position LIMIT ?",
+                (job_id, offset, limit),
+            ).fetchall()
+        results = [ScreeningResult.model_validate_json(row["result"]) for row in rows]
+        end = offset + len(results)
+        return ScreeningJobResults(
+            job_id=job_id,
+            status=job.status,
+            offset=offset,
+            limit=limit,
+            rows_done=job.rows_done,
+            results=results,
+            next_offset=end if end < job.rows_done else None,
+        )
+
+    def purge(self, older_than: datetime) -> int:
+        """Delete finished jobs, and their results, finished before a time.
+
+        Args:
+            older_than: Cutoff timestamp (UTC).
+
+        Returns:
+            Number of jobs deleted.
+        """
+        with self._transaction() as connection:
+            job_ids = [
+                row["job_id"]
+                for row in connection.execute(
+                    "SELECT job_id FROM jobs WHERE finished_at IS NOT NULL"
+                    " AND finished_at < ?",
+                    (older_than.isoformat(),),
+                )
+            ]
+            connection.executemany(
+                "DELETE FROM job_results WHERE job_id = ?",
+                ((job_id,) for job_id in job_ids),
+            )
+            connection.executemany(
+                "DELETE FROM jobs WHERE job_id = ?", ((job_id,) for job_id in job_ids)
+            )
+        return len(job_ids)
+
+    def fail_orphaned(self) -> int:
+        """Fail unfinished jobs created by another store instance.
+
+        Called once at server startup: any unfinished job not created by
+        this store belongs to a server process that has stopped, even if
+        its PID was since reused.
+
+        Returns:
+            Number of jobs marked failed.
+        """
+        with self._transaction() as connection:
+            rows = connection.execute(
+                "SELECT job_id FROM jobs WHERE status IN (?, ?) AND owner_token != ?",
+                (*_UNFINISHED, self.instance_token),
+            ).fetchall()
+        orphaned = [row["job_id"] for row in rows]
+        for job_id in orphaned:
+            self.finish(
+                job_id,
+                {
+                    "code": "JOB_INTERRUPTED",
+                    "message": "The job's server process stopped",
+                },
+            )
+        return len(orphaned)
+
+    def close(self) -> None:
+        """Close the database connection, if open."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class ScreeningJobRunner:
+    """Runs batch screening jobs on a bounded pool of job workers.
+
+    Attributes:
+        store: Job state and result store
+        workers: Jobs screened at the same time
+        max_queue: Jobs allowed to wait for a worker
+        chunk_rows: Rows screened between progress updates when a job is
+            screened in-process (sharded jobs report each shard)
+    """
+
+    def __init__(
+        self,
+        store: ScreeningJobStore,
+        lease_engine: Callable[[], AbstractContextManager[BatchScreeningEngine]],
+        workers: int | None = None,
+        max_queue: int | None = None,
+        chunk_rows: int | None = None,
+    ) -> None:
+        """Initialize the runner; job workers start with the first job.
+
+        Args:
+            store: Job state and result store.
+            lease_engine: Returns a context manager leasing the batch engine
+                of the current OFAC data for the duration of a job.
+            workers: Job workers. Defaults to settings.job_workers.
+            max_queue: Waiting jobs. Defaults to settings.job_queue_depth.
+            chunk_rows: Rows per progress update of in-process jobs.
+                Defaults to settings.job_chunk_rows.
+        """
+        self.store = store
+        self.workers = workers if workers is not None else settings.job_workers
+        self.max_queue = (
+            max_queue if max_queue is not None else settings.job_queue_depth
+        )
+        self.chunk_rows = (
+            chunk_rows if chunk_rows is not None else settings.job_chunk_rows
+        )
+        self._lease_engine = lease_engine
+        self._active = 0
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="ofac-job"
+        )
+
+    def submit(self, file_content: bytes, filename: str) -> ScreeningJob:
+        """Queue a file for screening and return right away.
+
+        Args:
+            file_content: Raw bytes of the uploaded file.
+            filename: Name of the uploaded file (selects the parser).
+
+        Returns:
+            The queued ScreeningJob; poll store.get() for progress.
+
+        Raises:
+            ScreeningBusyError: If running and queued jobs are at capacity.
+        """
+        with self._lock:
+            if self._active >= self.workers + self.max_queue:
+                raise ScreeningBusyError(
+                    "Too many batch jobs in progress, retry shortly",
+                    details={"capacity": self.workers + self.max_queue},
+                )
+            self._active += 1
+        try:
+            self.store.purge(
+                datetime.now(UTC) - timedelta(hours=settings.job_retention_hours)
+            )
+            job = self.store.create(filename)
+            self._pool.submit(self._run, job.job_id, file_content, filename)
+        except BaseException:
+            self._done()
+            raise
+        return job
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the job workers.
+
+        Args:
+            wait: Whether to wait for running jobs to finish.
+        """
+        self._pool.shutdown(wait=wait, cancel_futures=not wait)
+
+    def stats(self) -> dict[str, Any]:
+        """Get job worker load.
+
+        Returns:
+            Dictionary with workers, capacity and active (running or queued).
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "capacity": self.workers + self.max_queue,
+                "active": self._active,
+            }
+
+    def _run(self, job_id: str, file_content: bytes, filename: str) -> None:
+        """Parse and screen one job, storing progress shard by shard."""
+        try:
+            entity_inputs = read_entity_inputs(file_content, filename)
+            with self._lease_engine() as engine:
+                data_version = engine.matcher.data.version
+                self.store.start(
+                    job_id, len(entity_inputs), data_version.loaded_at or "unknown"
+                )
+                for offset, results in engine.iter_screen(
+                    entity_inputs, job_id, chunk_rows=self.chunk_rows
+                ):
+                    self.store.add_results(job_id, offset, results)
+            self.store.finish(job_id)
+        except OFACError as e:
+            self.store.finish(job_id, {"code": e.code, "message": e.message})
+        except Exception as e:
+            self.store.finish(
+                job_id,
+                {"code": "SCREENING_ERROR", "message": f"Batch job failed: {e}"},
+            )
+        finally:
+            self._done()
+
+    def _done(self) -> None:
+        """Release a job's slot."""
+        with self._lock:
+            self._active -= 1
+
+
+__all__ = ["ScreeningJobRunner", "ScreeningJobStore"]
@@ -3,7 +3,16 @@
 This module provides the EntityMatcher class for:
 - Fuzzy string matching against OFAC SDN entries
 - Matching against primary names and aliases
-- Country-aware score boosting
+- Country-aware score boosting via ISO country bitmasks
+- Configurable name normalization, applied to the corpus once per dataset
+- Optional weighted ensemble of scorers pruned by the score cutoff
+- Optional IDF-weighted token scoring that skips stop-token-only candidates
+- Top-k scanning with a rising score cutoff
+- Length-bucket pruning of names that cannot reach the threshold or top k
+- O(1) exact-hit detection, optionally returning exact hits without fuzzy scoring
+- Batched scoring against a precompiled name corpus
+- Matrix scoring of whole input columns (match_many)
+- Optional result caching keyed by query and dataset version
 - Returning sorted MatchResult objects
 
 Usage:
@@ -16,49 +25,306 @@ Usage:
     matches = matcher.match("ACME Corporation", country="US")
 """
 
-from typing import TYPE_CHECKING
+import heapq
+import threading
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Literal
 
-from rapidfuzz import fuzz
+import numpy as np
+from rapidfuzz import fuzz, process
 
+from ofac.core.buckets import LengthBuckets
 from ofac.core.config import settings
-from ofac.core.countries import is_sanctioned_country
+from ofac.core.countries import is_sanctioned_country, normalize_country_code
 from ofac.core.exceptions import OFACNotLoadedError
+from ofac.core.idf import IdfScorer, TokenStatistics
 from ofac.core.models import MatchResult, MatchType, OFACList
+from ofac.core.normalize import NamePipeline
+from ofac.core.scoring import EnsembleScorer
+from ofac.data.corpus import NAME_KIND_ALIAS, MappedNames, NameCorpus
+from ofac.data.entities import EntityRecord, EntityTable
+from ofac.data.exact import ExactIndex
 
 if TYPE_CHECKING:
+    from ofac.core.cache import MatchCache
     from ofac.data.loader import OFACData
 
+MatcherEngine = Literal["scan", "vectorized"]
+MatchScorer = Literal["ratio", "ensemble", "idf"]
+
+# Cache key: (normalized name, country, max_results, min_score, data version,
+# scoring configuration)
+CacheKey = tuple[str, str | None, int, int, str, tuple[Any, ...]]
+
+# Distinct input countries whose corpus masks a matcher keeps
+_COUNTRY_MASK_CACHE_SIZE = 512
+
+# Names scored per RapidFuzz call when scoring length buckets
+_BUCKET_GROUP_SIZE = 2048
+
+# Scan engine hit: (score, -scan position, record, alias name or None,
+# raw score was 100, country matched). Positions are unique, so tuples
+# never compare past the second field.
+_ScanHit = tuple[int, int, EntityRecord, str | None, bool, bool]
+
+
+def _top_k_rows(scores: np.ndarray, eligible: np.ndarray, k: int) -> list[np.ndarray]:
+    """Select the indices of the k highest eligible scores in each row.
+
+    The k-th best score per row is found for the whole matrix at once with
+    argpartition. Ties keep corpus order, matching a stable descending sort.
+
+    Args:
+        scores: Integer score matrix (queries x corpus).
+        eligible: Boolean matrix of entries that passed the threshold.
+        k: Number of indices to return per row.
+
+    Returns:
+        One array of corpus indices per row, ordered by score descending.
+    """
+    n_rows, n_cols = scores.shape
+    if k <= 0 or n_cols == 0:
+        return [np.empty(0, dtype=np.intp) for _ in range(n_rows)]
+
+    masked = np.where(eligible, scores, -1)
+    if n_cols > k:
+        kth_idx = np.argpartition(-masked, k - 1, axis=1)[:, k - 1]
+        kth_scores = masked[np.arange(n_rows), kth_idx]
+    else:
+        kth_scores = np.full(n_rows, -1)
+
+    top: list[np.ndarray] = []
+    for row, kth_score in zip(masked, kth_scores.tolist(), strict=True):
+        # Keep everything tied with the k-th best so the stable sort decides
+        candidates = np.flatnonzero(row >= max(kth_score, 0))
+        order = np.argsort(-row[candidates], kind="stable")
+        top.append(candidates[order[:k]])
+    return top
+
 
 class EntityMatcher:
     """Fuzzy matching engine for OFAC sanctions screening.
 
     This class performs fuzzy string matching against OFAC SDN entries
-    using RapidFuzz's token_sort_ratio algorithm. It matches against both
+    using RapidFuzz's ratio over normalized names. It matches against both
     primary names (sdn_name) and aliases, and applies country-aware scoring.
 
+    Names and queries go through the same NamePipeline. Corpus names are
+    normalized once per matcher (and so once per dataset version for the
+    shared matcher); the default pipeline only sorts tokens, which makes
+    the plain ratio score exactly like token_sort_ratio.
+
+    With the "ensemble" scorer, names are scored with a weighted blend of
+    Jaro-Winkler, ratio, token_set_ratio and partial_ratio (optionally
+    WRatio), cheapest first, dropping names once they cannot reach the
+    score cutoff. With the "idf"
+    scorer, tokens are weighted by inverse document frequency over the
+    normalized corpus names, so frequent tokens ("COMPANY", "TRADING")
+    count little and names sharing only such stop tokens are not scored.
+
+    Two engines produce identical results:
+    - "vectorized": scores the query against the flat name corpus in one
+      batched RapidFuzz call (default)
+    - "scan": walks entities and aliases one pair at a time
+
+    With the ratio scorer, the vectorized engine partitions the corpus by
+    name length (LengthBuckets) and skips buckets that cannot reach
+    min_score or, for a single query, its current top k.
+
+    When the data carries a CandidateIndex, the vectorized engine only
+    scores each query's trigram candidates instead of the full corpus
+    (except with the ensemble scorer, which prunes by score bounds instead),
+    plus the names sharing its phonetic key when a PhoneticIndex is loaded.
+
+    Names whose normalized form equals the query's are found in O(1) with
+    an ExactIndex. They fill a single query's top k with 100s when there
+    are enough of them, so only names that can still tie are scored. With
+    stop_at_exact_nok, a query with exact hits returns just those hits
+    (score 100, so a NOK however the other names would score) without
+    any fuzzy scoring.
+
+    With a MatchCache, results are reused across calls for the same
+    normalized query against the same dataset version.
+
     Attributes:
         data: OFACData containing SDN entries, aliases, and addresses
         min_score: Minimum match score to return (default: 0)
+        engine: Matching engine in use ("vectorized" or "scan")
+        normalizer: NamePipeline applied to names and queries
+        scorer: Scoring mode in use ("ratio", "ensemble" or "idf")
+        ensemble: EnsembleScorer used by the "ensemble" scorer, else None
+        idf: IdfScorer used by the "idf" scorer, else None
+        stop_at_exact_nok: Whether exact hits are returned without fuzzy scoring
+        entities: Per-entity metadata table read by both engines
+        corpus: Flat name corpus used by the vectorized engine
+        cache: Optional MatchCache shared between matchers
 
     Example:
         matcher = EntityMatcher(ofac_data)
         matches = matcher.match("BANCO NACIONAL DE CUBA", country="Cuba")
     """
 
-    def __init__(self, data: "OFACData", min_score: int = 0) -> None:
+    def __init__(
+        self,
+        data: "OFACData",
+        min_score: int = 0,
+        engine: MatcherEngine | None = None,
+        cache: "MatchCache | None" = None,
+        normalization: Sequence[str] | None = None,
+        scorer: MatchScorer | None = None,
+        stop_at_exact_nok: bool | None = None,
+    ) -> None:
         """Initialize the matcher.
 
         Args:
             data: OFACData containing loaded SDN entries and lookups.
             min_score: Minimum match score to return (0-100). Defaults to 0.
+            engine: Matching engine. Defaults to settings.matcher_engine.
+            cache: Optional result cache. Defaults to no caching.
+            normalization: Name normalization steps. Defaults to
+                settings.name_normalization.
+            scorer: Scoring mode. Defaults to settings.match_scorer; the
+                ensemble and IDF scorers take their parameters from settings.
+            stop_at_exact_nok: Return only the exact hits of queries that have
+                any. Defaults to settings.match_stop_at_exact_nok.
 
         Raises:
             OFACNotLoadedError: If data is None or invalid.
+            ConfigurationError: If a normalization step or ensemble weight
+                is invalid.
         """
         if data is None:
             raise OFACNotLoadedError("OFAC data is required for matching")
         self.data = data
         self.min_score = max(0, min(100, min_score))
+        self.engine: MatcherEngine = engine or settings.matcher_engine
+        self.normalizer = NamePipeline(
+            normalization if normalization is not None else settings.name_normalization
+        )
+        self.scorer: MatchScorer = scorer or settings.match_scorer
+        self.ensemble = EnsembleScorer() if self.scorer == "ensemble" else None
+        self.idf = IdfScorer() if self.scorer == "idf" else None
+        self.stop_at_exact_nok = (
+            stop_at_exact_nok
+            if stop_at_exact_nok is not None
+            else settings.match_stop_at_exact_nok
+        )
+        self._entities: EntityTable | None = data.entities
+        self._corpus: NameCorpus | None = data.corpus
+        self._name_keys: list[str] | None = None
+        self._token_stats: TokenStatistics | None = None
+        self._length_buckets: LengthBuckets | None = None
+        self._exact_index: ExactIndex | None = data.exact_index
+        self.cache = cache if cache is not None and cache.enabled else None
+        self._country_masks: dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def entities(self) -> EntityTable:
+        """Per-entity metadata table, built on first use if absent."""
+        if self._entities is None:
+            with self._lock:
+                if self._entities is None:
+                    # Imported here: ofac.data.loader imports ofac.core at module level
+                    from ofac.data.loader import build_entities
+
+                    self._entities = build_entities(self.data)
+        return self._entities
+
+    @property
+    def corpus(self) -> NameCorpus:
+        """Name corpus for the vectorized engine, built on first use if absent."""
+        if self._corpus is None:
+            entities = self.entities
+            with self._lock:
+                if self._corpus is None:
+                    from ofac.data.loader import build_corpus
+
+                    self._corpus = build_corpus(self.data, entities)
+        return self._corpus
+
+    @property
+    def name_keys(self) -> list[str]:
+        """Normalized corpus names, aligned with corpus.names, built on first use."""
+        if self._name_keys is None:
+            corpus = self.corpus
+            with self._lock:
+                if self._name_keys is None:
+                    names = corpus.names
+                    if isinstance(names, MappedNames):
+                        names = names.decoded()
+                    self._name_keys = self.normalizer.normalize_many(names)
+        return self._name_keys
+
+    @property
+    def token_stats(self) -> TokenStatistics:
+        """Token frequencies of the normalized corpus names, built on first use."""
+        if self._token_stats is None:
+            name_keys = self.name_keys
+            with self._lock:
+                if self._token_stats is None:
+                    self._token_stats = TokenStatistics.build(name_keys)
+        return self._token_stats
+
+    @property
+    def length_buckets(self) -> LengthBuckets:
+        """Normalized corpus names partitioned by length, built on first use."""
+        if self._length_buckets is None:
+            name_keys = self.name_keys
+            with self._lock:
+                if self._length_buckets is None:
+                    self._length_buckets = LengthBuckets.build(name_keys)
+        return self._length_buckets
+
+    @property
+    def exact_index(self) -> ExactIndex:
+        """Hash index of normalized corpus names, keyed like this matcher's queries.
+
+        The loader's index is used when it was built with the same
+        normalization steps; otherwise one is built from name_keys on
+        first use.
+        """
+        index = self._exact_index
+        if index is None or index.normalizer.steps != self.normalizer.steps:
+            name_keys = self.name_keys
+            with self._lock:
+                index = self._exact_index
+                if index is None or index.normalizer.steps != self.normalizer.steps:
+                    index = ExactIndex.from_keys(name_keys, self.normalizer)
+                    self._exact_index = index
+        return index
+
+    def prepare(self) -> "EntityMatcher":
+        """Build all per-dataset state now instead of on the first request.
+
+        Builds the entity table and name corpus if the data lacks them,
+        decodes memory-mapped corpus names and normalizes them (and
+        partitions them by length for the ratio scorer, or counts their
+        tokens for the IDF scorer), and indexes them for exact hits, so a
+        matcher shared across requests never does this work while serving.
+
+        Returns:
+            This matcher, ready to use.
+        """
+        names = self.corpus.names
+        if isinstance(names, MappedNames):
+            names.decoded()
+        _ = self.name_keys
+        if self.idf is not None:
+            _ = self.token_stats
+        if self.scorer == "ratio":
+            _ = self.length_buckets
+        _ = self.exact_index
+        return self
+
+    def _aliases(self, record: EntityRecord) -> list[str]:
+        """Get the aliases of an entity from the lookup of its OFAC list."""
+        if record.ofac_list is OFACList.CONSOLIDATED:
+            consolidated = self.data.consolidated
+            lookup = consolidated.aliases_by_ent if consolidated else {}
+        else:
+            lookup = self.data.aliases_by_ent
+        return lookup.get(record.ent_num, [])
 
     def match(
         self,
@@ -89,99 +355,803 @@ class EntityMatcher:
             return []
 
         entity_name_clean = entity_name.strip()
-        matches: list[tuple[int, MatchResult]] = []
+        if self.cache is not None:
+            key = self._cache_key(entity_name_clean, country, max_results)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
 
-        # Match against SDN primary names
-        for _, row in self.data.sdn_df.iterrows():
-            sdn_name = str(row.get("sdn_name", ""))
-            if not sdn_name:
-                continue
+        matches: list[MatchResult] = []
+        if self.stop_at_exact_nok:
+            matches = self._exact_matches(entity_name_clean, country, max_results)
+        if not matches and self.engine == "vectorized":
+            matches = self._match_vectorized(entity_name_clean, country, max_results)
+        elif not matches:
+            matches = self._match_scan(entity_name_clean, country, max_results)
+
+        if self.cache is not None:
+            self.cache.put(key, matches)
+        return matches
+
+    def _cache_key(
+        self, entity_name_clean: str, country: str | None, max_results: int
+    ) -> CacheKey:
+        """Build the result cache key for a query.
+
+        Scores depend only on the normalized query, so names are keyed by
+        their normalized form together with the normalization steps and
+        scorer configuration. The dataset version is the load timestamp, so
+        a refreshed list never reuses old results.
+
+        Args:
+            entity_name_clean: Stripped entity name.
+            country: Optional country code/name as given.
+            max_results: Maximum number of results requested.
+
+        Returns:
+            Hashable cache key.
+        """
+        version = self.data.version.loaded_at or f"id:{id(self.data)}"
+        return (
+            self.normalizer(entity_name_clean),
+            country or None,
+            max_results,
+            self.min_score,
+            version,
+            (
+                self.normalizer.steps,
+                self._scorer_key(),
+                self.stop_at_exact_nok,
+            ),
+        )
+
+    def _scorer_key(self) -> Any:
+        """Hashable description of the scorer configuration."""
+        if self.ensemble is not None:
+            return self.ensemble.key
+        if self.idf is not None:
+            return self.idf.key
+        return self.scorer
+
+    def _exact_matches(
+        self, entity_name_clean: str, country: str | None, max_results: int
+    ) -> list[MatchResult]:
+        """Look up the names whose normalized form equals the query's.
+
+        Each hit scores 100, which is at or above any NOK threshold, so the
+        screening is a NOK (or a REVIEW under a General License) whatever
+        the other names would score. Hits are returned in corpus order,
+        primary names as EXACT and aliases as ALIAS.
+
+        Args:
+            entity_name_clean: Stripped entity name.
+            country: Optional country code/name for the country_match flag.
+            max_results: Maximum number of results to return.
+
+        Returns:
+            List of MatchResult objects; empty if the query has no exact hit.
+        """
+        positions = self.exact_index.lookup_key(self.normalizer(entity_name_clean))
+        if not positions.size or max_results <= 0:
+            return []
+
+        corpus = self.corpus
+        entities = self.entities
+        country_code = normalize_country_code(country) if country else None
+        results: list[MatchResult] = []
+        for idx in positions[:max_results].tolist():
+            record = entities[int(corpus.entities[idx])]
+            country_match = bool(country) and self._record_country_match(
+                country or "", country_code, record
+            )
+            is_alias = corpus.kinds[idx] == NAME_KIND_ALIAS
+            results.append(
+                self._build_match_result(
+                    record,
+                    100,
+                    MatchType.ALIAS if is_alias else MatchType.EXACT,
+                    country_match,
+                    alias_name=corpus.names[idx] if is_alias else None,
+                )
+            )
+        return results
+
+    def _match_scan(
+        self, entity_name_clean: str, country: str | None, max_results: int
+    ) -> list[MatchResult]:
+        """Score every entity and alias one pair at a time.
+
+        This is the reference engine; the vectorized engine must return
+        identical results. Only the best max_results hits are kept, in a
+        bounded heap. Once it is full, the score a name must reach to enter
+        (the k-th best plus one, less this entity's country boost) is
+        passed to RapidFuzz as score_cutoff, so most comparisons stop
+        early, and MatchResult objects are built only for the kept hits.
+
+        Args:
+            entity_name_clean: Stripped entity name.
+            country: Optional country code/name for country-aware scoring.
+            max_results: Maximum number of results to return.
+
+        Returns:
+            List of MatchResult objects sorted by score (descending).
+        """
+        if max_results <= 0:
+            return []
+
+        # Min-heap of the best hits so far; its root is the weakest kept hit
+        # (lowest score, latest in scan order), the one a new hit must beat
+        top: list[_ScanHit] = []
+        query_key = self.normalizer(entity_name_clean)
+        # Normalized names in corpus order, which is this scan's order
+        name_keys = self.name_keys
+        country_code = normalize_country_code(country) if country else None
+        boost = settings.country_match_boost
+        position = 0
+        corpus_scores = None
+        if self.scorer != "ratio":
+            # The ensemble and IDF scorers select candidates across the corpus
+            corpus_scores = self._score_names(
+                [query_key],
+                None,
+                score_cutoff=max(0, self.min_score - (boost if country else 0)),
+                workers=1,
+            )[0]
+
+        # Match against primary names of every loaded list
+        for record in self.entities.records:
+            # Resolve the country once per entity; aliases share it
+            country_match = bool(country) and self._record_country_match(
+                country or "", country_code, record
+            )
+            record_boost = boost if country_match else 0
+
+            # Primary name first, then the entity's aliases
+            for alias_name in (None, *self._aliases(record)):
+                position += 1
+                # Once full, a hit must beat the k-th best (ties keep scan order)
+                threshold = self.min_score
+                if len(top) == max_results:
+                    threshold = max(threshold, top[0][0] + 1)
+                    if threshold > 100:
+                        # Every kept hit scored 100; nothing later can enter
+                        return self._scan_results(top)
+
+                # Raw scores that cannot reach the threshold stop early as 0
+                if corpus_scores is not None:
+                    raw_score = float(corpus_scores[position - 1])
+                else:
+                    raw_score = fuzz.ratio(
+                        query_key,
+                        name_keys[position - 1],
+                        score_cutoff=max(0, threshold - record_boost),
+                    )
+                score = min(100, int(raw_score) + record_boost)
+                if score < threshold:
+                    continue
+
+                hit = (
+                    score,
+                    -position,
+                    record,
+                    alias_name,
+                    raw_score == 100,
+                    country_match,
+                )
+                if len(top) < max_results:
+                    heapq.heappush(top, hit)
+                else:
+                    heapq.heapreplace(top, hit)
+
+        return self._scan_results(top)
+
+    def _scan_results(self, top: list[_ScanHit]) -> list[MatchResult]:
+        """Build MatchResult objects for the kept scan hits, best first.
+
+        Args:
+            top: Heap of kept hits.
+
+        Returns:
+            List of MatchResult objects sorted by score (descending), ties
+            in scan order.
+        """
+        results: list[MatchResult] = []
+        for score, _, record, alias_name, is_exact, country_match in sorted(
+            top, reverse=True
+        ):
+            if alias_name is not None:
+                match_type = MatchType.ALIAS
+            else:
+                match_type = MatchType.EXACT if is_exact else MatchType.FUZZY
+            results.append(
+                self._build_match_result(
+                    record, score, match_type, country_match, alias_name=alias_name
+                )
+            )
+        return results
+
+    def _match_vectorized(
+        self, entity_name_clean: str, country: str | None, max_results: int
+    ) -> list[MatchResult]:
+        """Score one query against the whole name corpus in one batched call.
+
+        Args:
+            entity_name_clean: Stripped entity name.
+            country: Optional country code/name for country-aware scoring.
+            max_results: Maximum number of results to return.
+
+        Returns:
+            List of MatchResult objects sorted by score (descending).
+        """
+        return self._match_vectorized_many(
+            [entity_name_clean], [country], max_results, workers=1
+        )[0]
+
+    def match_many(
+        self,
+        entity_names: Sequence[str],
+        countries: Sequence[str | None] | None = None,
+        max_results: int = 10,
+    ) -> list[list[MatchResult]]:
+        """Match many entity names against OFAC SDN entries at once.
+
+        With the vectorized engine the whole input column is scored against
+        the name corpus as a matrix using all cores, in chunks of
+        settings.batch_size rows to bound memory. Results are identical
+        to calling match() for each name. Names already in the result
+        cache are not rescored.
+
+        Args:
+            entity_names: Names of the entities to match.
+            countries: Optional country per name, aligned with entity_names.
+            max_results: Maximum number of results per name. Defaults to 10.
+
+        Returns:
+            One list of MatchResult objects per input name, in input order.
+            Blank names get an empty list.
+
+        Raises:
+            ValueError: If countries is not aligned with entity_names.
+
+        Example:
+            results = matcher.match_many(["ACME Corp", "Banco"], ["US", None])
+        """
+        if countries is None:
+            countries = [None] * len(entity_names)
+        if len(countries) != len(entity_names):
+            raise ValueError("countries must have the same length as entity_names")
+
+        if self.engine != "vectorized":
+            return [
+                self.match(name, country, max_results)
+                for name, country in zip(entity_names, countries, strict=True)
+            ]
+
+        results: list[list[MatchResult]] = [[] for _ in entity_names]
+        positions = [
+            pos for pos, name in enumerate(entity_names) if name and name.strip()
+        ]
+        keys: dict[int, CacheKey] = {}
+        if self.cache is not None:
+            pending: list[int] = []
+            for pos in positions:
+                keys[pos] = self._cache_key(
+                    entity_names[pos].strip(), countries[pos], max_results
+                )
+                cached = self.cache.get(keys[pos])
+                if cached is None:
+                    pending.append(pos)
+                else:
+                    results[pos] = cached
+            positions = pending
+
+        if self.stop_at_exact_nok:
+            pending = []
+            for pos in positions:
+                matches = self._exact_matches(
+                    entity_names[pos].strip(), countries[pos], max_results
+                )
+                if not matches:
+                    pending.append(pos)
+                    continue
+                results[pos] = matches
+                if self.cache is not None:
+                    self.cache.put(keys[pos], matches)
+            positions = pending
 
-            # Calculate base match score
-            score = fuzz.token_sort_ratio(entity_name_clean, sdn_name)
-
-            # Check for exact match
-            match_type = MatchType.EXACT if score == 100 else MatchType.FUZZY
-
-            # Apply country boost if provided and countries match
-            country_match = False
-            if country:
-                ent_num = int(row.get("ent_num", 0))
-                ofac_countries = self.data.addresses_by_ent.get(ent_num, [])
-                country_match = self._check_country_match(country, ofac_countries)
-                if country_match:
-                    score = min(100, score + settings.country_match_boost)
-
-            # Only include matches above minimum threshold
-            if score >= self.min_score:
-                ent_num = int(row.get("ent_num", 0))
-                sdn_type = str(row.get("sdn_type", "")) or "Unknown"
-                countries = self.data.addresses_by_ent.get(ent_num, [])
-                country = countries[0] if countries else None
-
-                match_result = MatchResult(
-                    sdn_name=sdn_name,
-                    sdn_type=sdn_type,
-                    match_score=int(score),
-                    match_type=match_type,
-                    ofac_list=OFACList.SDN,
-                    programs=self._parse_programs(row.get("programs")),
-                    ent_num=ent_num,
-                    country=country,
-                    country_match=country_match,
-                    remarks=str(row.get("remarks", "")) or None,
+        chunk_size = settings.batch_size
+        for start in range(0, len(positions), chunk_size):
+            chunk = positions[start : start + chunk_size]
+            chunk_results = self._match_vectorized_many(
+                [entity_names[pos].strip() for pos in chunk],
+                [countries[pos] for pos in chunk],
+                max_results,
+                workers=-1,
+            )
+            for pos, matches in zip(chunk, chunk_results, strict=True):
+                results[pos] = matches
+                if self.cache is not None:
+                    self.cache.put(keys[pos], matches)
+        return results
+
+    def _match_vectorized_many(
+        self,
+        queries: list[str],
+        countries: list[str | None],
+        max_results: int,
+        workers: int,
+    ) -> list[list[MatchResult]]:
+        """Score queries against the name corpus as one matrix.
+
+        RapidFuzz scores every query against every primary name and alias
+        in a single cdist call; entries below the cutoff are zeroed without
+        being fully computed. Country boost, threshold and top-k selection
+        then run as array operations, and MatchResult objects are only
+        built for the returned hits.
+
+        Args:
+            queries: Stripped, non-empty entity names.
+            countries: Country per query (None for no country).
+            max_results: Maximum number of results per query.
+            workers: RapidFuzz worker threads (-1 for all cores).
+
+        Returns:
+            One list of MatchResult objects per query.
+        """
+        corpus = self.corpus
+        if len(corpus) == 0 or max_results <= 0:
+            return [[] for _ in queries]
+
+        boost = settings.country_match_boost
+        has_country = any(countries)
+        country_masks: dict[str, np.ndarray | None] = {}
+        row_masks: list[np.ndarray | None] = []
+        for country in countries:
+            if country and country not in country_masks:
+                country_masks[country] = self._country_mask(country)
+            row_masks.append(country_masks[country] if country else None)
+
+        raw_scores, scored = self._score_corpus(
+            queries,
+            self.normalizer.normalize_many(queries),
+            score_cutoff=max(0, self.min_score - (boost if has_country else 0)),
+            workers=workers,
+            boosts=[
+                np.where(mask, boost, 0) if mask is not None else None
+                for mask in row_masks
+            ],
+            max_results=max_results,
+        )
+
+        # Truncate like int(score) in the scan engine, then apply boost
+        scores = raw_scores.astype(np.int64)
+        for row, mask in enumerate(row_masks):
+            if mask is not None:
+                scores[row] = np.where(
+                    mask, np.minimum(100, scores[row] + boost), scores[row]
                 )
-                matches.append((int(score), match_result))
-
-            # Also match against aliases for this entity
-            ent_num = int(row.get("ent_num", 0))
-            aliases = self.data.aliases_by_ent.get(ent_num, [])
-            for alias_name in aliases:
-                alias_score = fuzz.token_sort_ratio(entity_name_clean, alias_name)
-
-                # Apply country boost if provided and countries match
-                alias_country_match = False
-                if country:
-                    ofac_countries = self.data.addresses_by_ent.get(ent_num, [])
-                    alias_country_match = self._check_country_match(
-                        country, ofac_countries
+
+        eligible = scores >= self.min_score
+        if scored is not None:
+            eligible &= scored
+        top_rows = _top_k_rows(scores, eligible, max_results)
+
+        entities = self.entities
+        results: list[list[MatchResult]] = []
+        for row, top in enumerate(top_rows):
+            row_results: list[MatchResult] = []
+            country_mask = row_masks[row]
+            for idx in top.tolist():
+                is_alias = corpus.kinds[idx] == NAME_KIND_ALIAS
+                if is_alias:
+                    match_type = MatchType.ALIAS
+                else:
+                    match_type = (
+                        MatchType.EXACT
+                        if raw_scores[row, idx] == 100
+                        else MatchType.FUZZY
                     )
-                    if alias_country_match:
-                        alias_score = min(
-                            100, alias_score + settings.country_match_boost
-                        )
-
-                if alias_score >= self.min_score:
-                    ent_num = int(row.get("ent_num", 0))
-                    sdn_type = str(row.get("sdn_type", "")) or "Unknown"
-                    countries = self.data.addresses_by_ent.get(ent_num, [])
-                    country = countries[0] if countries else None
-
-                    match_result = MatchResult(
-                        sdn_name=sdn_name,  # Keep original SDN name
-                        sdn_type=sdn_type,
-                        match_score=int(alias_score),
-                        match_type=MatchType.ALIAS,
-                        ofac_list=OFACList.SDN,
-                        programs=self._parse_programs(row.get("programs")),
-                        ent_num=ent_num,
-                        country=country,
-                        country_match=alias_country_match,
-                        remarks=f"Matched alias: {alias_name}",
+                row_results.append(
+                    self._build_match_result(
+                        entities[int(corpus.entities[idx])],
+                        int(scores[row, idx]),
+                        match_type,
+                        bool(country_mask[idx]) if country_mask is not None else False,
+                        alias_name=corpus.names[idx] if is_alias else None,
                     )
-                    matches.append((int(alias_score), match_result))
+                )
+            results.append(row_results)
+        return results
+
+    def _score_corpus(
+        self,
+        queries: list[str],
+        query_keys: list[str],
+        score_cutoff: float,
+        workers: int,
+        boosts: list[np.ndarray | None],
+        max_results: int,
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """Compute raw scores of normalized names against the corpus.
+
+        With a candidate index, each query is scored only against its
+        candidates; queries the index cannot narrow safely fall back to
+        the full corpus. The ensemble scorer ignores the index. Exact
+        phonetic-key hits are added to the candidates, so transliterated
+        spellings are scored even when they share too few trigrams with
+        the query.
+
+        Full-corpus queries are scored by length bucket with the ratio
+        scorer (see _score_buckets), else against every name in one cdist
+        call.
+
+        Args:
+            queries: Stripped, non-empty entity names (for the index).
+            query_keys: Normalized form of each query (for scoring).
+            score_cutoff: Raw scores below this are returned as 0.
+            workers: RapidFuzz worker threads (-1 for all cores).
+            boosts: Country boost of every corpus entry per query, or None
+                for queries without a country match.
+            max_results: Results kept per query (for bucket pruning).
+
+        Returns:
+            Tuple of (raw score matrix, scored mask). The mask marks the
+            entries that were actually scored, or is None if all were.
+        """
+        corpus = self.corpus
+        # The ensemble prunes the whole corpus by score bounds; capping it
+        # by trigram overlap would drop subset-name hits
+        index = self.data.candidate_index if self.ensemble is None else None
+        bucketed = self.scorer == "ratio"
+        if index is None:
+            if bucketed:
+                return self._score_buckets(
+                    query_keys, score_cutoff, workers, boosts, max_results
+                )
+            raw_scores = self._score_names(query_keys, None, score_cutoff, workers)
+            return raw_scores, None
+
+        raw_scores = np.zeros((len(queries), len(corpus)), dtype=np.float64)
+        scored = np.zeros((len(queries), len(corpus)), dtype=bool)
+        full_rows: list[int] = []
+        phonetic_index = self.data.phonetic_index
+        for row, query in enumerate(queries):
+            positions = index.candidates(query) if index is not None else None
+            if positions is None:
+                full_rows.append(row)
+                continue
+            if phonetic_index is not None:
+                positions = np.union1d(positions, phonetic_index.lookup(query))
+            raw_scores[row, positions] = self._score_names(
+                [query_keys[row]], positions, score_cutoff, workers=1
+            )[0]
+            scored[row, positions] = True
+
+        if bucketed and full_rows:
+            full_scores, full_scored = self._score_buckets(
+                [query_keys[row] for row in full_rows],
+                score_cutoff,
+                workers,
+                [boosts[row] for row in full_rows],
+                max_results,
+            )
+            raw_scores[full_rows] = full_scores
+            scored[full_rows] = True if full_scored is None else full_scored
+        elif full_rows:
+            raw_scores[full_rows] = self._score_names(
+                [query_keys[row] for row in full_rows], None, score_cutoff, workers
+            )
+            scored[full_rows] = True
+        return raw_scores, scored
+
+    def _score_buckets(
+        self,
+        query_keys: list[str],
+        score_cutoff: float,
+        workers: int,
+        boosts: list[np.ndarray | None],
+        max_results: int,
+    ) -> tuple[np.ndarray, np.ndarray | None]:
+        """Score queries against the corpus, skipping hopeless length buckets.
+
+        Names in buckets whose upper bound plus the largest country boost
+        is below min_score are never scored. A single query also skips the
+        buckets that cannot reach its k-th best score (see
+        _score_bucket_window). A batch is scored in one call over the union
+        of its queries' windows, since RapidFuzz already rejects pairs of
+        very different lengths cheaply and the call cost is shared by
+        every row.
+
+        Scores are computed in the length order of LengthBuckets, where
+        every window is a contiguous slice, and moved back to corpus order.
+
+        Args:
+            query_keys: Normalized queries.
+            score_cutoff: Raw scores below this are returned as 0.
+            workers: RapidFuzz worker threads (-1 for all cores).
+            boosts: Country boost of every corpus entry per query, or None.
+            max_results: Results kept per query.
+
+        Returns:
+            Tuple of (raw score matrix, scored mask), in corpus order. The
+            mask is None if every entry was scored.
+        """
+        buckets = self.length_buckets
+        size = len(buckets.order)
+        boost_max = max(
+            (int(boost.max()) for boost in boosts if boost is not None and boost.size),
+            default=0,
+        )
+        min_raw = self.min_score - boost_max
+        raw_scores = np.zeros((len(query_keys), size), dtype=np.float64)
+        scored = np.zeros(raw_scores.shape, dtype=bool)
+
+        if len(query_keys) == 1:
+            self._score_bucket_window(
+                query_keys[0],
+                score_cutoff,
+                workers,
+                boosts[0],
+                boost_max,
+                max_results,
+                raw_scores[0],
+                scored[0],
+            )
+            return raw_scores[:, buckets.ranks], scored[:, buckets.ranks]
+
+        windows = [
+            window
+            for window in (
+                buckets.window(buckets.bounds(length), min_raw)
+                for length in {len(query_key) for query_key in query_keys}
+            )
+            if window[0] < window[1]
+        ]
+        if not windows:
+            return raw_scores, scored
+        start = min(window[0] for window in windows)
+        stop = max(window[1] for window in windows)
+        if (start, stop) == (0, size):
+            return self._score_names(query_keys, None, score_cutoff, workers), None
 
-        # Sort by score descending and return top N
-        matches.sort(key=lambda x: x[0], reverse=True)
-        return [match for _, match in matches[:max_results]]
+        raw_scores[:, start:stop] = process.cdist(
+            query_keys,
+            buckets.names[start:stop],
+            scorer=fuzz.ratio,
+            score_cutoff=score_cutoff,
+            dtype=np.float64,
+            workers=workers,
+        )
+        scored[:, start:stop] = True
+        return raw_scores[:, buckets.ranks], scored[:, buckets.ranks]
+
+    def _score_bucket_window(
+        self,
+        query_key: str,
+        score_cutoff: float,
+        workers: int,
+        boost: np.ndarray | None,
+        boost_max: int,
+        max_results: int,
+        raw_row: np.ndarray,
+        scored_row: np.ndarray,
+    ) -> None:
+        """Score one query by length bucket, best upper bound first.
+
+        The best-bound buckets, about _BUCKET_GROUP_SIZE names, are scored
+        first. The rest of the min_score window is then narrowed to the
+        buckets whose bound plus boost_max reaches the k-th best score so
+        far, since no other name could enter, or tie into, the top k.
+
+        When the exact index holds at least max_results hits for the query,
+        the k-th best is known to be 100 before scoring anything, and only
+        the buckets that can still reach 100 with boost_max are scored.
+
+        Args:
+            query_key: Normalized query.
+            score_cutoff: Raw scores below this are returned as 0.
+            workers: RapidFuzz worker threads (-1 for all cores).
+            boost: Country boost of every corpus entry, or None.
+            boost_max: Largest country boost.
+            max_results: Results kept for the query.
+            raw_row: Raw score row, in bucket order, to fill in.
+            scored_row: Scored mask row, in bucket order, to fill in.
+        """
+        buckets = self.length_buckets
+        bounds = buckets.bounds(len(query_key))
+        min_raw = self.min_score - boost_max
+
+        def score_slice(start: int, stop: int) -> None:
+            raw_row[start:stop] = process.cdist(
+                [query_key],
+                buckets.names[start:stop],
+                scorer=fuzz.ratio,
+                score_cutoff=score_cutoff,
+                dtype=np.float64,
+                workers=workers,
+            )[0]
+            scored_row[start:stop] = True
+
+        if len(self.exact_index.lookup_key(query_key)) >= max_results:
+            start, stop = buckets.window(bounds, max(min_raw, 100 - boost_max))
+            if start < stop:
+                score_slice(start, stop)
+            return
+
+        outer = buckets.window(bounds, min_raw)
+        inner = buckets.window(
+            bounds, max(min_raw, buckets.bound_for_size(bounds, _BUCKET_GROUP_SIZE))
+        )
+        if inner[0] == inner[1]:
+            return
+        score_slice(*inner)
+        if inner == outer:
+            return
+
+        # k-th best final score so far, as _match_vectorized_many computes it
+        final = raw_row[inner[0] : inner[1]].astype(np.int64)
+        if boost is not None:
+            final = np.minimum(100, final + boost[buckets.order[inner[0] : inner[1]]])
+        final = final[final >= self.min_score]
+        kth_best = -1
+        if final.size >= max_results:
+            kth_best = int(np.partition(final, -max_results)[-max_results])
+
+        start, stop = buckets.window(bounds, max(min_raw, kth_best - boost_max))
+        if start < inner[0]:
+            score_slice(start, inner[0])
+        if inner[1] < stop:
+            score_slice(inner[1], stop)
+
+    def _score_names(
+        self,
+        query_keys: list[str],
+        positions: np.ndarray | None,
+        score_cutoff: float,
+        workers: int,
+    ) -> np.ndarray:
+        """Score normalized queries against normalized corpus names.
+
+        Args:
+            query_keys: Normalized queries.
+            positions: Corpus positions to score, or None for the full corpus.
+            score_cutoff: Raw scores below this are returned as 0.
+            workers: RapidFuzz worker threads (-1 for all cores).
+
+        Returns:
+            Float score matrix (queries x positions).
+        """
+        if self.idf is not None:
+            return self.idf.score_matrix(
+                query_keys, self.token_stats, positions, score_cutoff, workers=workers
+            )
+        names: Sequence[str] = self.name_keys
+        if positions is not None:
+            names = [names[pos] for pos in positions.tolist()]
+        if self.ensemble is not None:
+            return self.ensemble.score_matrix(
+                query_keys, names, score_cutoff, workers=workers
+            )
+        return process.cdist(
+            query_keys,
+            names,
+            scorer=fuzz.ratio,
+            score_cutoff=score_cutoff,
+            dtype=np.float64,
+            workers=workers,
+        )
+
+    def _country_mask(self, country: str | None) -> np.ndarray | None:
+        """Resolve country matches for every corpus entry.
+
+        The input country is normalized to an ISO code once, tested against
+        every entity's country bitmask in one vectorized operation, then
+        broadcast to all of that entity's names.
+
+        Args:
+            country: Entity country (name or ISO code), or None.
+
+        Returns:
+            Boolean array aligned with the corpus, or None if no country.
+        """
+        if not country:
+            return None
+        cached = self._country_masks.get(country)
+        if cached is not None:
+            return cached
+        entities = self.entities
+        country_code = normalize_country_code(country)
+        if country_code is None:
+            # Free-text country: compare against every entity's strings
+            entity_mask = np.fromiter(
+                (
+                    self._check_country_match(country, list(record.countries))
+                    for record in entities.records
+                ),
+                dtype=bool,
+                count=len(entities),
+            )
+        else:
+            entity_mask = entities.country_mask(country_code)
+            for position in entities.unresolved_positions.tolist():
+                if not entity_mask[position]:
+                    entity_mask[position] = self._check_country_match(
+                        country, list(entities[position].unresolved_countries)
+                    )
+        mask: np.ndarray = entity_mask[self.corpus.entities]
+        # Shared by every query for this country, so keep it read-only
+        mask.setflags(write=False)
+        with self._lock:
+            if len(self._country_masks) < _COUNTRY_MASK_CACHE_SIZE:
+                self._country_masks[country] = mask
+        return mask
+
+    def _record_country_match(
+        self, country: str, country_code: str | None, record: EntityRecord
+    ) -> bool:
+        """Check one entity's countries, using the same rules as _country_mask.
+
+        Args:
+            country: Entity country as given.
+            country_code: ISO code for the entity country, or None.
+            record: OFAC entity to check.
+
+        Returns:
+            True if countries match, False otherwise.
+        """
+        if country_code is None:
+            return self._check_country_match(country, list(record.countries))
+        if country_code in record.country_codes:
+            return True
+        return self._check_country_match(country, list(record.unresolved_countries))
+
+    def _build_match_result(
+        self,
+        record: EntityRecord,
+        score: int,
+        match_type: MatchType,
+        country_match: bool,
+        alias_name: str | None = None,
+    ) -> MatchResult:
+        """Build a MatchResult from an entity record.
+
+        Args:
+            record: Entity the matched name belongs to.
+            score: Final match score (after country boost).
+            match_type: Type of match found.
+            country_match: Whether the entity country matched.
+            alias_name: Matched alias, if the hit was on an alias.
+
+        Returns:
+            Populated MatchResult.
+        """
+        if alias_name is not None:
+            remarks: str | None = f"Matched alias: {alias_name}"
+        else:
+            remarks = record.remarks
+
+        return MatchResult(
+            sdn_name=record.sdn_name,  # Keep original SDN name
+            sdn_type=record.sdn_type,
+            match_score=score,
+            match_type=match_type,
+            ofac_list=record.ofac_list,
+            programs=list(record.programs),
+            ent_num=record.ent_num,
+            country=record.country,
+            country_match=country_match,
+            remarks=remarks,
+        )
 
     def _check_country_match(
         self, entity_country: str, ofac_countries: list[str]
     ) -> bool:
-        """Check if entity country matches any OFAC entry country.
+        """Check if entity country matches any OFAC entry country by name.
 
         Performs case-insensitive matching and handles country name variations.
         Also checks if country codes match (e.g., "SY" matches "Syria").
+        Only used for countries that have no ISO code; resolved countries
+        are compared through the entity table's ISO bitmasks.
 
         Args:
             entity_country: Entity's country (name or ISO code).
@@ -227,19 +1197,6 @@ class EntityMatcher:
 
         return False
 
-    def _parse_programs(self, programs: str | None) -> list[str]:
-        """Parse programs string into list.
-
-        Args:
-            programs: Programs string (e.g., "SDGT; IRAN; CUBA").
-
-        Returns:
-            List of program codes.
-        """
-        if not programs or programs == "-0-":
-            return []
-        return [p.strip() for p in str(programs).split(";") if p.strip()]
-
     def match_entity(
         self,
         entity_name: str,
@@ -261,4 +1218,4 @@ class EntityMatcher:
         return self.match(entity_name, country, max_results)
 
 
-__all__ = ["EntityMatcher"]
+__all__ = ["EntityMatcher", "MatcherEngine", "MatchScorer", "CacheKey"]
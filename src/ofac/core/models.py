@@ -13,7 +13,7 @@ Usage:
 """
 
 from datetime import UTC, datetime
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Annotated
 from uuid import uuid4
 
@@ -57,6 +57,21 @@ class OFACList(str, Enum):
     CONSOLIDATED = "CONSOLIDATED"
 
 
+class JobStatus(StrEnum):
+    """Lifecycle state of an asynchronous batch screening job.
+
+    QUEUED: Submitted, waiting for a job worker
+    RUNNING: Being screened
+    COMPLETED: All rows screened; results are complete
+    FAILED: Stopped with an error (see the job's error)
+    """
+
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    COMPLETED = "COMPLETED"
+    FAILED = "FAILED"
+
+
 # Type alias for score validation
 Score = Annotated[int, Field(ge=0, le=100)]
 
@@ -239,14 +254,121 @@ class BatchScreeningResponse(BaseModel):
     )
 
 
+class BatchScreeningSummary(BaseModel):
+    """Trailing summary record of a streamed batch screening.
+
+    Attributes:
+        screening_id: Identifier shared by every result of the batch
+        total_screened: Total number of entities screened
+        ok_count: Number of OK results
+        review_count: Number of REVIEW results
+        nok_count: Number of NOK results
+        ofac_version: OFAC data version used
+        processing_time_ms: Processing time in milliseconds
+    """
+
+    screening_id: str = Field(..., description="Batch screening identifier")
+    total_screened: int = Field(..., ge=0, description="Total entities screened")
+    ok_count: int = Field(default=0, ge=0, description="OK count")
+    review_count: int = Field(default=0, ge=0, description="REVIEW count")
+    nok_count: int = Field(default=0, ge=0, description="NOK count")
+    ofac_version: str = Field(default="", description="OFAC data version")
+    processing_time_ms: int = Field(
+        default=0,
+        ge=0,
+        description="Processing time in milliseconds",
+    )
+
+
+class ScreeningJob(BaseModel):
+    """State and progress of an asynchronous batch screening job.
+
+    Attributes:
+        job_id: Job identifier (also the screening_id of its results)
+        status: Lifecycle state
+        filename: Name of the uploaded file
+        rows_total: Entities to screen (0 until the file is parsed)
+        rows_done: Entities screened so far
+        ok_count: Number of OK results so far
+        review_count: Number of REVIEW results so far
+        nok_count: Number of NOK results so far
+        ofac_version: OFAC data version used
+        error: Error code and message if the job failed
+        created_at: Submission timestamp (UTC)
+        started_at: Timestamp screening started (UTC)
+        finished_at: Timestamp the job completed or failed (UTC)
+        eta_seconds: Estimated seconds until completion, from the rate so far
+    """
+
+    job_id: str = Field(..., description="Job identifier")
+    status: JobStatus = Field(..., description="Job lifecycle state")
+    filename: str = Field(default="", description="Uploaded file name")
+    rows_total: int = Field(default=0, ge=0, description="Entities to screen")
+    rows_done: int = Field(default=0, ge=0, description="Entities screened so far")
+    ok_count: int = Field(default=0, ge=0, description="OK count")
+    review_count: int = Field(default=0, ge=0, description="REVIEW count")
+    nok_count: int = Field(default=0, ge=0, description="NOK count")
+    ofac_version: str = Field(default="", description="OFAC data version")
+    error: dict[str, str] | None = Field(
+        default=None, description="Error code and message if the job failed"
+    )
+    created_at: datetime = Field(..., description="Submission timestamp (UTC)")
+    started_at: datetime | None = Field(
+        default=None, description="Screening start timestamp (UTC)"
+    )
+    finished_at: datetime | None = Field(
+        default=None, description="Completion or failure timestamp (UTC)"
+    )
+    eta_seconds: float | None = Field(
+        default=None, ge=0, description="Estimated seconds until completion"
+    )
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+    )
+
+
+class ScreeningJobResults(BaseModel):
+    """One page of results of a batch screening job, in input order.
+
+    Attributes:
+        job_id: Job identifier
+        status: Job lifecycle state when the page was read
+        offset: Position of the first result in the page
+        limit: Maximum results requested
+        rows_done: Results available so far
+        results: Screening results of the page
+        next_offset: Offset of the next page, or None if no more results
+            are available yet
+    """
+
+    job_id: str = Field(..., description="Job identifier")
+    status: JobStatus = Field(..., description="Job lifecycle state")
+    offset: int = Field(..., ge=0, description="Position of the first result")
+    limit: int = Field(..., ge=1, description="Maximum results requested")
+    rows_done: int = Field(..., ge=0, description="Results available so far")
+    results: list[ScreeningResult] = Field(..., description="Screening results")
+    next_offset: int | None = Field(
+        default=None, description="Offset of the next page, if any"
+    )
+
+    model_config = ConfigDict(
+        populate_by_name=True,
+    )
+
+
 __all__ = [
     "MatchStatus",
     "MatchType",
     "OFACList",
+    "JobStatus",
     "EntityInput",
     "MatchResult",
     "ScreeningResult",
     "BatchScreeningRequest",
     "BatchScreeningResponse",
+    "BatchScreeningSummary",
+    "ScreeningJob",
+    "ScreeningJobResults",
 ]
 
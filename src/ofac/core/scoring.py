@@ -0,0 +1,246 @@
+"""Weighted multi-scorer ensemble for fuzzy name matching.
+
+This module provides the EnsembleScorer class for:
+- Running the weighted scorers cheapest first (Jaro-Winkler, ratio,
+  token_set_ratio, partial_ratio, WRatio)
+- Pruning names whose best possible combined score misses the cutoff
+  before each costlier scorer runs
+- Combining the scores with configurable weights
+
+token_set_ratio and partial_ratio catch subset names ("AL-NUSRA" vs
+"AL-NUSRA FRONT FOR THE PEOPLE OF THE LEVANT") but cost tens of times more
+than ratio or Jaro-Winkler per comparison, and on their own they score any
+short name contained in a longer one at 100. The ensemble blends them
+with ratio and Jaro-Winkler. There is no fixed similarity gate: a name
+is only dropped once its score so far, with every remaining scorer at
+100, cannot reach the score cutoff. Subset names, which score low on
+Jaro-Winkler and ratio, therefore keep every score they can reach, and
+pruning only gets cheaper as the cutoff rises. The one exception is the
+ensemble_max_candidates memory guard, which logs a warning whenever it
+truncates.
+
+WRatio is available with weight 0 by default: it combines ratio,
+partial and token scorers internally, so with the default weights it
+would mostly double-count them at the highest cost per comparison.
+
+Usage:
+    from ofac.core.scoring import EnsembleScorer
+
+    ensemble = EnsembleScorer({"token_set": 0.5, "ratio": 0.5})
+    scores = ensemble.score_matrix(["AL-NUSRA"], corpus_keys, score_cutoff=0)
+"""
+
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any
+
+import numpy as np
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import JaroWinkler
+
+from ofac.core.config import settings
+from ofac.core.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+# Scorer name -> (RapidFuzz scorer, factor to the 0-100 scale), cheapest first
+SCORERS: dict[str, tuple[Callable[..., float], float]] = {
+    "jaro_winkler": (JaroWinkler.normalized_similarity, 100.0),
+    "ratio": (fuzz.ratio, 1.0),
+    "token_set": (fuzz.token_set_ratio, 1.0),
+    "partial": (fuzz.partial_ratio, 1.0),
+    "wratio": (fuzz.WRatio, 1.0),
+}
+
+# Scorers cheap enough to run on every name; the memory guard only caps
+# the names passed to the others
+_CHEAP_SCORERS = frozenset({"jaro_winkler", "ratio"})
+
+
+class EnsembleScorer:
+    """Weighted combination of fuzzy scorers with bound-based pruning.
+
+    Combined scores are the weighted mean of the enabled scorers on the
+    0-100 scale, rounded to 6 decimals so that perfect matches score
+    exactly 100. Names whose combined score cannot reach the cutoff may
+    score 0.
+
+    Attributes:
+        weights: Weight per enabled scorer name
+        max_candidates: Memory guard on the names each costly scorer
+            (token_set, partial, wratio) rescores per query
+    """
+
+    def __init__(
+        self,
+        weights: Mapping[str, float] | None = None,
+        max_candidates: int | None = None,
+    ) -> None:
+        """Initialize the ensemble.
+
+        Args:
+            weights: Weight per scorer name in SCORERS. Defaults to
+                settings.ensemble_weights.
+            max_candidates: Memory guard on names per costly scorer and
+                query. Defaults to settings.ensemble_max_candidates.
+
+        Raises:
+            ConfigurationError: If a scorer is unknown, a weight is negative,
+                or no scorer has a positive weight.
+        """
+        source = weights if weights is not None else settings.ensemble_weights
+        weights = {str(name): float(weight) for name, weight in source.items()}
+        unknown = weights.keys() - SCORERS.keys()
+        if unknown:
+            raise ConfigurationError(
+                f"Unknown ensemble scorers: {', '.join(sorted(unknown))}",
+                details={"available": list(SCORERS)},
+            )
+        if any(weight < 0 for weight in weights.values()):
+            raise ConfigurationError("Ensemble weights must not be negative")
+        if sum(weights.values()) <= 0:
+            raise ConfigurationError("At least one ensemble weight must be positive")
+
+        self.weights = {name: weights[name] for name in SCORERS if weights.get(name)}
+        self.max_candidates = (
+            max_candidates
+            if max_candidates is not None
+            else settings.ensemble_max_candidates
+        )
+        self._total_weight = sum(self.weights.values())
+
+    @property
+    def key(self) -> tuple[Any, ...]:
+        """Hashable description of the configuration, for cache keys."""
+        return ("ensemble", tuple(self.weights.items()), self.max_candidates)
+
+    def score_matrix(
+        self,
+        queries: Sequence[str],
+        names: Sequence[str],
+        score_cutoff: float,
+        workers: int = 1,
+    ) -> np.ndarray:
+        """Score queries against names with the ensemble.
+
+        Args:
+            queries: Normalized query names.
+            names: Normalized corpus names.
+            score_cutoff: Combined scores below this may be returned as 0.
+            workers: RapidFuzz worker threads for the Jaro-Winkler pass.
+
+        Returns:
+            Float matrix (queries x names) of combined scores, 0 for names
+            pruned because they could not reach score_cutoff.
+        """
+        scores = np.zeros((len(queries), len(names)), dtype=np.float64)
+        if not len(queries) or not len(names):
+            return scores
+
+        jaro_winkler: np.ndarray | None = None
+        jw_weight = self.weights.get("jaro_winkler", 0.0)
+        if jw_weight:
+            # Lowest Jaro-Winkler score at which every other scorer at 100
+            # still lifts the combined score to the cutoff
+            jw_floor = max(
+                0.0,
+                (
+                    score_cutoff * self._total_weight
+                    - (self._total_weight - jw_weight) * 100.0
+                )
+                / jw_weight,
+            )
+            scorer, scale = SCORERS["jaro_winkler"]
+            jaro_winkler = (
+                process.cdist(
+                    queries,
+                    names,
+                    scorer=scorer,
+                    score_cutoff=min(jw_floor / scale, 1.0),
+                    dtype=np.float64,
+                    workers=workers,
+                )
+                * scale
+            )
+        all_names = np.arange(len(names))
+        for row, query in enumerate(queries):
+            if jaro_winkler is None:
+                candidates, jw_row = all_names, None
+            else:
+                candidates = np.flatnonzero(jaro_winkler[row] >= jw_floor)
+                jw_row = jaro_winkler[row, candidates]
+            if candidates.size:
+                scores[row, candidates] = self._rescore(
+                    query, names, candidates, jw_row, score_cutoff
+                )
+        return scores
+
+    def _rescore(
+        self,
+        query: str,
+        names: Sequence[str],
+        candidates: np.ndarray,
+        jaro_winkler: np.ndarray | None,
+        score_cutoff: float,
+    ) -> np.ndarray:
+        """Combine every weighted scorer for one query's candidates.
+
+        Scorers run cheapest first. Before each one, candidates whose
+        combined score can no longer reach score_cutoff, even if every
+        remaining scorer returned 100, are dropped (their score stays 0).
+        Before a costly scorer, at most max_candidates names are kept: the
+        best scores so far, ties included, with a warning when names that
+        could still reach the cutoff are dropped.
+        """
+        combined = np.zeros(candidates.size, dtype=np.float64)
+        alive = np.arange(candidates.size)
+        remaining = self._total_weight
+        for name, weight in self.weights.items():
+            if name == "jaro_winkler" and jaro_winkler is not None:
+                part = jaro_winkler[alive]
+            else:
+                bound = combined[alive] + remaining * 100.0
+                alive = alive[bound >= score_cutoff * self._total_weight]
+                if not alive.size:
+                    break
+                if name not in _CHEAP_SCORERS and alive.size > self.max_candidates:
+                    alive = self._guard(alive, combined[alive], name)
+                positions = candidates[alive]
+                # Candidates are sorted and unique: all of them means all names
+                choices = (
+                    names
+                    if positions.size == len(names)
+                    else [names[idx] for idx in positions.tolist()]
+                )
+                scorer, scale = SCORERS[name]
+                part = (
+                    process.cdist([query], choices, scorer=scorer, dtype=np.float64)[0]
+                    * scale
+                )
+            combined[alive] += weight * part
+            remaining -= weight
+
+        result = np.zeros(candidates.size, dtype=np.float64)
+        result[alive] = np.round(combined[alive] / self._total_weight, 6)
+        return result
+
+    def _guard(self, alive: np.ndarray, partial: np.ndarray, name: str) -> np.ndarray:
+        """Keep the max_candidates best partial scores (ties included)."""
+        logger.warning(
+            "Ensemble candidates for %s truncated from %d to about %d names; "
+            "raise ensemble_max_candidates to keep them all",
+            name,
+            alive.size,
+            self.max_candidates,
+        )
+        kth = alive.size - self.max_candidates
+        kth_best = np.partition(partial, kth)[kth]
+        kept: np.ndarray = alive[partial >= kth_best]
+        return kept
+
+    def __repr__(self) -> str:
+        """Return the ensemble with its weights."""
+        return f"EnsembleScorer({self.weights!r})"
+
+
+__all__ = ["EnsembleScorer", "SCORERS"]
@@ -1,12 +1,27 @@
 """OFAC data management layer.
 
 This module contains:
-- loader: CSV triplet parsing and DataFrame construction
+- loader: CSV triplet parsing (SDN and Consolidated) and DataFrame construction
+- entities: Per-entity matching metadata table
+- corpus: Flat name corpus for batched matching (optionally memory-mapped)
+- index: Trigram candidate index for narrowing fuzzy scoring
+- phonetic: Phonetic name keys and their index (transliterated variants)
+- exact: Hash index of normalized names for exact-hit detection
+- snapshot: Arrow snapshot of parsed data for fast cold start
+- delta: Change sets and incremental patching for data refreshes
+- holder: Versioned holder publishing data and its shared matcher
 - updater: Download, version tracking, and atomic swap
 - schemas: OFAC data schemas (SDN, Address, Alias)
 """
 
-from ofac.data.loader import OFACData, OFACDataLoader
+from ofac.data.corpus import MappedNames, NameCorpus, build_name_corpus
+from ofac.data.delta import OFACChangeSet
+from ofac.data.entities import EntityRecord, EntityTable, build_entity_table
+from ofac.data.exact import ExactIndex
+from ofac.data.holder import OFACDataHolder
+from ofac.data.index import CandidateIndex
+from ofac.data.loader import OFACData, OFACDataLoader, OFACListData
+from ofac.data.phonetic import PhoneticIndex, phonetic_key
 from ofac.data.schemas import (
     ADD_CSV_COLUMNS,
     ALT_CSV_COLUMNS,
@@ -18,12 +33,35 @@ from ofac.data.schemas import (
     SDNEntry,
     SDNType,
 )
+from ofac.data.snapshot import OFACSnapshot, read_snapshot, write_snapshot
 from ofac.data.updater import OFACUpdater
 
 __all__ = [
     # Loader
     "OFACDataLoader",
     "OFACData",
+    "OFACListData",
+    # Delta
+    "OFACChangeSet",
+    # Holder
+    "OFACDataHolder",
+    # Entities
+    "EntityRecord",
+    "EntityTable",
+    "build_entity_table",
+    # Corpus
+    "MappedNames",
+    "NameCorpus",
+    "build_name_corpus",
+    # Index
+    "CandidateIndex",
+    "ExactIndex",
+    "PhoneticIndex",
+    "phonetic_key",
+    # Snapshot
+    "OFACSnapshot",
+    "read_snapshot",
+    "write_snapshot",
     # Updater
     "OFACUpdater",
     # Schemas
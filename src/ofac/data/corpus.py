@@ -0,0 +1,302 @@
+"""Precompiled name corpus for batched fuzzy matching.
+
+This module provides the NameCorpus class for:
+- Flattening SDN and Consolidated primary names and aliases into one list
+- Parallel arrays mapping each corpus entry back to its entity
+- Recording whether an entry is a primary name or an alias
+- Names backed by a memory-mapped UTF-8 buffer (MappedNames)
+
+The corpus is built once at load time so the matcher can score a query
+against every name with a single RapidFuzz ``process`` call. A corpus read
+from a data snapshot keeps its arrays memory-mapped, so uvicorn workers
+share the same read-only pages for the name bytes and id arrays.
+Pickling such a corpus (for example to send it to batch worker
+processes) passes file references, and the receiving process maps the
+same files instead of copying them.
+
+This does not make per-worker memory small: each process still decodes
+the names into Python strings (MappedNames.decoded), and the matcher
+builds its own normalized names, keys and length buckets from them, so
+every worker holds O(corpus) private memory on top of the shared pages.
+
+Usage:
+    from ofac.data.corpus import build_name_corpus
+
+    corpus = build_name_corpus(data.entities, data.aliases_by_ent)
+    print(f"{len(corpus)} names for {corpus.entity_count} entities")
+"""
+
+import mmap
+from collections.abc import Iterator, Sequence
+from typing import Any, overload
+
+import numpy as np
+
+from ofac.core.models import OFACList
+from ofac.data.entities import EntityTable
+
+# Name kind codes stored in NameCorpus.kinds
+NAME_KIND_PRIMARY = 0
+NAME_KIND_ALIAS = 1
+
+
+# Pickled form of an array: ("mmap", filename, dtype, offset, shape) or ("array", array)
+_ArrayState = tuple[Any, ...]
+
+
+def _array_state(array: np.ndarray) -> _ArrayState:
+    """Describe an array for pickling, by file reference when memory-mapped.
+
+    Only safe for files that never change once written, such as the
+    versioned snapshot files (see ofac.data.snapshot).
+    """
+    # Only whole mappings: slices of a memmap share its (stale) offset
+    if (
+        isinstance(array, np.memmap)
+        and isinstance(array.base, mmap.mmap)
+        and array.filename
+    ):
+        return ("mmap", array.filename, array.dtype.str, array.offset, array.shape)
+    return ("array", np.asarray(array))
+
+
+def _array_from_state(state: _ArrayState) -> np.ndarray:
+    """Rebuild an array described by _array_state."""
+    if state[0] == "mmap":
+        _, filename, dtype, offset, shape = state
+        return np.memmap(filename, dtype=dtype, mode="r", offset=offset, shape=shape)
+    array: np.ndarray = state[1]
+    return array
+
+
+def _restore_names(data: _ArrayState, offsets: _ArrayState) -> "MappedNames":
+    """Unpickle MappedNames."""
+    return MappedNames(_array_from_state(data), _array_from_state(offsets))
+
+
+def _restore_corpus(
+    names: Sequence[str],
+    ent_nums: _ArrayState,
+    kinds: _ArrayState,
+    entities: _ArrayState,
+) -> "NameCorpus":
+    """Unpickle NameCorpus."""
+    return NameCorpus(
+        names,
+        _array_from_state(ent_nums),
+        _array_from_state(kinds),
+        _array_from_state(entities),
+    )
+
+
+class MappedNames(Sequence[str]):
+    """Read-only sequence of names stored as one UTF-8 buffer plus offsets.
+
+    Single names are decoded on access. Iterating decodes the whole buffer
+    once per process and keeps the list, because RapidFuzz scores Python
+    strings and decoding on every query would slow matching down. That
+    list is private to the process and several times larger than the
+    shared buffer.
+
+    Attributes:
+        data: UTF-8 bytes of all names back to back (uint8, usually mmapped)
+        offsets: Byte offset of each name, plus the end offset (int64)
+    """
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray) -> None:
+        """Initialize from a name buffer and its offsets.
+
+        Args:
+            data: Concatenated UTF-8 name bytes.
+            offsets: len(names) + 1 byte offsets into data.
+        """
+        self.data = data
+        self.offsets = offsets
+        self._decoded: list[str] | None = None
+
+    def __len__(self) -> int:
+        """Return the number of names."""
+        return len(self.offsets) - 1
+
+    @overload
+    def __getitem__(self, position: int) -> str: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> list[str]: ...
+
+    def __getitem__(self, position: int | slice) -> str | list[str]:
+        """Return the name at a position, or a list of names for a slice."""
+        if self._decoded is not None:
+            return self._decoded[position]
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        if position < 0:
+            position += len(self)
+        if not 0 <= position < len(self):
+            raise IndexError("name position out of range")
+        start, end = int(self.offsets[position]), int(self.offsets[position + 1])
+        return bytes(self.data[start:end]).decode("utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over all names, decoding the buffer on first use."""
+        return iter(self.decoded())
+
+    def decoded(self) -> list[str]:
+        """Decode every name once and cache the list.
+
+        Returns:
+            All names as Python strings.
+        """
+        if self._decoded is None:
+            buffer = bytes(self.data)
+            bounds = self.offsets.tolist()
+            self._decoded = [
+                buffer[start:end].decode("utf-8")
+                for start, end in zip(bounds[:-1], bounds[1:], strict=True)
+            ]
+        return self._decoded
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the buffers by file reference when memory-mapped."""
+        return (_restore_names, (_array_state(self.data), _array_state(self.offsets)))
+
+    @classmethod
+    def encode(cls, names: Sequence[str]) -> "MappedNames":
+        """Pack names into a UTF-8 buffer with offsets.
+
+        Args:
+            names: Names to pack.
+
+        Returns:
+            MappedNames over in-memory arrays.
+        """
+        encoded = [name.encode("utf-8") for name in names]
+        offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        lengths = np.fromiter(
+            (len(item) for item in encoded), dtype=np.int64, count=len(encoded)
+        )
+        np.cumsum(lengths, out=offsets[1:])
+        data = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        return cls(data, offsets)
+
+
+class NameCorpus:
+    """Flat corpus of OFAC primary names and aliases.
+
+    Entries are ordered by entity (SDN row order), with each primary name
+    followed by that entity's aliases. This is the same order the scan
+    engine visits names, so ties sort identically in both engines.
+
+    Attributes:
+        names: Primary names and aliases, one string per entry (a list, or
+            MappedNames when read from a snapshot)
+        ent_nums: OFAC entity number for each entry (int64)
+        kinds: NAME_KIND_PRIMARY or NAME_KIND_ALIAS for each entry (int8)
+        entities: Position in the EntityTable for each entry (int64)
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        ent_nums: np.ndarray,
+        kinds: np.ndarray,
+        entities: np.ndarray,
+    ) -> None:
+        """Initialize the corpus from prebuilt parallel arrays.
+
+        Args:
+            names: Corpus strings.
+            ent_nums: Entity number per entry.
+            kinds: Name kind code per entry.
+            entities: EntityTable position per entry.
+        """
+        self.names = names
+        self.ent_nums = ent_nums
+        self.kinds = kinds
+        self.entities = entities
+
+    def __len__(self) -> int:
+        """Return the number of names in the corpus."""
+        return len(self.names)
+
+    @property
+    def entity_count(self) -> int:
+        """Number of distinct entities represented in the corpus."""
+        return int(np.unique(self.ent_nums).size)
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the id arrays by file reference when memory-mapped."""
+        return (
+            _restore_corpus,
+            (
+                self.names,
+                _array_state(self.ent_nums),
+                _array_state(self.kinds),
+                _array_state(self.entities),
+            ),
+        )
+
+
+def build_name_corpus(
+    entities: EntityTable,
+    aliases_by_ent: dict[int, list[str]],
+    consolidated_aliases_by_ent: dict[int, list[str]] | None = None,
+) -> NameCorpus:
+    """Build a NameCorpus from entity records and their aliases.
+
+    SDN and Consolidated entity numbers are separate sequences, so each
+    record takes its aliases from the lookup of its own list.
+
+    Args:
+        entities: EntityTable with one record per matchable row.
+        aliases_by_ent: Dict mapping SDN ent_num to list of alias names.
+        consolidated_aliases_by_ent: Same for Consolidated entities.
+
+    Returns:
+        NameCorpus with one entry per primary name and alias.
+    """
+    names: list[str] = []
+    ent_nums: list[int] = []
+    kinds: list[int] = []
+    positions: list[int] = []
+
+    consolidated_aliases = consolidated_aliases_by_ent or {}
+    for position, record in enumerate(entities.records):
+        list_aliases = (
+            consolidated_aliases
+            if record.ofac_list is OFACList.CONSOLIDATED
+            else aliases_by_ent
+        )
+        names.append(record.sdn_name)
+        ent_nums.append(record.ent_num)
+        kinds.append(NAME_KIND_PRIMARY)
+        positions.append(position)
+
+        for alias_name in list_aliases.get(record.ent_num, []):
+            names.append(alias_name)
+            ent_nums.append(record.ent_num)
+            kinds.append(NAME_KIND_ALIAS)
+            positions.append(position)
+
+    return _from_lists(names, ent_nums, kinds, positions)
+
+
+def _from_lists(
+    names: list[str], ent_nums: list[int], kinds: list[int], positions: list[int]
+) -> NameCorpus:
+    """Convert accumulated Python lists into a NameCorpus."""
+    return NameCorpus(
+        names=names,
+        ent_nums=np.asarray(ent_nums, dtype=np.int64),
+        kinds=np.asarray(kinds, dtype=np.int8),
+        entities=np.asarray(positions, dtype=np.int64),
+    )
+
+
+__all__ = [
+    "MappedNames",
+    "NameCorpus",
+    "build_name_corpus",
+    "NAME_KIND_PRIMARY",
+    "NAME_KIND_ALIAS",
+]
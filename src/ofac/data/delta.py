@@ -0,0 +1,340 @@
+"""Incremental refresh of loaded OFAC data.
+
+This module provides delta helpers for:
+- Diffing newly parsed OFAC files against the loaded data by ent_num,
+  alt_num and add_num
+- A change set of added, modified and removed entities per list
+- Patching the entity table and name corpus, reusing every unchanged entry
+
+Daily OFAC updates usually touch a handful of entities, so a refresh only
+builds records and corpus entries for those. The patched table and corpus
+have exactly the layout a full load of the new files would produce.
+
+Usage:
+    from ofac.data.delta import diff_lists, patch_corpus, patch_entities
+
+    changes = diff_lists(old_lists, new_lists)
+    entities, sources = patch_entities(old.entities, new_lists, changes)
+    corpus, old_to_new = patch_corpus(old.corpus, entities, sources, aliases)
+"""
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from ofac.core.models import OFACList
+from ofac.data.corpus import NAME_KIND_ALIAS, NAME_KIND_PRIMARY, NameCorpus
+from ofac.data.entities import (
+    EntityRecord,
+    EntityTable,
+    build_entity_table,
+    matchable_rows,
+)
+
+if TYPE_CHECKING:
+    from ofac.data.loader import OFACListData
+
+# (list, ent_num): entity numbers are only unique within one OFAC list
+EntityKey = tuple[OFACList, int]
+
+
+class OFACChangeSet(NamedTuple):
+    """Entities added, modified or removed by a data refresh.
+
+    Keys are sorted by list, then entity number.
+
+    Attributes:
+        added: Entities only present in the new data
+        modified: Entities whose primary, alias or address rows changed
+        removed: Entities no longer listed
+    """
+
+    added: tuple[EntityKey, ...] = ()
+    modified: tuple[EntityKey, ...] = ()
+    removed: tuple[EntityKey, ...] = ()
+
+    @property
+    def is_empty(self) -> bool:
+        """Whether the refresh changed nothing."""
+        return not (self.added or self.modified or self.removed)
+
+    @property
+    def changed(self) -> frozenset[EntityKey]:
+        """All added, modified and removed entities."""
+        return frozenset(self.added + self.modified + self.removed)
+
+    def summary(self) -> dict[str, int]:
+        """Count changes for reporting.
+
+        Returns:
+            Dictionary with added, modified and removed counts.
+        """
+        return {
+            "added": len(self.added),
+            "modified": len(self.modified),
+            "removed": len(self.removed),
+        }
+
+
+def _ent_nums(df: pd.DataFrame) -> set[int]:
+    """Distinct non-null entity numbers of a frame."""
+    if "ent_num" not in df.columns:
+        return set()
+    return set(df["ent_num"].dropna().astype("int64").tolist())
+
+
+def _changed_rows(old_df: pd.DataFrame, new_df: pd.DataFrame) -> set[int]:
+    """Entity numbers with rows that differ between two frames.
+
+    Rows are compared by content hash (which covers alt_num/add_num), as
+    multisets per entity, so added, removed and edited rows all count.
+    """
+
+    def row_counts(df: pd.DataFrame) -> pd.Series:
+        rows = df[df["ent_num"].notna()] if "ent_num" in df.columns else df.iloc[0:0]
+        hashes = pd.DataFrame(
+            {
+                "ent_num": rows["ent_num"].astype("int64").to_numpy()
+                if "ent_num" in rows.columns
+                else np.empty(0, dtype=np.int64),
+                "row": pd.util.hash_pandas_object(rows, index=False).to_numpy(),
+            }
+        )
+        return hashes.value_counts()
+
+    difference = row_counts(old_df).sub(row_counts(new_df), fill_value=0)
+    changed = difference[difference != 0].index.get_level_values("ent_num")
+    return set(changed.tolist())
+
+
+def _changed_lookup(
+    old: Mapping[int, list[str]], new: Mapping[int, list[str]]
+) -> set[int]:
+    """Entity numbers whose lookup values differ."""
+    return {
+        ent_num
+        for ent_num in old.keys() | new.keys()
+        if old.get(ent_num, []) != new.get(ent_num, [])
+    }
+
+
+def _changed_details(
+    old_df: pd.DataFrame,
+    new_df: pd.DataFrame,
+    old_lookup: Mapping[int, list[str]],
+    new_lookup: Mapping[int, list[str]],
+    key_column: str,
+) -> set[int]:
+    """Entities with changed ALT/ADD rows, or changed lookups for compact frames."""
+    if key_column in old_df.columns and key_column in new_df.columns:
+        return _changed_rows(old_df, new_df)
+    # Compact frames (settings.keep_raw_frames off) only keep the lookups
+    return _changed_lookup(old_lookup, new_lookup)
+
+
+def diff_list(
+    old: "OFACListData | None", new: "OFACListData | None"
+) -> tuple[set[int], set[int], set[int]]:
+    """Diff one OFAC list by ent_num, alt_num and add_num.
+
+    Args:
+        old: Currently loaded list, or None if it was not loaded.
+        new: Newly parsed list, or None if it is no longer loaded.
+
+    Returns:
+        Tuple of (added, modified, removed) entity numbers.
+    """
+    old_ents = _ent_nums(old.prim_df) if old is not None else set()
+    new_ents = _ent_nums(new.prim_df) if new is not None else set()
+    if old is None or new is None:
+        return new_ents - old_ents, set(), old_ents - new_ents
+
+    changed = _changed_rows(old.prim_df, new.prim_df)
+    changed |= _changed_details(
+        old.alt_df, new.alt_df, old.aliases_by_ent, new.aliases_by_ent, "alt_num"
+    )
+    changed |= _changed_details(
+        old.add_df, new.add_df, old.addresses_by_ent, new.addresses_by_ent, "add_num"
+    )
+    return new_ents - old_ents, changed & old_ents & new_ents, old_ents - new_ents
+
+
+def diff_lists(
+    old_lists: Mapping[OFACList, "OFACListData | None"],
+    new_lists: Mapping[OFACList, "OFACListData | None"],
+) -> OFACChangeSet:
+    """Diff every OFAC list into one change set.
+
+    Args:
+        old_lists: Currently loaded data per list.
+        new_lists: Newly parsed data per list.
+
+    Returns:
+        OFACChangeSet covering all lists.
+    """
+    added: list[EntityKey] = []
+    modified: list[EntityKey] = []
+    removed: list[EntityKey] = []
+    for ofac_list in OFACList:
+        list_added, list_modified, list_removed = diff_list(
+            old_lists.get(ofac_list), new_lists.get(ofac_list)
+        )
+        added.extend((ofac_list, ent_num) for ent_num in sorted(list_added))
+        modified.extend((ofac_list, ent_num) for ent_num in sorted(list_modified))
+        removed.extend((ofac_list, ent_num) for ent_num in sorted(list_removed))
+    return OFACChangeSet(tuple(added), tuple(modified), tuple(removed))
+
+
+def _occurrence(ent_nums: np.ndarray) -> np.ndarray:
+    """Number each row by how many earlier rows share its entity number."""
+    return pd.Series(ent_nums).groupby(ent_nums).cumcount().to_numpy()
+
+
+def patch_entities(
+    old: EntityTable,
+    new_lists: Mapping[OFACList, "OFACListData | None"],
+    changes: OFACChangeSet,
+) -> tuple[EntityTable, np.ndarray]:
+    """Build the entity table for new data, reusing unchanged records.
+
+    Records are laid out exactly as build_entities() would lay them out;
+    only added and modified entities are built from their rows.
+
+    Args:
+        old: Entity table of the currently loaded data.
+        new_lists: Newly parsed data per list, in table order.
+        changes: Change set from diff_lists().
+
+    Returns:
+        Tuple of (new EntityTable, old position of each new record or -1).
+    """
+    changed = changes.changed
+    old_lists = np.asarray([record.ofac_list.value for record in old.records])
+    old_ent_nums = np.fromiter(
+        (record.ent_num for record in old.records), dtype=np.int64, count=len(old)
+    )
+
+    records: list[EntityRecord] = []
+    sources: list[np.ndarray] = []
+    for ofac_list, data in new_lists.items():
+        if data is None or "ent_num" not in data.prim_df.columns:
+            continue
+        prim_df = data.prim_df[matchable_rows(data.prim_df)]
+        ent_nums = prim_df["ent_num"].to_numpy(dtype=np.int64)
+
+        # Pair the nth row of an entity with its nth old record of this list
+        old_positions = np.flatnonzero(old_lists == ofac_list.value)
+        old_keys = pd.MultiIndex.from_arrays(
+            [old_ent_nums[old_positions], _occurrence(old_ent_nums[old_positions])]
+        )
+        matched = old_keys.get_indexer(
+            pd.MultiIndex.from_arrays([ent_nums, _occurrence(ent_nums)])
+        )
+        changed_ents = [ent for lst, ent in changed if lst is ofac_list]
+        rebuild = (matched < 0) | np.isin(ent_nums, changed_ents)
+        list_sources = np.full(len(ent_nums), -1, dtype=np.int64)
+        list_sources[~rebuild] = old_positions[matched[~rebuild]]
+
+        fresh = iter(
+            build_entity_table(
+                prim_df[rebuild], data.addresses_by_ent, ofac_list
+            ).records
+        )
+        records.extend(
+            next(fresh) if source < 0 else old.records[source]
+            for source in list_sources.tolist()
+        )
+        sources.append(list_sources)
+
+    return EntityTable(records), (
+        np.concatenate(sources) if sources else np.empty(0, dtype=np.int64)
+    )
+
+
+def patch_corpus(
+    old: NameCorpus,
+    entities: EntityTable,
+    sources: np.ndarray,
+    aliases_by_list: Mapping[OFACList, Mapping[int, list[str]]],
+) -> tuple[NameCorpus, np.ndarray]:
+    """Build the name corpus for a patched entity table.
+
+    Entries of reused entities are copied from the old corpus with array
+    operations; only new and modified entities are expanded into names.
+
+    Args:
+        old: Name corpus of the currently loaded data.
+        entities: Entity table from patch_entities().
+        sources: Old position of each entity, or -1, from patch_entities().
+        aliases_by_list: Alias lookup per list of the new data.
+
+    Returns:
+        Tuple of (new NameCorpus, new position of each old entry or -1).
+    """
+    old_entity_count = int(old.entities.max()) + 1 if len(old) else 0
+    old_counts = np.bincount(old.entities, minlength=old_entity_count)
+    old_starts = np.concatenate(([0], np.cumsum(old_counts)[:-1])).astype(np.int64)
+
+    fresh_names: dict[int, list[str]] = {}
+    counts = np.zeros(len(entities), dtype=np.int64)
+    for position, source in enumerate(sources.tolist()):
+        if source >= 0:
+            counts[position] = old_counts[source]
+        else:
+            record = entities[position]
+            names = [record.sdn_name]
+            names.extend(
+                aliases_by_list.get(record.ofac_list, {}).get(record.ent_num, [])
+            )
+            fresh_names[position] = names
+            counts[position] = len(names)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+    total = int(counts.sum())
+
+    # Map every old entry of a reused entity to its new position
+    new_of_old_entity = np.full(old_entity_count, -1, dtype=np.int64)
+    reused_positions = np.flatnonzero(sources >= 0)
+    new_of_old_entity[sources[reused_positions]] = reused_positions
+    old_entities = np.asarray(old.entities, dtype=np.int64)
+    new_entities_of_old = new_of_old_entity[old_entities]
+    keep = new_entities_of_old >= 0
+    old_to_new = np.full(len(old), -1, dtype=np.int64)
+    old_to_new[keep] = starts[new_entities_of_old[keep]] + (
+        np.flatnonzero(keep) - old_starts[old_entities[keep]]
+    )
+
+    names_out = np.empty(total, dtype=object)
+    ent_nums = np.empty(total, dtype=np.int64)
+    kinds = np.empty(total, dtype=np.int8)
+    positions = np.repeat(np.arange(len(entities), dtype=np.int64), counts)
+
+    kept_old = np.flatnonzero(keep)
+    kept_new = old_to_new[kept_old]
+    old_names = np.asarray(list(old.names), dtype=object)
+    names_out[kept_new] = old_names[kept_old]
+    ent_nums[kept_new] = np.asarray(old.ent_nums)[kept_old]
+    kinds[kept_new] = np.asarray(old.kinds)[kept_old]
+
+    for position, names in fresh_names.items():
+        start = int(starts[position])
+        names_out[start : start + len(names)] = names
+        ent_nums[start : start + len(names)] = entities[position].ent_num
+        kinds[start] = NAME_KIND_PRIMARY
+        kinds[start + 1 : start + len(names)] = NAME_KIND_ALIAS
+
+    corpus = NameCorpus(
+        names=names_out.tolist(), ent_nums=ent_nums, kinds=kinds, entities=positions
+    )
+    return corpus, old_to_new
+
+
+__all__ = [
+    "EntityKey",
+    "OFACChangeSet",
+    "diff_list",
+    "diff_lists",
+    "patch_corpus",
+    "patch_entities",
+]
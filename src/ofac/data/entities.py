@@ -0,0 +1,290 @@
+"""Precomputed per-entity metadata for the matching hot path.
+
+This module provides the EntityTable class for:
+- One compact record per SDN or Consolidated entity, built once at load time
+- The OFAC list each entity comes from
+- Parsed programs, normalized type and remarks
+- Primary country, all address countries and their ISO codes
+- ISO country codes packed as a bitmask per entity
+
+The matcher reads entity metadata from this table instead of touching
+pandas rows or the address lookup for every candidate.
+
+Usage:
+    from ofac.data.entities import build_entity_table
+
+    entities = build_entity_table(data.sdn_df, data.addresses_by_ent)
+    record = entities.get(306)
+    print(record.programs, record.country_codes)
+"""
+
+from typing import Any, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from ofac.core.countries import COUNTRY_NAMES, normalize_country_code
+from ofac.core.models import OFACList
+
+# Bit position of each ISO code in EntityTable.country_bits
+COUNTRY_BITS: dict[str, int] = {
+    code: bit for bit, code in enumerate(sorted(COUNTRY_NAMES))
+}
+_COUNTRY_WORDS = (len(COUNTRY_BITS) + 63) // 64
+
+
+class EntityRecord(NamedTuple):
+    """Matching metadata for one OFAC entity.
+
+    Attributes:
+        ent_num: OFAC entity number
+        sdn_name: Primary name
+        sdn_type: Entity type ("Unknown" when OFAC leaves it blank)
+        programs: Parsed sanctions programs
+        remarks: OFAC remarks, or None
+        country: First address country, or None
+        countries: All distinct address countries
+        country_codes: ISO 3166-1 alpha-2 codes of the address countries
+        unresolved_countries: Address countries with no ISO code
+        ofac_list: OFAC list the entity belongs to
+    """
+
+    ent_num: int
+    sdn_name: str
+    sdn_type: str
+    programs: tuple[str, ...]
+    remarks: str | None
+    country: str | None
+    countries: tuple[str, ...]
+    country_codes: frozenset[str]
+    unresolved_countries: tuple[str, ...] = ()
+    ofac_list: OFACList = OFACList.SDN
+
+
+class EntityTable:
+    """Entity records in SDN row order with an ent_num index.
+
+    Country codes are also packed into a bitmask per entity, so a country
+    check over every entity is a single vectorized bit test.
+
+    Attributes:
+        records: EntityRecord per matchable SDN row
+        positions: Dict mapping ent_num to its position in records
+        country_bits: uint64 bitmask matrix (entities x words), one bit per
+            ISO code as numbered in COUNTRY_BITS
+        unresolved_positions: Positions of entities with address countries
+            that have no ISO code
+    """
+
+    def __init__(self, records: list[EntityRecord]) -> None:
+        """Initialize the table, index records by ent_num and pack country bits.
+
+        Args:
+            records: Entity records in SDN row order.
+        """
+        self.records = records
+        self.positions: dict[int, int] = {}
+        self.country_bits = np.zeros((len(records), _COUNTRY_WORDS), dtype=np.uint64)
+        unresolved: list[int] = []
+        bit_positions: list[int] = []
+        bits: list[int] = []
+        for position, record in enumerate(records):
+            self.positions.setdefault(record.ent_num, position)
+            for code in record.country_codes:
+                bit_positions.append(position)
+                bits.append(COUNTRY_BITS[code])
+            if record.unresolved_countries:
+                unresolved.append(position)
+        bit_array = np.asarray(bits, dtype=np.uint64)
+        np.bitwise_or.at(
+            self.country_bits,
+            (
+                np.asarray(bit_positions, dtype=np.int64),
+                (bit_array // 64).astype(np.int64),
+            ),
+            np.left_shift(np.uint64(1), bit_array % np.uint64(64)),
+        )
+        self.unresolved_positions = np.asarray(unresolved, dtype=np.int64)
+
+    def __len__(self) -> int:
+        """Return the number of entity records."""
+        return len(self.records)
+
+    def __getitem__(self, position: int) -> EntityRecord:
+        """Return the record at a table position."""
+        return self.records[position]
+
+    def get(self, ent_num: int) -> EntityRecord | None:
+        """Look up an entity by OFAC entity number.
+
+        Args:
+            ent_num: OFAC entity number.
+
+        Returns:
+            EntityRecord, or None if the entity is unknown.
+        """
+        position = self.positions.get(ent_num)
+        return self.records[position] if position is not None else None
+
+    def country_mask(self, code: str) -> np.ndarray:
+        """Flag the entities with an address in a country.
+
+        Args:
+            code: ISO 3166-1 alpha-2 country code.
+
+        Returns:
+            Boolean array aligned with records. All False for unknown codes.
+        """
+        bit = COUNTRY_BITS.get(code)
+        if bit is None:
+            return np.zeros(len(self.records), dtype=bool)
+        word = self.country_bits[:, bit // 64]
+        mask: np.ndarray = (word & np.uint64(1 << (bit % 64))) != 0
+        return mask
+
+
+def parse_programs(programs: Any) -> tuple[str, ...]:
+    """Parse an OFAC programs field into a tuple of program codes.
+
+    Args:
+        programs: Programs string (e.g., "SDGT; IRAN; CUBA"), or NA.
+
+    Returns:
+        Tuple of program codes.
+    """
+    if programs is None or pd.isna(programs) or programs == "-0-":
+        return ()
+    return tuple(p.strip() for p in str(programs).split(";") if p.strip())
+
+
+def _optional_str(value: Any) -> str | None:
+    """Convert a DataFrame cell to a stripped string, or None if blank/NA."""
+    if value is None or pd.isna(value):
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def matchable_rows(sdn_df: pd.DataFrame) -> np.ndarray:
+    """Flag the primary rows that can be reported as a match.
+
+    Args:
+        sdn_df: DataFrame with SDN (or CONS_PRIM) entries.
+
+    Returns:
+        Boolean array aligned with the rows: True where the row has an
+        entity number and a non-empty primary name.
+    """
+    if "ent_num" not in sdn_df.columns or "sdn_name" not in sdn_df.columns:
+        return np.zeros(len(sdn_df), dtype=bool)
+    names = sdn_df["sdn_name"]
+    mask = sdn_df["ent_num"].notna() & names.notna()
+    mask &= names.fillna("").astype(str).str.len() > 0
+    return mask.to_numpy(dtype=bool)
+
+
+def build_entity_table(
+    sdn_df: pd.DataFrame,
+    addresses_by_ent: dict[int, list[str]],
+    ofac_list: OFACList = OFACList.SDN,
+) -> EntityTable:
+    """Build an EntityTable from SDN entries and address countries.
+
+    Rows without an entity number or a primary name are skipped, because
+    they cannot be reported as a match.
+
+    Args:
+        sdn_df: DataFrame with SDN entries (or CONS_PRIM entries, which
+            share the SDN layout).
+        addresses_by_ent: Dict mapping ent_num to list of countries.
+        ofac_list: OFAC list the entries belong to.
+
+    Returns:
+        EntityTable with one record per matchable SDN row.
+    """
+    return EntityTable(build_entity_records(sdn_df, addresses_by_ent, ofac_list))
+
+
+def build_entity_records(
+    sdn_df: pd.DataFrame,
+    addresses_by_ent: dict[int, list[str]],
+    ofac_list: OFACList = OFACList.SDN,
+) -> list[EntityRecord]:
+    """Build the entity records of some SDN rows, as build_entity_table().
+
+    The records of consecutive chunks of a file, concatenated, equal the
+    records of the whole file, so the loader can build them while parsing.
+
+    Args:
+        sdn_df: DataFrame with SDN (or CONS_PRIM) entries.
+        addresses_by_ent: Dict mapping ent_num to list of countries.
+        ofac_list: OFAC list the entries belong to.
+
+    Returns:
+        One EntityRecord per matchable row, in row order.
+    """
+    if "ent_num" not in sdn_df.columns or "sdn_name" not in sdn_df.columns:
+        return []
+    sdn_df = sdn_df[matchable_rows(sdn_df)]
+
+    def column(name: str) -> list[Any]:
+        if name in sdn_df.columns:
+            return list(sdn_df[name].tolist())
+        return [None] * len(sdn_df)
+
+    # Few distinct countries and program strings repeat across many rows
+    country_codes: dict[str, str | None] = {}
+    program_tuples: dict[str, tuple[str, ...]] = {}
+
+    records: list[EntityRecord] = []
+    for ent_num, sdn_name, sdn_type, programs, remarks in zip(
+        column("ent_num"),
+        column("sdn_name"),
+        column("sdn_type"),
+        column("programs"),
+        column("remarks"),
+        strict=True,
+    ):
+        ent_num_int = int(ent_num)
+        countries = tuple(addresses_by_ent.get(ent_num_int, []))
+        codes = []
+        for country in countries:
+            if country not in country_codes:
+                country_codes[country] = normalize_country_code(country)
+            codes.append(country_codes[country])
+        if isinstance(programs, str):
+            if programs not in program_tuples:
+                program_tuples[programs] = parse_programs(programs)
+            program_codes = program_tuples[programs]
+        else:
+            program_codes = parse_programs(programs)
+        records.append(
+            EntityRecord(
+                ent_num=ent_num_int,
+                sdn_name=str(sdn_name),
+                sdn_type=_optional_str(sdn_type) or "Unknown",
+                programs=program_codes,
+                remarks=_optional_str(remarks),
+                country=countries[0] if countries else None,
+                countries=countries,
+                country_codes=frozenset(code for code in codes if code),
+                unresolved_countries=tuple(
+                    country
+                    for country, code in zip(countries, codes, strict=True)
+                    if code is None
+                ),
+                ofac_list=ofac_list,
+            )
+        )
+    return records
+
+
+__all__ = [
+    "EntityRecord",
+    "EntityTable",
+    "build_entity_records",
+    "build_entity_table",
+    "matchable_rows",
+    "parse_programs",
+    "COUNTRY_BITS",
+]
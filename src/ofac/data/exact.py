@@ -0,0 +1,170 @@
+"""Exact-match hash index over normalized corpus names.
+
+This module provides the ExactIndex class for:
+- Mapping each normalized primary name and alias to its corpus positions
+- O(1) detection of queries whose normalized form equals a listed name
+- Patching the index after an incremental refresh instead of rebuilding it
+
+Names are keyed with the same NamePipeline the matcher applies before
+scoring, so a hit is a name whose normalized form equals the query's: it
+scores exactly 100 with every scorer and is an EXACT match (or a 100
+alias match). The entity number and name kind of each hit are read from
+the corpus arrays at the returned positions.
+
+Usage:
+    from ofac.data.exact import ExactIndex
+
+    index = ExactIndex.build(data.corpus)
+    positions = index.lookup("BANCO NACIONAL DE CUBA")
+    ent_nums = data.corpus.ent_nums[positions]
+    kinds = data.corpus.kinds[positions]
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from ofac.core.config import settings
+from ofac.core.normalize import NamePipeline
+from ofac.data.corpus import MappedNames, NameCorpus
+
+
+def _postings(keys: Sequence[str], positions: Sequence[int]) -> dict[str, list[int]]:
+    """Group corpus positions by non-empty name key."""
+    lists: dict[str, list[int]] = {}
+    for key, position in zip(keys, positions, strict=True):
+        if key:
+            lists.setdefault(key, []).append(position)
+    return lists
+
+
+class ExactIndex:
+    """Hash index from normalized name to corpus positions.
+
+    Attributes:
+        postings: Dict mapping normalized name to sorted int32 corpus positions
+        normalizer: NamePipeline the keys were normalized with
+        corpus_size: Number of entries in the indexed corpus
+    """
+
+    def __init__(
+        self,
+        postings: dict[str, np.ndarray],
+        normalizer: NamePipeline,
+        corpus_size: int,
+    ) -> None:
+        """Initialize the index from prebuilt postings.
+
+        Args:
+            postings: Dict mapping normalized name to corpus positions.
+            normalizer: NamePipeline the keys were normalized with.
+            corpus_size: Number of entries in the indexed corpus.
+        """
+        self.postings = postings
+        self.normalizer = normalizer
+        self.corpus_size = corpus_size
+
+    @classmethod
+    def build(
+        cls, corpus: NameCorpus, normalization: Sequence[str] | None = None
+    ) -> "ExactIndex":
+        """Normalize and key every name in a corpus.
+
+        Args:
+            corpus: NameCorpus to index.
+            normalization: Name normalization steps. Defaults to
+                settings.name_normalization.
+
+        Returns:
+            ExactIndex for the corpus.
+        """
+        normalizer = NamePipeline(
+            normalization if normalization is not None else settings.name_normalization
+        )
+        names = corpus.names
+        if isinstance(names, MappedNames):
+            names = names.decoded()
+        return cls.from_keys(normalizer.normalize_many(names), normalizer)
+
+    @classmethod
+    def from_keys(cls, keys: Sequence[str], normalizer: NamePipeline) -> "ExactIndex":
+        """Index names that are already normalized.
+
+        Args:
+            keys: Normalized corpus names, in corpus order.
+            normalizer: NamePipeline the names were normalized with.
+
+        Returns:
+            ExactIndex for the names.
+        """
+        postings = {
+            key: np.asarray(positions, dtype=np.int32)
+            for key, positions in _postings(keys, range(len(keys))).items()
+        }
+        return cls(postings, normalizer, len(keys))
+
+    def patched(self, corpus: NameCorpus, old_to_new: np.ndarray) -> "ExactIndex":
+        """Build the index of a patched corpus from this one.
+
+        Postings of entries carried over are renumbered; only entries new
+        to the corpus are normalized.
+
+        Args:
+            corpus: Patched NameCorpus.
+            old_to_new: New position of each entry of the indexed corpus, or
+                -1 if it was dropped (from delta.patch_corpus()).
+
+        Returns:
+            ExactIndex for the patched corpus.
+        """
+        mapping = old_to_new.astype(np.int32)
+        lists: dict[str, list[int]] = {}
+        for key, positions in self.postings.items():
+            mapped = mapping[positions]
+            kept = mapped[mapped >= 0].tolist()
+            if kept:
+                lists[key] = kept
+
+        fresh = np.ones(len(corpus), dtype=bool)
+        fresh[old_to_new[old_to_new >= 0]] = False
+        fresh_positions = np.flatnonzero(fresh).tolist()
+        fresh_keys = self.normalizer.normalize_many(
+            [corpus.names[position] for position in fresh_positions]
+        )
+        for key, added in _postings(fresh_keys, fresh_positions).items():
+            lists.setdefault(key, []).extend(added)
+
+        postings = {
+            key: np.sort(np.asarray(kept_positions, dtype=np.int32))
+            for key, kept_positions in lists.items()
+        }
+        return ExactIndex(postings, self.normalizer, len(corpus))
+
+    def __len__(self) -> int:
+        """Return the number of distinct normalized names."""
+        return len(self.postings)
+
+    def lookup(self, name: str) -> np.ndarray:
+        """Return the corpus positions whose normalized name equals a name's.
+
+        Args:
+            name: Entity name to look up.
+
+        Returns:
+            Sorted array of corpus positions (empty if none).
+        """
+        return self.lookup_key(self.normalizer(name.strip()))
+
+    def lookup_key(self, key: str) -> np.ndarray:
+        """Return the corpus positions of an already normalized name.
+
+        Args:
+            key: Name normalized with this index's normalizer.
+
+        Returns:
+            Sorted array of corpus positions (empty if none).
+        """
+        return self.postings.get(key, np.empty(0, dtype=np.int32))
+
+
+__all__ = ["ExactIndex"]
@@ -0,0 +1,216 @@
+"""Versioned holder for the OFAC data served by the API.
+
+This module provides the OFACDataHolder class for:
+- Publishing a new OFACData with a single reference swap
+- Building one shared matcher per published version
+- Reference-counted leases, so in-flight requests finish on the data
+  they started with
+- Releasing replaced datasets once their last lease ends
+- Serializing background builds without blocking readers
+
+A refresh builds the new dataset and its indexes outside the holder and
+only then publishes it, so requests never wait for a build and never see
+a half-built dataset.
+
+Usage:
+    from ofac.data.holder import OFACDataHolder
+
+    holder = OFACDataHolder(loader.load(), matcher_factory=EntityMatcher)
+    with holder.lease_matcher() as matcher:
+        results = matcher.match("BANCO NACIONAL")
+
+    with holder.building():
+        data, changes = loader.refresh()
+        holder.publish(data)
+"""
+
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from ofac.core.exceptions import OFACNotLoadedError
+
+if TYPE_CHECKING:
+    from ofac.core.matcher import EntityMatcher
+    from ofac.data.loader import OFACData
+
+# (version, data, matcher built for that data)
+_Published = tuple[int, "OFACData", "EntityMatcher | None"]
+
+
+class OFACDataHolder:
+    """Holds the published OFACData and counts who is still using older ones.
+
+    Attributes:
+        on_release: Optional callback run with (version, data) once a
+            replaced dataset has no leases left
+        matcher_factory: Optional callable building the matcher shared by
+            every request of a published dataset
+    """
+
+    def __init__(
+        self,
+        data: "OFACData | None" = None,
+        on_release: Callable[[int, "OFACData"], None] | None = None,
+        matcher_factory: Callable[["OFACData"], "EntityMatcher"] | None = None,
+    ) -> None:
+        """Initialize the holder, optionally publishing initial data.
+
+        Args:
+            data: Dataset to publish as version 1.
+            on_release: Callback for released datasets.
+            matcher_factory: Builds the shared matcher of each published dataset.
+        """
+        self.on_release = on_release
+        self.matcher_factory = matcher_factory
+        # Replaced as a whole so readers see one consistent version/data/matcher
+        self._published: _Published | None = None
+        self._leases: dict[int, int] = {}
+        self._retired: dict[int, OFACData] = {}
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        if data is not None:
+            self.publish(data)
+
+    @property
+    def current(self) -> "OFACData | None":
+        """The published dataset, or None if nothing was published."""
+        published = self._published
+        return published[1] if published is not None else None
+
+    @property
+    def matcher(self) -> "EntityMatcher | None":
+        """Shared matcher of the published dataset, or None."""
+        published = self._published
+        return published[2] if published is not None else None
+
+    @property
+    def version(self) -> int:
+        """Version number of the published dataset (0 before the first)."""
+        published = self._published
+        return published[0] if published is not None else 0
+
+    def publish(self, data: "OFACData") -> int:
+        """Make a dataset current with one reference swap.
+
+        Requests holding a lease on the previous dataset keep using it; it
+        is released when the last of them finishes. The dataset's matcher
+        is built before the swap, so no request pays for building it.
+
+        Args:
+            data: Fully built dataset (entities, corpus and indexes).
+
+        Returns:
+            Version number assigned to the dataset.
+        """
+        matcher = self.matcher_factory(data) if self.matcher_factory else None
+        released: _Published | None = None
+        with self._lock:
+            previous = self._published
+            version = previous[0] + 1 if previous is not None else 1
+            self._published = (version, data, matcher)
+            if previous is not None:
+                if self._leases.get(previous[0], 0):
+                    self._retired[previous[0]] = previous[1]
+                else:
+                    released = previous
+        if released is not None:
+            self._released(released[0], released[1])
+        return version
+
+    @contextmanager
+    def lease(self) -> Iterator["OFACData"]:
+        """Use the published dataset until the block exits.
+
+        Yields:
+            The dataset that was current when the lease was taken.
+
+        Raises:
+            OFACNotLoadedError: If no dataset has been published.
+        """
+        version, data, _ = self._acquire()
+        try:
+            yield data
+        finally:
+            self._return(version)
+
+    @contextmanager
+    def lease_matcher(self) -> Iterator["EntityMatcher"]:
+        """Use the shared matcher of the published dataset until the block exits.
+
+        The dataset behind the matcher is leased like with lease().
+
+        Yields:
+            The matcher built for the dataset current when the lease was taken.
+
+        Raises:
+            OFACNotLoadedError: If no dataset has been published.
+            RuntimeError: If the holder has no matcher_factory.
+        """
+        version, _, matcher = self._acquire()
+        try:
+            if matcher is None:
+                raise RuntimeError(
+                    "OFACDataHolder was created without a matcher_factory"
+                )
+            yield matcher
+        finally:
+            self._return(version)
+
+    @contextmanager
+    def building(self) -> Iterator[None]:
+        """Run one dataset build at a time.
+
+        Only concurrent builds wait on each other; leases and the published
+        dataset are unaffected while a build runs.
+
+        Yields:
+            None
+        """
+        with self._build_lock:
+            yield
+
+    def stats(self) -> dict[str, Any]:
+        """Get the published version and outstanding leases.
+
+        Returns:
+            Dictionary with version, leases (per version) and retired
+            (versions replaced but still leased).
+        """
+        with self._lock:
+            return {
+                "version": self._published[0] if self._published else 0,
+                "leases": dict(self._leases),
+                "retired": sorted(self._retired),
+            }
+
+    def _acquire(self) -> _Published:
+        """Take one lease on the published version."""
+        with self._lock:
+            published = self._published
+            if published is None:
+                raise OFACNotLoadedError("OFAC data has not been published yet")
+            self._leases[published[0]] = self._leases.get(published[0], 0) + 1
+        return published
+
+    def _return(self, version: int) -> None:
+        """End one lease, releasing a replaced dataset when it was the last."""
+        released: OFACData | None = None
+        with self._lock:
+            remaining = self._leases[version] - 1
+            if remaining:
+                self._leases[version] = remaining
+            else:
+                del self._leases[version]
+                released = self._retired.pop(version, None)
+        if released is not None:
+            self._released(version, released)
+
+    def _released(self, version: int, data: "OFACData") -> None:
+        """Notify the release callback about a dataset no longer in use."""
+        if self.on_release is not None:
+            self.on_release(version, data)
+
+
+__all__ = ["OFACDataHolder"]
@@ -0,0 +1,206 @@
+"""Candidate-generation index for narrowing fuzzy matching.
+
+This module provides the CandidateIndex class for:
+- Character-trigram inverted index over normalized corpus names
+- Ranking corpus entries by trigram overlap with a query
+- A recall guard that falls back to a full scan for weak candidate sets
+
+Usage:
+    from ofac.data.index import CandidateIndex
+
+    index = CandidateIndex.build(data.corpus)
+    positions = index.candidates("BANCO NACIONAL")  # None means full scan
+"""
+
+import re
+import unicodedata
+
+import numpy as np
+
+from ofac.core.config import settings
+from ofac.data.corpus import NameCorpus
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_index_text(name: str) -> list[str]:
+    """Normalize a name into lowercase ASCII tokens for indexing.
+
+    Args:
+        name: Raw entity or corpus name.
+
+    Returns:
+        List of tokens with accents and punctuation removed.
+    """
+    decomposed = unicodedata.normalize("NFKD", name.casefold())
+    ascii_text = decomposed.encode("ascii", "ignore").decode("ascii")
+    return _NON_ALNUM.sub(" ", ascii_text).split()
+
+
+def name_trigrams(name: str) -> set[str]:
+    """Extract space-padded character trigrams from each token of a name.
+
+    Tokens are indexed separately, so the trigram set does not depend on
+    word order, like token_sort_ratio.
+
+    Args:
+        name: Raw entity or corpus name.
+
+    Returns:
+        Set of trigrams.
+    """
+    trigrams: set[str] = set()
+    for token in normalize_index_text(name):
+        padded = f" {token} "
+        trigrams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return trigrams
+
+
+class CandidateIndex:
+    """Trigram inverted index over a NameCorpus.
+
+    Each trigram maps to the sorted corpus positions whose name contains
+    it. A query is narrowed to the entries sharing the most trigrams with
+    it, before any fuzzy scoring runs.
+
+    Attributes:
+        postings: Dict mapping trigram to int32 array of corpus positions
+        corpus_size: Number of entries in the indexed corpus
+        max_candidates: Maximum candidates returned per query
+        min_candidates: Recall guard; fewer candidates means full scan
+    """
+
+    def __init__(
+        self,
+        postings: dict[str, np.ndarray],
+        corpus_size: int,
+        max_candidates: int | None = None,
+        min_candidates: int | None = None,
+    ) -> None:
+        """Initialize the index from prebuilt postings.
+
+        Args:
+            postings: Dict mapping trigram to corpus positions.
+            corpus_size: Number of entries in the indexed corpus.
+            max_candidates: Candidate cap. Defaults to settings.candidate_max_count.
+            min_candidates: Recall guard. Defaults to settings.candidate_min_count.
+        """
+        self.postings = postings
+        self.corpus_size = corpus_size
+        self.max_candidates = (
+            max_candidates
+            if max_candidates is not None
+            else settings.candidate_max_count
+        )
+        self.min_candidates = (
+            min_candidates
+            if min_candidates is not None
+            else settings.candidate_min_count
+        )
+
+    @classmethod
+    def build(
+        cls,
+        corpus: NameCorpus,
+        max_candidates: int | None = None,
+        min_candidates: int | None = None,
+    ) -> "CandidateIndex":
+        """Build a trigram index over every name in a corpus.
+
+        Args:
+            corpus: NameCorpus to index.
+            max_candidates: Candidate cap. Defaults to settings.candidate_max_count.
+            min_candidates: Recall guard. Defaults to settings.candidate_min_count.
+
+        Returns:
+            CandidateIndex for the corpus.
+        """
+        lists: dict[str, list[int]] = {}
+        for position, name in enumerate(corpus.names):
+            for trigram in name_trigrams(name):
+                lists.setdefault(trigram, []).append(position)
+
+        postings = {
+            trigram: np.asarray(positions, dtype=np.int32)
+            for trigram, positions in lists.items()
+        }
+        return cls(postings, len(corpus), max_candidates, min_candidates)
+
+    def patched(self, corpus: NameCorpus, old_to_new: np.ndarray) -> "CandidateIndex":
+        """Build the index of a patched corpus from this one.
+
+        Postings of entries carried over are renumbered with array
+        operations; only entries new to the corpus are split into trigrams.
+
+        Args:
+            corpus: Patched NameCorpus.
+            old_to_new: New position of each entry of the indexed corpus, or
+                -1 if it was dropped (from delta.patch_corpus()).
+
+        Returns:
+            CandidateIndex for the patched corpus.
+        """
+        mapping = old_to_new.astype(np.int32)
+        postings: dict[str, np.ndarray] = {}
+        for trigram, positions in self.postings.items():
+            mapped = mapping[positions]
+            mapped = mapped[mapped >= 0]
+            if mapped.size:
+                postings[trigram] = mapped
+
+        fresh = np.ones(len(corpus), dtype=bool)
+        fresh[old_to_new[old_to_new >= 0]] = False
+        lists: dict[str, list[int]] = {}
+        for position in np.flatnonzero(fresh).tolist():
+            for trigram in name_trigrams(corpus.names[position]):
+                lists.setdefault(trigram, []).append(position)
+        for trigram, new_positions in lists.items():
+            postings[trigram] = np.concatenate(
+                (postings.get(trigram, np.empty(0, dtype=np.int32)), new_positions)
+            ).astype(np.int32)
+
+        # Reordered or appended entries leave postings unsorted
+        for trigram, positions in postings.items():
+            if positions.size > 1 and (np.diff(positions) < 0).any():
+                postings[trigram] = np.sort(positions)
+        return CandidateIndex(
+            postings, len(corpus), self.max_candidates, self.min_candidates
+        )
+
+    def candidates(self, query: str) -> np.ndarray | None:
+        """Return the corpus positions worth fuzzy-scoring for a query.
+
+        Entries are ranked by the number of trigrams shared with the query
+        and capped at max_candidates.
+
+        Args:
+            query: Entity name to look up.
+
+        Returns:
+            Sorted array of corpus positions, or None when fewer than
+            min_candidates entries share a trigram with the query and the
+            caller should scan the full corpus.
+        """
+        hits = [
+            self.postings[trigram]
+            for trigram in name_trigrams(query)
+            if trigram in self.postings
+        ]
+        if not hits:
+            return None
+
+        overlap = np.bincount(np.concatenate(hits), minlength=self.corpus_size)
+        positions = np.flatnonzero(overlap)
+        if positions.size < self.min_candidates:
+            return None
+
+        if positions.size > self.max_candidates:
+            counts = overlap[positions]
+            keep = np.argpartition(-counts, self.max_candidates - 1)[
+                : self.max_candidates
+            ]
+            positions = np.sort(positions[keep])
+        return positions
+
+
+__all__ = ["CandidateIndex", "name_trigrams", "normalize_index_text"]
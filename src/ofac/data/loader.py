@@ -2,8 +2,15 @@
 
 This module provides the OFACDataLoader class for:
 - Loading SDN.CSV, ALT.CSV, ADD.CSV triplets
+- Loading the Consolidated (non-SDN) CONS_PRIM/CONS_ALT/CONS_ADD triplet
 - Merging data by ent_num for efficient lookups
-- Handling encoding issues (UTF-8 with Latin-1 fallback)
+- Streaming, chunked CSV parsing with incremental encoding detection
+  (UTF-8, switching to Latin-1 at the first invalid chunk)
+- Feeding each parsed chunk into the lookups and entity records, so
+  ALT/ADD files are never held whole unless raw frames are kept
+- Optionally keeping only the columns the matcher needs
+- Reusing an Arrow snapshot of parsed data when the CSVs are unchanged
+- Incremental refresh that rebuilds only changed entities
 - Caching loaded data in memory
 
 Usage:
@@ -14,20 +21,222 @@ Usage:
     # data.sdn_df, data.aliases_by_ent, data.addresses_by_ent
 """
 
+import codecs
+from collections.abc import Iterator
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import NamedTuple
+from typing import TYPE_CHECKING, BinaryIO, NamedTuple, cast
 
+import numpy as np
 import pandas as pd
 
 from ofac.core.config import settings
 from ofac.core.exceptions import OFACNotLoadedError, OFACParseError
+from ofac.core.models import OFACList
+from ofac.core.normalize import NamePipeline
+from ofac.data.corpus import NameCorpus, build_name_corpus
+from ofac.data.delta import OFACChangeSet, diff_lists, patch_corpus, patch_entities
+from ofac.data.entities import (
+    EntityRecord,
+    EntityTable,
+    build_entity_records,
+    build_entity_table,
+)
+from ofac.data.exact import ExactIndex
+from ofac.data.index import CandidateIndex
+from ofac.data.phonetic import PhoneticIndex
 from ofac.data.schemas import (
     ADD_CSV_COLUMNS,
     ALT_CSV_COLUMNS,
     SDN_CSV_COLUMNS,
     OFACDataVersion,
 )
+from ofac.data.snapshot import (
+    SNAPSHOT_DIRNAME,
+    OFACSnapshot,
+    read_snapshot,
+    source_fingerprint,
+    write_snapshot,
+)
+
+if TYPE_CHECKING:
+    from pandas._typing import ReadCsvBuffer
+
+# SDN triplet and Consolidated (non-SDN) triplet, which uses the same columns
+SDN_FILES = ("sdn.csv", "alt.csv", "add.csv")
+CONSOLIDATED_FILES = ("cons_prim.csv", "cons_alt.csv", "cons_add.csv")
+
+# Columns read when raw DataFrames are not kept (settings.keep_raw_frames)
+_SDN_MATCH_COLUMNS = ["ent_num", "sdn_name", "sdn_type", "programs", "remarks"]
+_ALT_MATCH_COLUMNS = ["ent_num", "alt_name"]
+_ADD_MATCH_COLUMNS = ["ent_num", "country"]
+
+_DECODE_CHUNK_BYTES = 1 << 20
+
+
+class _DecodedStream:
+    """Text stream over a binary file with incremental encoding detection.
+
+    Bytes are decoded as UTF-8 chunk by chunk. At the first chunk that is
+    not valid UTF-8 the stream switches to Latin-1 (which accepts any
+    byte) for the rest of the file, so the file is read only once.
+
+    Attributes:
+        encoding: Encoding currently used ("utf-8" or "latin-1")
+    """
+
+    def __init__(self, raw: BinaryIO, chunk_bytes: int = _DECODE_CHUNK_BYTES) -> None:
+        """Initialize the stream.
+
+        Args:
+            raw: Binary file opened for reading.
+            chunk_bytes: Bytes read from the file per decode step.
+        """
+        self.encoding = "utf-8"
+        self._raw = raw
+        self._chunk_bytes = chunk_bytes
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._eof = False
+
+    def _decode_next(self) -> str:
+        """Read and decode the next chunk of the file."""
+        data = self._raw.read(self._chunk_bytes)
+        self._eof = not data
+        if self.encoding == "utf-8":
+            # Bytes of a multi-byte sequence split across chunks
+            pending, _ = self._decoder.getstate()
+            try:
+                return self._decoder.decode(data, final=self._eof)
+            except UnicodeDecodeError:
+                self.encoding = "latin-1"
+                data = pending + data
+        return data.decode("latin-1")
+
+    def read(self, size: int | None = -1) -> str:
+        """Read up to size characters (all remaining if size is negative)."""
+        while not self._eof and (size is None or size < 0 or len(self._buffer) < size):
+            self._buffer += self._decode_next()
+        if size is None or size < 0:
+            text, self._buffer = self._buffer, ""
+        else:
+            text, self._buffer = self._buffer[:size], self._buffer[size:]
+        return text
+
+
+def _group_by_ent(ent_nums: np.ndarray, values: list[str]) -> dict[int, list[str]]:
+    """Group values by entity number in a CSR layout.
+
+    Rows are stable-sorted by ent_num so each entity's values form one
+    contiguous run (offsets into the sorted rows), then sliced into lists.
+    Entities keep their first-appearance order and values keep row order.
+
+    Args:
+        ent_nums: Entity number per row (int64).
+        values: Value per row, aligned with ent_nums.
+
+    Returns:
+        Dict mapping ent_num to list of values.
+    """
+    if len(ent_nums) == 0:
+        return {}
+
+    order = np.argsort(ent_nums, kind="stable")
+    sorted_ents = ent_nums[order]
+    starts = np.flatnonzero(np.r_[True, sorted_ents[1:] != sorted_ents[:-1]])
+    ends = np.r_[starts[1:], len(order)]
+    sorted_values = [values[i] for i in order.tolist()]
+
+    # The stable sort puts each entity's first row at its run start
+    groups = np.argsort(order[starts], kind="stable").tolist()
+    keys = sorted_ents[starts].tolist()
+    starts_list, ends_list = starts.tolist(), ends.tolist()
+    return {keys[g]: sorted_values[starts_list[g] : ends_list[g]] for g in groups}
+
+
+class _AliasRows:
+    """(ent_num, alt_name) rows collected chunk by chunk for _group_by_ent."""
+
+    def __init__(self) -> None:
+        """Initialize with no rows."""
+        self._ent_nums: list[np.ndarray] = []
+        self._names: list[str] = []
+
+    def add(self, alt_df: pd.DataFrame) -> None:
+        """Collect the aliases of one chunk of ALT rows."""
+        if "ent_num" not in alt_df.columns or "alt_name" not in alt_df.columns:
+            return
+        valid = alt_df[["ent_num", "alt_name"]].dropna()
+        self._ent_nums.append(valid["ent_num"].to_numpy(dtype=np.int64))
+        self._names.extend(valid["alt_name"].astype(str).tolist())
+
+    def build(self) -> dict[int, list[str]]:
+        """Group the collected aliases by entity number."""
+        if not self._ent_nums:
+            return {}
+        return _group_by_ent(np.concatenate(self._ent_nums), self._names)
+
+
+class _AddressRows:
+    """Distinct (ent_num, country) rows collected chunk by chunk."""
+
+    def __init__(self) -> None:
+        """Initialize with no rows."""
+        # Entities with any non-null country, blank included, in first-seen order
+        self._entities: dict[int, None] = {}
+        self._seen: set[tuple[int, str]] = set()
+        self._ent_nums: list[int] = []
+        self._countries: list[str] = []
+
+    def add(self, add_df: pd.DataFrame) -> None:
+        """Collect the countries of one chunk of ADD rows."""
+        if "ent_num" not in add_df.columns or "country" not in add_df.columns:
+            return
+        valid = add_df[["ent_num", "country"]].dropna()
+        for ent_num, country in zip(
+            valid["ent_num"].to_numpy(dtype=np.int64).tolist(),
+            valid["country"].astype(str).str.strip().tolist(),
+            strict=True,
+        ):
+            self._entities.setdefault(ent_num)
+            if country and (ent_num, country) not in self._seen:
+                self._seen.add((ent_num, country))
+                self._ent_nums.append(ent_num)
+                self._countries.append(country)
+
+    def build(self) -> dict[int, list[str]]:
+        """Group the collected countries by entity number."""
+        grouped = _group_by_ent(
+            np.asarray(self._ent_nums, dtype=np.int64), self._countries
+        )
+        return {ent_num: grouped.get(ent_num, []) for ent_num in self._entities}
+
+
+def _concat(chunks: list[pd.DataFrame], columns: list[str]) -> pd.DataFrame:
+    """Join parsed chunks into one frame (an empty one if there are none)."""
+    if not chunks:
+        return pd.DataFrame(columns=columns)
+    if len(chunks) == 1:
+        return chunks[0]
+    return pd.concat(chunks, ignore_index=True)
+
+
+class OFACListData(NamedTuple):
+    """Parsed primary, alias and address files of one OFAC list.
+
+    Attributes:
+        prim_df: DataFrame with primary entries (same columns as SDN.CSV)
+        alt_df: DataFrame with alternate names
+        add_df: DataFrame with addresses
+        aliases_by_ent: Dict mapping ent_num to list of alias names
+        addresses_by_ent: Dict mapping ent_num to list of countries
+    """
+
+    prim_df: pd.DataFrame
+    alt_df: pd.DataFrame
+    add_df: pd.DataFrame
+    aliases_by_ent: dict[int, list[str]]
+    addresses_by_ent: dict[int, list[str]]
 
 
 class OFACData(NamedTuple):
@@ -40,6 +249,12 @@ class OFACData(NamedTuple):
         aliases_by_ent: Dict mapping ent_num to list of alias names
         addresses_by_ent: Dict mapping ent_num to list of countries
         version: Metadata about the loaded data
+        entities: Per-entity matching metadata (programs, type, countries)
+        corpus: Flat corpus of primary names and aliases for batched matching
+        candidate_index: Optional trigram index for narrowing fuzzy scoring
+        phonetic_index: Optional phonetic-key index adding candidates to it
+        exact_index: Hash index of normalized names for exact-hit detection
+        consolidated: Consolidated (non-SDN) list data, if loaded
     """
 
     sdn_df: pd.DataFrame
@@ -48,6 +263,81 @@ class OFACData(NamedTuple):
     aliases_by_ent: dict[int, list[str]]
     addresses_by_ent: dict[int, list[str]]
     version: OFACDataVersion
+    entities: EntityTable | None = None
+    corpus: NameCorpus | None = None
+    candidate_index: CandidateIndex | None = None
+    phonetic_index: PhoneticIndex | None = None
+    exact_index: ExactIndex | None = None
+    consolidated: OFACListData | None = None
+
+
+def build_entities(data: OFACData) -> EntityTable:
+    """Build one entity table over every list in the data.
+
+    SDN entities come first, followed by Consolidated entities tagged
+    with OFACList.CONSOLIDATED.
+
+    Args:
+        data: Loaded OFAC data.
+
+    Returns:
+        EntityTable covering all loaded lists.
+    """
+    entities = build_entity_table(data.sdn_df, data.addresses_by_ent)
+    if data.consolidated is None:
+        return entities
+    consolidated = build_entity_table(
+        data.consolidated.prim_df,
+        data.consolidated.addresses_by_ent,
+        OFACList.CONSOLIDATED,
+    )
+    return EntityTable(entities.records + consolidated.records)
+
+
+def build_corpus(data: OFACData, entities: EntityTable) -> NameCorpus:
+    """Build the combined name corpus for an entity table from build_entities.
+
+    Args:
+        data: Loaded OFAC data providing each list's aliases.
+        entities: Entity table covering all loaded lists.
+
+    Returns:
+        NameCorpus with primary names and aliases of every list.
+    """
+    return build_name_corpus(
+        entities,
+        data.aliases_by_ent,
+        data.consolidated.aliases_by_ent if data.consolidated else None,
+    )
+
+
+def _phonetic_index_enabled() -> bool:
+    """Whether the phonetic index is built (it only feeds the candidate index)."""
+    return settings.candidate_index_enabled and settings.phonetic_index_enabled
+
+
+def _lists(data: OFACData) -> dict[OFACList, OFACListData | None]:
+    """Split loaded data into per-list parts, in entity table order."""
+    return {
+        OFACList.SDN: OFACListData(
+            data.sdn_df,
+            data.alt_df,
+            data.add_df,
+            data.aliases_by_ent,
+            data.addresses_by_ent,
+        ),
+        OFACList.CONSOLIDATED: data.consolidated,
+    }
+
+
+class _Sources(NamedTuple):
+    """OFAC files as parsed (or read from a snapshot) by the loader."""
+
+    data: OFACData
+    row_counts: tuple[int, int, int]
+    snapshot: OFACSnapshot | None
+    # Entity table built while parsing, or None if read from a snapshot
+    entities: EntityTable | None = None
 
 
 class OFACDataLoader:
@@ -76,6 +366,11 @@ class OFACDataLoader:
         self.data_path = data_path or settings.ofac_data_path
         self._cached_data: OFACData | None = None
 
+    @property
+    def snapshot_path(self) -> Path:
+        """Directory holding the Arrow snapshot of parsed data."""
+        return self.data_path / SNAPSHOT_DIRNAME
+
     @property
     def is_loaded(self) -> bool:
         """Check if data has been loaded."""
@@ -100,7 +395,30 @@ class OFACDataLoader:
 
         Reads SDN.CSV, ALT.CSV, and ADD.CSV files, parses them into
         DataFrames, and builds lookup dictionaries for aliases and
-        addresses by entity number.
+        addresses by entity number plus the entity table and name corpus. The trigram
+        candidate index is built too when settings.candidate_index_enabled,
+        with the phonetic index unless settings.phonetic_index_enabled is off.
+        The exact-match index of normalized names is always built.
+
+        When settings.consolidated_enabled and CONS_PRIM.CSV, CONS_ALT.CSV and
+        CONS_ADD.CSV are present, the Consolidated (non-SDN) list is loaded
+        too and merged into the same entity table and corpus, tagged with
+        OFACList.CONSOLIDATED.
+
+        When settings.snapshot_enabled, the parsed DataFrames, lookups and
+        name corpus are read from a snapshot built from the same CSV contents,
+        and a new snapshot version is written after parsing whenever it is
+        missing or stale. The snapshot corpus is memory-mapped read-only, so
+        all API workers on a host share one copy of its arrays; everything
+        else (frames, lookups, entity table, decoded names) is per process.
+
+        CSV files are parsed in chunks of settings.load_chunk_rows, and each
+        chunk is fed into the alias/address lookups and the entity records
+        before the next one is read. With settings.keep_raw_frames disabled
+        only the columns needed for matching are parsed and ALT/ADD chunks
+        are dropped after use, so those files are never held whole. The
+        compact primary frame is always kept: it is data.sdn_df and the
+        basis of refresh() diffs.
 
         Args:
             force_reload: If True, reload even if data is cached.
@@ -109,19 +427,139 @@ class OFACDataLoader:
             OFACData containing all loaded data and lookups.
 
         Raises:
-            OFACParseError: If CSV files cannot be found or parsed.
+            OFACParseError: If CSV files cannot be found or parsed, or only
+                part of the Consolidated triplet is present.
         """
         if self._cached_data is not None and not force_reload:
             return self._cached_data
 
-        # Build file paths
-        sdn_path = self.data_path / "sdn.csv"
-        alt_path = self.data_path / "alt.csv"
-        add_path = self.data_path / "add.csv"
+        sources = self._read_sources()
+        data = sources.data
+
+        # Build entity metadata table and flat name corpus for matching.
+        # A snapshot corpus keeps its arrays memory-mapped and shared across
+        # workers; the entity table is rebuilt in every process.
+        entities = (
+            sources.entities if sources.entities is not None else build_entities(data)
+        )
+        if sources.snapshot is not None and sources.snapshot.corpus is not None:
+            corpus = sources.snapshot.corpus
+        else:
+            corpus = build_corpus(data, entities)
+        self._write_snapshot(sources, corpus)
+
+        candidate_index = (
+            CandidateIndex.build(corpus) if settings.candidate_index_enabled else None
+        )
+        phonetic_index = (
+            PhoneticIndex.build(corpus) if _phonetic_index_enabled() else None
+        )
+
+        self._cached_data = data._replace(
+            entities=entities,
+            corpus=corpus,
+            candidate_index=candidate_index,
+            phonetic_index=phonetic_index,
+            exact_index=ExactIndex.build(corpus),
+        )
+
+        return self._cached_data
+
+    def refresh(self) -> tuple[OFACData, OFACChangeSet]:
+        """Reload OFAC files, rebuilding only the entities that changed.
+
+        The new files are diffed against the loaded data by ent_num, alt_num
+        and add_num. Records, corpus entries and index postings of
+        unchanged entities are reused; only added and modified entities are
+        rebuilt. The result is the same as a full load of the new files.
+
+        Falls back to a full load when nothing is loaded yet, reporting every
+        entity as added. Returns the loaded data unchanged when the files
+        have the same content.
+
+        Returns:
+            Tuple of (refreshed OFACData, change set).
+
+        Raises:
+            OFACParseError: If CSV files cannot be found or parsed.
+        """
+        old = self._cached_data
+        if old is None or old.entities is None or old.corpus is None:
+            data = self.load(force_reload=True)
+            return data, diff_lists({}, _lists(data))
+
+        # Unchanged entities are patched from the old table, not rebuilt
+        sources = self._read_sources(with_entities=False)
+        if sources.data.version.source_hash == old.version.source_hash:
+            return old, OFACChangeSet()
+
+        data = sources.data
+        new_lists = _lists(data)
+        changes = diff_lists(_lists(old), new_lists)
+        entities, entity_sources = patch_entities(old.entities, new_lists, changes)
+        corpus, old_to_new = patch_corpus(
+            old.corpus,
+            entities,
+            entity_sources,
+            {
+                ofac_list: list_data.aliases_by_ent
+                for ofac_list, list_data in new_lists.items()
+                if list_data is not None
+            },
+        )
+        self._write_snapshot(sources, corpus)
+
+        if not settings.candidate_index_enabled:
+            candidate_index = None
+        elif old.candidate_index is not None:
+            candidate_index = old.candidate_index.patched(corpus, old_to_new)
+        else:
+            candidate_index = CandidateIndex.build(corpus)
+
+        if not _phonetic_index_enabled():
+            phonetic_index = None
+        elif old.phonetic_index is not None:
+            phonetic_index = old.phonetic_index.patched(corpus, old_to_new)
+        else:
+            phonetic_index = PhoneticIndex.build(corpus)
+
+        # Keys of an index built with other normalization steps are stale
+        if (
+            old.exact_index is not None
+            and old.exact_index.normalizer.steps
+            == NamePipeline(settings.name_normalization).steps
+        ):
+            exact_index = old.exact_index.patched(corpus, old_to_new)
+        else:
+            exact_index = ExactIndex.build(corpus)
+
+        self._cached_data = data._replace(
+            entities=entities,
+            corpus=corpus,
+            candidate_index=candidate_index,
+            phonetic_index=phonetic_index,
+            exact_index=exact_index,
+        )
+        return self._cached_data, changes
+
+    def _read_sources(self, with_entities: bool = True) -> _Sources:
+        """Parse the OFAC files, or read them from a matching snapshot.
+
+        Args:
+            with_entities: Build the entity table while parsing the CSVs.
+
+        Returns:
+            _Sources with OFACData lacking entities, corpus and index, and
+            the entity table if it was built while parsing.
+
+        Raises:
+            OFACParseError: If CSV files cannot be found or parsed.
+        """
+        sdn_paths = [self.data_path / name for name in SDN_FILES]
 
         # Check files exist
         missing_files = []
-        for path in [sdn_path, alt_path, add_path]:
+        for path in sdn_paths:
             if not path.exists():
                 missing_files.append(path.name)
 
@@ -134,90 +572,238 @@ class OFACDataLoader:
                     "missing_files": missing_files,
                 },
             )
-
-        # Load CSV files
-        sdn_df = self._read_csv(sdn_path, SDN_CSV_COLUMNS)
-        alt_df = self._read_csv(alt_path, ALT_CSV_COLUMNS)
-        add_df = self._read_csv(add_path, ADD_CSV_COLUMNS)
-
-        # Build lookup dictionaries
-        aliases_by_ent = self._build_aliases_lookup(alt_df)
-        addresses_by_ent = self._build_addresses_lookup(add_df)
-
-        # Create version info
-        version = OFACDataVersion(
-            sdn_count=len(sdn_df),
-            alt_count=len(alt_df),
-            add_count=len(add_df),
-            source="SDN",
-            loaded_at=datetime.now(UTC).isoformat(),
+        consolidated_paths = self._consolidated_paths()
+
+        # Reuse the snapshot when it was built from these exact files
+        source_hash = source_fingerprint(sdn_paths + (consolidated_paths or []))
+        snapshot = (
+            read_snapshot(self.snapshot_path, source_hash, settings.keep_raw_frames)
+            if settings.snapshot_enabled
+            else None
         )
 
-        self._cached_data = OFACData(
-            sdn_df=sdn_df,
-            alt_df=alt_df,
-            add_df=add_df,
-            aliases_by_ent=aliases_by_ent,
-            addresses_by_ent=addresses_by_ent,
-            version=version,
+        keep_raw = settings.keep_raw_frames
+        entities: EntityTable | None = None
+        if snapshot is None:
+            sdn, row_counts, records = self._parse_list(
+                sdn_paths, keep_raw, OFACList.SDN, with_entities
+            )
+            consolidated = None
+            if consolidated_paths:
+                consolidated, _, cons_records = self._parse_list(
+                    consolidated_paths,
+                    keep_raw,
+                    OFACList.CONSOLIDATED,
+                    with_entities,
+                )
+                records += cons_records
+            if with_entities:
+                entities = EntityTable(records)
+        else:
+            sdn = OFACListData(
+                snapshot.sdn_df,
+                snapshot.alt_df,
+                snapshot.add_df,
+                snapshot.aliases_by_ent,
+                snapshot.addresses_by_ent,
+            )
+            row_counts = snapshot.row_counts
+            consolidated = (
+                OFACListData(*snapshot.consolidated)
+                if snapshot.consolidated is not None
+                else None
+            )
+
+        data = OFACData(
+            sdn_df=sdn.prim_df,
+            alt_df=sdn.alt_df,
+            add_df=sdn.add_df,
+            aliases_by_ent=sdn.aliases_by_ent,
+            addresses_by_ent=sdn.addresses_by_ent,
+            version=OFACDataVersion(
+                sdn_count=row_counts[0],
+                alt_count=row_counts[1],
+                add_count=row_counts[2],
+                cons_count=len(consolidated.prim_df) if consolidated else 0,
+                source="BOTH" if consolidated else "SDN",
+                loaded_at=datetime.now(UTC).isoformat(),
+                source_hash=source_hash,
+            ),
+            consolidated=consolidated,
+        )
+        return _Sources(data, row_counts, snapshot, entities)
+
+    def _write_snapshot(self, sources: _Sources, corpus: NameCorpus) -> None:
+        """Write a snapshot of freshly parsed sources, if snapshots are enabled."""
+        if sources.snapshot is not None or not settings.snapshot_enabled:
+            return
+        data = sources.data
+        write_snapshot(
+            self.snapshot_path,
+            OFACSnapshot(
+                data.sdn_df,
+                data.alt_df,
+                data.add_df,
+                data.aliases_by_ent,
+                data.addresses_by_ent,
+                source_hash=data.version.source_hash or "",
+                corpus=corpus,
+                row_counts=sources.row_counts,
+                raw_frames=settings.keep_raw_frames,
+                consolidated=data.consolidated,
+            ),
         )
 
-        return self._cached_data
+    def _consolidated_paths(self) -> list[Path] | None:
+        """Locate the Consolidated list files.
+
+        Returns:
+            Paths of CONS_PRIM, CONS_ALT and CONS_ADD, or None if the list is
+            disabled or none of its files are present.
+
+        Raises:
+            OFACParseError: If only some of the Consolidated files exist.
+        """
+        if not settings.consolidated_enabled:
+            return None
+        paths = [self.data_path / name for name in CONSOLIDATED_FILES]
+        missing_files = [path.name for path in paths if not path.exists()]
+        if len(missing_files) == len(paths):
+            return None
+        if missing_files:
+            raise OFACParseError(
+                f"OFAC data files not found: {', '.join(missing_files)}",
+                code="OFAC_DATA_NOT_FOUND",
+                details={
+                    "data_path": str(self.data_path),
+                    "missing_files": missing_files,
+                },
+            )
+        return paths
+
+    def _parse_list(
+        self,
+        paths: list[Path],
+        keep_raw: bool,
+        ofac_list: OFACList,
+        with_entities: bool = True,
+    ) -> tuple[OFACListData, tuple[int, int, int], list[EntityRecord]]:
+        """Parse one list's primary, alias and address files chunk by chunk.
+
+        ADD and ALT chunks go straight into the lookups, then primary chunks
+        into the entity records (which need every address). Without raw
+        frames, ALT and ADD chunks are dropped once collected, so only the
+        lookups and one chunk are in memory.
+
+        Args:
+            paths: Primary, ALT and ADD CSV paths, in that order.
+            keep_raw: Keep every column and the ALT/ADD rows in the frames.
+            ofac_list: OFAC list the entities belong to.
+            with_entities: Build the entity records of the primary rows.
+
+        Returns:
+            Parsed list data, the rows read from each file, and the entity
+            records (empty unless with_entities).
+        """
+        prim_path, alt_path, add_path = paths
+        # Keep only matching columns unless raw frames are wanted
+        add_columns = ADD_CSV_COLUMNS if keep_raw else _ADD_MATCH_COLUMNS
+        alt_columns = ALT_CSV_COLUMNS if keep_raw else _ALT_MATCH_COLUMNS
+        prim_columns = SDN_CSV_COLUMNS if keep_raw else _SDN_MATCH_COLUMNS
+
+        addresses = _AddressRows()
+        add_chunks: list[pd.DataFrame] = []
+        add_rows = 0
+        for chunk in self._iter_csv(add_path, ADD_CSV_COLUMNS, add_columns):
+            addresses.add(chunk)
+            add_rows += len(chunk)
+            if keep_raw:
+                add_chunks.append(chunk)
+        addresses_by_ent = addresses.build()
+
+        aliases = _AliasRows()
+        alt_chunks: list[pd.DataFrame] = []
+        alt_rows = 0
+        for chunk in self._iter_csv(alt_path, ALT_CSV_COLUMNS, alt_columns):
+            aliases.add(chunk)
+            alt_rows += len(chunk)
+            if keep_raw:
+                alt_chunks.append(chunk)
+        aliases_by_ent = aliases.build()
+
+        prim_chunks: list[pd.DataFrame] = []
+        records: list[EntityRecord] = []
+        for chunk in self._iter_csv(prim_path, SDN_CSV_COLUMNS, prim_columns):
+            prim_chunks.append(chunk)
+            if with_entities:
+                records += build_entity_records(chunk, addresses_by_ent, ofac_list)
+        prim_df = _concat(prim_chunks, prim_columns)
+
+        return (
+            OFACListData(
+                prim_df,
+                _concat(alt_chunks, alt_columns),
+                _concat(add_chunks, add_columns),
+                aliases_by_ent,
+                addresses_by_ent,
+            ),
+            (len(prim_df), alt_rows, add_rows),
+            records,
+        )
 
-    def _read_csv(self, path: Path, columns: list[str]) -> pd.DataFrame:
-        """Read a CSV file with encoding fallback.
+    def _iter_csv(
+        self, path: Path, columns: list[str], usecols: list[str] | None = None
+    ) -> Iterator[pd.DataFrame]:
+        """Parse a CSV file chunk by chunk.
 
-        Tries UTF-8 first, falls back to Latin-1 for encoding issues.
+        Each chunk holds at most settings.load_chunk_rows rows, so parsing
+        memory does not grow with the file size.
 
         Args:
             path: Path to CSV file.
             columns: Expected column names.
+            usecols: Columns to keep. Defaults to all columns.
 
-        Returns:
-            DataFrame with parsed CSV data.
+        Yields:
+            DataFrame chunks with ID columns converted to Int64.
 
         Raises:
             OFACParseError: If CSV cannot be parsed.
         """
         try:
-            # Try UTF-8 first
-            df = pd.read_csv(
-                path,
-                names=columns,
-                header=None,
-                dtype=str,
-                na_values=["-0-"],
-                keep_default_na=True,
-                encoding="utf-8",
-            )
-        except UnicodeDecodeError:
-            # Fallback to Latin-1
-            df = pd.read_csv(
-                path,
-                names=columns,
-                header=None,
-                dtype=str,
-                na_values=["-0-"],
-                keep_default_na=True,
-                encoding="latin-1",
-            )
+            with path.open("rb") as raw:
+                # The C parser only calls read(); the stub protocol lists
+                # file methods _DecodedStream does not need to provide
+                reader = pd.read_csv(
+                    cast("ReadCsvBuffer[str]", _DecodedStream(raw)),
+                    names=columns,
+                    header=None,
+                    usecols=usecols,
+                    dtype=str,
+                    na_values=["-0-"],
+                    keep_default_na=True,
+                    chunksize=settings.load_chunk_rows,
+                )
+                for chunk in reader:
+                    yield self._convert_ids(chunk)
         except Exception as e:
             raise OFACParseError(
                 f"Failed to parse CSV file: {path.name}",
                 details={"path": str(path), "error": str(e)},
             ) from e
 
-        # Convert ent_num to int
-        if "ent_num" in df.columns:
-            df["ent_num"] = pd.to_numeric(df["ent_num"], errors="coerce").astype(
-                "Int64"
-            )
+    def _convert_ids(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert ent_num, alt_num and add_num columns to nullable integers.
 
-        # Convert other ID columns to int
-        for col in ["alt_num", "add_num"]:
+        Args:
+            df: Parsed CSV chunk.
+
+        Returns:
+            The same DataFrame with ID columns as Int64.
+        """
+        for col in ["ent_num", "alt_num", "add_num"]:
             if col in df.columns:
                 df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int64")
-
         return df
 
     def _build_aliases_lookup(self, alt_df: pd.DataFrame) -> dict[int, list[str]]:
@@ -229,19 +815,9 @@ class OFACDataLoader:
         Returns:
             Dict mapping ent_num to list of alias names.
         """
-        aliases: dict[int, list[str]] = {}
-
-        for _, row in alt_df.iterrows():
-            ent_num = row.get("ent_num")
-            alt_name = row.get("alt_name")
-
-            if pd.notna(ent_num) and pd.notna(alt_name):
-                ent_num_int = int(ent_num)
-                if ent_num_int not in aliases:
-                    aliases[ent_num_int] = []
-                aliases[ent_num_int].append(str(alt_name))
-
-        return aliases
+        aliases = _AliasRows()
+        aliases.add(alt_df)
+        return aliases.build()
 
     def _build_addresses_lookup(self, add_df: pd.DataFrame) -> dict[int, list[str]]:
         """Build a lookup dictionary for countries by entity number.
@@ -250,23 +826,13 @@ class OFACDataLoader:
             add_df: DataFrame with addresses.
 
         Returns:
-            Dict mapping ent_num to list of country names.
+            Dict mapping ent_num to list of distinct country names, in
+            address order. Entities whose countries are all blank map to
+            an empty list.
         """
-        addresses: dict[int, list[str]] = {}
-
-        for _, row in add_df.iterrows():
-            ent_num = row.get("ent_num")
-            country = row.get("country")
-
-            if pd.notna(ent_num) and pd.notna(country):
-                ent_num_int = int(ent_num)
-                if ent_num_int not in addresses:
-                    addresses[ent_num_int] = []
-                country_str = str(country).strip()
-                if country_str and country_str not in addresses[ent_num_int]:
-                    addresses[ent_num_int].append(country_str)
-
-        return addresses
+        addresses = _AddressRows()
+        addresses.add(add_df)
+        return addresses.build()
 
     def get_aliases(self, ent_num: int) -> list[str]:
         """Get all aliases for an entity.
@@ -301,5 +867,13 @@ class OFACDataLoader:
         self._cached_data = None
 
 
-__all__ = ["OFACData", "OFACDataLoader"]
+__all__ = [
+    "OFACData",
+    "OFACDataLoader",
+    "OFACListData",
+    "build_corpus",
+    "build_entities",
+    "CONSOLIDATED_FILES",
+    "SDN_FILES",
+]
 
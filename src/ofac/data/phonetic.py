@@ -0,0 +1,268 @@
+"""Phonetic name keys and their hash index.
+
+This module provides phonetic matching helpers for:
+- Transliterating Cyrillic and Arabic/Persian script to Latin letters
+- Reducing Arabic-origin, Persian and Slavic names to a consonant skeleton
+  key that spelling variants share (Mohammed/Muhammad/Mohamad,
+  Abdul Rahman/Abd al-Rahman, Hussein/Husayn, Yevgeny/Evgeniy)
+- A hash index from name key to corpus positions (PhoneticIndex)
+
+Keys are built once at load time for every primary name and alias. The
+matcher adds a query's exact key hits to the trigram candidates with one
+dict lookup, so variants whose spelling shares few trigrams with the
+query are still fuzzy-scored.
+
+Usage:
+    from ofac.data.phonetic import PhoneticIndex, phonetic_key
+
+    phonetic_key("Muhammad Abd al-Rahman")  # "abd mhmd rmn"
+    index = PhoneticIndex.build(data.corpus)
+    positions = index.lookup("Mohamed Abdul Rahman")
+"""
+
+import re
+import unicodedata
+
+import numpy as np
+
+from ofac.data.corpus import NameCorpus
+
+_CYRILLIC = {
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ё": "e",
+    "ж": "zh", "з": "z", "и": "i", "й": "y", "к": "k", "л": "l", "м": "m",
+    "н": "n", "о": "o", "п": "p", "р": "r", "с": "s", "т": "t", "у": "u",
+    "ф": "f", "х": "kh", "ц": "ts", "ч": "ch", "ш": "sh", "щ": "shch",
+    "ъ": "", "ы": "y", "ь": "", "э": "e", "ю": "yu", "я": "ya", "і": "i",
+    "ї": "yi", "є": "ye", "ґ": "g",
+}  # fmt: skip
+
+# Arabic and Persian letters; short vowels are not written, which the
+# consonant skeleton ignores anyway
+_ARABIC = {
+    "ا": "a", "أ": "a", "إ": "a", "آ": "a", "ٱ": "a", "ء": "", "ؤ": "u",
+    "ئ": "i", "ب": "b", "پ": "p", "ت": "t", "ث": "s", "ج": "j", "چ": "ch",
+    "ح": "h", "خ": "kh", "د": "d", "ذ": "z", "ر": "r", "ز": "z", "ژ": "zh",
+    "س": "s", "ش": "sh", "ص": "s", "ض": "d", "ط": "t", "ظ": "z", "ع": "a",
+    "غ": "gh", "ف": "f", "ق": "q", "ك": "k", "ک": "k", "گ": "g", "ل": "l",
+    "م": "m", "ن": "n", "ه": "h", "ة": "h", "و": "u", "ى": "a", "ي": "i",
+    "ی": "i",
+}  # fmt: skip
+
+_ARABIC_LETTERS = re.compile(r"[؀-ۿ]+")
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+# Articles dropped from keys ("al-Rahman", "el Sayed", "ad-Din")
+_ARTICLES = frozenset({"al", "el", "ul", "ad", "ed", "ar", "as", "ash", "at", "az"})
+# Patronymic particles sharing one key ("bin", "ibn", "ben")
+_SON_OF = frozenset({"bin", "ibn", "ben", "bn"})
+# "Abdul"/"Abdel"/... followed by the rest of a compound name
+_ABD_PREFIX = re.compile(r"^abd(?:ul|el|al|ol|il)?")
+_ALLAH = frozenset({"lah", "llah", "ullah", "allah", "ollah", "ellah"})
+
+# Spelling variants of the same sound, longest first
+_SUBSTITUTIONS = (
+    ("dzh", "j"),
+    ("sch", "s"),
+    ("tch", "s"),
+    ("kh", "h"),
+    ("gh", "g"),
+    ("ph", "f"),
+    ("th", "t"),
+    ("dh", "d"),
+    ("sh", "s"),
+    ("ch", "s"),
+    ("zh", "j"),
+    ("dj", "j"),
+    ("ck", "k"),
+    ("ts", "s"),
+    ("x", "ks"),
+    ("q", "k"),
+    ("c", "k"),
+    ("w", "v"),
+)
+_VOWELS = frozenset("aeiouy")
+
+
+def _arabic_word(match: re.Match[str]) -> str:
+    """Transliterate one Arabic-script word, separating its article."""
+    word = match.group()
+    prefix = ""
+    if word.startswith("ال") and len(word) > 3:
+        prefix, word = "al ", word[2:]
+    # Waw and yeh start a word as consonants (Walid, Yusuf), else are vowels
+    head = {"و": "w", "ي": "y", "ی": "y"}.get(word[0], _ARABIC.get(word[0], word[0]))
+    return f" {prefix}{head}{''.join(_ARABIC.get(char, char) for char in word[1:])} "
+
+
+def transliterate(name: str) -> str:
+    """Transliterate Cyrillic and Arabic/Persian letters to Latin.
+
+    Args:
+        name: Name in any script.
+
+    Returns:
+        Lowercase name with Cyrillic and Arabic letters replaced; other
+        characters are kept.
+    """
+    name = _ARABIC_LETTERS.sub(_arabic_word, name.casefold())
+    return "".join(_CYRILLIC.get(char, char) for char in name)
+
+
+def _latin_tokens(name: str) -> list[str]:
+    """Split a name into lowercase ASCII tokens after transliteration."""
+    decomposed = unicodedata.normalize("NFKD", transliterate(name))
+    ascii_text = decomposed.encode("ascii", "ignore").decode("ascii")
+    return _NON_ALNUM.sub(" ", ascii_text).split()
+
+
+def _skeleton(token: str) -> str:
+    """Reduce one token to its consonant skeleton."""
+    if token.isdigit():
+        return token
+    for spelling, sound in _SUBSTITUTIONS:
+        token = token.replace(spelling, sound)
+    # A leading vowel is kept as "a"; later vowels and a final "h" are not
+    head = "a" if token[0] in _VOWELS else token[0]
+    tail = [char for char in token[1:] if char not in _VOWELS]
+    if tail and tail[-1] == "h":
+        tail.pop()
+    letters = [head, *tail]
+    return "".join(
+        char
+        for position, char in enumerate(letters)
+        if position == 0 or char != letters[position - 1]
+    )
+
+
+def token_keys(name: str) -> list[str]:
+    """Compute the phonetic key of every meaningful token of a name.
+
+    Args:
+        name: Raw entity, alias or query name.
+
+    Returns:
+        Token keys in name order, without articles.
+    """
+    keys: list[str] = []
+    for token in _latin_tokens(name):
+        if token in _ARTICLES:
+            continue
+        if token in _SON_OF:
+            keys.append("bn")
+            continue
+        match = _ABD_PREFIX.match(token)
+        if match:
+            keys.append("abd")
+            token = token[match.end() :]
+            if token in _ALLAH:
+                token = "allah"
+        if token:
+            keys.append(_skeleton(token))
+    return keys
+
+
+def phonetic_key(name: str) -> str:
+    """Compute the order-independent phonetic key of a name.
+
+    Args:
+        name: Raw entity, alias or query name.
+
+    Returns:
+        Sorted token keys joined by spaces ("" if the name has no letters
+        or digits).
+    """
+    return " ".join(sorted(token_keys(name)))
+
+
+class PhoneticIndex:
+    """Hash index from phonetic name key to corpus positions.
+
+    Attributes:
+        postings: Dict mapping name key to sorted int32 corpus positions
+        corpus_size: Number of entries in the indexed corpus
+    """
+
+    def __init__(self, postings: dict[str, np.ndarray], corpus_size: int) -> None:
+        """Initialize the index from prebuilt postings.
+
+        Args:
+            postings: Dict mapping phonetic key to corpus positions.
+            corpus_size: Number of entries in the indexed corpus.
+        """
+        self.postings = postings
+        self.corpus_size = corpus_size
+
+    @classmethod
+    def build(cls, corpus: NameCorpus) -> "PhoneticIndex":
+        """Key every name in a corpus.
+
+        Args:
+            corpus: NameCorpus to index.
+
+        Returns:
+            PhoneticIndex for the corpus.
+        """
+        lists: dict[str, list[int]] = {}
+        for position, name in enumerate(corpus.names):
+            key = phonetic_key(name)
+            if key:
+                lists.setdefault(key, []).append(position)
+        postings = {
+            key: np.asarray(positions, dtype=np.int32)
+            for key, positions in lists.items()
+        }
+        return cls(postings, len(corpus))
+
+    def patched(self, corpus: NameCorpus, old_to_new: np.ndarray) -> "PhoneticIndex":
+        """Build the index of a patched corpus from this one.
+
+        Postings of entries carried over are renumbered; only entries new
+        to the corpus are keyed.
+
+        Args:
+            corpus: Patched NameCorpus.
+            old_to_new: New position of each entry of the indexed corpus, or
+                -1 if it was dropped (from delta.patch_corpus()).
+
+        Returns:
+            PhoneticIndex for the patched corpus.
+        """
+        mapping = old_to_new.astype(np.int32)
+        lists: dict[str, list[int]] = {}
+        for key, positions in self.postings.items():
+            mapped = mapping[positions]
+            kept = mapped[mapped >= 0].tolist()
+            if kept:
+                lists[key] = kept
+
+        fresh = np.ones(len(corpus), dtype=bool)
+        fresh[old_to_new[old_to_new >= 0]] = False
+        for position in np.flatnonzero(fresh).tolist():
+            key = phonetic_key(corpus.names[position])
+            if key:
+                lists.setdefault(key, []).append(position)
+
+        postings = {
+            key: np.sort(np.asarray(positions, dtype=np.int32))
+            for key, positions in lists.items()
+        }
+        return PhoneticIndex(postings, len(corpus))
+
+    def __len__(self) -> int:
+        """Return the number of distinct keys."""
+        return len(self.postings)
+
+    def lookup(self, query: str) -> np.ndarray:
+        """Return the corpus positions whose key equals the query's.
+
+        Args:
+            query: Entity name to look up.
+
+        Returns:
+            Sorted array of corpus positions (empty if none).
+        """
+        key = phonetic_key(query)
+        return self.postings.get(key, np.empty(0, dtype=np.int32))
+
+
+__all__ = ["PhoneticIndex", "phonetic_key", "token_keys", "transliterate"]
@@ -226,16 +226,24 @@ class OFACDataVersion(BaseModel):
         sdn_count: Number of SDN entries
         alt_count: Number of alternate name entries
         add_count: Number of address entries
+        cons_count: Number of Consolidated (non-SDN) primary entries
         source: Data source (SDN, CONSOLIDATED, or BOTH)
         loaded_at: When data was loaded into memory
+        source_hash: Content hash of the source CSV files
     """
 
     publish_date: str | None = Field(default=None, description="OFAC publish date")
     sdn_count: int = Field(default=0, ge=0, description="SDN entry count")
     alt_count: int = Field(default=0, ge=0, description="Alt name count")
     add_count: int = Field(default=0, ge=0, description="Address count")
+    cons_count: int = Field(
+        default=0, ge=0, description="Consolidated list entry count"
+    )
     source: str = Field(default="SDN", description="Data source")
     loaded_at: str | None = Field(default=None, description="Load timestamp")
+    source_hash: str | None = Field(
+        default=None, description="SHA-256 of the source CSV files"
+    )
 
     model_config = ConfigDict(
         populate_by_name=True,
@@ -0,0 +1,400 @@
+"""Columnar snapshot of parsed OFAC data for fast cold start.
+
+This module provides snapshot helpers for:
+- Fingerprinting the SDN/ALT/ADD (and Consolidated) source files by content hash
+- Writing parsed DataFrames and derived lookups as Arrow IPC files
+- Writing the name corpus as raw UTF-8 bytes, offsets and id arrays
+- Memory-mapping a snapshot back instead of re-parsing the CSVs
+- Rejecting snapshots that are missing, stale or unreadable
+
+The snapshot is only a cache: any problem reading or writing it makes
+the loader fall back to parsing the CSV files.
+
+Corpus arrays are opened read-only with mmap, so every uvicorn worker on
+a host maps the same page-cache pages instead of holding its own copy of
+them. DataFrames and lookups are copied into each process when read, and
+the matcher decodes the names per process, so per-worker memory is still
+O(corpus); the snapshot mainly saves parsing time at startup.
+
+Each snapshot is written into a new version directory that is never
+modified afterwards, and published by atomically replacing the CURRENT
+file that names it. A corpus pickled by file name (for a spawned worker)
+therefore always maps the files it was read from, even if the snapshot
+is rebuilt in the meantime. Older versions are removed after a few
+rebuilds; unpickling a corpus from a removed version fails with
+FileNotFoundError instead of mapping other data.
+
+Usage:
+    from ofac.data.snapshot import read_snapshot, source_fingerprint
+
+    source_hash = source_fingerprint([sdn_path, alt_path, add_path])
+    snapshot = read_snapshot(data_path / "snapshot", source_hash)
+    if snapshot is None:
+        ...  # parse CSVs, then write_snapshot()
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
+
+from ofac.data.corpus import MappedNames, NameCorpus
+
+# Bump when the snapshot layout changes so old snapshots are rebuilt
+SNAPSHOT_FORMAT_VERSION = 5
+SNAPSHOT_DIRNAME = "snapshot"
+MANIFEST_NAME = "manifest.json"
+CURRENT_NAME = "CURRENT"
+
+# Version directories are named <prefix><random>, see tempfile.mkdtemp
+_VERSION_PREFIX = "v-"
+# Versions kept on disk, including the current one, so that workers
+# spawned shortly before a rebuild can still map the previous corpus
+_KEPT_VERSIONS = 3
+
+_READ_CHUNK = 1 << 20
+
+
+class OFACSnapshot(NamedTuple):
+    """Parsed OFAC data as stored in a snapshot.
+
+    Attributes:
+        sdn_df: DataFrame with SDN entries
+        alt_df: DataFrame with alternate names
+        add_df: DataFrame with addresses
+        aliases_by_ent: Dict mapping ent_num to list of alias names
+        addresses_by_ent: Dict mapping ent_num to list of countries
+        source_hash: Fingerprint of the CSV files the data was parsed from
+        corpus: Name corpus built from the data, or None if not stored
+        row_counts: Rows parsed from the SDN, ALT and ADD files
+        raw_frames: Whether the DataFrames hold every CSV column and row,
+            or only what the matcher needs (settings.keep_raw_frames)
+        consolidated: Consolidated list (prim_df, alt_df, add_df,
+            aliases_by_ent, addresses_by_ent), or None if not loaded
+    """
+
+    sdn_df: pd.DataFrame
+    alt_df: pd.DataFrame
+    add_df: pd.DataFrame
+    aliases_by_ent: dict[int, list[str]]
+    addresses_by_ent: dict[int, list[str]]
+    source_hash: str
+    corpus: NameCorpus | None = None
+    row_counts: tuple[int, int, int] = (0, 0, 0)
+    raw_frames: bool = True
+    consolidated: (
+        tuple[
+            pd.DataFrame,
+            pd.DataFrame,
+            pd.DataFrame,
+            dict[int, list[str]],
+            dict[int, list[str]],
+        ]
+        | None
+    ) = None
+
+
+def source_fingerprint(paths: Sequence[Path]) -> str:
+    """Hash the content of the OFAC source files.
+
+    Args:
+        paths: Source CSV files, in a fixed order.
+
+    Returns:
+        Hex SHA-256 digest over file names and contents.
+    """
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(path.name.encode("utf-8") + b"\0")
+        with path.open("rb") as handle:
+            while chunk := handle.read(_READ_CHUNK):
+                digest.update(chunk)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _lookup_to_frame(lookup: dict[int, list[str]], value_column: str) -> pd.DataFrame:
+    """Flatten an ent_num lookup into (ent_num, value) rows in dict order."""
+    ent_nums = [ent_num for ent_num, values in lookup.items() for _ in values]
+    values = [value for values in lookup.values() for value in values]
+    return pd.DataFrame(
+        {"ent_num": pd.array(ent_nums, dtype="int64"), value_column: values}
+    )
+
+
+def _frame_to_lookup(table: pa.Table, value_column: str) -> dict[int, list[str]]:
+    """Rebuild an ent_num lookup from flattened (ent_num, value) rows."""
+    lookup: dict[int, list[str]] = {}
+    for ent_num, value in zip(
+        table.column("ent_num").to_pylist(),
+        table.column(value_column).to_pylist(),
+        strict=True,
+    ):
+        lookup.setdefault(ent_num, []).append(value)
+    return lookup
+
+
+def _write_table(df: pd.DataFrame, path: Path) -> None:
+    """Write a DataFrame as an uncompressed Arrow file."""
+    feather.write_feather(df, path, compression="uncompressed")
+
+
+def _read_table(path: Path) -> pa.Table:
+    """Memory-map an Arrow file written by _write_table."""
+    return feather.read_table(path, memory_map=True)
+
+
+def _write_array(array: np.ndarray, path: Path) -> None:
+    """Write an array as .npy."""
+    with path.open("wb") as handle:
+        np.save(handle, np.ascontiguousarray(array))
+
+
+def _write_corpus(corpus: NameCorpus, directory: Path) -> None:
+    """Write corpus names as UTF-8 bytes plus offsets, and its id arrays."""
+    names = (
+        corpus.names
+        if isinstance(corpus.names, MappedNames)
+        else MappedNames.encode(corpus.names)
+    )
+    (directory / "corpus_names.bin").write_bytes(names.data.tobytes())
+    _write_array(names.offsets, directory / "corpus_offsets.npy")
+    _write_array(corpus.ent_nums, directory / "corpus_ent_nums.npy")
+    _write_array(corpus.kinds, directory / "corpus_kinds.npy")
+    _write_array(corpus.entities, directory / "corpus_entities.npy")
+
+
+def _read_corpus(directory: Path) -> NameCorpus:
+    """Memory-map a corpus written by _write_corpus, read-only."""
+    names_path = directory / "corpus_names.bin"
+    data = (
+        np.memmap(names_path, dtype=np.uint8, mode="r")
+        if names_path.stat().st_size
+        else np.empty(0, dtype=np.uint8)
+    )
+    offsets = np.load(directory / "corpus_offsets.npy", mmap_mode="r")
+    corpus = NameCorpus(
+        names=MappedNames(data, offsets),
+        ent_nums=np.load(directory / "corpus_ent_nums.npy", mmap_mode="r"),
+        kinds=np.load(directory / "corpus_kinds.npy", mmap_mode="r"),
+        entities=np.load(directory / "corpus_entities.npy", mmap_mode="r"),
+    )
+    if not (
+        len(offsets) >= 1
+        and int(offsets[-1]) == len(data)
+        and len(corpus.ent_nums) == len(corpus.kinds) == len(corpus.entities)
+        and len(corpus.ent_nums) == len(corpus)
+    ):
+        raise ValueError("Inconsistent corpus arrays in snapshot")
+    return corpus
+
+
+def _write_list(
+    directory: Path,
+    prefix: str,
+    frames: tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame],
+    aliases_by_ent: dict[int, list[str]],
+    addresses_by_ent: dict[int, list[str]],
+) -> None:
+    """Write one list's frames and lookups as <prefix>*.arrow files."""
+    for name, df in zip(("prim", "alt", "add"), frames, strict=True):
+        _write_table(df, directory / f"{prefix}{name}.arrow")
+    _write_table(
+        _lookup_to_frame(aliases_by_ent, "alt_name"),
+        directory / f"{prefix}aliases.arrow",
+    )
+    _write_table(
+        _lookup_to_frame(addresses_by_ent, "country"),
+        directory / f"{prefix}addresses.arrow",
+    )
+
+
+def _read_list(
+    directory: Path, prefix: str
+) -> tuple[
+    pd.DataFrame,
+    pd.DataFrame,
+    pd.DataFrame,
+    dict[int, list[str]],
+    dict[int, list[str]],
+]:
+    """Read one list written by _write_list."""
+    prim_df, alt_df, add_df = (
+        _read_table(directory / f"{prefix}{name}.arrow").to_pandas()
+        for name in ("prim", "alt", "add")
+    )
+    return (
+        prim_df,
+        alt_df,
+        add_df,
+        _frame_to_lookup(_read_table(directory / f"{prefix}aliases.arrow"), "alt_name"),
+        _frame_to_lookup(
+            _read_table(directory / f"{prefix}addresses.arrow"), "country"
+        ),
+    )
+
+
+def _current_version(directory: Path) -> Path:
+    """Return the version directory named by the CURRENT file."""
+    name = (directory / CURRENT_NAME).read_text(encoding="utf-8").strip()
+    if not name.startswith(_VERSION_PREFIX) or Path(name).name != name:
+        raise ValueError(f"Invalid snapshot version: {name!r}")
+    return directory / name
+
+
+def _publish_version(directory: Path, version: Path) -> None:
+    """Point the CURRENT file at a fully written version directory."""
+    handle, temp_name = tempfile.mkstemp(
+        prefix=f"{CURRENT_NAME}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(handle, "w", encoding="utf-8") as current:
+            current.write(version.name)
+        # mkstemp creates owner-only files; match the other snapshot files
+        os.chmod(temp_name, 0o644)
+        os.replace(temp_name, directory / CURRENT_NAME)
+    except OSError:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+
+
+def _prune_versions(directory: Path, current: Path) -> None:
+    """Remove all but the newest _KEPT_VERSIONS version directories."""
+    versions = sorted(
+        (
+            path
+            for path in directory.glob(f"{_VERSION_PREFIX}*")
+            if path.is_dir() and path != current
+        ),
+        key=lambda path: path.stat().st_mtime_ns,
+        reverse=True,
+    )
+    for path in versions[_KEPT_VERSIONS - 1 :]:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def write_snapshot(directory: Path, snapshot: OFACSnapshot) -> bool:
+    """Write parsed OFAC data to a new snapshot version.
+
+    Every file goes into a fresh, uniquely named version directory, with
+    the manifest written last. The version is then published by
+    replacing the CURRENT file, so readers never see a partially written
+    snapshot and files that were already published never change.
+    Concurrent writers each publish their own complete version.
+
+    Args:
+        directory: Snapshot directory (created if needed).
+        snapshot: Parsed data and the fingerprint of its source files.
+
+    Returns:
+        True if the snapshot was written, False if writing failed.
+    """
+    version: Path | None = None
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        version = Path(tempfile.mkdtemp(prefix=_VERSION_PREFIX, dir=directory))
+        version.chmod(0o755)
+        _write_list(
+            version,
+            "sdn_",
+            (snapshot.sdn_df, snapshot.alt_df, snapshot.add_df),
+            snapshot.aliases_by_ent,
+            snapshot.addresses_by_ent,
+        )
+        if snapshot.consolidated is not None:
+            cons_prim, cons_alt, cons_add, cons_aliases, cons_addresses = (
+                snapshot.consolidated
+            )
+            _write_list(
+                version,
+                "cons_",
+                (cons_prim, cons_alt, cons_add),
+                cons_aliases,
+                cons_addresses,
+            )
+        if snapshot.corpus is not None:
+            _write_corpus(snapshot.corpus, version)
+        manifest = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "source_hash": snapshot.source_hash,
+            "has_corpus": snapshot.corpus is not None,
+            "has_consolidated": snapshot.consolidated is not None,
+            "row_counts": list(snapshot.row_counts),
+            "raw_frames": snapshot.raw_frames,
+            "created_at": datetime.now(UTC).isoformat(),
+        }
+        (version / MANIFEST_NAME).write_text(
+            json.dumps(manifest, indent=2), encoding="utf-8"
+        )
+        _publish_version(directory, version)
+    except (OSError, pa.ArrowException):
+        if version is not None:
+            shutil.rmtree(version, ignore_errors=True)
+        return False
+    # Another writer may be pruning the same versions
+    with contextlib.suppress(OSError):
+        _prune_versions(directory, version)
+    return True
+
+
+def read_snapshot(
+    directory: Path, source_hash: str, raw_frames: bool = True
+) -> OFACSnapshot | None:
+    """Load a snapshot if it was built from the given source files.
+
+    Args:
+        directory: Snapshot directory; the version named by its CURRENT
+            file is read.
+        source_hash: Fingerprint of the current source files.
+        raw_frames: Whether full DataFrames are required.
+
+    Returns:
+        OFACSnapshot, or None if the snapshot is missing, stale, from an
+        older format or unreadable.
+    """
+    try:
+        version = _current_version(directory)
+        manifest = json.loads((version / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if (
+            manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION
+            or manifest.get("source_hash") != source_hash
+            or manifest.get("raw_frames") != raw_frames
+        ):
+            return None
+
+        sdn_rows, alt_rows, add_rows = (int(count) for count in manifest["row_counts"])
+        return OFACSnapshot(
+            *_read_list(version, "sdn_"),
+            source_hash=source_hash,
+            corpus=_read_corpus(version) if manifest.get("has_corpus") else None,
+            row_counts=(sdn_rows, alt_rows, add_rows),
+            raw_frames=raw_frames,
+            consolidated=(
+                _read_list(version, "cons_")
+                if manifest.get("has_consolidated")
+                else None
+            ),
+        )
+    except (OSError, ValueError, KeyError, AttributeError, pa.ArrowException):
+        return None
+
+
+__all__ = [
+    "OFACSnapshot",
+    "read_snapshot",
+    "source_fingerprint",
+    "write_snapshot",
+    "SNAPSHOT_DIRNAME",
+    "SNAPSHOT_FORMAT_VERSION",
+]
@@ -2,6 +2,7 @@
 
 This module provides the OFACUpdater class for:
 - Downloading SDN.CSV, ALT.CSV, ADD.CSV from Treasury.gov
+- Downloading the Consolidated (non-SDN) CONS_PRIM/CONS_ALT/CONS_ADD files
 - Atomic swap mechanism to prevent corruption
 - Version tracking with version.json
 - Error handling with rollback
@@ -33,6 +34,11 @@ SDN_FILES = {
     "alt.csv": f"{OFAC_BASE_URL}/alt.csv",
     "add.csv": f"{OFAC_BASE_URL}/add.csv",
 }
+CONSOLIDATED_FILES = {
+    "cons_prim.csv": f"{OFAC_BASE_URL}/consolidated/cons_prim.csv",
+    "cons_alt.csv": f"{OFAC_BASE_URL}/consolidated/cons_alt.csv",
+    "cons_add.csv": f"{OFAC_BASE_URL}/consolidated/cons_add.csv",
+}
 
 
 class OFACUpdater:
@@ -82,6 +88,39 @@ class OFACUpdater:
             OFACDownloadError: If download fails or network error occurs.
             OFACIntegrityError: If downloaded files are invalid or corrupted.
         """
+        version_info = self._download_files(SDN_FILES)
+        self._write_version_json(version_info)
+        return version_info
+
+    def download_consolidated_files(self) -> dict[str, Any]:
+        """Download the Consolidated (non-SDN) triplet files.
+
+        Downloads CONS_PRIM.CSV, CONS_ALT.CSV and CONS_ADD.CSV with the same
+        validation and atomic swap as the SDN files. version.json keeps
+        tracking the SDN files only.
+
+        Returns:
+            Dict with download metadata, as for download_sdn_files().
+
+        Raises:
+            OFACDownloadError: If download fails or network error occurs.
+            OFACIntegrityError: If downloaded files are invalid or corrupted.
+        """
+        return self._download_files(CONSOLIDATED_FILES)
+
+    def _download_files(self, files: dict[str, str]) -> dict[str, Any]:
+        """Download a set of files, validate them and swap them into place.
+
+        Args:
+            files: Dict mapping local filename to download URL.
+
+        Returns:
+            Dict with download metadata (download_date, last_modified,
+            files_downloaded, file_sizes).
+
+        Raises:
+            OFACDownloadError: If download fails or network error occurs.
+        """
         downloaded_files: dict[str, Path] = {}
         file_metadata: dict[str, Any] = {}
         last_modified: str | None = None
@@ -91,7 +130,7 @@ class OFACUpdater:
             with TemporaryDirectory(prefix="ofac_download_") as temp_dir:
                 temp_path = Path(temp_dir)
 
-                for filename, url in SDN_FILES.items():
+                for filename, url in files.items():
                     file_path = temp_path / filename
                     metadata = self._download_file(url, file_path)
                     downloaded_files[filename] = file_path
@@ -110,24 +149,20 @@ class OFACUpdater:
                 # Atomic swap: move temp files to data_path
                 self._atomic_swap(downloaded_files)
 
-                # Create version.json
-                version_info = {
+                return {
                     "download_date": datetime.now(UTC).isoformat(),
                     "last_modified": last_modified or datetime.now(UTC).isoformat(),
-                    "files_downloaded": list(SDN_FILES.keys()),
+                    "files_downloaded": list(files.keys()),
                     "file_sizes": {
                         name: metadata.get("size", 0)
                         for name, metadata in file_metadata.items()
                     },
                 }
-                self._write_version_json(version_info)
-
-                return version_info
 
         except httpx.HTTPError as e:
             raise OFACDownloadError(
                 f"Network error during OFAC download: {str(e)}",
-                details={"urls": list(SDN_FILES.values()), "error": str(e)},
+                details={"urls": list(files.values()), "error": str(e)},
             ) from e
         except Exception as e:
             # Ensure existing files are not corrupted
@@ -340,5 +375,5 @@ class OFACUpdater:
             return True
 
 
-__all__ = ["OFACUpdater", "OFAC_BASE_URL", "SDN_FILES"]
+__all__ = ["OFACUpdater", "OFAC_BASE_URL", "SDN_FILES", "CONSOLIDATED_FILES"]
 
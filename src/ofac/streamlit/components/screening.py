@@ -1,7 +1,9 @@
 """Screening execution component for Streamlit application.
 
 This module provides the screening execution UI with progress tracking
-and API integration.
+and API integration. Files are submitted as background screening jobs;
+the progress bar follows the job's real progress and results are fetched
+page by page once it completes.
 
 Usage:
     from ofac.streamlit.components.screening import render_screening
@@ -11,6 +13,7 @@ Usage:
 
 import io
 import time
+from typing import Any
 
 import requests
 import streamlit as st
@@ -18,6 +21,15 @@ import streamlit as st
 from ofac.core.config import settings
 from ofac.streamlit.state import set_workflow_step
 
+# Seconds between job progress polls
+_POLL_INTERVAL_SECONDS = 0.5
+
+# Give up waiting on a job that has not finished after this long
+_JOB_DEADLINE_SECONDS = 2 * 60 * 60
+
+# Results fetched per page once a job finishes
+_RESULTS_PAGE_SIZE = 1000
+
 
 def render_screening() -> bool:
     """Render screening execution component.
@@ -81,11 +93,12 @@ def render_screening() -> bool:
             uploaded_file.seek(0)
             file_content = uploaded_file.read()
 
-            status_text.text("Sending request to API...")
-            progress_bar.progress(30)
+            status_text.text("Submitting screening job...")
+            progress_bar.progress(15)
 
-            # Call batch screening API
-            api_url = f"http://{settings.api_host}:{settings.api_port}/screenings/batch"
+            # Submit the file as a background screening job
+            api_base = f"http://{settings.api_host}:{settings.api_port}"
+            api_url = f"{api_base}/screenings/jobs"
             files = {
                 "file": (
                     uploaded_file.name,
@@ -94,57 +107,68 @@ def render_screening() -> bool:
                 )
             }
 
-            status_text.text("Processing entities...")
-            progress_bar.progress(50)
-
             start_time = time.time()
-            response = requests.post(api_url, files=files, timeout=300)
-
-            progress_bar.progress(90)
-
-            if response.status_code == 200:
-                result_data = response.json()
-                processing_time = time.time() - start_time
-
-                status_text.text("Screening completed!")
-                progress_bar.progress(100)
-
-                # Store results
-                st.session_state["screening_results"] = result_data
-                st.session_state["screening_id"] = (
-                    result_data.get("results", [{}])[0].get("screening_id")
-                    if result_data.get("results")
-                    else None
-                )
-
-                st.success(f"✅ Screening completed in {processing_time:.2f} seconds!")
-                st.info(
-                    f"Processed {result_data.get('total_screened', 0)} entities. "
-                    f"OK: {result_data.get('ok_count', 0)}, "
-                    f"REVIEW: {result_data.get('review_count', 0)}, "
-                    f"NOK: {result_data.get('nok_count', 0)}"
-                )
-
-                # Advance to review step
-                time.sleep(1)  # Brief pause to show completion
-                set_workflow_step("review")
-                st.rerun()
-
-            else:
-                error_data = response.json() if response.content else {}
-                error_message = error_data.get("detail", {}).get(
-                    "message", "Unknown error"
-                )
-                st.error(f"❌ Screening failed: {error_message}")
-                progress_bar.empty()
-                status_text.empty()
-
-                if st.button("Try Again"):
-                    st.session_state["screening_started"] = False
-                    st.rerun()
+            response = requests.post(api_url, files=files, timeout=60)
+            if response.status_code != 202:
+                _show_api_error(response, progress_bar, status_text)
+                return False
 
+            # Poll real progress until the job finishes
+            job = response.json()
+            job_url = f"{api_url}/{job['job_id']}"
+            deadline = start_time + _JOB_DEADLINE_SECONDS
+            while job["status"] in ("QUEUED", "RUNNING"):
+                if time.time() > deadline:
+                    _show_error(
+                        "Screening job did not finish in time",
+                        progress_bar,
+                        status_text,
+                    )
+                    return False
+                time.sleep(_POLL_INTERVAL_SECONDS)
+                response = requests.get(job_url, timeout=30)
+                if response.status_code != 200:
+                    _show_api_error(response, progress_bar, status_text)
+                    return False
+                job = response.json()
+                _show_job_progress(job, progress_bar, status_text)
+
+            if job["status"] != "COMPLETED":
+                error_message = (job.get("error") or {}).get("message", "Unknown error")
+                _show_error(error_message, progress_bar, status_text)
                 return False
 
+            status_text.text("Downloading results...")
+            result_data = {
+                "results": _fetch_job_results(f"{job_url}/results"),
+                "total_screened": job["rows_total"],
+                "ok_count": job["ok_count"],
+                "review_count": job["review_count"],
+                "nok_count": job["nok_count"],
+                "ofac_version": job["ofac_version"],
+            }
+            processing_time = time.time() - start_time
+
+            status_text.text("Screening completed!")
+            progress_bar.progress(100)
+
+            # Store results
+            st.session_state["screening_results"] = result_data
+            st.session_state["screening_id"] = job["job_id"]
+
+            st.success(f"✅ Screening completed in {processing_time:.2f} seconds!")
+            st.info(
+                f"Processed {result_data['total_screened']} entities. "
+                f"OK: {result_data['ok_count']}, "
+                f"REVIEW: {result_data['review_count']}, "
+                f"NOK: {result_data['nok_count']}"
+            )
+
+            # Advance to review step
+            time.sleep(1)  # Brief pause to show completion
+            set_workflow_step("review")
+            st.rerun()
+
         except requests.exceptions.ConnectionError:
             st.error("❌ Could not connect to API. Is the API server running?")
             st.info(f"Expected API URL: {api_url}")
@@ -174,4 +198,64 @@ def render_screening() -> bool:
     return True
 
 
+def _show_job_progress(
+    job: dict[str, Any], progress_bar: Any, status_text: Any
+) -> None:
+    """Update the progress widgets from a polled job."""
+    rows_total = job.get("rows_total") or 0
+    if not rows_total:
+        status_text.text("Waiting for a screening worker...")
+        return
+    rows_done = job.get("rows_done", 0)
+    progress_bar.progress(min(99, 15 + 80 * rows_done // rows_total))
+    eta = job.get("eta_seconds")
+    eta_text = f", about {eta:.0f}s left" if eta is not None else ""
+    status_text.text(f"Screened {rows_done} of {rows_total} entities{eta_text}...")
+
+
+def _fetch_job_results(results_url: str) -> list[dict[str, Any]]:
+    """Download every result page of a finished job."""
+    results: list[dict[str, Any]] = []
+    offset: int | None = 0
+    while offset is not None:
+        response = requests.get(
+            results_url,
+            params={"offset": offset, "limit": _RESULTS_PAGE_SIZE},
+            timeout=60,
+        )
+        response.raise_for_status()
+        page = response.json()
+        results.extend(page["results"])
+        offset = page["next_offset"]
+    return results
+
+
+def _show_api_error(
+    response: requests.Response, progress_bar: Any, status_text: Any
+) -> None:
+    """Report a rejected job submission or failed status request."""
+    try:
+        error_data = response.json() if response.content else {}
+    except ValueError:
+        error_data = {}
+    detail = error_data.get("detail") if isinstance(error_data, dict) else None
+    error_message = (
+        detail.get("message", "Unknown error")
+        if isinstance(detail, dict)
+        else f"API returned HTTP {response.status_code}"
+    )
+    _show_error(error_message, progress_bar, status_text)
+
+
+def _show_error(error_message: str, progress_bar: Any, status_text: Any) -> None:
+    """Report a failed screening and offer to start over."""
+    st.error(f"❌ Screening failed: {error_message}")
+    progress_bar.empty()
+    status_text.empty()
+
+    if st.button("Try Again"):
+        st.session_state["screening_started"] = False
+        st.rerun()
+
+
 __all__ = ["render_screening"]
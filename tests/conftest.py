@@ -1,7 +1,8 @@
 """Pytest configuration and shared fixtures.
 
 This module provides fixtures for:
-- Mock OFAC data
+- Mock OFAC data (with data snapshots disabled)
+- Batch job store in a temporary directory
 - Test client setup
 - Temporary directories
 - Sample entities for testing
@@ -17,6 +18,24 @@ FIXTURES_DIR = Path(__file__).parent / "fixtures"
 MOCK_OFAC_DATA_DIR = FIXTURES_DIR / "mock_ofac_data"
 
 
+@pytest.fixture(autouse=True)
+def no_ofac_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep loaders from writing snapshots into the fixtures directory."""
+    from ofac.core.config import settings
+
+    monkeypatch.setattr(settings, "snapshot_enabled", False)
+
+
+@pytest.fixture(autouse=True)
+def job_store_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep batch job databases out of the working directory."""
+    from ofac.core.config import settings
+
+    path = tmp_path / "jobs" / "jobs.db"
+    monkeypatch.setattr(settings, "job_store_path", path)
+    return path
+
+
 @pytest.fixture
 def fixtures_dir() -> Path:
     """Return the path to the test fixtures directory."""
@@ -236,3 +236,202 @@ class TestBatchScreening:
         data = response.json()
         assert "FILE_COLUMN_MAPPING_ERROR" in str(data["detail"])
 
+
+def test_screening_saturated_pool_returns_503(mock_ofac_data_dir) -> None:
+    """A full worker pool rejects screenings with 503 and Retry-After."""
+    from ofac.core.executor import MatchExecutor
+
+    app = create_app()
+    app.state.ofac_data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+    executor = MatchExecutor(max_workers=1, max_queue=0)
+    executor._pending = executor.capacity
+    app.state.match_executor = executor
+
+    client = TestClient(app)
+    response = client.post(
+        "/screenings/single", json={"entity_name": "BANCO NACIONAL DE CUBA"}
+    )
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["detail"]["code"] == "SCREEN_BUSY"
+
+
+def test_screening_client_limit_returns_429(mock_ofac_data_dir) -> None:
+    """A client with too many pending screenings gets 429."""
+    from ofac.core.executor import MatchExecutor
+
+    app = create_app()
+    app.state.ofac_data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+    executor = MatchExecutor(max_workers=1, max_queue=4, max_per_client=1)
+    executor._per_client["testclient"] = 1
+    app.state.match_executor = executor
+
+    client = TestClient(app)
+    response = client.post(
+        "/screenings/batch",
+        files={"file": ("orgs.csv", b"Organization Name\nACME\n", "text/csv")},
+    )
+
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "1"
+    assert response.json()["detail"]["code"] == "SCREEN_RATE_LIMITED"
+
+
+
+def test_batch_screening_job_lifecycle(mock_ofac_data_dir) -> None:
+    """Jobs are accepted, report progress and return paged results."""
+    import time
+
+    app = create_app()
+    app.state.ofac_data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+
+    client = TestClient(app)
+
+    csv_content = "Organization Name,Country\nBANCO NACIONAL DE CUBA,Cuba\nTest Org,US"
+    response = client.post(
+        "/screenings/jobs",
+        files={"file": ("test.csv", io.BytesIO(csv_content.encode()), "text/csv")},
+    )
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    deadline = time.monotonic() + 10
+    job = response.json()
+    while job["status"] not in ("COMPLETED", "FAILED"):
+        assert time.monotonic() < deadline
+        time.sleep(0.05)
+        job = client.get(f"/screenings/jobs/{job_id}").json()
+
+    assert job["status"] == "COMPLETED"
+    assert job["rows_done"] == job["rows_total"] == 2
+    assert job["ok_count"] + job["review_count"] + job["nok_count"] == 2
+
+    page = client.get(f"/screenings/jobs/{job_id}/results", params={"limit": 1})
+    assert page.status_code == 200
+    assert len(page.json()["results"]) == 1
+    assert page.json()["next_offset"] == 1
+
+    missing = client.get("/screenings/jobs/unknown")
+    assert missing.status_code == 404
+    assert missing.json()["detail"]["code"] == "JOB_NOT_FOUND"
+
+
+class TestStreamingBatchScreening:
+    """Tests for streamed batch screening."""
+
+    CSV_CONTENT = (
+        "Organization Name,Country\nBANCO NACIONAL DE CUBA,Cuba\nTest Org,US\nAL QAEDA,"
+    )
+
+    def _client(self, mock_ofac_data_dir) -> TestClient:
+        """Client of an app serving the mock OFAC data."""
+        app = create_app()
+        app.state.ofac_data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+        return TestClient(app)
+
+    def test_ndjson_matches_batch_response(
+        self, mock_ofac_data_dir, monkeypatch
+    ) -> None:
+        """Streamed results, screened in chunks, match the batch endpoint."""
+        import json
+
+        from ofac.core.config import settings
+
+        monkeypatch.setattr(settings, "stream_chunk_rows", 2)
+        client = self._client(mock_ofac_data_dir)
+        files = {
+            "file": ("test.csv", io.BytesIO(self.CSV_CONTENT.encode()), "text/csv")
+        }
+
+        response = client.post("/screenings/batch/stream", files=files)
+        batch = client.post(
+            "/screenings/batch",
+            files={
+                "file": ("test.csv", io.BytesIO(self.CSV_CONTENT.encode()), "text/csv")
+            },
+        ).json()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [record["type"] for record in records] == [
+            "result",
+            "result",
+            "result",
+            "summary",
+        ]
+        streamed = [record["data"] for record in records[:-1]]
+        assert [r["entity_input"] for r in streamed] == [
+            r["entity_input"] for r in batch["results"]
+        ]
+        assert [r["match_status"] for r in streamed] == [
+            r["match_status"] for r in batch["results"]
+        ]
+        summary = records[-1]["data"]
+        assert summary["total_screened"] == 3
+        assert summary["nok_count"] == batch["nok_count"]
+        assert summary["ok_count"] + summary["review_count"] + summary["nok_count"] == 3
+        assert {r["screening_id"] for r in streamed} == {summary["screening_id"]}
+
+    def test_sse_format(self, mock_ofac_data_dir) -> None:
+        """SSE streams name each event after its record type."""
+        client = self._client(mock_ofac_data_dir)
+        files = {
+            "file": ("test.csv", io.BytesIO(self.CSV_CONTENT.encode()), "text/csv")
+        }
+
+        response = client.post("/screenings/batch/stream?format=sse", files=files)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [event for event in response.text.split("\n\n") if event]
+        assert [event.splitlines()[0] for event in events] == [
+            "event: result",
+            "event: result",
+            "event: result",
+            "event: summary",
+        ]
+        assert all(event.splitlines()[1].startswith("data: {") for event in events)
+
+    def test_invalid_file_rejected_before_streaming(self, mock_ofac_data_dir) -> None:
+        """File errors keep their status code instead of starting a stream."""
+        client = self._client(mock_ofac_data_dir)
+        files = {"file": ("test.pdf", io.BytesIO(b"PDF content"), "application/pdf")}
+
+        response = client.post("/screenings/batch/stream", files=files)
+
+        assert response.status_code == 400
+        assert response.json()["detail"]["code"] == "FILE_INVALID_FORMAT"
+
+    def test_failure_mid_stream_ends_with_error_record(
+        self, mock_ofac_data_dir, monkeypatch
+    ) -> None:
+        """A chunk failing after the stream started yields an error record."""
+        import json
+
+        from ofac.api.routes import screening
+        from ofac.core.config import settings
+
+        screen_entities = screening.screen_entities
+        calls = []
+
+        def failing_after_first_chunk(*args, **kwargs):
+            calls.append(args)
+            if len(calls) > 1:
+                raise RuntimeError("worker lost")
+            return screen_entities(*args, **kwargs)
+
+        monkeypatch.setattr(settings, "stream_chunk_rows", 2)
+        monkeypatch.setattr(screening, "screen_entities", failing_after_first_chunk)
+        client = self._client(mock_ofac_data_dir)
+        files = {
+            "file": ("test.csv", io.BytesIO(self.CSV_CONTENT.encode()), "text/csv")
+        }
+
+        response = client.post("/screenings/batch/stream", files=files)
+
+        assert response.status_code == 200
+        records = [json.loads(line) for line in response.text.splitlines()]
+        assert [record["type"] for record in records] == ["result", "result", "error"]
+        assert records[-1]["data"]["code"] == "SCREENING_ERROR"
@@ -1,5 +1,6 @@
 """Integration tests for data status endpoint."""
 
+from fastapi import Depends
 from fastapi.testclient import TestClient
 
 from ofac.api.main import create_app
@@ -67,3 +68,84 @@ def test_get_status_includes_record_count(mock_ofac_data_dir) -> None:
     assert isinstance(result["record_count"], int)
     assert result["record_count"] >= 0
 
+
+
+def test_cache_stats_count_repeated_screenings(mock_ofac_data_dir) -> None:
+    """GET /data/cache reports hits for repeated screenings."""
+    loader = OFACDataLoader(data_path=mock_ofac_data_dir)
+    app = create_app()
+    app.state.ofac_data = loader.load()
+
+    client = TestClient(app)
+    for _ in range(2):
+        client.post("/screenings/single", json={"entity_name": "BANCO NACIONAL DE CUBA"})
+
+    response = client.get("/data/cache")
+    assert response.status_code == 200
+
+    result = response.json()
+    assert result["enabled"] is True
+    assert result["hits"] == 1
+    assert result["misses"] == 1
+    assert result["size"] == 1
+
+
+def test_refresh_publishes_new_data(mock_ofac_data_dir, tmp_path, monkeypatch) -> None:
+    """POST /data/refresh swaps in the refreshed data as a new version."""
+    import shutil
+
+    import ofac.api.main as api_main
+    from ofac.data.updater import OFACUpdater
+
+    data_dir = tmp_path / "ofac"
+    shutil.copytree(mock_ofac_data_dir, data_dir)
+    loader = OFACDataLoader(data_path=data_dir)
+    app = create_app()
+    app.state.ofac_data = loader.load()
+    monkeypatch.setattr(api_main, "_ofac_loader", loader)
+
+    def fake_download(_self: OFACUpdater) -> dict:
+        sdn_path = data_dir / "sdn.csv"
+        sdn_path.write_text(
+            sdn_path.read_text(encoding="utf-8").replace("TEST VESSEL", "NEW VESSEL"),
+            encoding="utf-8",
+        )
+        return {}
+
+    monkeypatch.setattr(OFACUpdater, "download_sdn_files", fake_download)
+    monkeypatch.setattr(OFACUpdater, "download_consolidated_files", lambda _self: {})
+
+    client = TestClient(app)
+    client.get("/data/status")
+    response = client.post("/data/refresh")
+
+    assert response.status_code == 200
+    assert response.json()["changes"] == {"added": 0, "modified": 1, "removed": 0}
+    assert app.state.data_holder.version == 2
+    assert app.state.data_holder.current is loader.data
+    assert app.state.data_holder.matcher.data is loader.data
+    screening = client.post("/screenings/single", json={"entity_name": "NEW VESSEL"})
+    assert screening.json()["data"]["matches"][0]["sdn_name"] == "NEW VESSEL"
+
+
+def test_matcher_shared_across_requests(mock_ofac_data_dir) -> None:
+    """Requests reuse the matcher built when the data was published."""
+    from ofac.api.deps import get_matcher
+
+    loader = OFACDataLoader(data_path=mock_ofac_data_dir)
+    app = create_app()
+    app.state.ofac_data = loader.load()
+    seen = []
+
+    @app.get("/test/matcher")
+    def matcher_id(matcher=Depends(get_matcher)) -> dict:
+        seen.append(matcher)
+        return {}
+
+    client = TestClient(app)
+    for _ in range(3):
+        assert client.get("/test/matcher").status_code == 200
+
+    assert len({id(matcher) for matcher in seen}) == 1
+    assert seen[0] is app.state.data_holder.matcher
+    assert seen[0].data is app.state.ofac_data
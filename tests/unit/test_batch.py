@@ -0,0 +1,162 @@
+"""Unit tests for sharded batch screening."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from ofac.core.batch import BatchEnginePool, BatchScreeningEngine, screen_entities
+from ofac.core.matcher import EntityMatcher
+from ofac.core.models import EntityInput
+from ofac.data.loader import OFACDataLoader
+
+
+@pytest.fixture
+def matcher(mock_ofac_data_dir: Path) -> EntityMatcher:
+    """Shared matcher over the mock OFAC data."""
+    return EntityMatcher(OFACDataLoader(data_path=mock_ofac_data_dir).load()).prepare()
+
+
+@pytest.fixture
+def entity_inputs() -> list[EntityInput]:
+    """A small batch mixing hits, misses and countries."""
+    return [
+        EntityInput(entity_name="BANCO NACIONAL DE CUBA", country="Cuba"),
+        EntityInput(entity_name="AL QAEDA"),
+        EntityInput(entity_name="Acme Widgets", country="US"),
+        EntityInput(entity_name="TEST VESSEL"),
+        EntityInput(entity_name="Cuban National Bank", country="CU"),
+    ]
+
+
+def _comparable(results: list) -> list[dict]:
+    """Result dumps without the per-result timestamp."""
+    return [result.model_dump(exclude={"timestamp"}) for result in results]
+
+
+class TestBatchScreeningEngine:
+    """Tests for in-process and sharded batch screening."""
+
+    def test_small_batch_screens_in_process(
+        self, matcher: EntityMatcher, entity_inputs: list[EntityInput]
+    ) -> None:
+        """Batches within one shard never start worker processes."""
+        engine = BatchScreeningEngine(matcher, workers=2, shard_size=10)
+
+        results = engine.screen(entity_inputs, "batch-1")
+
+        assert engine._pool is None
+        assert _comparable(results) == _comparable(
+            screen_entities(matcher, entity_inputs, "batch-1")
+        )
+
+    def test_sharded_results_match_in_process(
+        self, matcher: EntityMatcher, entity_inputs: list[EntityInput]
+    ) -> None:
+        """Shards screened by worker processes merge back in input order."""
+        engine = BatchScreeningEngine(matcher, workers=2, shard_size=2)
+        try:
+            first = engine.screen(entity_inputs, "batch-1")
+            second = engine.screen(entity_inputs[::-1], "batch-2")
+            pool = engine._pool
+        finally:
+            engine.shutdown()
+
+        assert pool is not None
+        assert _comparable(first) == _comparable(
+            screen_entities(matcher, entity_inputs, "batch-1")
+        )
+        assert [result.entity_input for result in second] == entity_inputs[::-1]
+        assert engine._pool is None
+
+    def test_workers_keep_stop_at_exact_nok(
+        self, mock_ofac_data_dir: Path, entity_inputs: list[EntityInput]
+    ) -> None:
+        """Worker matchers stop at exact hits when the engine's matcher does."""
+        data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+        stopping = EntityMatcher(data, stop_at_exact_nok=True).prepare()
+        full = EntityMatcher(data, stop_at_exact_nok=False).prepare()
+        expected = screen_entities(stopping, entity_inputs, "batch-1")
+        assert _comparable(expected) != _comparable(
+            screen_entities(full, entity_inputs, "batch-1")
+        )
+
+        engine = BatchScreeningEngine(stopping, workers=2, shard_size=2)
+        try:
+            results = engine.screen(entity_inputs, "batch-1")
+        finally:
+            engine.shutdown()
+
+        assert _comparable(results) == _comparable(expected)
+
+    def test_iter_screen_yields_each_shard(
+        self, matcher: EntityMatcher, entity_inputs: list[EntityInput]
+    ) -> None:
+        """Sharded batches are yielded shard by shard with their offsets."""
+        engine = BatchScreeningEngine(matcher, workers=2, shard_size=2)
+        try:
+            parts = list(engine.iter_screen(entity_inputs, "batch-1", chunk_rows=1))
+        finally:
+            engine.shutdown()
+
+        assert [(offset, len(results)) for offset, results in parts] == [
+            (0, 2),
+            (2, 2),
+            (4, 1),
+        ]
+        assert _comparable([r for _, results in parts for r in results]) == (
+            _comparable(screen_entities(matcher, entity_inputs, "batch-1"))
+        )
+
+    def test_iter_screen_in_process_chunks(
+        self, matcher: EntityMatcher, entity_inputs: list[EntityInput]
+    ) -> None:
+        """In-process batches are yielded every chunk_rows rows."""
+        engine = BatchScreeningEngine(matcher, workers=1)
+
+        parts = list(engine.iter_screen(entity_inputs, "batch-1", chunk_rows=2))
+
+        assert [offset for offset, _ in parts] == [0, 2, 4]
+        assert list(engine.iter_screen([], "batch-1")) == []
+        assert engine._pool is None
+
+    def test_zero_workers_uses_every_core(self, matcher: EntityMatcher) -> None:
+        """workers=0 sizes the pool to the CPU count."""
+        assert BatchScreeningEngine(matcher, workers=0).workers == (os.cpu_count() or 1)
+
+
+class TestBatchEnginePool:
+    """Tests for per-version batch engines with leases."""
+
+    def test_versions_keep_their_engines_until_last_lease(
+        self, matcher: EntityMatcher, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A replaced version's engine stops only after its last lease ends."""
+        stopped: list[BatchScreeningEngine] = []
+
+        def shutdown(engine: BatchScreeningEngine, wait: bool = True) -> None:
+            assert not wait
+            stopped.append(engine)
+
+        monkeypatch.setattr(BatchScreeningEngine, "shutdown", shutdown)
+        newer = EntityMatcher(matcher.data)
+        current = matcher
+        pool = BatchEnginePool(lambda: current)
+
+        with pool.lease(matcher) as old_engine:
+            current = newer
+            with pool.lease(newer) as new_engine:
+                assert new_engine is not old_engine
+                assert new_engine.matcher is newer
+                # A lease on the new version leaves the old engine running
+                assert stopped == []
+            with pool.lease(matcher) as same_engine:
+                assert same_engine is old_engine
+            assert stopped == []
+
+        assert stopped == [old_engine]
+        with pool.lease(newer) as engine:
+            # The idle current engine is reused
+            assert engine is new_engine
+        pool.shutdown()
+        assert stopped == [old_engine, new_engine]
@@ -0,0 +1,86 @@
+"""Unit tests for length-bucketed corpus partitions."""
+
+import random
+import string
+
+import numpy as np
+from rapidfuzz import fuzz
+
+from ofac.core.buckets import LengthBuckets, ratio_upper_bound
+
+
+def _random_names(rng: random.Random, count: int) -> list[str]:
+    """Generate names of 0-40 characters from a small alphabet."""
+    return [
+        "".join(rng.choice("ABC D") for _ in range(rng.randint(0, 40)))
+        for _ in range(count)
+    ]
+
+
+class TestRatioUpperBound:
+    """Tests for the length-ratio bound."""
+
+    def test_bound_is_never_exceeded(self) -> None:
+        """No pair of strings scores above the bound of their lengths."""
+        rng = random.Random(7)
+        names = _random_names(rng, 300)
+        buckets = LengthBuckets.build(names)
+
+        for query in _random_names(rng, 30):
+            bounds = dict(
+                zip(buckets.lengths.tolist(), buckets.bounds(len(query)), strict=True)
+            )
+            for name in names:
+                assert fuzz.ratio(query, name) <= bounds[len(name)]
+
+    def test_bound_values(self) -> None:
+        """Equal lengths bound at 100; the bound falls with the length ratio."""
+        bounds = ratio_upper_bound(10, np.array([0, 5, 10, 30]))
+
+        np.testing.assert_allclose(bounds, [0, 200 * 5 / 15, 100, 50])
+        assert ratio_upper_bound(0, np.array([0]))[0] == 100
+
+
+class TestLengthBuckets:
+    """Tests for bucket windows."""
+
+    def test_names_are_in_length_order(self) -> None:
+        """names and order list the corpus sorted by length, stably."""
+        names = ["ABCD", "A", "XY", "B", "ABCDE"]
+        buckets = LengthBuckets.build(names)
+
+        assert buckets.order.tolist() == [1, 3, 2, 0, 4]
+        assert buckets.names == ["A", "B", "XY", "ABCD", "ABCDE"]
+        assert buckets.ranks[buckets.order].tolist() == list(range(len(names)))
+        assert len(buckets) == 4
+
+    def test_window_holds_exactly_the_reachable_names(self) -> None:
+        """The window is every name whose bucket bound reaches the score."""
+        rng = random.Random(11)
+        names = [string.ascii_uppercase[: rng.randint(1, 26)] for _ in range(200)]
+        buckets = LengthBuckets.build(names)
+        bounds = buckets.bounds(10)
+
+        start, stop = buckets.window(bounds, 80)
+        inside = set(buckets.order[start:stop].tolist())
+
+        for position, name in enumerate(names):
+            reachable = ratio_upper_bound(10, np.array([len(name)]))[0] >= 80 - 1e-6
+            assert (position in inside) == reachable
+
+    def test_unreachable_score_gives_empty_window(self) -> None:
+        """No window is returned when no bucket can reach the score."""
+        buckets = LengthBuckets.build(["A", "AB"])
+
+        assert buckets.window(buckets.bounds(40), 90) == (0, 0)
+
+    def test_bound_for_size(self) -> None:
+        """The returned bound's window holds at least the requested names."""
+        names = ["A" * length for length in range(1, 21) for _ in range(5)]
+        buckets = LengthBuckets.build(names)
+        bounds = buckets.bounds(10)
+
+        start, stop = buckets.window(bounds, buckets.bound_for_size(bounds, 12))
+
+        assert 12 <= stop - start < 30
+        assert buckets.bound_for_size(bounds, 1000) == 0.0
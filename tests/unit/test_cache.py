@@ -0,0 +1,130 @@
+"""Unit tests for the screening result cache."""
+
+from pathlib import Path
+
+import pytest
+
+from ofac.core import cache as cache_module
+from ofac.core.cache import MatchCache
+from ofac.core.config import settings
+from ofac.core.matcher import EntityMatcher
+from ofac.data.loader import OFACData, OFACDataLoader
+
+
+@pytest.fixture
+def ofac_data(mock_ofac_data_dir: Path) -> OFACData:
+    """OFAC data loaded from the mock CSV files."""
+    return OFACDataLoader(data_path=mock_ofac_data_dir).load()
+
+
+class TestMatchCache:
+    """Tests for MatchCache storage, eviction and counters."""
+
+    def test_defaults_from_settings(self) -> None:
+        """Size and TTL default to the configured values."""
+        cache = MatchCache()
+
+        assert cache.max_size == settings.match_cache_size
+        assert cache.ttl_seconds == settings.match_cache_ttl_seconds
+
+    def test_hit_and_miss_counters(self) -> None:
+        """Lookups are counted as hits or misses."""
+        cache = MatchCache(max_size=10, ttl_seconds=0)
+
+        assert cache.get("a") is None
+        cache.put("a", [])
+        assert cache.get("a") == []
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        """The entry not used for longest is dropped when full."""
+        cache = MatchCache(max_size=2, ttl_seconds=0)
+        cache.put("a", [])
+        cache.put("b", [])
+        cache.get("a")
+        cache.put("c", [])
+
+        assert cache.get("b") is None
+        assert cache.get("a") == []
+        assert cache.stats()["evictions"] == 1
+
+    def test_expired_entries_are_misses(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Entries older than the TTL are not served."""
+        now = [1000.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = MatchCache(max_size=10, ttl_seconds=60)
+        cache.put("a", [])
+
+        now[0] += 61
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_zero_size_disables_storage(self) -> None:
+        """A cache of size 0 never stores results."""
+        cache = MatchCache(max_size=0)
+        cache.put("a", [])
+
+        assert not cache.enabled
+        assert len(cache) == 0
+
+
+class TestMatcherCache:
+    """Tests for EntityMatcher with a result cache."""
+
+    def test_repeated_query_hits_cache(self, ofac_data: OFACData) -> None:
+        """The second identical query is served from the cache."""
+        cache = MatchCache(max_size=10)
+        matcher = EntityMatcher(ofac_data, cache=cache)
+
+        first = matcher.match("BANCO NACIONAL DE CUBA", "Cuba")
+        second = matcher.match("  CUBA   BANCO NACIONAL DE", "Cuba")
+
+        assert [m.model_dump() for m in second] == [m.model_dump() for m in first]
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_key_includes_query_parameters(self, ofac_data: OFACData) -> None:
+        """Country, max_results and min_score are part of the key."""
+        cache = MatchCache(max_size=10)
+        EntityMatcher(ofac_data, cache=cache).match("BANCO NACIONAL DE CUBA")
+        EntityMatcher(ofac_data, cache=cache).match("BANCO NACIONAL DE CUBA", "Cuba")
+        EntityMatcher(ofac_data, cache=cache).match(
+            "BANCO NACIONAL DE CUBA", max_results=1
+        )
+        EntityMatcher(ofac_data, min_score=80, cache=cache).match(
+            "BANCO NACIONAL DE CUBA"
+        )
+
+        assert cache.hits == 0
+        assert len(cache) == 4
+
+    def test_new_dataset_version_misses(self, ofac_data: OFACData) -> None:
+        """Results cached for one data version are not reused for another."""
+        cache = MatchCache(max_size=10)
+        EntityMatcher(ofac_data, cache=cache).match("BANCO NACIONAL DE CUBA")
+
+        refreshed = ofac_data._replace(
+            version=ofac_data.version.model_copy(update={"loaded_at": "later"})
+        )
+        EntityMatcher(refreshed, cache=cache).match("BANCO NACIONAL DE CUBA")
+
+        assert cache.hits == 0
+
+    def test_match_many_uses_cache(self, ofac_data: OFACData) -> None:
+        """match_many serves cached names and caches the rest."""
+        cache = MatchCache(max_size=10)
+        matcher = EntityMatcher(ofac_data, cache=cache)
+        expected = EntityMatcher(ofac_data).match_many(["AL QAEDA", "PASDARAN", ""])
+
+        matcher.match("AL QAEDA")
+        results = matcher.match_many(["AL QAEDA", "PASDARAN", ""])
+
+        assert [[m.model_dump() for m in row] for row in results] == [
+            [m.model_dump() for m in row] for row in expected
+        ]
+        assert cache.hits == 1
+        assert len(cache) == 2
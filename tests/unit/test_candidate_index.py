@@ -0,0 +1,251 @@
+"""Unit tests for the trigram candidate index."""
+
+import random
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ofac.core.config import settings
+from ofac.core.matcher import EntityMatcher
+from ofac.data.corpus import build_name_corpus
+from ofac.data.entities import build_entity_table
+from ofac.data.index import CandidateIndex, name_trigrams, normalize_index_text
+from ofac.data.loader import OFACData, OFACDataLoader
+from ofac.data.schemas import OFACDataVersion
+
+SAMPLE_DATA_CSV = (
+    Path(__file__).parents[2]
+    / "sample-data"
+    / "Round 2 2025-Project to Fund Response ACN INTL - 20250812 - RAW DATA.csv"
+)
+
+
+def _make_data(
+    names: list[str],
+    aliases_by_ent: dict[int, list[str]] | None = None,
+    addresses_by_ent: dict[int, list[str]] | None = None,
+) -> OFACData:
+    """Build OFACData with one SDN entry per name (ent_num = position + 1)."""
+    sdn_df = pd.DataFrame(
+        {
+            "ent_num": list(range(1, len(names) + 1)),
+            "sdn_name": names,
+            "sdn_type": ["entity"] * len(names),
+            "programs": ["SDGT"] * len(names),
+            "remarks": [""] * len(names),
+        }
+    )
+    aliases_by_ent = aliases_by_ent or {}
+    addresses_by_ent = addresses_by_ent or {}
+    entities = build_entity_table(sdn_df, addresses_by_ent)
+    return OFACData(
+        sdn_df=sdn_df,
+        alt_df=pd.DataFrame(),
+        add_df=pd.DataFrame(),
+        aliases_by_ent=aliases_by_ent,
+        addresses_by_ent=addresses_by_ent,
+        version=OFACDataVersion(sdn_count=len(names), source="SDN"),
+        entities=entities,
+        corpus=build_name_corpus(entities, aliases_by_ent),
+    )
+
+
+class TestTrigrams:
+    """Tests for name normalization and trigram extraction."""
+
+    def test_normalize_strips_accents_and_punctuation(self) -> None:
+        """Names are casefolded ASCII tokens."""
+        assert normalize_index_text("Archidiocèse de Bangui!") == [
+            "archidiocese",
+            "de",
+            "bangui",
+        ]
+
+    def test_trigrams_ignore_word_order(self) -> None:
+        """Trigram sets do not depend on token order."""
+        assert name_trigrams("BANCO NACIONAL") == name_trigrams("Nacional Banco")
+
+    def test_short_token_produces_trigram(self) -> None:
+        """Single-character tokens still contribute a padded trigram."""
+        assert name_trigrams("A") == {" a "}
+
+
+class TestCandidateIndex:
+    """Tests for CandidateIndex.candidates()."""
+
+    def test_candidates_share_trigrams(self) -> None:
+        """Only entries sharing a trigram with the query are returned."""
+        data = _make_data(["BANCO NACIONAL DE CUBA", "AL-QAIDA", "ZZZ"])
+        index = CandidateIndex.build(data.corpus, min_candidates=1)
+
+        assert index.candidates("banco").tolist() == [0]
+
+    def test_recall_guard_falls_back_to_full_scan(self) -> None:
+        """Too few candidates returns None so the caller scans everything."""
+        data = _make_data(["BANCO NACIONAL DE CUBA", "AL-QAIDA"])
+        index = CandidateIndex.build(data.corpus, min_candidates=2)
+
+        assert index.candidates("banco") is None
+        assert index.candidates("qqqq") is None
+
+    def test_caps_at_max_candidates(self) -> None:
+        """Only the best-overlapping entries are kept, in corpus order."""
+        data = _make_data(["ALPHA ONE", "ALPHA TWO", "ALPHA ONE TWO", "BETA"])
+        index = CandidateIndex.build(data.corpus, max_candidates=1, min_candidates=1)
+
+        assert index.candidates("ALPHA ONE TWO").tolist() == [2]
+
+    def test_defaults_from_settings(self) -> None:
+        """Limits default to the configured values."""
+        index = CandidateIndex({}, 0)
+
+        assert index.max_candidates == settings.candidate_max_count
+        assert index.min_candidates == settings.candidate_min_count
+
+    def test_loader_builds_index_when_enabled(
+        self, mock_ofac_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """load() attaches an index only when enabled in settings."""
+        assert (
+            OFACDataLoader(data_path=mock_ofac_data_dir).load().candidate_index is None
+        )
+
+        monkeypatch.setattr(settings, "candidate_index_enabled", True)
+        data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+        assert isinstance(data.candidate_index, CandidateIndex)
+
+
+class TestMatcherWithIndex:
+    """Tests for EntityMatcher using a candidate index."""
+
+    def test_index_results_match_full_scan(self, mock_ofac_data_dir: Path) -> None:
+        """Indexed matching returns the full-scan hits for real queries."""
+        data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+        indexed = data._replace(
+            candidate_index=CandidateIndex.build(data.corpus, min_candidates=1)
+        )
+        full = EntityMatcher(data, min_score=settings.match_threshold_review)
+        narrowed = EntityMatcher(indexed, min_score=settings.match_threshold_review)
+
+        for query in ["BANCO NACIONAL DE CUBA", "AL QAEDA", "PASDARAN", "IRGC"]:
+            assert [m.model_dump() for m in narrowed.match(query, "Cuba")] == [
+                m.model_dump() for m in full.match(query, "Cuba")
+            ]
+
+    def test_entries_outside_candidates_not_returned(self) -> None:
+        """Entries that were never scored are not reported as matches."""
+        data = _make_data(["BANCO NACIONAL DE CUBA", "XYZ"])
+        indexed = data._replace(
+            candidate_index=CandidateIndex.build(data.corpus, min_candidates=1)
+        )
+
+        matches = EntityMatcher(indexed).match("BANCO NACIONAL DE CUBA")
+
+        assert [m.ent_num for m in matches] == [1]
+
+
+def _perturb(name: str, rng: random.Random) -> str:
+    """Apply a realistic spelling variation to a name."""
+    tokens = name.split()
+    choice = rng.randrange(4)
+    if choice == 0 and len(tokens) > 1:
+        rng.shuffle(tokens)
+    elif choice == 1:
+        position = rng.randrange(len(tokens))
+        token = tokens[position]
+        if len(token) > 3:
+            cut = rng.randrange(1, len(token) - 1)
+            tokens[position] = token[:cut] + token[cut + 1 :]
+    elif choice == 2:
+        tokens = [token.upper() for token in tokens]
+    else:
+        position = rng.randrange(len(tokens))
+        tokens[position] = tokens[position] + "s"
+    return " ".join(tokens)
+
+
+class TestRecallBenchmark:
+    """Recall of the candidate index against the full scan on sample data.
+
+    Sample-data institutions are screened against a synthetic list made of
+    perturbed copies of those institutions (the true hits) hidden among
+    distractors built from the same vocabulary. Every full-scan hit at or
+    above the REVIEW threshold must also be found through the index.
+    """
+
+    DISTRACTOR_COUNT = 3000
+
+    @pytest.fixture
+    def sample_entities(self) -> list[tuple[str, str]]:
+        """Institution names and countries from the sample grant file."""
+        df = pd.read_csv(SAMPLE_DATA_CSV, encoding="latin-1")
+        return [
+            (" ".join(str(name).split()), str(country).title())
+            for name, country in zip(df["Institution"], df["Country"], strict=True)
+            if pd.notna(name)
+        ]
+
+    @pytest.fixture
+    def benchmark_data(self, sample_entities: list[tuple[str, str]]) -> OFACData:
+        """Synthetic sanctions list with planted near-duplicates."""
+        rng = random.Random(2025)
+        vocabulary = sorted(
+            {token for name, _ in sample_entities for token in name.split()}
+        )
+        countries = sorted({country for _, country in sample_entities})
+
+        names: list[str] = []
+        addresses: dict[int, list[str]] = {}
+        for name, country in sample_entities:
+            names.append(_perturb(name, rng))
+            addresses[len(names)] = [country]
+        for _ in range(self.DISTRACTOR_COUNT):
+            names.append(" ".join(rng.sample(vocabulary, rng.randint(2, 6))))
+            addresses[len(names)] = [rng.choice(countries)]
+
+        aliases = {
+            rng.randint(1, len(names)): [_perturb(name, rng)]
+            for name, _ in sample_entities
+        }
+        return _make_data(names, aliases, addresses)
+
+    def test_index_recall_against_full_scan(
+        self,
+        sample_entities: list[tuple[str, str]],
+        benchmark_data: OFACData,
+    ) -> None:
+        """No full-scan hit above the REVIEW threshold is lost."""
+        assert benchmark_data.corpus is not None
+        index = CandidateIndex.build(benchmark_data.corpus)
+        indexed_data = benchmark_data._replace(candidate_index=index)
+
+        threshold = settings.match_threshold_review
+        full = EntityMatcher(benchmark_data, min_score=threshold)
+        narrowed = EntityMatcher(indexed_data, min_score=threshold)
+
+        true_hits = 0
+        found_hits = 0
+        candidate_counts: list[int] = []
+        for name, country in sample_entities:
+            positions = index.candidates(name)
+            candidate_counts.append(
+                len(benchmark_data.corpus) if positions is None else len(positions)
+            )
+            for entity_country in (None, country):
+                expected = {
+                    (m.ent_num, m.match_type, m.match_score)
+                    for m in full.match(name, entity_country)
+                }
+                actual = {
+                    (m.ent_num, m.match_type, m.match_score)
+                    for m in narrowed.match(name, entity_country)
+                }
+                true_hits += len(expected)
+                found_hits += len(expected & actual)
+
+        assert true_hits >= len(sample_entities)
+        assert found_hits / true_hits == 1.0
+        # The index must actually narrow the search
+        assert sum(candidate_counts) / len(candidate_counts) <= index.max_candidates
+        assert index.max_candidates < len(benchmark_data.corpus) / 5
@@ -23,6 +23,11 @@ class TestSettingsDefaults:
         settings = Settings()
         assert settings.match_threshold_review == 80
 
+    def test_default_matcher_engine(self) -> None:
+        """Default matcher engine is vectorized."""
+        settings = Settings()
+        assert settings.matcher_engine == "vectorized"
+
     def test_default_ofac_data_path(self) -> None:
         """Default OFAC data path is ./data/ofac."""
         settings = Settings()
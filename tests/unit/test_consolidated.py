@@ -0,0 +1,145 @@
+"""Unit tests for loading and matching the Consolidated (non-SDN) list."""
+
+import shutil
+from pathlib import Path
+
+import pytest
+
+from ofac.core.config import settings
+from ofac.core.exceptions import OFACParseError
+from ofac.core.matcher import EntityMatcher
+from ofac.core.models import MatchType, OFACList
+from ofac.data.loader import OFACData, OFACDataLoader
+
+# Entity 306 also exists on the SDN list; numbering is separate per list
+CONS_PRIM = (
+    '306,"CONSOLIDATED TRADING LLC",entity,"NS-MBS",-0-,-0-,-0-,-0-,-0-,-0-,-0-,'
+    '"Sectoral sanctions."\n'
+    '9100,"PETROLEO DEL SUR SA",entity,"SSI",-0-,-0-,-0-,-0-,-0-,-0-,-0-,-0-\n'
+)
+CONS_ALT = '306,900,"aka","CONTRA TRADING",-0-\n'
+CONS_ADD = '9100,901,-0-,"Caracas","Venezuela",-0-\n'
+
+
+@pytest.fixture
+def data_dir(mock_ofac_data_dir: Path, tmp_path: Path) -> Path:
+    """Mock SDN data plus a Consolidated triplet."""
+    target = tmp_path / "ofac"
+    shutil.copytree(mock_ofac_data_dir, target)
+    (target / "cons_prim.csv").write_text(CONS_PRIM, encoding="utf-8")
+    (target / "cons_alt.csv").write_text(CONS_ALT, encoding="utf-8")
+    (target / "cons_add.csv").write_text(CONS_ADD, encoding="utf-8")
+    return target
+
+
+@pytest.fixture
+def ofac_data(data_dir: Path) -> OFACData:
+    """Data loaded with the Consolidated list."""
+    return OFACDataLoader(data_path=data_dir).load()
+
+
+class TestConsolidatedLoading:
+    """Tests for loading the Consolidated triplet."""
+
+    def test_loaded_next_to_sdn(self, ofac_data: OFACData) -> None:
+        """Consolidated entries are loaded and counted separately."""
+        assert ofac_data.consolidated is not None
+        assert len(ofac_data.consolidated.prim_df) == 2
+        assert ofac_data.consolidated.aliases_by_ent == {306: ["CONTRA TRADING"]}
+        assert ofac_data.version.cons_count == 2
+        assert ofac_data.version.source == "BOTH"
+        assert ofac_data.version.sdn_count == len(ofac_data.sdn_df)
+
+    def test_entities_tagged_by_list(self, ofac_data: OFACData) -> None:
+        """The merged entity table keeps SDN first and tags each list."""
+        assert ofac_data.entities is not None
+        lists = [record.ofac_list for record in ofac_data.entities.records]
+        sdn_count = len(ofac_data.sdn_df)
+
+        assert lists[:sdn_count] == [OFACList.SDN] * sdn_count
+        assert lists[sdn_count:] == [OFACList.CONSOLIDATED] * 2
+
+    def test_missing_triplet_loads_sdn_only(self, mock_ofac_data_dir: Path) -> None:
+        """Without Consolidated files only the SDN list is loaded."""
+        data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+
+        assert data.consolidated is None
+        assert data.version.source == "SDN"
+        assert data.version.cons_count == 0
+
+    def test_partial_triplet_raises(self, data_dir: Path) -> None:
+        """A Consolidated triplet with missing files is an error."""
+        (data_dir / "cons_add.csv").unlink()
+
+        with pytest.raises(OFACParseError) as exc_info:
+            OFACDataLoader(data_path=data_dir).load()
+
+        assert exc_info.value.code == "OFAC_DATA_NOT_FOUND"
+        assert exc_info.value.details["missing_files"] == ["cons_add.csv"]
+
+    def test_disabled_by_setting(
+        self, data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """settings.consolidated_enabled=False ignores the Consolidated files."""
+        monkeypatch.setattr(settings, "consolidated_enabled", False)
+
+        data = OFACDataLoader(data_path=data_dir).load()
+
+        assert data.consolidated is None
+
+    def test_snapshot_round_trip(
+        self, data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The Consolidated list is stored in and read from the snapshot."""
+        monkeypatch.setattr(settings, "snapshot_enabled", True)
+        parsed = OFACDataLoader(data_path=data_dir).load()
+        cached = OFACDataLoader(data_path=data_dir).load()
+
+        assert cached.consolidated is not None
+        assert parsed.consolidated is not None
+        assert cached.consolidated.aliases_by_ent == parsed.consolidated.aliases_by_ent
+        assert cached.consolidated.addresses_by_ent == {9100: ["Venezuela"]}
+        assert cached.version.cons_count == 2
+
+
+class TestConsolidatedMatching:
+    """Tests for screening against the merged SDN and Consolidated corpus."""
+
+    @pytest.mark.parametrize("engine", ["scan", "vectorized"])
+    def test_results_carry_list(self, ofac_data: OFACData, engine: str) -> None:
+        """Consolidated hits are reported with OFACList.CONSOLIDATED."""
+        matcher = EntityMatcher(ofac_data, engine=engine)  # type: ignore[arg-type]
+
+        consolidated = matcher.match("PETROLEO DEL SUR SA", "Venezuela")[0]
+        sdn = matcher.match("BANCO NACIONAL DE CUBA")[0]
+
+        assert consolidated.ofac_list == OFACList.CONSOLIDATED
+        assert consolidated.ent_num == 9100
+        assert consolidated.match_type == MatchType.EXACT
+        assert consolidated.country_match
+        assert sdn.ofac_list == OFACList.SDN
+
+    @pytest.mark.parametrize("engine", ["scan", "vectorized"])
+    def test_aliases_follow_list(self, ofac_data: OFACData, engine: str) -> None:
+        """Aliases are matched against the entity of their own list."""
+        matcher = EntityMatcher(ofac_data, engine=engine)  # type: ignore[arg-type]
+
+        alias_hit = matcher.match("CONTRA TRADING")[0]
+        sdn_alias = matcher.match("NATIONAL BANK OF CUBA")[0]
+
+        assert alias_hit.match_type == MatchType.ALIAS
+        assert alias_hit.sdn_name == "CONSOLIDATED TRADING LLC"
+        assert alias_hit.ofac_list == OFACList.CONSOLIDATED
+        assert sdn_alias.sdn_name == "BANCO NACIONAL DE CUBA"
+        assert sdn_alias.ofac_list == OFACList.SDN
+
+    def test_engines_agree(self, ofac_data: OFACData) -> None:
+        """Both engines return the same results over the merged corpus."""
+        names = ["TRADING", "CONSOLIDATED TRADING", "BANCO CUBA", "PETROLEO"]
+        scan = EntityMatcher(ofac_data, engine="scan")
+        vectorized = EntityMatcher(ofac_data, engine="vectorized")
+
+        for name in names:
+            assert [m.model_dump() for m in scan.match(name)] == [
+                m.model_dump() for m in vectorized.match(name)
+            ]
@@ -0,0 +1,98 @@
+"""Unit tests for the precompiled name corpus."""
+
+import pickle
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from ofac.data.corpus import (
+    NAME_KIND_ALIAS,
+    NAME_KIND_PRIMARY,
+    MappedNames,
+    build_name_corpus,
+)
+from ofac.data.entities import build_entity_table
+from ofac.data.loader import OFACDataLoader
+
+
+class TestBuildNameCorpus:
+    """Tests for build_name_corpus()."""
+
+    def test_primary_followed_by_aliases(self) -> None:
+        """Each primary name is followed by that entity's aliases."""
+        sdn_df = pd.DataFrame({"ent_num": [1, 2], "sdn_name": ["ALPHA", "BETA"]})
+        corpus = build_name_corpus(
+            build_entity_table(sdn_df, {}), {1: ["A1", "A2"], 2: ["B1"]}
+        )
+
+        assert corpus.names == ["ALPHA", "A1", "A2", "BETA", "B1"]
+        assert corpus.ent_nums.tolist() == [1, 1, 1, 2, 2]
+        assert corpus.kinds.tolist() == [
+            NAME_KIND_PRIMARY,
+            NAME_KIND_ALIAS,
+            NAME_KIND_ALIAS,
+            NAME_KIND_PRIMARY,
+            NAME_KIND_ALIAS,
+        ]
+        assert corpus.entities.tolist() == [0, 0, 0, 1, 1]
+
+    def test_skips_rows_without_name_or_ent_num(self) -> None:
+        """Rows missing ent_num or sdn_name are left out with their aliases."""
+        sdn_df = pd.DataFrame(
+            {
+                "ent_num": pd.array([1, None, 3], dtype="Int64"),
+                "sdn_name": ["ALPHA", "BETA", None],
+            }
+        )
+        corpus = build_name_corpus(build_entity_table(sdn_df, {}), {3: ["C1"]})
+
+        assert corpus.names == ["ALPHA"]
+        assert corpus.entity_count == 1
+
+    def test_empty_dataframe(self) -> None:
+        """An empty SDN DataFrame produces an empty corpus."""
+        corpus = build_name_corpus(build_entity_table(pd.DataFrame(), {}), {})
+        assert len(corpus) == 0
+
+
+class TestLoaderCorpus:
+    """Tests for the corpus built by OFACDataLoader."""
+
+    def test_load_builds_corpus(self, mock_ofac_data_dir: Path) -> None:
+        """load() attaches a corpus covering all names and aliases."""
+        data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+
+        assert data.corpus is not None
+        assert len(data.corpus) == len(data.sdn_df) + len(data.alt_df)
+        assert data.corpus.entity_count == len(data.sdn_df)
+
+
+class TestMappedNames:
+    """Tests for MappedNames."""
+
+    def test_round_trip(self) -> None:
+        """Encoded names read back identically, including non-ASCII."""
+        names = ["BANCO NACIONAL", "Archidiocèse de Bangui", "", "ÅÄÖ"]
+        mapped = MappedNames.encode(names)
+
+        assert len(mapped) == 4
+        assert [mapped[i] for i in range(4)] == names
+        assert mapped[-1] == "ÅÄÖ"
+        assert mapped[1:3] == names[1:3]
+        assert list(mapped) == names
+
+    def test_out_of_range(self) -> None:
+        """Positions past the end raise IndexError."""
+        with pytest.raises(IndexError):
+            MappedNames.encode(["A"])[1]
+
+    def test_empty(self) -> None:
+        """An empty name list encodes to an empty sequence."""
+        assert list(MappedNames.encode([])) == []
+
+    def test_pickle_in_memory(self) -> None:
+        """In-memory names pickle by value."""
+        mapped = MappedNames.encode(["BANCO NACIONAL", "ÅÄÖ"])
+
+        assert list(pickle.loads(pickle.dumps(mapped))) == ["BANCO NACIONAL", "ÅÄÖ"]
@@ -131,3 +131,37 @@ class TestGetCountriesWithGL:
         countries = get_countries_with_gl()
         # North Korea is sanctioned but has no GL
         assert "KP" not in countries
+
+
+class TestNormalizeCountryCode:
+    """Tests for normalize_country_code() function."""
+
+    def test_iso_codes(self) -> None:
+        """ISO codes resolve in any case."""
+        from ofac.core.countries import normalize_country_code
+
+        assert normalize_country_code("SY") == "SY"
+        assert normalize_country_code(" ir ") == "IR"
+
+    def test_ofac_name_variants(self) -> None:
+        """OFAC address spellings resolve to ISO codes."""
+        from ofac.core.countries import normalize_country_code
+
+        assert normalize_country_code("Korea, North") == "KP"
+        assert normalize_country_code("Burma") == "MM"
+        assert normalize_country_code("Syrian Arab Republic") == "SY"
+        assert normalize_country_code("Congo, Democratic Republic of the") == "CD"
+
+    def test_accents_and_case_ignored(self) -> None:
+        """Accents, punctuation and case do not matter."""
+        from ofac.core.countries import normalize_country_code
+
+        assert normalize_country_code("CÔTE D’IVOIRE") == "CI"
+        assert normalize_country_code("central african republic") == "CF"
+
+    def test_unknown_country(self) -> None:
+        """Unknown or empty values return None."""
+        from ofac.core.countries import normalize_country_code
+
+        assert normalize_country_code("Atlantis") is None
+        assert normalize_country_code("") is None
@@ -0,0 +1,208 @@
+"""Unit tests for incremental OFAC data refresh."""
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from ofac.core.config import settings
+from ofac.core.matcher import EntityMatcher
+from ofac.core.models import OFACList
+from ofac.data.delta import OFACChangeSet
+from ofac.data.exact import ExactIndex
+from ofac.data.index import CandidateIndex
+from ofac.data.loader import OFACData, OFACDataLoader
+from ofac.data.phonetic import PhoneticIndex
+
+SDN = OFACList.SDN
+CONSOLIDATED = OFACList.CONSOLIDATED
+
+
+@pytest.fixture
+def data_dir(mock_ofac_data_dir: Path, tmp_path: Path) -> Path:
+    """Writable copy of the mock OFAC data."""
+    target = tmp_path / "ofac"
+    shutil.copytree(mock_ofac_data_dir, target)
+    return target
+
+
+@pytest.fixture(autouse=True)
+def enable_index(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Build the candidate index so its patching is covered too."""
+    monkeypatch.setattr(settings, "candidate_index_enabled", True)
+
+
+def _replace_line(path: Path, old: str, new: str) -> None:
+    """Edit one CSV file in place."""
+    text = path.read_text(encoding="utf-8")
+    assert old in text
+    path.write_text(text.replace(old, new), encoding="utf-8")
+
+
+def _apply_daily_update(data_dir: Path) -> None:
+    """Add, remove and modify a few entities across all three files."""
+    # 4000 added, 3000 removed, 2000 programs changed
+    _replace_line(
+        data_dir / "sdn.csv",
+        '3000,"TEST VESSEL"',
+        '4000,"NEW TRADING LLC",entity,"SDGT",-0-,-0-,-0-,-0-,-0-,-0-,-0-,-0-\n'
+        '3000,"TEST VESSEL"',
+    )
+    lines = (data_dir / "sdn.csv").read_text(encoding="utf-8").splitlines(True)
+    (data_dir / "sdn.csv").write_text(
+        "".join(line for line in lines if not line.startswith("3000,")),
+        encoding="utf-8",
+    )
+    _replace_line(data_dir / "sdn.csv", '"IRAN; IRGC"', '"IRAN; IRGC; SDGT"')
+    # 1000 alias edited by alt_num, 306 address removed by add_num
+    _replace_line(
+        data_dir / "alt.csv", '1000,501,"aka","THE BASE"', '1000,501,"aka","AL-QA\'IDA"'
+    )
+    _replace_line(
+        data_dir / "add.csv", '306,200,"Havana Office","Havana","Cuba",-0-\n', ""
+    )
+
+
+def _assert_same_as_full_load(refreshed: OFACData, data_dir: Path) -> None:
+    """A patched refresh must equal a full load of the new files."""
+    full = OFACDataLoader(data_path=data_dir).load()
+
+    assert refreshed.entities is not None and full.entities is not None
+    assert refreshed.entities.records == full.entities.records
+    assert refreshed.corpus is not None and full.corpus is not None
+    assert list(refreshed.corpus.names) == list(full.corpus.names)
+    for field in ("ent_nums", "kinds", "entities"):
+        np.testing.assert_array_equal(
+            getattr(refreshed.corpus, field), getattr(full.corpus, field)
+        )
+
+    assert refreshed.candidate_index is not None
+    rebuilt = CandidateIndex.build(full.corpus)
+    assert refreshed.candidate_index.postings.keys() == rebuilt.postings.keys()
+    for trigram, positions in rebuilt.postings.items():
+        np.testing.assert_array_equal(
+            refreshed.candidate_index.postings[trigram], positions
+        )
+
+    assert refreshed.phonetic_index is not None
+    rebuilt_phonetic = PhoneticIndex.build(full.corpus)
+    assert refreshed.phonetic_index.postings.keys() == rebuilt_phonetic.postings.keys()
+    for key, positions in rebuilt_phonetic.postings.items():
+        np.testing.assert_array_equal(refreshed.phonetic_index.postings[key], positions)
+
+    assert refreshed.exact_index is not None
+    rebuilt_exact = ExactIndex.build(full.corpus)
+    assert refreshed.exact_index.postings.keys() == rebuilt_exact.postings.keys()
+    for key, positions in rebuilt_exact.postings.items():
+        np.testing.assert_array_equal(refreshed.exact_index.postings[key], positions)
+
+    for name in ["NEW TRADING", "AL-QA'IDA", "BANCO NACIONAL DE CUBA", "IRGC"]:
+        assert [m.model_dump() for m in EntityMatcher(refreshed).match(name)] == [
+            m.model_dump() for m in EntityMatcher(full).match(name)
+        ]
+
+
+class TestChangeSet:
+    """Tests for OFACChangeSet."""
+
+    def test_empty(self) -> None:
+        """A default change set reports no changes."""
+        changes = OFACChangeSet()
+
+        assert changes.is_empty
+        assert changes.summary() == {"added": 0, "modified": 0, "removed": 0}
+
+    def test_changed_covers_all_kinds(self) -> None:
+        """changed unions added, modified and removed keys."""
+        changes = OFACChangeSet(((SDN, 1),), ((SDN, 2),), ((CONSOLIDATED, 1),))
+
+        assert changes.changed == {(SDN, 1), (SDN, 2), (CONSOLIDATED, 1)}
+        assert not changes.is_empty
+
+
+class TestLoaderRefresh:
+    """Tests for OFACDataLoader.refresh()."""
+
+    @pytest.mark.parametrize("keep_raw", [True, False])
+    def test_detects_changes(
+        self, data_dir: Path, keep_raw: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Changes are found by ent_num, alt_num and add_num."""
+        monkeypatch.setattr(settings, "keep_raw_frames", keep_raw)
+        loader = OFACDataLoader(data_path=data_dir)
+        loader.load()
+        _apply_daily_update(data_dir)
+
+        _, changes = loader.refresh()
+
+        assert changes.added == ((SDN, 4000),)
+        assert changes.modified == ((SDN, 306), (SDN, 1000), (SDN, 2000))
+        assert changes.removed == ((SDN, 3000),)
+
+    @pytest.mark.parametrize("keep_raw", [True, False])
+    def test_matches_full_load(
+        self, data_dir: Path, keep_raw: bool, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Patched entities, corpus and index equal a full reload."""
+        monkeypatch.setattr(settings, "keep_raw_frames", keep_raw)
+        loader = OFACDataLoader(data_path=data_dir)
+        loader.load()
+        _apply_daily_update(data_dir)
+
+        refreshed, _ = loader.refresh()
+
+        assert loader.data is refreshed
+        assert refreshed.version.sdn_count == 4
+        _assert_same_as_full_load(refreshed, data_dir)
+
+    def test_reports_address_only_changes(self, data_dir: Path) -> None:
+        """With raw frames, non-matching columns still count as changes."""
+        loader = OFACDataLoader(data_path=data_dir)
+        loader.load()
+        _replace_line(data_dir / "add.csv", "Tehran HQ", "Tehran Office")
+
+        refreshed, changes = loader.refresh()
+
+        assert changes.modified == ((SDN, 2000),)
+        _assert_same_as_full_load(refreshed, data_dir)
+
+    def test_unchanged_files_keep_data(self, data_dir: Path) -> None:
+        """Refreshing identical files returns the loaded data as is."""
+        loader = OFACDataLoader(data_path=data_dir)
+        data = loader.load()
+
+        refreshed, changes = loader.refresh()
+
+        assert refreshed is data
+        assert changes.is_empty
+
+    def test_first_refresh_loads_everything(self, data_dir: Path) -> None:
+        """Without loaded data every entity is reported as added."""
+        loader = OFACDataLoader(data_path=data_dir)
+
+        data, changes = loader.refresh()
+
+        assert loader.is_loaded
+        assert len(changes.added) == len(data.sdn_df)
+        assert not changes.modified and not changes.removed
+
+    def test_consolidated_list_added(self, data_dir: Path) -> None:
+        """A Consolidated list appearing on refresh is diffed per list."""
+        loader = OFACDataLoader(data_path=data_dir)
+        loader.load()
+        (data_dir / "cons_prim.csv").write_text(
+            '306,"CONSOLIDATED TRADING LLC",entity,"NS-MBS",'
+            "-0-,-0-,-0-,-0-,-0-,-0-,-0-,-0-\n",
+            encoding="utf-8",
+        )
+        (data_dir / "cons_alt.csv").write_text(
+            '306,900,"aka","CONTRA TRADING",-0-\n', encoding="utf-8"
+        )
+        (data_dir / "cons_add.csv").write_text("", encoding="utf-8")
+
+        refreshed, changes = loader.refresh()
+
+        assert changes.added == ((CONSOLIDATED, 306),)
+        assert not changes.modified
+        _assert_same_as_full_load(refreshed, data_dir)
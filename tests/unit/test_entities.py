@@ -0,0 +1,107 @@
+"""Unit tests for the per-entity metadata table."""
+
+from pathlib import Path
+
+import pandas as pd
+
+from ofac.core.matcher import EntityMatcher
+from ofac.data.entities import EntityRecord, build_entity_table, parse_programs
+from ofac.data.loader import OFACDataLoader
+
+
+class TestParsePrograms:
+    """Tests for parse_programs()."""
+
+    def test_splits_on_semicolon(self) -> None:
+        """Programs are split and stripped."""
+        assert parse_programs("IRAN; IRGC ;") == ("IRAN", "IRGC")
+
+    def test_null_values(self) -> None:
+        """OFAC null markers and NA give an empty tuple."""
+        assert parse_programs("-0-") == ()
+        assert parse_programs(None) == ()
+        assert parse_programs(float("nan")) == ()
+
+
+class TestBuildEntityTable:
+    """Tests for build_entity_table()."""
+
+    def test_record_fields(self) -> None:
+        """Records hold parsed metadata and resolved country codes."""
+        sdn_df = pd.DataFrame(
+            {
+                "ent_num": [306],
+                "sdn_name": ["BANCO NACIONAL DE CUBA"],
+                "sdn_type": [None],
+                "programs": ["CUBA"],
+                "remarks": [None],
+            }
+        )
+        table = build_entity_table(sdn_df, {306: ["Switzerland", "Cuba"]})
+
+        assert table.get(306) == EntityRecord(
+            ent_num=306,
+            sdn_name="BANCO NACIONAL DE CUBA",
+            sdn_type="Unknown",
+            programs=("CUBA",),
+            remarks=None,
+            country="Switzerland",
+            countries=("Switzerland", "Cuba"),
+            country_codes=frozenset({"CH", "CU"}),
+        )
+
+    def test_country_mask_bitsets(self) -> None:
+        """country_mask() flags entities by ISO code in one bit test."""
+        sdn_df = pd.DataFrame({"ent_num": [1, 2, 3], "sdn_name": ["A", "B", "C"]})
+        table = build_entity_table(
+            sdn_df, {1: ["Syria", "Iran"], 2: ["Zimbabwe"], 3: ["Cuba"]}
+        )
+
+        assert table.country_mask("SY").tolist() == [True, False, False]
+        assert table.country_mask("IR").tolist() == [True, False, False]
+        assert table.country_mask("ZW").tolist() == [False, True, False]
+        assert table.country_mask("XX").tolist() == [False, False, False]
+
+    def test_unresolved_countries_tracked(self) -> None:
+        """Countries without an ISO code are kept for string comparison."""
+        sdn_df = pd.DataFrame({"ent_num": [1, 2], "sdn_name": ["A", "B"]})
+        table = build_entity_table(sdn_df, {1: ["region: Crimea", "Ukraine"]})
+
+        assert table.get(1).unresolved_countries == ("region: Crimea",)
+        assert table.get(1).country_codes == frozenset({"UA"})
+        assert table.unresolved_positions.tolist() == [0]
+
+    def test_unknown_entity(self) -> None:
+        """get() returns None for unknown entity numbers."""
+        table = build_entity_table(
+            pd.DataFrame({"ent_num": [1], "sdn_name": ["A"]}), {}
+        )
+        assert table.get(2) is None
+        assert len(table) == 1
+
+    def test_loader_builds_table(self, mock_ofac_data_dir: Path) -> None:
+        """load() attaches an entity table covering every SDN row."""
+        data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+
+        assert data.entities is not None
+        assert len(data.entities) == len(data.sdn_df)
+        assert data.entities.get(2000).programs == ("IRAN", "IRGC")
+        assert data.entities.get(3000).country_codes == frozenset({"SY"})
+
+
+class TestMatcherUsesEntityTable:
+    """The matcher reads metadata from the table, not the DataFrames."""
+
+    def test_matching_without_dataframes(self, mock_ofac_data_dir: Path) -> None:
+        """Both engines match once the table and corpus are built."""
+        data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+        detached = data._replace(sdn_df=None, alt_df=None, add_df=None)
+
+        for engine in ("scan", "vectorized"):
+            matches = EntityMatcher(detached, engine=engine).match(  # type: ignore[arg-type]
+                "BANCO NACIONAL DE CUBA", country="Cuba"
+            )
+            assert matches[0].ent_num == 306
+            assert matches[0].programs == ["CUBA"]
+            assert matches[0].country == "Switzerland"
+            assert matches[0].country_match is True
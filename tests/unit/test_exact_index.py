@@ -0,0 +1,116 @@
+"""Unit tests for the exact-match name index."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ofac.core.config import settings
+from ofac.core.matcher import EntityMatcher
+from ofac.data.corpus import NAME_KIND_ALIAS, NAME_KIND_PRIMARY, build_name_corpus
+from ofac.data.entities import build_entity_table
+from ofac.data.exact import ExactIndex
+from ofac.data.loader import OFACData, OFACDataLoader
+from ofac.data.schemas import OFACDataVersion
+
+
+def _make_data(names: list[str], aliases: dict[int, list[str]]) -> OFACData:
+    """Build OFACData with one SDN entry per name (ent_num = position + 1)."""
+    sdn_df = pd.DataFrame(
+        {
+            "ent_num": list(range(1, len(names) + 1)),
+            "sdn_name": names,
+            "sdn_type": ["entity"] * len(names),
+            "programs": ["SDGT"] * len(names),
+            "remarks": [""] * len(names),
+        }
+    )
+    entities = build_entity_table(sdn_df, {})
+    return OFACData(
+        sdn_df=sdn_df,
+        alt_df=pd.DataFrame(),
+        add_df=pd.DataFrame(),
+        aliases_by_ent=aliases,
+        addresses_by_ent={},
+        version=OFACDataVersion(sdn_count=len(names), source="SDN"),
+        entities=entities,
+        corpus=build_name_corpus(entities, aliases),
+    )
+
+
+class TestExactIndex:
+    """Tests for ExactIndex."""
+
+    def test_lookup_returns_primary_names_and_aliases(self) -> None:
+        """Every name normalizing like the query is returned, in corpus order."""
+        data = _make_data(
+            ["BANCO NACIONAL DE CUBA", "AL-QAIDA", "ACME"],
+            {2: ["CUBA DE NACIONAL BANCO"]},
+        )
+        index = ExactIndex.build(data.corpus, ["token_sort"])
+
+        positions = index.lookup(" BANCO NACIONAL DE CUBA ")
+
+        assert data.corpus.ent_nums[positions].tolist() == [1, 2]
+        assert data.corpus.kinds[positions].tolist() == [
+            NAME_KIND_PRIMARY,
+            NAME_KIND_ALIAS,
+        ]
+        assert index.lookup("BANCO NACIONAL").size == 0
+
+    def test_keys_follow_the_normalization_steps(self) -> None:
+        """Only steps in the pipeline make spellings equal."""
+        data = _make_data(["Al-Qaida Ltd."], {})
+
+        plain = ExactIndex.build(data.corpus, ["token_sort"])
+        loose = ExactIndex.build(
+            data.corpus,
+            ["casefold", "strip_punctuation", "legal_suffixes", "token_sort"],
+        )
+
+        assert plain.lookup("AL QAIDA LIMITED").size == 0
+        assert loose.lookup("AL QAIDA LIMITED").tolist() == [0]
+
+    def test_empty_keys_are_not_indexed(self) -> None:
+        """Names normalizing to nothing never match a blank query."""
+        data = _make_data(["-", "ACME"], {})
+        index = ExactIndex.build(data.corpus, ["strip_punctuation", "token_sort"])
+
+        assert len(index) == 1
+        assert index.lookup(" - ").size == 0
+
+    def test_patched_equals_rebuild(self) -> None:
+        """Renumbered postings plus fresh entries equal a full rebuild."""
+        old = _make_data(["ACME", "BANCO NACIONAL", "ZETA"], {})
+        new = _make_data(["ACME", "ZETA", "ACME"], {})
+        old_to_new = np.array([0, -1, -1])
+
+        patched = ExactIndex.build(old.corpus).patched(new.corpus, old_to_new)
+        rebuilt = ExactIndex.build(new.corpus)
+
+        assert patched.postings.keys() == rebuilt.postings.keys()
+        for key, positions in rebuilt.postings.items():
+            np.testing.assert_array_equal(patched.postings[key], positions)
+
+    def test_loader_builds_index(self, mock_ofac_data_dir: Path) -> None:
+        """The loader keys the corpus with the configured normalization."""
+        data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+
+        assert isinstance(data.exact_index, ExactIndex)
+        assert data.exact_index.normalizer.steps == ("token_sort",)
+        assert len(data.exact_index.postings) > 0
+
+    def test_matcher_rekeys_index_built_with_other_steps(
+        self, mock_ofac_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A matcher normalizing differently builds its own index."""
+        data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+        monkeypatch.setattr(settings, "name_normalization", ["casefold", "token_sort"])
+
+        default = EntityMatcher(data, normalization=["token_sort"])
+        casefolded = EntityMatcher(data)
+
+        assert default.exact_index is data.exact_index
+        assert casefolded.exact_index is not data.exact_index
+        assert casefolded.exact_index.normalizer.steps == ("casefold", "token_sort")
@@ -0,0 +1,82 @@
+"""Unit tests for the bounded screening worker pool."""
+
+import asyncio
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from ofac.core.exceptions import ScreeningBusyError, ScreeningRateLimitError
+from ofac.core.executor import MatchExecutor
+
+
+@pytest.fixture
+def executor() -> Iterator[MatchExecutor]:
+    """Pool with one worker, one queue slot and two jobs per client."""
+    pool = MatchExecutor(max_workers=1, max_queue=1, max_per_client=2)
+    yield pool
+    pool.shutdown()
+
+
+class TestMatchExecutor:
+    """Tests for running and admitting screening jobs."""
+
+    async def test_runs_in_worker_thread(self, executor: MatchExecutor) -> None:
+        """Jobs run off the event loop thread and return their result."""
+        loop_thread = threading.get_ident()
+
+        def job(value: int, *, offset: int) -> tuple[int, int]:
+            return value + offset, threading.get_ident()
+
+        result, job_thread = await executor.run(job, 1, offset=2, client="a")
+
+        assert result == 3
+        assert job_thread != loop_thread
+        assert executor.stats()["completed"] == 1
+
+    async def test_rejects_beyond_capacity(self, executor: MatchExecutor) -> None:
+        """Running plus queued jobs are bounded; extra jobs get busy errors."""
+        release = threading.Event()
+        running = [
+            asyncio.ensure_future(executor.run(release.wait, client=client))
+            for client in ("a", "b")
+        ]
+        await asyncio.sleep(0)
+
+        with pytest.raises(ScreeningBusyError):
+            await executor.run(release.wait, client="c")
+
+        release.set()
+        await asyncio.gather(*running)
+        assert executor.stats()["pending"] == 0
+        assert executor.stats()["rejected_busy"] == 1
+
+    async def test_limits_jobs_per_client(self) -> None:
+        """One client cannot take every slot from the others."""
+        executor = MatchExecutor(max_workers=1, max_queue=4, max_per_client=1)
+        release = threading.Event()
+        first = asyncio.ensure_future(executor.run(release.wait, client="a"))
+        await asyncio.sleep(0)
+
+        with pytest.raises(ScreeningRateLimitError):
+            await executor.run(release.wait, client="a")
+        other = asyncio.ensure_future(executor.run(release.wait, client="b"))
+        await asyncio.sleep(0)
+
+        release.set()
+        await asyncio.gather(first, other)
+        assert executor.stats()["rejected_client"] == 1
+        assert executor.stats()["clients"] == 0
+        executor.shutdown()
+
+    async def test_slot_released_on_error(self, executor: MatchExecutor) -> None:
+        """A failing job still frees its slot."""
+
+        def fail() -> None:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            await executor.run(fail, client="a")
+
+        assert executor.stats()["pending"] == 0
+        assert await executor.run(int, "7", client="a") == 7
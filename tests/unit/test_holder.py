@@ -0,0 +1,147 @@
+"""Unit tests for the versioned OFAC data holder."""
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from ofac.core.exceptions import OFACNotLoadedError
+from ofac.core.matcher import EntityMatcher
+from ofac.data.holder import OFACDataHolder
+from ofac.data.loader import OFACData, OFACDataLoader
+
+
+@pytest.fixture
+def ofac_data(mock_ofac_data_dir: Path) -> OFACData:
+    """OFAC data loaded from the mock CSV files."""
+    return OFACDataLoader(data_path=mock_ofac_data_dir).load()
+
+
+@pytest.fixture
+def newer_data(ofac_data: OFACData) -> OFACData:
+    """A second dataset standing in for a refresh."""
+    return ofac_data._replace(
+        version=ofac_data.version.model_copy(update={"loaded_at": "later"})
+    )
+
+
+class TestOFACDataHolder:
+    """Tests for publishing, leasing and releasing datasets."""
+
+    def test_empty_holder(self) -> None:
+        """Nothing is served before the first publish."""
+        holder = OFACDataHolder()
+
+        assert holder.current is None
+        assert holder.version == 0
+        with pytest.raises(OFACNotLoadedError), holder.lease():
+            pass
+
+    def test_publish_increments_version(
+        self, ofac_data: OFACData, newer_data: OFACData
+    ) -> None:
+        """Each publish swaps the current data and bumps the version."""
+        holder = OFACDataHolder(ofac_data)
+        assert holder.version == 1
+
+        assert holder.publish(newer_data) == 2
+        assert holder.current is newer_data
+
+    def test_lease_keeps_old_data(
+        self, ofac_data: OFACData, newer_data: OFACData
+    ) -> None:
+        """A lease taken before a publish keeps its dataset."""
+        holder = OFACDataHolder(ofac_data)
+
+        with holder.lease() as data:
+            holder.publish(newer_data)
+            assert data is ofac_data
+            with holder.lease() as fresh:
+                assert fresh is newer_data
+            assert holder.stats()["retired"] == [1]
+
+        assert holder.stats() == {"version": 2, "leases": {}, "retired": []}
+
+    def test_release_waits_for_last_lease(
+        self, ofac_data: OFACData, newer_data: OFACData
+    ) -> None:
+        """A replaced dataset is released once its leases drain."""
+        released: list[tuple[int, OFACData]] = []
+        holder = OFACDataHolder(
+            ofac_data, on_release=lambda version, data: released.append((version, data))
+        )
+
+        with holder.lease(), holder.lease():
+            holder.publish(newer_data)
+            assert released == []
+
+        assert released == [(1, ofac_data)]
+
+    def test_release_immediately_without_leases(
+        self, ofac_data: OFACData, newer_data: OFACData
+    ) -> None:
+        """A dataset nobody is using is released on publish."""
+        released: list[int] = []
+        holder = OFACDataHolder(
+            ofac_data, on_release=lambda version, _data: released.append(version)
+        )
+
+        holder.publish(newer_data)
+
+        assert released == [1]
+
+    def test_leases_are_thread_safe(
+        self, ofac_data: OFACData, newer_data: OFACData
+    ) -> None:
+        """Concurrent leases and publishes leave no outstanding counts."""
+        holder = OFACDataHolder(ofac_data)
+        seen: list[OFACData] = []
+
+        def worker() -> None:
+            for _ in range(200):
+                with holder.lease() as data:
+                    seen.append(data)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for dataset in [newer_data, ofac_data] * 10:
+            holder.publish(dataset)
+        for thread in threads:
+            thread.join()
+
+        assert holder.stats()["leases"] == {}
+        assert holder.stats()["retired"] == []
+        assert {id(data) for data in seen} <= {id(ofac_data), id(newer_data)}
+
+    def test_matcher_built_once_per_version(
+        self, ofac_data: OFACData, newer_data: OFACData
+    ) -> None:
+        """Each publish builds one matcher, shared by every lease."""
+        built: list[OFACData] = []
+
+        def factory(data: OFACData) -> EntityMatcher:
+            built.append(data)
+            return EntityMatcher(data).prepare()
+
+        holder = OFACDataHolder(ofac_data, matcher_factory=factory)
+        with holder.lease_matcher() as first, holder.lease_matcher() as second:
+            assert first is second
+            assert first.data is ofac_data
+            holder.publish(newer_data)
+            # Leased matchers keep their own dataset
+            assert holder.stats()["retired"] == [1]
+
+        with holder.lease_matcher() as matcher:
+            assert matcher.data is newer_data
+        assert built == [ofac_data, newer_data]
+        assert holder.stats()["retired"] == []
+
+    def test_lease_matcher_requires_factory(self, ofac_data: OFACData) -> None:
+        """A holder without a matcher_factory has no matcher to lease."""
+        holder = OFACDataHolder(ofac_data)
+
+        assert holder.matcher is None
+        with pytest.raises(RuntimeError), holder.lease_matcher():
+            pass
+        assert holder.stats()["leases"] == {}
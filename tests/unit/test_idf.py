@@ -0,0 +1,100 @@
+"""Unit tests for IDF token statistics and the IDF scorer."""
+
+import numpy as np
+from rapidfuzz import fuzz
+
+from ofac.core.idf import IdfScorer, TokenStatistics, name_tokens
+
+NAMES = [
+    "ACME TRADING COMPANY",
+    "ZETA TRADING COMPANY",
+    "BANCO NACIONAL DE CUBA",
+    "AL-QAIDA",
+    "AL NUSRA FRONT",
+    *(f"FILLER{n} TRADING COMPANY AL" for n in range(15)),
+]
+
+
+class TestTokenStatistics:
+    """Tests for token document frequencies."""
+
+    def test_document_frequency_counts_names(self) -> None:
+        """Each token counts once per name containing it."""
+        stats = TokenStatistics.build(["AL AL QAIDA", "AL NUSRA", "NUSRA"])
+
+        frequency = dict(
+            zip(stats.vocabulary, stats.document_frequency.tolist(), strict=True)
+        )
+
+        assert frequency == {"al": 2, "qaida": 1, "nusra": 2}
+        assert stats.idf[stats.token_ids["qaida"]] > stats.idf[stats.token_ids["al"]]
+
+    def test_rows_with_returns_sorted_positions(self) -> None:
+        """The inverted index lists every name containing a token."""
+        stats = TokenStatistics.build(NAMES)
+
+        rows = stats.rows_with(np.array([stats.token_ids["trading"]]))
+
+        assert rows.tolist() == [0, 1, *range(5, len(NAMES))]
+
+    def test_name_tokens_split_punctuation(self) -> None:
+        """Tokens are casefolded and split on punctuation, without repeats."""
+        assert name_tokens("Al-Qaida AL") == ["al", "qaida"]
+
+
+class TestIdfScorer:
+    """Tests for IDF-weighted scoring and stop-token skipping."""
+
+    def test_common_tokens_are_down_weighted(self) -> None:
+        """Names sharing only frequent tokens score far below token_sort_ratio."""
+        stats = TokenStatistics.build(NAMES)
+        scorer = IdfScorer(token_cutoff=80, stop_token_fraction=1.0)
+        query = "ACME TRADING COMPANY"
+
+        scores = scorer.score_matrix([query], stats, None, score_cutoff=0)[0]
+
+        assert scores[0] == 100
+        assert 0 < scores[1] < fuzz.token_sort_ratio(query, NAMES[1]) - 30
+
+    def test_stop_token_only_candidates_are_skipped(self) -> None:
+        """Names sharing nothing but stop tokens with the query score 0."""
+        stats = TokenStatistics.build(NAMES)
+        scorer = IdfScorer(token_cutoff=80, stop_token_fraction=0.5)
+
+        scores = scorer.score_matrix(["ACME TRADING COMPANY"], stats, None, 0)[0]
+
+        assert scores[0] == 100
+        assert np.count_nonzero(scores) == 1
+
+    def test_stop_token_only_query_still_matches(self) -> None:
+        """A query made only of stop tokens is matched on any token."""
+        stats = TokenStatistics.build(NAMES)
+        scorer = IdfScorer(token_cutoff=80, stop_token_fraction=0.5)
+
+        scores = scorer.score_matrix(["TRADING COMPANY"], stats, None, 0)[0]
+
+        assert np.count_nonzero(scores) == 17
+
+    def test_misspelled_tokens_align(self) -> None:
+        """Tokens above the token cutoff count with their similarity."""
+        stats = TokenStatistics.build(NAMES)
+        scorer = IdfScorer(token_cutoff=75, stop_token_fraction=0.5)
+
+        scores = scorer.score_matrix(["AL QAEDA"], stats, None, 0)[0]
+
+        assert int(np.argmax(scores)) == 3
+        assert 80 <= scores[3] < 100
+
+    def test_positions_and_cutoff(self) -> None:
+        """Only the given positions are scored; low scores become 0."""
+        stats = TokenStatistics.build(NAMES)
+        scorer = IdfScorer(token_cutoff=80, stop_token_fraction=1.0)
+        query = ["ACME TRADING COMPANY"]
+        positions = np.array([1, 0])
+
+        full = scorer.score_matrix(query, stats, None, 0)[0]
+        subset = scorer.score_matrix(query, stats, positions, 0)[0]
+        cut = scorer.score_matrix(query, stats, None, 99)[0]
+
+        np.testing.assert_array_equal(subset, full[positions])
+        assert np.count_nonzero(cut) == 1
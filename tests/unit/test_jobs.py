@@ -0,0 +1,283 @@
+"""Unit tests for SQLite-backed batch screening jobs."""
+
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from ofac.core.batch import BatchScreeningEngine, screen_entities
+from ofac.core.exceptions import ScreeningBusyError
+from ofac.core.jobs import ScreeningJobRunner, ScreeningJobStore
+from ofac.core.matcher import EntityMatcher
+from ofac.core.models import EntityInput, JobStatus, ScreeningJob, ScreeningResult
+from ofac.data.loader import OFACDataLoader
+
+CSV_CONTENT = (
+    b"Organization Name,Country\n"
+    b"BANCO NACIONAL DE CUBA,Cuba\n"
+    b"Acme Widgets,US\n"
+    b"AL QAEDA,\n"
+    b"TEST VESSEL,\n"
+    b"Cuban National Bank,CU\n"
+)
+
+
+@pytest.fixture
+def matcher(mock_ofac_data_dir: Path) -> EntityMatcher:
+    """Shared matcher over the mock OFAC data."""
+    return EntityMatcher(OFACDataLoader(data_path=mock_ofac_data_dir).load()).prepare()
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> Iterator[ScreeningJobStore]:
+    """Job store in a temporary database."""
+    job_store = ScreeningJobStore(tmp_path / "jobs.db")
+    yield job_store
+    job_store.close()
+
+
+def _runner(
+    store: ScreeningJobStore, matcher: EntityMatcher, **kwargs: int
+) -> ScreeningJobRunner:
+    """Runner leasing an in-process batch engine."""
+
+    @contextmanager
+    def lease_engine() -> Iterator[BatchScreeningEngine]:
+        yield BatchScreeningEngine(matcher, workers=1)
+
+    return ScreeningJobRunner(store, lease_engine, **kwargs)
+
+
+def _wait(store: ScreeningJobStore, job_id: str) -> ScreeningJob:
+    """Poll a job until it finishes."""
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        job = store.get(job_id)
+        assert job is not None
+        if job.status in (JobStatus.COMPLETED, JobStatus.FAILED):
+            return job
+        time.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+class TestScreeningJobStore:
+    """Tests for job state, progress and paging."""
+
+    def test_database_opened_on_first_use(self, tmp_path: Path) -> None:
+        """Creating a store does not create the database file."""
+        path = tmp_path / "nested" / "jobs.db"
+        job_store = ScreeningJobStore(path)
+        assert not path.exists()
+
+        job_store.create("orgs.csv")
+        job_store.close()
+
+        assert path.exists()
+
+    def test_unknown_job(self, store: ScreeningJobStore) -> None:
+        """Unknown job ids return None."""
+        assert store.get("missing") is None
+        assert store.results("missing") is None
+
+    def test_progress_eta_and_paging(
+        self, store: ScreeningJobStore, matcher: EntityMatcher
+    ) -> None:
+        """Progress, ETA and result pages follow the stored chunks."""
+        entity_inputs = [EntityInput(entity_name=f"ORG {i}") for i in range(5)]
+        job = store.create("orgs.csv")
+        assert job.status is JobStatus.QUEUED
+
+        store.start(job.job_id, rows_total=5, ofac_version="v1")
+        store.add_results(
+            job.job_id, 0, screen_entities(matcher, entity_inputs[:3], job.job_id)
+        )
+
+        running = store.get(job.job_id)
+        assert running is not None
+        assert running.status is JobStatus.RUNNING
+        assert (running.rows_done, running.rows_total) == (3, 5)
+        assert running.eta_seconds is not None and running.eta_seconds >= 0
+
+        page = store.results(job.job_id, offset=0, limit=2)
+        assert page is not None
+        assert [r.entity_input.entity_name for r in page.results] == ["ORG 0", "ORG 1"]
+        assert page.next_offset == 2
+        last = store.results(job.job_id, offset=2, limit=2)
+        assert last is not None
+        assert last.next_offset is None
+
+        store.add_results(
+            job.job_id, 3, screen_entities(matcher, entity_inputs[3:], job.job_id)
+        )
+        store.finish(job.job_id)
+        done = store.get(job.job_id)
+        assert done is not None
+        assert done.status is JobStatus.COMPLETED
+        assert done.ok_count + done.review_count + done.nok_count == 5
+        assert done.eta_seconds == 0
+
+    def test_purge_removes_finished_jobs(self, store: ScreeningJobStore) -> None:
+        """Purging drops finished jobs but keeps unfinished ones."""
+        finished = store.create("a.csv")
+        store.finish(finished.job_id)
+        queued = store.create("b.csv")
+
+        assert store.purge(datetime.now(UTC) + timedelta(seconds=1)) == 1
+        assert store.get(finished.job_id) is None
+        assert store.get(queued.job_id) is not None
+
+    def test_fail_orphaned(self, tmp_path: Path) -> None:
+        """Unfinished jobs of an earlier store are failed despite a reused PID."""
+        earlier = ScreeningJobStore(tmp_path / "jobs.db")
+        orphan = earlier.create("a.csv")
+        finished = earlier.create("c.csv")
+        earlier.finish(finished.job_id)
+        earlier.close()
+        store = ScreeningJobStore(tmp_path / "jobs.db")
+        live = store.create("b.csv")
+
+        # Both stores ran in this process, so the PIDs match
+        assert store.fail_orphaned() == 1
+        failed = store.get(orphan.job_id)
+        assert failed is not None
+        assert failed.status is JobStatus.FAILED
+        assert failed.error is not None
+        assert failed.error["code"] == "JOB_INTERRUPTED"
+        live_job = store.get(live.job_id)
+        assert live_job is not None
+        assert live_job.status is JobStatus.QUEUED
+        finished_job = store.get(finished.job_id)
+        assert finished_job is not None
+        assert finished_job.status is JobStatus.COMPLETED
+        store.close()
+
+    def test_migrates_database_without_owner_token(self, tmp_path: Path) -> None:
+        """Jobs in a database from before instance tokens count as orphaned."""
+        path = tmp_path / "jobs.db"
+        with sqlite3.connect(path) as connection:
+            connection.execute(
+                "CREATE TABLE jobs (job_id TEXT PRIMARY KEY, status TEXT NOT NULL,"
+                " filename TEXT NOT NULL, rows_total INTEGER NOT NULL DEFAULT 0,"
+                " rows_done INTEGER NOT NULL DEFAULT 0,"
+                " ok_count INTEGER NOT NULL DEFAULT 0,"
+                " review_count INTEGER NOT NULL DEFAULT 0,"
+                " nok_count INTEGER NOT NULL DEFAULT 0,"
+                " ofac_version TEXT NOT NULL DEFAULT '', error TEXT,"
+                " owner_pid INTEGER NOT NULL, created_at TEXT NOT NULL,"
+                " started_at TEXT, finished_at TEXT)"
+            )
+            connection.execute(
+                "INSERT INTO jobs (job_id, status, filename, owner_pid, created_at)"
+                " VALUES ('old', 'RUNNING', 'a.csv', ?, ?)",
+                (os.getpid(), datetime.now(UTC).isoformat()),
+            )
+        connection.close()
+        store = ScreeningJobStore(path)
+
+        assert store.fail_orphaned() == 1
+        old = store.get("old")
+        assert old is not None
+        assert old.status is JobStatus.FAILED
+        store.close()
+
+
+class TestScreeningJobRunner:
+    """Tests for running jobs in the background."""
+
+    def test_job_results_match_batch_screening(
+        self, store: ScreeningJobStore, matcher: EntityMatcher
+    ) -> None:
+        """A job stores the same results as screening the file directly."""
+        runner = _runner(store, matcher, chunk_rows=2)
+        try:
+            job = runner.submit(CSV_CONTENT, "orgs.csv")
+            done = _wait(store, job.job_id)
+        finally:
+            runner.shutdown()
+
+        assert done.status is JobStatus.COMPLETED
+        assert (done.rows_done, done.rows_total) == (5, 5)
+        page = store.results(job.job_id, limit=100)
+        assert page is not None
+        names = [result.entity_input.entity_name for result in page.results]
+        assert names[0] == "BANCO NACIONAL DE CUBA"
+        assert len(names) == 5
+        assert {result.screening_id for result in page.results} == {job.job_id}
+        assert page.results[0].match_status.value == "NOK"
+
+    def test_large_job_is_sharded_across_workers(
+        self,
+        store: ScreeningJobStore,
+        matcher: EntityMatcher,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Files larger than a shard reach the worker pool, one shard per update."""
+        engine = BatchScreeningEngine(matcher, workers=2, shard_size=2)
+        offsets: list[int] = []
+        add_results = store.add_results
+
+        def record(job_id: str, offset: int, results: list[ScreeningResult]) -> None:
+            offsets.append(offset)
+            add_results(job_id, offset, results)
+
+        @contextmanager
+        def lease_engine() -> Iterator[BatchScreeningEngine]:
+            yield engine
+
+        monkeypatch.setattr(store, "add_results", record)
+        runner = ScreeningJobRunner(store, lease_engine, chunk_rows=1)
+        try:
+            job = runner.submit(CSV_CONTENT, "orgs.csv")
+            done = _wait(store, job.job_id)
+            pool = engine._pool
+        finally:
+            runner.shutdown()
+            engine.shutdown()
+
+        assert done.status is JobStatus.COMPLETED
+        assert pool is not None
+        assert offsets == [0, 2, 4]
+        assert (done.rows_done, done.rows_total) == (5, 5)
+
+    def test_file_error_fails_job(
+        self, store: ScreeningJobStore, matcher: EntityMatcher
+    ) -> None:
+        """Unreadable files are reported as a failed job with the error code."""
+        runner = _runner(store, matcher)
+        try:
+            job = runner.submit(b"data", "orgs.pdf")
+            done = _wait(store, job.job_id)
+        finally:
+            runner.shutdown()
+
+        assert done.status is JobStatus.FAILED
+        assert done.error is not None
+        assert done.error["code"] == "FILE_INVALID_FORMAT"
+
+    def test_rejects_beyond_capacity(
+        self, store: ScreeningJobStore, matcher: EntityMatcher
+    ) -> None:
+        """Submissions beyond running plus queued capacity are rejected."""
+        release = threading.Event()
+
+        @contextmanager
+        def blocked_engine() -> Iterator[BatchScreeningEngine]:
+            release.wait()
+            yield BatchScreeningEngine(matcher, workers=1)
+
+        runner = ScreeningJobRunner(store, blocked_engine, workers=1, max_queue=0)
+        try:
+            runner.submit(CSV_CONTENT, "orgs.csv")
+            with pytest.raises(ScreeningBusyError):
+                runner.submit(CSV_CONTENT, "orgs.csv")
+        finally:
+            release.set()
+            runner.shutdown()
+
+        assert runner.stats()["active"] == 0
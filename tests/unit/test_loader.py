@@ -1,12 +1,17 @@
 """Unit tests for OFAC data loader."""
 
+import io
+import shutil
+import time
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from ofac.core.config import settings
 from ofac.core.exceptions import OFACNotLoadedError, OFACParseError
-from ofac.data.loader import OFACData, OFACDataLoader
+from ofac.data.loader import OFACData, OFACDataLoader, _DecodedStream
 
 
 @pytest.fixture
@@ -128,6 +133,129 @@ class TestLoadMethod:
         assert len(data1.sdn_df) == len(data2.sdn_df)
 
 
+class TestStreamingIngestion:
+    """Tests for chunked parsing and incremental encoding detection."""
+
+    def test_utf8_sequence_split_across_chunks(self) -> None:
+        """Multi-byte characters split between reads decode correctly."""
+        text = "Archidiocèse de Bangui, Société Générale\n" * 3
+        stream = _DecodedStream(io.BytesIO(text.encode("utf-8")), chunk_bytes=3)
+
+        assert stream.read() == text
+        assert stream.encoding == "utf-8"
+
+    def test_switches_to_latin1_without_rereading(self) -> None:
+        """Invalid UTF-8 switches the rest of the stream to Latin-1."""
+        raw = io.BytesIO("ascii start\nCafé Ñandú\n".encode("latin-1"))
+        stream = _DecodedStream(raw, chunk_bytes=4)
+
+        assert stream.read(5) == "ascii"
+        assert stream.read() == " start\nCafé Ñandú\n"
+        assert stream.encoding == "latin-1"
+
+    def test_latin1_file_loads(self, mock_ofac_data_dir: Path, tmp_path: Path) -> None:
+        """A Latin-1 encoded SDN file parses with accents intact."""
+        shutil.copytree(mock_ofac_data_dir, tmp_path, dirs_exist_ok=True)
+        with (tmp_path / "sdn.csv").open("ab") as handle:
+            handle.write(
+                '9999,"SOCIÉTÉ ÉCRAN",-0-,"SDGT",-0-,-0-,-0-,-0-,-0-,-0-,-0-,-0-\n'.encode(
+                    "latin-1"
+                )
+            )
+
+        data = OFACDataLoader(data_path=tmp_path).load()
+
+        assert "SOCIÉTÉ ÉCRAN" in data.sdn_df["sdn_name"].tolist()
+
+    def test_chunked_parse_matches_single_read(
+        self, loader: OFACDataLoader, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Parsing in tiny chunks gives the same frames as one read."""
+        expected = loader.load()
+        monkeypatch.setattr(settings, "load_chunk_rows", 2)
+
+        chunked = OFACDataLoader(data_path=loader.data_path).load()
+
+        pd.testing.assert_frame_equal(chunked.sdn_df, expected.sdn_df)
+        pd.testing.assert_frame_equal(chunked.alt_df, expected.alt_df)
+        pd.testing.assert_frame_equal(chunked.add_df, expected.add_df)
+        assert chunked.aliases_by_ent == expected.aliases_by_ent
+
+    def test_unparseable_file_raises_parse_error(self, tmp_path: Path) -> None:
+        """Parser failures are reported as OFACParseError."""
+        (tmp_path / "sdn.csv").write_text('306,"BANCO NACIONAL DE CUBA\n')
+        for name in ("alt.csv", "add.csv"):
+            (tmp_path / name).write_text("")
+
+        with pytest.raises(OFACParseError, match="sdn.csv"):
+            OFACDataLoader(data_path=tmp_path).load()
+
+
+class TestCompactFrames:
+    """Tests for loading without raw DataFrames (keep_raw_frames=False)."""
+
+    def test_keeps_only_matching_data(
+        self, loader: OFACDataLoader, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Lookups, corpus and counts are unchanged; raw columns are dropped."""
+        full = loader.load()
+        monkeypatch.setattr(settings, "keep_raw_frames", False)
+
+        compact = OFACDataLoader(data_path=loader.data_path).load()
+
+        assert list(compact.sdn_df.columns) == [
+            "ent_num",
+            "sdn_name",
+            "sdn_type",
+            "programs",
+            "remarks",
+        ]
+        assert compact.alt_df.empty and compact.add_df.empty
+        assert compact.aliases_by_ent == full.aliases_by_ent
+        assert compact.addresses_by_ent == full.addresses_by_ent
+        assert compact.entities is not None and full.entities is not None
+        assert compact.entities.records == full.entities.records
+        assert compact.version.alt_count == full.version.alt_count
+        assert compact.version.add_count == full.version.add_count
+
+    def test_alias_and_address_files_are_never_held_whole(
+        self, loader: OFACDataLoader, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """ALT/ADD rows are consumed chunk by chunk and never concatenated."""
+        full = loader.load()
+        monkeypatch.setattr(settings, "keep_raw_frames", False)
+        monkeypatch.setattr(settings, "load_chunk_rows", 2)
+        chunk_sizes: list[int] = []
+        concat_columns: list[list[str]] = []
+        iter_csv = OFACDataLoader._iter_csv
+        concat = pd.concat
+
+        def spy_iter_csv(
+            self: OFACDataLoader, *args: object, **kwargs: object
+        ) -> object:
+            for chunk in iter_csv(self, *args, **kwargs):  # type: ignore[arg-type]
+                chunk_sizes.append(len(chunk))
+                yield chunk
+
+        def spy_concat(objs: list[pd.DataFrame], **kwargs: object) -> object:
+            concat_columns.extend(list(obj.columns) for obj in objs)
+            return concat(objs, **kwargs)  # type: ignore[call-overload]
+
+        monkeypatch.setattr(OFACDataLoader, "_iter_csv", spy_iter_csv)
+        monkeypatch.setattr(pd, "concat", spy_concat)
+
+        compact = OFACDataLoader(data_path=loader.data_path).load()
+
+        assert len(chunk_sizes) > 3
+        assert max(chunk_sizes) <= 2
+        # Only primary chunks are joined; the ALT/ADD chunks were dropped
+        assert all("sdn_name" in columns for columns in concat_columns)
+        assert compact.aliases_by_ent == full.aliases_by_ent
+        assert compact.addresses_by_ent == full.addresses_by_ent
+        assert compact.entities is not None and full.entities is not None
+        assert compact.entities.records == full.entities.records
+
+
 class TestMissingFiles:
     """Tests for missing file handling."""
 
@@ -224,6 +352,197 @@ class TestDataContent:
         assert "THE BASE" in aq_aliases
 
 
+def _reference_aliases(alt_df: pd.DataFrame) -> dict[int, list[str]]:
+    """Row-by-row alias grouping the vectorized builder must reproduce."""
+    aliases: dict[int, list[str]] = {}
+    for ent_num, alt_name in zip(alt_df["ent_num"], alt_df["alt_name"], strict=True):
+        if pd.notna(ent_num) and pd.notna(alt_name):
+            aliases.setdefault(int(ent_num), []).append(str(alt_name))
+    return aliases
+
+
+def _reference_addresses(add_df: pd.DataFrame) -> dict[int, list[str]]:
+    """Row-by-row country grouping the vectorized builder must reproduce."""
+    addresses: dict[int, list[str]] = {}
+    for ent_num, country in zip(add_df["ent_num"], add_df["country"], strict=True):
+        if pd.notna(ent_num) and pd.notna(country):
+            countries = addresses.setdefault(int(ent_num), [])
+            country_str = str(country).strip()
+            if country_str and country_str not in countries:
+                countries.append(country_str)
+    return addresses
+
+
+class TestVectorizedLookups:
+    """The grouped lookup builders match row-by-row construction."""
+
+    def test_aliases_match_reference(self, loader: OFACDataLoader) -> None:
+        """Aliases keep entity first-appearance order and row order."""
+        alt_df = pd.DataFrame(
+            {
+                "ent_num": pd.array([7, 3, 7, None, 3, 9], dtype="Int64"),
+                "alt_name": ["A", "B", "C", "D", None, "E"],
+            }
+        )
+        aliases = loader._build_aliases_lookup(alt_df)
+
+        assert aliases == _reference_aliases(alt_df)
+        assert list(aliases) == [7, 3, 9]
+        assert aliases[7] == ["A", "C"]
+
+    def test_addresses_match_reference(self, loader: OFACDataLoader) -> None:
+        """Countries are stripped, deduplicated and blank-only entities kept."""
+        add_df = pd.DataFrame(
+            {
+                "ent_num": pd.array([5, 5, 2, 5, 4, None, 2], dtype="Int64"),
+                "country": ["Cuba", " Cuba ", "Iran", "Syria", "  ", "Iran", None],
+            }
+        )
+        addresses = loader._build_addresses_lookup(add_df)
+
+        assert addresses == _reference_addresses(add_df)
+        assert addresses == {5: ["Cuba", "Syria"], 2: ["Iran"], 4: []}
+        assert list(addresses) == [5, 2, 4]
+
+    def test_empty_frames(self, loader: OFACDataLoader) -> None:
+        """Empty or column-less frames give empty lookups."""
+        assert loader._build_aliases_lookup(pd.DataFrame()) == {}
+        assert loader._build_addresses_lookup(pd.DataFrame()) == {}
+
+
+@pytest.mark.benchmark
+class TestLoadBenchmark:
+    """Load time on a synthetic list ten times the size of the SDN file.
+
+    The published SDN list has roughly 18,000 entries, with about as many
+    aliases and addresses. The row-by-row lookup builders alone took over
+    15 seconds at this size; the grouped builders take well under one.
+
+    Deselected by default; run with ``pytest -m benchmark``.
+    """
+
+    ENTITY_COUNT = 180_000
+    LOOKUP_SECONDS = 3.0
+    LOAD_SECONDS = 30.0
+
+    @pytest.fixture
+    def synthetic_data_dir(self, tmp_path: Path) -> Path:
+        """Write synthetic SDN/ALT/ADD files with realistic shapes."""
+        rng = np.random.default_rng(2025)
+        data_dir = tmp_path / "ofac_10x"
+        data_dir.mkdir()
+        words = np.array(
+            [
+                "BANCO",
+                "NACIONAL",
+                "TRADING",
+                "AL",
+                "NOOR",
+                "GROUP",
+                "SHIPPING",
+                "INDUSTRIAL",
+                "PETRO",
+                "KIM",
+                "HOLDING",
+                "INVEST",
+                "CO",
+                "LTD",
+            ]
+        )
+        countries = np.array(
+            [
+                "Cuba",
+                "Iran",
+                "Syria",
+                "Russia",
+                "China",
+                "Venezuela",
+                "Switzerland",
+                "United Arab Emirates",
+                "Korea, North",
+                "Lebanon",
+            ]
+        )
+
+        def names(count: int) -> list[str]:
+            tokens = words[rng.integers(0, len(words), size=(count, 3))]
+            serials = rng.integers(0, 1_000_000, size=count)
+            return [
+                f"{a} {b} {c} {n}"
+                for (a, b, c), n in zip(tokens.tolist(), serials.tolist(), strict=True)
+            ]
+
+        ent_nums = np.arange(1, self.ENTITY_COUNT + 1)
+        pd.DataFrame(
+            {
+                "ent_num": ent_nums,
+                "sdn_name": names(self.ENTITY_COUNT),
+                "sdn_type": rng.choice(
+                    ["-0-", "individual", "vessel"], self.ENTITY_COUNT
+                ),
+                "programs": rng.choice(
+                    ["SDGT", "IRAN] [SDGT", "CUBA"], self.ENTITY_COUNT
+                ),
+                **dict.fromkeys(
+                    [
+                        "title",
+                        "call_sign",
+                        "vess_type",
+                        "tonnage",
+                        "grt",
+                        "vess_flag",
+                        "vess_owner",
+                    ],
+                    "-0-",
+                ),
+                "remarks": "Synthetic entry.",
+            }
+        ).to_csv(data_dir / "sdn.csv", header=False, index=False)
+
+        alt_ents = rng.integers(1, self.ENTITY_COUNT + 1, size=self.ENTITY_COUNT)
+        pd.DataFrame(
+            {
+                "ent_num": alt_ents,
+                "alt_num": np.arange(1, len(alt_ents) + 1),
+                "alt_type": "aka",
+                "alt_name": names(len(alt_ents)),
+                "alt_remarks": "-0-",
+            }
+        ).to_csv(data_dir / "alt.csv", header=False, index=False)
+
+        add_ents = rng.integers(1, self.ENTITY_COUNT + 1, size=self.ENTITY_COUNT)
+        pd.DataFrame(
+            {
+                "ent_num": add_ents,
+                "add_num": np.arange(1, len(add_ents) + 1),
+                "address": "-0-",
+                "city_state_zip": "-0-",
+                "country": rng.choice(countries, len(add_ents)),
+                "add_remarks": "-0-",
+            }
+        ).to_csv(data_dir / "add.csv", header=False, index=False)
+        return data_dir
+
+    def test_load_time(self, synthetic_data_dir: Path) -> None:
+        """Full load and lookup construction stay within pinned budgets."""
+        loader = OFACDataLoader(data_path=synthetic_data_dir)
+
+        start = time.perf_counter()
+        data = loader.load()
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        aliases = loader._build_aliases_lookup(data.alt_df)
+        addresses = loader._build_addresses_lookup(data.add_df)
+        lookup_seconds = time.perf_counter() - start
+
+        assert len(data.sdn_df) == self.ENTITY_COUNT
+        assert sum(map(len, aliases.values())) == self.ENTITY_COUNT
+        assert addresses == data.addresses_by_ent
+        assert lookup_seconds < self.LOOKUP_SECONDS
+        assert load_seconds < self.LOAD_SECONDS
+
+
 class TestLoaderImports:
     """Tests for loader imports."""
 
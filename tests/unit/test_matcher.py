@@ -1,5 +1,7 @@
 """Unit tests for OFAC matching engine."""
 
+import threading
+
 import pandas as pd
 import pytest
 
@@ -309,3 +311,717 @@ class TestMatcherImports:
         from ofac.core.matcher import EntityMatcher
 
         assert EntityMatcher is not None
+
+
+class TestVectorizedEngine:
+    """Tests for the batched corpus engine."""
+
+    QUERIES = [
+        "BANCO NACIONAL DE CUBA",
+        "BANCO NACIONAL",
+        "NATIONAL BANK",
+        "AL QAIDA",
+        "ISLAMIC GUARD",
+        "BANCO",
+        "ZZZ",
+    ]
+
+    def test_default_engine_is_vectorized(self, mock_ofac_data: OFACData) -> None:
+        """EntityMatcher uses the vectorized engine by default."""
+        matcher = EntityMatcher(mock_ofac_data)
+        assert matcher.engine == "vectorized"
+
+    def test_corpus_built_when_missing(self, mock_ofac_data: OFACData) -> None:
+        """Matcher builds the corpus itself when OFACData has none."""
+        matcher = EntityMatcher(mock_ofac_data)
+        assert len(matcher.corpus) == 6
+
+    @pytest.mark.parametrize("country", [None, "Cuba", "Iran", "Japan"])
+    @pytest.mark.parametrize("min_score", [0, 40, 90])
+    def test_matches_scan_engine(
+        self, mock_ofac_data: OFACData, country: str | None, min_score: int
+    ) -> None:
+        """Vectorized results are identical to the row-by-row scan."""
+        scan = EntityMatcher(mock_ofac_data, min_score=min_score, engine="scan")
+        vectorized = EntityMatcher(
+            mock_ofac_data, min_score=min_score, engine="vectorized"
+        )
+
+        for query in self.QUERIES:
+            for max_results in (1, 3, 10):
+                expected = scan.match(query, country=country, max_results=max_results)
+                actual = vectorized.match(
+                    query, country=country, max_results=max_results
+                )
+                assert [m.model_dump() for m in actual] == [
+                    m.model_dump() for m in expected
+                ]
+
+    def test_matches_scan_engine_on_loaded_data(self, mock_ofac_data_dir) -> None:
+        """Vectorized results equal scan results on loader-built data."""
+        from ofac.data.loader import OFACDataLoader
+
+        data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+        scan = EntityMatcher(data, engine="scan")
+        vectorized = EntityMatcher(data, engine="vectorized")
+
+        for query in [*self.QUERIES, "TEST VESSEL", "PASDARAN"]:
+            for country in (None, "Syria", "SY", "Switzerland"):
+                expected = scan.match(query, country=country)
+                actual = vectorized.match(query, country=country)
+                assert [m.model_dump() for m in actual] == [
+                    m.model_dump() for m in expected
+                ]
+
+    def test_exact_alias_is_alias_type(self, mock_ofac_data: OFACData) -> None:
+        """A perfect alias hit is reported as ALIAS, not EXACT."""
+        matcher = EntityMatcher(mock_ofac_data)
+        matches = matcher.match("AL QAEDA", max_results=1)
+
+        assert matches[0].match_type == MatchType.ALIAS
+        assert matches[0].match_score == 100
+        assert matches[0].remarks == "Matched alias: AL QAEDA"
+
+
+class TestScanTopK:
+    """Tests for the scan engine's bounded top-k selection."""
+
+    @pytest.fixture
+    def tied_data(self) -> OFACData:
+        """Data where many names share scores, with and without a country."""
+        names = ["ACME TRADING", "ACME TRADERS", "ACME TRADING CO", "ACME", "TRADING"]
+        sdn_df = pd.DataFrame(
+            {
+                "ent_num": list(range(1, 21)),
+                "sdn_name": [names[i % len(names)] for i in range(20)],
+                "sdn_type": ["entity"] * 20,
+                "programs": ["SDGT"] * 20,
+                "remarks": [""] * 20,
+            }
+        )
+        aliases_by_ent = {i: ["ACME TRADING"] for i in range(1, 21, 3)}
+        addresses_by_ent = {i: ["Cuba"] for i in range(2, 21, 4)}
+        return OFACData(
+            sdn_df=sdn_df,
+            alt_df=pd.DataFrame(columns=["ent_num", "alt_num", "alt_name", "alt_type"]),
+            add_df=pd.DataFrame(columns=["ent_num", "add_num", "country"]),
+            aliases_by_ent=aliases_by_ent,
+            addresses_by_ent=addresses_by_ent,
+            version=OFACDataVersion(sdn_count=20, source="SDN"),
+        )
+
+    @staticmethod
+    def _exhaustive(
+        matcher: EntityMatcher, query: str, country: str | None, max_results: int
+    ) -> list[tuple[int, str, str | None]]:
+        """Score every name, then stable-sort, like the original scan."""
+        from rapidfuzz import fuzz
+
+        from ofac.core.config import settings
+        from ofac.core.countries import normalize_country_code
+
+        hits = []
+        code = normalize_country_code(country) if country else None
+        for record in matcher.entities.records:
+            boost = (
+                settings.country_match_boost
+                if country and matcher._record_country_match(country, code, record)
+                else 0
+            )
+            for alias in (None, *matcher._aliases(record)):
+                raw = fuzz.token_sort_ratio(query, alias or record.sdn_name)
+                score = min(100, int(raw) + boost)
+                if score >= matcher.min_score:
+                    hits.append((score, record.ent_num, alias))
+        hits.sort(key=lambda hit: hit[0], reverse=True)
+        return hits[:max_results]
+
+    @pytest.mark.parametrize("country", [None, "Cuba"])
+    @pytest.mark.parametrize("min_score", [0, 60])
+    def test_matches_exhaustive_sort(
+        self, tied_data: OFACData, country: str | None, min_score: int
+    ) -> None:
+        """Heap selection keeps the same hits and tie order as a full sort."""
+        matcher = EntityMatcher(tied_data, min_score=min_score, engine="scan")
+
+        for query in ("ACME TRADING", "ACME", "TRADING CO", "ZZZ"):
+            for max_results in (0, 1, 3, 7, 50):
+                matches = matcher.match(query, country=country, max_results=max_results)
+                actual = [
+                    (
+                        m.match_score,
+                        m.ent_num,
+                        m.remarks.removeprefix("Matched alias: ")
+                        if m.match_type == MatchType.ALIAS
+                        else None,
+                    )
+                    for m in matches
+                ]
+                expected = self._exhaustive(matcher, query, country, max_results)
+                assert actual == expected
+
+    def test_score_cutoff_rises_with_kth_best(
+        self, tied_data: OFACData, monkeypatch
+    ) -> None:
+        """Once the heap is full, later names are scored with a raised cutoff."""
+        from rapidfuzz import fuzz
+
+        from ofac.core import matcher as matcher_module
+
+        cutoffs: list[float] = []
+        ratio = fuzz.ratio
+
+        def recording_ratio(*args, **kwargs):
+            cutoffs.append(kwargs.get("score_cutoff", 0))
+            return ratio(*args, **kwargs)
+
+        monkeypatch.setattr(matcher_module.fuzz, "ratio", recording_ratio)
+        matcher = EntityMatcher(tied_data, engine="scan")
+
+        matches = matcher.match("ACME TRADING", max_results=2)
+
+        assert [m.match_score for m in matches] == [100, 100]
+        assert cutoffs[0] == 0
+        # Two perfect hits fill the heap early; nothing later is scored
+        assert len(cutoffs) < 20
+
+
+class TestNamePipelineMatching:
+    """Tests for matching with a configured normalization pipeline."""
+
+    FULL_PIPELINE = [
+        "strip_diacritics",
+        "strip_punctuation",
+        "legal_suffixes",
+        "casefold",
+        "token_sort",
+    ]
+
+    def test_default_pipeline_keeps_token_sort_scores(
+        self, mock_ofac_data: OFACData
+    ) -> None:
+        """The default pipeline scores exactly like token_sort_ratio."""
+        from rapidfuzz import fuzz
+
+        matcher = EntityMatcher(mock_ofac_data)
+        matches = matcher.match("nacional BANCO cuba", max_results=1)
+
+        assert matcher.normalizer.steps == ("token_sort",)
+        assert matches[0].match_score == int(
+            fuzz.token_sort_ratio("nacional BANCO cuba", "BANCO NACIONAL DE CUBA")
+        )
+
+    @pytest.mark.parametrize("engine", ["scan", "vectorized"])
+    def test_full_pipeline_matches_variants(
+        self, mock_ofac_data: OFACData, engine: str
+    ) -> None:
+        """Case, accents and punctuation no longer lower the score."""
+        matcher = EntityMatcher(
+            mock_ofac_data, engine=engine, normalization=self.FULL_PIPELINE
+        )
+
+        matches = matcher.match("Banco Nacional de Cubá", max_results=1)
+
+        assert matches[0].sdn_name == "BANCO NACIONAL DE CUBA"
+        assert matches[0].match_score == 100
+        assert matches[0].match_type == MatchType.EXACT
+
+    @pytest.mark.parametrize("country", [None, "Cuba"])
+    def test_engines_agree_with_full_pipeline(
+        self, mock_ofac_data: OFACData, country: str | None
+    ) -> None:
+        """Scan and vectorized engines agree under any pipeline."""
+        scan = EntityMatcher(
+            mock_ofac_data, engine="scan", normalization=self.FULL_PIPELINE
+        )
+        vectorized = EntityMatcher(
+            mock_ofac_data, engine="vectorized", normalization=self.FULL_PIPELINE
+        )
+
+        for query in ("al-qaeda", "national bank of cuba", "Islamic Guard Corp."):
+            expected = scan.match(query, country=country)
+            actual = vectorized.match(query, country=country)
+            assert [m.model_dump() for m in actual] == [
+                m.model_dump() for m in expected
+            ]
+
+    def test_corpus_normalized_once(self, mock_ofac_data: OFACData) -> None:
+        """prepare() normalizes corpus names once; queries reuse them."""
+        matcher = EntityMatcher(mock_ofac_data, normalization=["casefold"]).prepare()
+        name_keys = matcher.name_keys
+
+        matcher.match("banco nacional de cuba")
+
+        assert matcher.name_keys is name_keys
+        assert name_keys[0] == "banco nacional de cuba"
+
+    def test_cache_keys_separate_pipelines(self, mock_ofac_data: OFACData) -> None:
+        """Matchers with different pipelines never share cached results."""
+        from ofac.core.cache import MatchCache
+
+        cache = MatchCache(max_size=16)
+        case_sensitive = EntityMatcher(mock_ofac_data, cache=cache)
+        casefolded = EntityMatcher(
+            mock_ofac_data, cache=cache, normalization=["casefold", "token_sort"]
+        )
+
+        low = case_sensitive.match("banco nacional de cuba", max_results=1)
+        high = casefolded.match("banco nacional de cuba", max_results=1)
+
+        assert low[0].match_score < 100
+        assert high[0].match_score == 100
+
+
+class TestEnsembleMatching:
+    """Tests for the ensemble scorer inside the matcher."""
+
+    @pytest.mark.parametrize("country", [None, "Cuba", "Iran"])
+    @pytest.mark.parametrize("min_score", [0, 60])
+    def test_engines_agree(
+        self, mock_ofac_data: OFACData, country: str | None, min_score: int
+    ) -> None:
+        """Scan and vectorized engines agree with the ensemble scorer."""
+        scan = EntityMatcher(
+            mock_ofac_data, min_score=min_score, engine="scan", scorer="ensemble"
+        )
+        vectorized = EntityMatcher(
+            mock_ofac_data, min_score=min_score, engine="vectorized", scorer="ensemble"
+        )
+
+        for query in TestVectorizedEngine.QUERIES:
+            for max_results in (1, 3, 10):
+                expected = scan.match(query, country=country, max_results=max_results)
+                actual = vectorized.match(
+                    query, country=country, max_results=max_results
+                )
+                assert [m.model_dump() for m in actual] == [
+                    m.model_dump() for m in expected
+                ]
+
+    def test_subset_name_found(self, mock_ofac_data: OFACData) -> None:
+        """A query contained in a longer SDN name scores higher than ratio."""
+        ratio = EntityMatcher(mock_ofac_data)
+        ensemble = EntityMatcher(mock_ofac_data, scorer="ensemble")
+
+        ratio_best = ratio.match("ISLAMIC REVOLUTIONARY GUARD", max_results=1)[0]
+        ensemble_best = ensemble.match("ISLAMIC REVOLUTIONARY GUARD", max_results=1)[0]
+
+        assert ensemble_best.sdn_name == "ISLAMIC REVOLUTIONARY GUARD CORPS"
+        assert ensemble_best.match_score > ratio_best.match_score
+
+    def test_exact_name_is_exact(self, mock_ofac_data: OFACData) -> None:
+        """A perfect match still scores exactly 100 as EXACT."""
+        matcher = EntityMatcher(mock_ofac_data, scorer="ensemble")
+
+        best = matcher.match("BANCO NACIONAL DE CUBA", max_results=1)[0]
+
+        assert best.match_score == 100
+        assert best.match_type == MatchType.EXACT
+
+    def test_cache_keys_separate_scorers(self, mock_ofac_data: OFACData) -> None:
+        """Ratio and ensemble matchers never share cached results."""
+        from ofac.core.cache import MatchCache
+
+        cache = MatchCache(max_size=16)
+        ratio = EntityMatcher(mock_ofac_data, cache=cache)
+        ensemble = EntityMatcher(mock_ofac_data, cache=cache, scorer="ensemble")
+
+        query = "ISLAMIC REVOLUTIONARY GUARD"
+        assert ratio._cache_key(query, None, 10) != ensemble._cache_key(query, None, 10)
+        ratio.match(query)
+        assert ensemble.match(query) != ratio.match(query)
+
+    def test_candidate_index_does_not_narrow_ensemble(
+        self, mock_ofac_data: OFACData
+    ) -> None:
+        """A capped trigram index leaves ensemble results unchanged."""
+        from ofac.data.index import CandidateIndex
+
+        full = EntityMatcher(mock_ofac_data, scorer="ensemble")
+        index = CandidateIndex.build(full.corpus, max_candidates=1, min_candidates=1)
+        indexed = EntityMatcher(
+            mock_ofac_data._replace(candidate_index=index), scorer="ensemble"
+        )
+
+        for query in ("AL-NUSRA", "NATIONAL BANK", "ISLAMIC GUARD"):
+            assert [m.model_dump() for m in indexed.match(query)] == [
+                m.model_dump() for m in full.match(query)
+            ]
+
+
+class TestMatchMany:
+    """Tests for match_many() batch matching."""
+
+    def test_matches_single_queries(self, mock_ofac_data: OFACData) -> None:
+        """match_many() returns the same results as match() per name."""
+        matcher = EntityMatcher(mock_ofac_data)
+        names = ["BANCO NACIONAL", "AL QAIDA", "NATIONAL BANK", "ISLAMIC GUARD"]
+        countries = ["Cuba", None, "Switzerland", "Iran"]
+
+        batch = matcher.match_many(names, countries, max_results=3)
+
+        assert len(batch) == len(names)
+        for name, country, matches in zip(names, countries, batch, strict=True):
+            expected = matcher.match(name, country=country, max_results=3)
+            assert [m.model_dump() for m in matches] == [
+                m.model_dump() for m in expected
+            ]
+
+    def test_blank_names_get_empty_results(self, mock_ofac_data: OFACData) -> None:
+        """Blank names keep their position with an empty result list."""
+        matcher = EntityMatcher(mock_ofac_data)
+        batch = matcher.match_many(["", "AL-QAIDA", "   "])
+
+        assert batch[0] == []
+        assert batch[1][0].sdn_name == "AL-QAIDA"
+        assert batch[2] == []
+
+    def test_chunks_preserve_order(
+        self, mock_ofac_data: OFACData, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Results stay in input order across matrix chunks."""
+        from ofac.core.config import settings
+
+        monkeypatch.setattr(settings, "batch_size", 2)
+        matcher = EntityMatcher(mock_ofac_data)
+        names = [
+            "AL-QAIDA",
+            "BANCO NACIONAL DE CUBA",
+            "ISLAMIC GUARD",
+            "AL QAEDA",
+            "CUBA",
+        ]
+
+        batch = matcher.match_many(names, max_results=1)
+
+        assert [m[0].ent_num for m in batch] == [1000, 306, 2000, 1000, 306]
+
+    def test_scan_engine_supported(self, mock_ofac_data: OFACData) -> None:
+        """match_many() falls back to per-name matching for the scan engine."""
+        scan = EntityMatcher(mock_ofac_data, engine="scan")
+        vectorized = EntityMatcher(mock_ofac_data)
+        names = ["BANCO", "AL QAEDA"]
+
+        assert [
+            [m.model_dump() for m in matches] for matches in scan.match_many(names)
+        ] == [
+            [m.model_dump() for m in matches]
+            for matches in vectorized.match_many(names)
+        ]
+
+    def test_rejects_misaligned_countries(self, mock_ofac_data: OFACData) -> None:
+        """match_many() raises when countries do not align with names."""
+        matcher = EntityMatcher(mock_ofac_data)
+        with pytest.raises(ValueError):
+            matcher.match_many(["A", "B"], ["US"])
+
+
+class TestCountryCodeResolution:
+    """Tests for ISO-code based country matching."""
+
+    @pytest.mark.parametrize("engine", ["scan", "vectorized"])
+    def test_country_variants_match(
+        self, mock_ofac_data: OFACData, engine: str
+    ) -> None:
+        """Country names and ISO codes resolve to the same country."""
+        matcher = EntityMatcher(mock_ofac_data, engine=engine)  # type: ignore[arg-type]
+        for country in ("CU", "cuba", "Cuba", "CUBA"):
+            matches = matcher.match("BANCO NACIONAL DE CUBA", country=country)
+            assert matches[0].country_match is True
+
+    @pytest.mark.parametrize("engine", ["scan", "vectorized"])
+    def test_code_is_not_substring_matched(
+        self, mock_ofac_data: OFACData, engine: str
+    ) -> None:
+        """A code is not matched as a substring of another country's name."""
+        data = mock_ofac_data._replace(addresses_by_ent={2000: ["Russia"]})
+        matcher = EntityMatcher(data, engine=engine)  # type: ignore[arg-type]
+
+        matches = matcher.match("ISLAMIC REVOLUTIONARY GUARD CORPS", country="US")
+
+        assert matches[0].country_match is False
+
+    @pytest.mark.parametrize("engine", ["scan", "vectorized"])
+    def test_unresolved_country_falls_back_to_names(
+        self, mock_ofac_data: OFACData, engine: str
+    ) -> None:
+        """Countries without an ISO code still match by name."""
+        data = mock_ofac_data._replace(addresses_by_ent={1000: ["Tribal Areas"]})
+        matcher = EntityMatcher(data, engine=engine)  # type: ignore[arg-type]
+
+        matches = matcher.match("AL-QAIDA", country="tribal areas")
+
+        assert matches[0].country_match is True
+
+
+class TestSharedMatcher:
+    """Tests for one matcher shared by concurrent requests."""
+
+    def test_prepare_builds_state(self, mock_ofac_data: OFACData) -> None:
+        """prepare() builds the entity table and corpus up front."""
+        matcher = EntityMatcher(mock_ofac_data)
+
+        assert matcher.prepare() is matcher
+        assert matcher._entities is not None
+        assert matcher._corpus is not None
+
+    def test_country_mask_is_reused(self, mock_ofac_data: OFACData) -> None:
+        """Country masks are built once per country and are read-only."""
+        matcher = EntityMatcher(mock_ofac_data)
+
+        mask = matcher._country_mask("Cuba")
+
+        assert mask is matcher._country_mask("Cuba")
+        assert not mask.flags.writeable
+
+    def test_concurrent_matches_agree(self, mock_ofac_data: OFACData) -> None:
+        """Threads sharing a lazily built matcher get identical results."""
+        matcher = EntityMatcher(mock_ofac_data)
+        expected = [
+            m.model_dump()
+            for m in EntityMatcher(mock_ofac_data).match("BANCO NACIONAL", "Cuba")
+        ]
+        results: list[list[dict]] = []
+
+        def worker() -> None:
+            for _ in range(20):
+                results.append(
+                    [m.model_dump() for m in matcher.match("BANCO NACIONAL", "Cuba")]
+                )
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(results) == 80
+        assert all(result == expected for result in results)
+
+
+class TestIdfMatching:
+    """Tests for the IDF scorer inside the matcher."""
+
+    @pytest.mark.parametrize("country", [None, "Cuba", "Iran"])
+    @pytest.mark.parametrize("min_score", [0, 60])
+    def test_engines_agree(
+        self, mock_ofac_data: OFACData, country: str | None, min_score: int
+    ) -> None:
+        """Scan and vectorized engines agree with the IDF scorer."""
+        scan = EntityMatcher(
+            mock_ofac_data, min_score=min_score, engine="scan", scorer="idf"
+        )
+        vectorized = EntityMatcher(
+            mock_ofac_data, min_score=min_score, engine="vectorized", scorer="idf"
+        )
+
+        for query in TestVectorizedEngine.QUERIES:
+            for max_results in (1, 3, 10):
+                expected = scan.match(query, country=country, max_results=max_results)
+                actual = vectorized.match(
+                    query, country=country, max_results=max_results
+                )
+                assert [m.model_dump() for m in actual] == [
+                    m.model_dump() for m in expected
+                ]
+
+    def test_exact_name_is_exact(self, mock_ofac_data: OFACData) -> None:
+        """A perfect match still scores exactly 100 as EXACT."""
+        matcher = EntityMatcher(mock_ofac_data, scorer="idf")
+
+        best = matcher.match("BANCO NACIONAL DE CUBA", max_results=1)[0]
+
+        assert best.match_score == 100
+        assert best.match_type == MatchType.EXACT
+
+    def test_prepare_counts_tokens(self, mock_ofac_data: OFACData) -> None:
+        """prepare() builds the token statistics of the normalized corpus."""
+        matcher = EntityMatcher(mock_ofac_data, scorer="idf").prepare()
+
+        assert matcher._token_stats is not None
+        assert matcher._token_stats.corpus_size == len(matcher.name_keys)
+
+
+class TestLengthBucketPruning:
+    """Tests that length-bucket pruning returns the full-scan results."""
+
+    QUERIES = ["ACME", "ACME TRADING", "BANCO NACIONAL DE CUBA", "AL", "TRADING CO"]
+
+    @pytest.fixture
+    def varied_data(self, monkeypatch: pytest.MonkeyPatch) -> OFACData:
+        """Names of many lengths, with aliases and countries, in small groups."""
+        import random
+
+        import ofac.core.matcher as matcher_module
+
+        monkeypatch.setattr(matcher_module, "_BUCKET_GROUP_SIZE", 8)
+        rng = random.Random(24)
+        words = ["ACME", "TRADING", "CO", "BANCO", "NACIONAL", "DE", "CUBA", "AL"]
+        names = [
+            " ".join(rng.choice(words) for _ in range(rng.randint(1, 6)))
+            for _ in range(120)
+        ]
+        sdn_df = pd.DataFrame(
+            {
+                "ent_num": list(range(1, len(names) + 1)),
+                "sdn_name": names,
+                "sdn_type": ["entity"] * len(names),
+                "programs": ["SDGT"] * len(names),
+                "remarks": [""] * len(names),
+            }
+        )
+        aliases_by_ent = {i: [rng.choice(names)] for i in range(1, len(names), 7)}
+        addresses_by_ent = {i: ["Cuba"] for i in range(2, len(names), 5)}
+        return OFACData(
+            sdn_df=sdn_df,
+            alt_df=pd.DataFrame(columns=["ent_num", "alt_num", "alt_name", "alt_type"]),
+            add_df=pd.DataFrame(columns=["ent_num", "add_num", "country"]),
+            aliases_by_ent=aliases_by_ent,
+            addresses_by_ent=addresses_by_ent,
+            version=OFACDataVersion(sdn_count=len(names), source="SDN"),
+        )
+
+    @pytest.mark.parametrize("country", [None, "Cuba"])
+    @pytest.mark.parametrize("min_score", [0, 50, 80, 95])
+    def test_pruned_results_equal_full_scan(
+        self, varied_data: OFACData, country: str | None, min_score: int
+    ) -> None:
+        """match() and match_many() return exactly the scan engine's hits."""
+        scan = EntityMatcher(varied_data, min_score=min_score, engine="scan")
+        pruned = EntityMatcher(varied_data, min_score=min_score, engine="vectorized")
+
+        for max_results in (1, 3, 10):
+            expected = [
+                [m.model_dump() for m in scan.match(query, country, max_results)]
+                for query in self.QUERIES
+            ]
+            single = [
+                [m.model_dump() for m in pruned.match(query, country, max_results)]
+                for query in self.QUERIES
+            ]
+            batch = [
+                [m.model_dump() for m in matches]
+                for matches in pruned.match_many(
+                    self.QUERIES, [country] * len(self.QUERIES), max_results
+                )
+            ]
+            assert single == expected
+            assert batch == expected
+
+    def test_hopeless_buckets_are_not_scored(
+        self, varied_data: OFACData, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Names too long or short to reach min_score or the top k are skipped."""
+        from typing import Any
+
+        import ofac.core.matcher as matcher_module
+
+        scored: list[int] = []
+        cdist = matcher_module.process.cdist
+
+        def counting_cdist(queries: Any, choices: Any, **kwargs: Any) -> Any:
+            scored.append(len(choices))
+            return cdist(queries, choices, **kwargs)
+
+        monkeypatch.setattr(matcher_module.process, "cdist", counting_cdist)
+        matcher = EntityMatcher(varied_data, min_score=80)
+        corpus_size = len(matcher.corpus)
+
+        matcher.match("ACME")
+        assert 0 < sum(scored) < corpus_size
+
+        scored.clear()
+        EntityMatcher(varied_data).match("ACME", max_results=1)
+        assert 0 < sum(scored) < corpus_size
+
+
+class TestExactHits:
+    """Tests for exact-index seeding and the stop-at-exact-NOK mode."""
+
+    @pytest.fixture
+    def repeated_data(self) -> OFACData:
+        """Repeated names, a near miss with a country, and an alias."""
+        names = ["ACME TRADING", "ACME TRADINGS", "ZETA", "ACME TRADING", "ACME"]
+        sdn_df = pd.DataFrame(
+            {
+                "ent_num": [1, 2, 3, 4, 5],
+                "sdn_name": names,
+                "sdn_type": ["entity"] * len(names),
+                "programs": ["SDGT"] * len(names),
+                "remarks": [""] * len(names),
+            }
+        )
+        return OFACData(
+            sdn_df=sdn_df,
+            alt_df=pd.DataFrame(columns=["ent_num", "alt_num", "alt_name", "alt_type"]),
+            add_df=pd.DataFrame(columns=["ent_num", "add_num", "country"]),
+            aliases_by_ent={3: ["TRADING ACME"]},
+            addresses_by_ent={2: ["Cuba"]},
+            version=OFACDataVersion(sdn_count=len(names), source="SDN"),
+        )
+
+    @pytest.mark.parametrize("country", [None, "Cuba"])
+    def test_seeded_results_equal_full_scan(
+        self, repeated_data: OFACData, country: str | None
+    ) -> None:
+        """Exact hits seeding the top k leave the results unchanged."""
+        scan = EntityMatcher(repeated_data, engine="scan")
+        vectorized = EntityMatcher(repeated_data, engine="vectorized")
+
+        for max_results in (1, 2, 3, 5):
+            assert [
+                m.model_dump()
+                for m in vectorized.match("ACME TRADING", country, max_results)
+            ] == [
+                m.model_dump() for m in scan.match("ACME TRADING", country, max_results)
+            ]
+
+    @pytest.mark.parametrize("engine", ["scan", "vectorized"])
+    def test_stop_mode_returns_only_exact_hits(
+        self,
+        repeated_data: OFACData,
+        engine: str,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A query with exact hits is answered from the index alone."""
+        import ofac.core.matcher as matcher_module
+
+        def no_scoring(*_args: object, **_kwargs: object) -> None:
+            raise AssertionError("fuzzy scoring should be skipped")
+
+        monkeypatch.setattr(matcher_module.process, "cdist", no_scoring)
+        monkeypatch.setattr(matcher_module.fuzz, "ratio", no_scoring)
+        matcher = EntityMatcher(repeated_data, engine=engine, stop_at_exact_nok=True)
+
+        matches = matcher.match("TRADING ACME", country="Cuba")
+
+        assert [(m.ent_num, m.match_type) for m in matches] == [
+            (1, MatchType.EXACT),
+            (3, MatchType.ALIAS),
+            (4, MatchType.EXACT),
+        ]
+        assert all(m.match_score == 100 for m in matches)
+        assert not any(m.country_match for m in matches)
+        assert len(matcher.match("TRADING ACME", max_results=2)) == 2
+
+    def test_stop_mode_without_exact_hit_scores_as_usual(
+        self, repeated_data: OFACData
+    ) -> None:
+        """Queries without an exact hit get the normal fuzzy results."""
+        stop = EntityMatcher(repeated_data, stop_at_exact_nok=True)
+        normal = EntityMatcher(repeated_data)
+
+        queries = ["ACME TRADNG", "ACME TRADING", "ZETA CO"]
+        expected = [[m.model_dump() for m in normal.match(q)] for q in queries[::2]]
+
+        batch = stop.match_many(queries)
+        assert [[m.model_dump() for m in batch[i]] for i in (0, 2)] == expected
+        assert [m.ent_num for m in batch[1]] == [1, 3, 4]
+        assert len(normal.match("ACME TRADING")) == 6
+
+    def test_stop_mode_is_part_of_cache_key(self, repeated_data: OFACData) -> None:
+        """Results of the two modes are never served from each other's cache."""
+        stop = EntityMatcher(repeated_data, stop_at_exact_nok=True)
+        normal = EntityMatcher(repeated_data)
+
+        assert stop._cache_key("ACME", None, 10) != normal._cache_key("ACME", None, 10)
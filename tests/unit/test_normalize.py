@@ -0,0 +1,90 @@
+"""Unit tests for the name normalization pipeline."""
+
+import pytest
+from rapidfuzz import fuzz
+
+from ofac.core.exceptions import ConfigurationError
+from ofac.core.normalize import (
+    NamePipeline,
+    canonicalize_legal_suffixes,
+    sort_tokens,
+    strip_diacritics,
+    strip_punctuation,
+)
+
+
+class TestNormalizationSteps:
+    """Tests for the individual normalization steps."""
+
+    def test_strip_diacritics_keeps_other_scripts(self) -> None:
+        """Accents are removed without dropping non-Latin letters."""
+        assert strip_diacritics("SÃO PAULO ÉTOILE") == "SAO PAULO ETOILE"
+        assert strip_diacritics("ШАХИД") == "ШАХИД"
+
+    def test_strip_punctuation(self) -> None:
+        """Periods join letters; other punctuation separates tokens."""
+        assert strip_punctuation("S.A.") == "SA"
+        assert strip_punctuation("AL-QAIDA") == "AL QAIDA"
+        assert strip_punctuation("O'BRIEN, INC.") == "OBRIEN  INC"
+
+    def test_legal_suffixes(self) -> None:
+        """Legal-form spellings collapse to one canonical token."""
+        assert canonicalize_legal_suffixes("Acme Limited") == "Acme LTD"
+        assert canonicalize_legal_suffixes("ACME L.L.C.") == "ACME LLC"
+        assert canonicalize_legal_suffixes("Banco S.A.") == "Banco SA"
+        assert canonicalize_legal_suffixes("Trading Company,") == "Trading CO"
+        assert canonicalize_legal_suffixes("COBALT") == "COBALT"
+
+    def test_sort_tokens_matches_token_sort_ratio(self) -> None:
+        """A plain ratio of sorted names equals token_sort_ratio."""
+        pairs = [
+            ("BANCO NACIONAL DE CUBA", "NACIONAL BANCO CUBA"),
+            ("AL  QAIDA", "QAIDA AL"),
+            ("Acme", "ACME CORP"),
+        ]
+        for left, right in pairs:
+            assert fuzz.ratio(sort_tokens(left), sort_tokens(right)) == (
+                fuzz.token_sort_ratio(left, right)
+            )
+
+
+class TestNamePipeline:
+    """Tests for NamePipeline configuration and ordering."""
+
+    def test_steps_run_in_canonical_order(self) -> None:
+        """Configured order does not matter; steps run in a fixed order."""
+        pipeline = NamePipeline(["token_sort", "casefold", "legal_suffixes"])
+
+        assert pipeline.steps == ("legal_suffixes", "casefold", "token_sort")
+        assert pipeline("Trading Company Limited") == "co ltd trading"
+
+    def test_full_pipeline_equates_variants(self) -> None:
+        """Spelling variants of one name normalize to the same form."""
+        pipeline = NamePipeline(
+            [
+                "strip_diacritics",
+                "strip_punctuation",
+                "legal_suffixes",
+                "casefold",
+                "token_sort",
+            ]
+        )
+
+        assert pipeline("Banco Nacional de Cuba, S.A.") == pipeline(
+            "BANCO NACIONAL DE CUBA SA"
+        )
+        assert pipeline("Société Générale Ltd.") == pipeline("GENERALE SOCIETE LIMITED")
+
+    def test_empty_pipeline_is_identity(self) -> None:
+        """With no steps, names are compared as given."""
+        assert NamePipeline([])("Acme  Corp") == "Acme  Corp"
+
+    def test_unknown_step_rejected(self) -> None:
+        """Unknown step names raise ConfigurationError."""
+        with pytest.raises(ConfigurationError, match="soundex"):
+            NamePipeline(["casefold", "soundex"])
+
+    def test_normalize_many(self) -> None:
+        """normalize_many keeps input order."""
+        pipeline = NamePipeline(["casefold"])
+        assert pipeline.normalize_many(["B", "A"]) == ["b", "a"]
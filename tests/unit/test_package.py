@@ -34,3 +34,34 @@ def test_ofac_streamlit_module_imports() -> None:
     from ofac import streamlit  # noqa: F401
 
     assert True
+
+
+def test_data_module_imports_before_core() -> None:
+    """Verify that ofac.data can be imported in a fresh interpreter first."""
+    import subprocess
+    import sys
+
+    for module in ("ofac.data", "ofac.data.loader", "ofac.core.matcher"):
+        result = subprocess.run(
+            [sys.executable, "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        assert result.returncode == 0, result.stderr
+
+
+def test_data_module_does_not_import_matcher() -> None:
+    """Verify that loading ofac.data leaves the matcher unimported."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, ofac.data.loader, ofac.core; "
+        "assert 'ofac.core.matcher' not in sys.modules; "
+        "assert ofac.core.EntityMatcher.__module__ == 'ofac.core.matcher'"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=False
+    )
+    assert result.returncode == 0, result.stderr
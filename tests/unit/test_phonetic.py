@@ -0,0 +1,134 @@
+"""Unit tests for phonetic name keys and the phonetic index."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ofac.core.config import settings
+from ofac.core.matcher import EntityMatcher
+from ofac.data.corpus import build_name_corpus
+from ofac.data.entities import build_entity_table
+from ofac.data.index import CandidateIndex
+from ofac.data.loader import OFACData, OFACDataLoader
+from ofac.data.phonetic import PhoneticIndex, phonetic_key, transliterate
+from ofac.data.schemas import OFACDataVersion
+
+
+def _make_data(names: list[str]) -> OFACData:
+    """Build OFACData with one SDN entry per name (ent_num = position + 1)."""
+    sdn_df = pd.DataFrame(
+        {
+            "ent_num": list(range(1, len(names) + 1)),
+            "sdn_name": names,
+            "sdn_type": ["individual"] * len(names),
+            "programs": ["SDGT"] * len(names),
+            "remarks": [""] * len(names),
+        }
+    )
+    entities = build_entity_table(sdn_df, {})
+    return OFACData(
+        sdn_df=sdn_df,
+        alt_df=pd.DataFrame(),
+        add_df=pd.DataFrame(),
+        aliases_by_ent={},
+        addresses_by_ent={},
+        version=OFACDataVersion(sdn_count=len(names), source="SDN"),
+        entities=entities,
+        corpus=build_name_corpus(entities, {}),
+    )
+
+
+class TestPhoneticKey:
+    """Tests for phonetic_key()."""
+
+    @pytest.mark.parametrize(
+        "variants",
+        [
+            ["Mohammed", "Muhammad", "Mohamad", "MOHAMED", "محمد"],
+            ["Abdul Rahman", "Abd al-Rahman", "ABDELRAHMAN", "عبد الرحمن"],
+            ["Hussein", "Husayn", "Hosseini"],
+            ["Yevgeny", "Evgeniy", "Евгений"],
+            ["Alexander", "Aleksandr", "Александр"],
+            ["Yusuf", "Youssef", "يوسف"],
+            ["Osama bin Laden", "Usama ibn Ladin"],
+            ["Khalid", "Khaled", "خالد"],
+        ],
+    )
+    def test_spelling_variants_share_key(self, variants: list[str]) -> None:
+        """Transliteration variants of one name have the same key."""
+        assert len({phonetic_key(name) for name in variants}) == 1
+
+    def test_key_ignores_token_order(self) -> None:
+        """Keys are sorted by token, like token_sort_ratio."""
+        assert phonetic_key("Rahman Abdul") == phonetic_key("Abdul Rahman")
+
+    def test_distinct_names_differ(self) -> None:
+        """Different consonant skeletons keep different keys."""
+        assert phonetic_key("Mohammed") != phonetic_key("Mahmoud Hamed")
+
+    def test_empty_name_has_empty_key(self) -> None:
+        """Names without letters or digits produce no key."""
+        assert phonetic_key(" - ") == ""
+
+    def test_transliterate_cyrillic(self) -> None:
+        """Cyrillic letters are replaced by Latin ones."""
+        assert transliterate("Шойгу") == "shoygu"
+
+
+class TestPhoneticIndex:
+    """Tests for PhoneticIndex."""
+
+    def test_lookup_returns_positions_of_matching_keys(self) -> None:
+        """All names sharing the query's key are returned in corpus order."""
+        data = _make_data(["MUHAMMAD HASAN", "BANCO NACIONAL", "MOHAMED HASSAN"])
+        index = PhoneticIndex.build(data.corpus)
+
+        np.testing.assert_array_equal(index.lookup("Mohammed Hassan"), [0, 2])
+        assert index.lookup("Unknown Name").size == 0
+
+    def test_patched_equals_rebuild(self) -> None:
+        """Renumbered postings plus fresh entries equal a full rebuild."""
+        old = _make_data(["MUHAMMAD HASAN", "BANCO NACIONAL", "YUSUF ALI"])
+        new = _make_data(["MUHAMMAD HASAN", "YOUSSEF ALI", "MOHAMED HASSAN"])
+        old_to_new = np.array([0, -1, -1])
+
+        patched = PhoneticIndex.build(old.corpus).patched(new.corpus, old_to_new)
+        rebuilt = PhoneticIndex.build(new.corpus)
+
+        assert patched.postings.keys() == rebuilt.postings.keys()
+        for key, positions in rebuilt.postings.items():
+            np.testing.assert_array_equal(patched.postings[key], positions)
+
+    def test_loader_builds_index_with_candidate_index(
+        self, mock_ofac_data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The phonetic index is only built alongside the candidate index."""
+        assert (
+            OFACDataLoader(data_path=mock_ofac_data_dir).load().phonetic_index is None
+        )
+
+        monkeypatch.setattr(settings, "candidate_index_enabled", True)
+        data = OFACDataLoader(data_path=mock_ofac_data_dir).load()
+        assert isinstance(data.phonetic_index, PhoneticIndex)
+
+        monkeypatch.setattr(settings, "phonetic_index_enabled", False)
+        data = OFACDataLoader(data_path=mock_ofac_data_dir).load(force_reload=True)
+        assert data.phonetic_index is None
+
+    def test_matcher_scores_phonetic_hits_outside_trigram_candidates(self) -> None:
+        """A variant cut by the trigram cap is still scored via its key."""
+        names = [f"MOHAMMED HASSAN TRADING {n}" for n in range(5)]
+        data = _make_data([*names, "MUHAMAD HASAN"])
+        index = CandidateIndex.build(data.corpus, max_candidates=3, min_candidates=1)
+        trigram_only = data._replace(candidate_index=index)
+        with_phonetic = trigram_only._replace(
+            phonetic_index=PhoneticIndex.build(data.corpus)
+        )
+
+        missed = EntityMatcher(trigram_only).match("MOHAMMED HASSAN")
+        found = EntityMatcher(with_phonetic).match("MOHAMMED HASSAN")
+
+        assert 6 not in [m.ent_num for m in missed]
+        assert 6 in [m.ent_num for m in found]
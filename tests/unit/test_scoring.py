@@ -0,0 +1,158 @@
+"""Unit tests for the weighted scorer ensemble."""
+
+import logging
+
+import numpy as np
+import pytest
+from rapidfuzz import fuzz
+
+from ofac.core.exceptions import ConfigurationError
+from ofac.core.normalize import sort_tokens
+from ofac.core.scoring import SCORERS, EnsembleScorer
+
+NAMES = [
+    sort_tokens(name)
+    for name in [
+        "AL-NUSRA FRONT FOR THE PEOPLE OF THE LEVANT",
+        "BANCO NACIONAL DE CUBA",
+        "ISLAMIC REVOLUTIONARY GUARD CORPS",
+        "AL-NUSRA",
+        "NUSRA TRADING",
+    ]
+]
+
+
+def _weighted_mean(query: str, name: str, weights: dict[str, float]) -> float:
+    """Combined score computed scorer by scorer, without any pruning."""
+    total = sum(
+        weight * SCORERS[scorer][0](query, name) * SCORERS[scorer][1]
+        for scorer, weight in weights.items()
+    )
+    return total / sum(weights.values())
+
+
+class TestEnsembleScorer:
+    """Tests for ensemble scoring and pruning."""
+
+    def test_subset_name_scores_above_plain_ratio(self) -> None:
+        """A name contained in a longer SDN name reaches the review range."""
+        ensemble = EnsembleScorer()
+        query = sort_tokens("AL-NUSRA")
+
+        scores = ensemble.score_matrix([query], NAMES, score_cutoff=0)[0]
+
+        assert scores[0] >= 80
+        assert scores[0] > fuzz.ratio(query, NAMES[0])
+        assert scores[3] == 100
+
+    def test_weights_combine_as_weighted_mean(self) -> None:
+        """The combined score is the weighted mean of the scorers."""
+        ensemble = EnsembleScorer({"ratio": 1, "token_set": 3})
+        query, name = sort_tokens("AL-NUSRA"), NAMES[0]
+
+        score = ensemble.score_matrix([query], [name], score_cutoff=0)[0, 0]
+
+        expected = (fuzz.ratio(query, name) + 3 * fuzz.token_set_ratio(query, name)) / 4
+        assert score == pytest.approx(expected)
+
+    @pytest.mark.parametrize(
+        ("query", "name"),
+        [
+            ("Tidewater", "Tidewater Middle East Co"),
+            ("Mahan", "Mahan Air"),
+            ("Trading Zhou", "Shanghai Trading Zhou"),
+        ],
+    )
+    def test_subset_names_dissimilar_on_jaro_winkler_are_scored(
+        self, query: str, name: str
+    ) -> None:
+        """Subset names keep their full score at the review cutoff.
+
+        These pairs score well below 60 on Jaro-Winkler after token
+        sorting, yet their combined score is in the review band.
+        """
+        query, name = sort_tokens(query), sort_tokens(name)
+        expected = _weighted_mean(query, name, EnsembleScorer().weights)
+        assert expected >= 79
+
+        score = EnsembleScorer().score_matrix([query], [name], score_cutoff=79)[0, 0]
+
+        assert score == pytest.approx(expected)
+
+    def test_candidate_guard_keeps_best_scores_and_logs(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Above the memory guard, the best cheap scores are kept."""
+        ensemble = EnsembleScorer(max_candidates=1)
+        query = sort_tokens("BANCO NACIONAL DE CUBA")
+
+        with caplog.at_level(logging.WARNING, logger="ofac.core.scoring"):
+            scores = ensemble.score_matrix([query], NAMES, score_cutoff=0)[0]
+
+        assert np.flatnonzero(scores).tolist() == [1]
+        assert scores[1] == 100
+        assert "truncated" in caplog.text
+
+    def test_no_hit_above_cutoff_is_lost(self) -> None:
+        """Pruning never changes a score at or above the cutoff."""
+        names = [sort_tokens(f"ACME TRADING COMPANY {n}") for n in range(600)]
+        names += [sort_tokens(f"ZETA SHIPPING {n}") for n in range(600)]
+        names += [sort_tokens("ACME"), sort_tokens("SHIPPING ZETA HOLDING LIMITED")]
+        queries = [sort_tokens("ACME TRADING COMPANY"), sort_tokens("ZETA SHIPPING")]
+        weights = EnsembleScorer().weights
+        expected = np.array(
+            [
+                [_weighted_mean(query, name, weights) for name in names]
+                for query in queries
+            ]
+        )
+
+        for cutoff in (0, 80, 95):
+            scores = EnsembleScorer().score_matrix(queries, names, cutoff)
+            kept = expected >= cutoff
+            assert kept.sum() > 200
+            np.testing.assert_allclose(scores[kept], expected[kept], atol=1e-6)
+
+    def test_names_below_the_bound_are_not_rescored(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Names whose best possible score misses the cutoff are dropped."""
+        ensemble = EnsembleScorer(
+            {"jaro_winkler": 3, "ratio": 1, "token_set": 1}, max_candidates=1
+        )
+        query = sort_tokens("BANCO NACIONAL DE CUBA")
+
+        # Only the exact name can reach 95, so the guard never truncates
+        with caplog.at_level(logging.WARNING, logger="ofac.core.scoring"):
+            scores = ensemble.score_matrix([query], NAMES, score_cutoff=95)[0]
+
+        assert np.flatnonzero(scores).tolist() == [1]
+        assert "truncated" not in caplog.text
+
+    def test_wratio_is_available(self) -> None:
+        """WRatio can be weighted like the other scorers."""
+        ensemble = EnsembleScorer({"wratio": 1.0})
+        query, name = sort_tokens("AL-NUSRA"), NAMES[0]
+
+        score = ensemble.score_matrix([query], [name], score_cutoff=0)[0, 0]
+
+        assert score == pytest.approx(fuzz.WRatio(query, name))
+
+    def test_cutoff_prunes_without_changing_survivors(self) -> None:
+        """Pruned names are below the cutoff; others keep their exact score."""
+        ensemble = EnsembleScorer()
+        queries = [sort_tokens("AL-NUSRA"), sort_tokens("NACIONAL BANCO")]
+
+        full = ensemble.score_matrix(queries, NAMES, score_cutoff=0)
+        pruned = ensemble.score_matrix(queries, NAMES, score_cutoff=70)
+
+        assert np.array_equal(np.where(full >= 70, full, 0), pruned)
+
+    @pytest.mark.parametrize(
+        "weights",
+        [{"soundex": 1.0}, {"ratio": -1.0, "partial": 2.0}, {"ratio": 0.0}],
+    )
+    def test_invalid_weights_rejected(self, weights: dict[str, float]) -> None:
+        """Unknown scorers, negative or all-zero weights are rejected."""
+        with pytest.raises(ConfigurationError):
+            EnsembleScorer(weights)
@@ -0,0 +1,293 @@
+"""Unit tests for the Arrow snapshot of parsed OFAC data."""
+
+import pickle
+import shutil
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from ofac.core.config import settings
+from ofac.core.matcher import EntityMatcher
+from ofac.data.corpus import MappedNames, NameCorpus
+from ofac.data.loader import OFACDataLoader
+from ofac.data.snapshot import (
+    CURRENT_NAME,
+    OFACSnapshot,
+    read_snapshot,
+    source_fingerprint,
+    write_snapshot,
+)
+
+
+@pytest.fixture
+def data_dir(mock_ofac_data_dir: Path, tmp_path: Path) -> Path:
+    """Writable copy of the mock OFAC data with snapshots enabled."""
+    target = tmp_path / "ofac"
+    shutil.copytree(mock_ofac_data_dir, target)
+    return target
+
+
+@pytest.fixture(autouse=True)
+def enable_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Enable snapshots for every test in this module."""
+    monkeypatch.setattr(settings, "snapshot_enabled", True)
+
+
+def _source_paths(data_dir: Path) -> list[Path]:
+    """Source CSV files in loader order."""
+    return [data_dir / "sdn.csv", data_dir / "alt.csv", data_dir / "add.csv"]
+
+
+def _current_version(data_dir: Path) -> Path:
+    """Version directory the snapshot CURRENT file points to."""
+    root = data_dir / "snapshot"
+    return root / (root / CURRENT_NAME).read_text(encoding="utf-8")
+
+
+def _add_alias(data_dir: Path, name: str) -> None:
+    """Append an alias to the ALT file so the snapshot becomes stale."""
+    with (data_dir / "alt.csv").open("a", encoding="utf-8") as handle:
+        handle.write(f'306,99999,"aka","{name}",-0-\n')
+
+
+class TestSourceFingerprint:
+    """Tests for source_fingerprint()."""
+
+    def test_stable_for_same_content(self, data_dir: Path) -> None:
+        """The same files always hash the same."""
+        paths = _source_paths(data_dir)
+        assert source_fingerprint(paths) == source_fingerprint(paths)
+
+    def test_changes_with_content(self, data_dir: Path) -> None:
+        """Editing a source file changes the fingerprint."""
+        paths = _source_paths(data_dir)
+        before = source_fingerprint(paths)
+        with paths[1].open("a", encoding="utf-8") as handle:
+            handle.write('999,99999,"aka","EXTRA NAME",-0-\n')
+
+        assert source_fingerprint(paths) != before
+
+
+class TestLoaderSnapshot:
+    """Tests for OFACDataLoader snapshot reuse."""
+
+    def test_first_load_writes_snapshot(self, data_dir: Path) -> None:
+        """A successful CSV parse leaves a snapshot behind."""
+        data = OFACDataLoader(data_path=data_dir).load()
+
+        snapshot = read_snapshot(data_dir / "snapshot", data.version.source_hash)
+        assert snapshot is not None
+        assert snapshot.aliases_by_ent == data.aliases_by_ent
+
+    def test_snapshot_load_equals_csv_load(
+        self, data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Data read back from the snapshot matches the CSV parse."""
+        parsed = OFACDataLoader(data_path=data_dir).load()
+
+        def fail(*_args: object) -> None:
+            raise AssertionError("CSV should not be parsed")
+
+        monkeypatch.setattr(OFACDataLoader, "_iter_csv", fail)
+        restored = OFACDataLoader(data_path=data_dir).load()
+
+        pd.testing.assert_frame_equal(restored.sdn_df, parsed.sdn_df)
+        pd.testing.assert_frame_equal(restored.alt_df, parsed.alt_df)
+        pd.testing.assert_frame_equal(restored.add_df, parsed.add_df)
+        assert restored.aliases_by_ent == parsed.aliases_by_ent
+        assert restored.addresses_by_ent == parsed.addresses_by_ent
+        assert restored.corpus is not None and parsed.corpus is not None
+        assert list(restored.corpus.names) == list(parsed.corpus.names)
+
+    def test_stale_snapshot_falls_back_to_csv(self, data_dir: Path) -> None:
+        """Changed CSVs are re-parsed and the snapshot is rebuilt."""
+        first = OFACDataLoader(data_path=data_dir).load()
+        _add_alias(data_dir, "EXTRA NAME")
+
+        second = OFACDataLoader(data_path=data_dir).load()
+
+        assert second.version.source_hash != first.version.source_hash
+        assert "EXTRA NAME" in second.aliases_by_ent[306]
+        assert read_snapshot(data_dir / "snapshot", second.version.source_hash)
+
+    def test_corrupt_snapshot_falls_back_to_csv(self, data_dir: Path) -> None:
+        """An unreadable snapshot is ignored."""
+        first = OFACDataLoader(data_path=data_dir).load()
+        (_current_version(data_dir) / "sdn_prim.arrow").write_bytes(b"not arrow")
+
+        second = OFACDataLoader(data_path=data_dir).load()
+
+        assert len(second.sdn_df) == len(first.sdn_df)
+
+    def test_unwritable_snapshot_does_not_fail_load(self, data_dir: Path) -> None:
+        """Failing to write a snapshot is not an error."""
+        (data_dir / "snapshot").write_text("a file, not a directory")
+
+        data = OFACDataLoader(data_path=data_dir).load()
+
+        assert len(data.sdn_df) > 0
+        assert (data_dir / "snapshot").is_file()
+
+    def test_compact_snapshot_not_used_for_raw_frames(
+        self, data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A snapshot without raw frames is rebuilt when they are needed."""
+        monkeypatch.setattr(settings, "keep_raw_frames", False)
+        compact = OFACDataLoader(data_path=data_dir).load()
+        restored = OFACDataLoader(data_path=data_dir).load()
+        monkeypatch.setattr(settings, "keep_raw_frames", True)
+        full = OFACDataLoader(data_path=data_dir).load()
+
+        assert restored.version.alt_count == compact.version.alt_count > 0
+        assert restored.alt_df.empty
+        assert not full.alt_df.empty
+
+    def test_rebuild_writes_new_version(self, data_dir: Path) -> None:
+        """A rebuilt snapshot goes to a new directory, leaving no temp files."""
+        OFACDataLoader(data_path=data_dir).load()
+        first = _current_version(data_dir)
+        _add_alias(data_dir, "EXTRA NAME")
+
+        OFACDataLoader(data_path=data_dir).load()
+
+        assert _current_version(data_dir) != first
+        assert first.is_dir()
+        assert not list((data_dir / "snapshot").rglob("*.tmp"))
+
+    def test_old_versions_are_pruned(self, data_dir: Path) -> None:
+        """Only the newest few snapshot versions stay on disk."""
+        data = OFACDataLoader(data_path=data_dir).load()
+        snapshot = read_snapshot(data_dir / "snapshot", data.version.source_hash)
+        assert snapshot is not None
+
+        for _ in range(6):
+            assert write_snapshot(data_dir / "snapshot", snapshot)
+
+        versions = [p for p in (data_dir / "snapshot").iterdir() if p.is_dir()]
+        assert len(versions) == 3
+        assert _current_version(data_dir) in versions
+
+    def test_disabled_snapshot_is_not_written(
+        self, data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """No snapshot is read or written when disabled."""
+        monkeypatch.setattr(settings, "snapshot_enabled", False)
+
+        OFACDataLoader(data_path=data_dir).load()
+
+        assert not (data_dir / "snapshot").exists()
+
+
+class TestMappedCorpus:
+    """Tests for the memory-mapped corpus stored in the snapshot."""
+
+    def test_snapshot_corpus_is_memory_mapped(self, data_dir: Path) -> None:
+        """The corpus read back uses read-only mmapped arrays."""
+        OFACDataLoader(data_path=data_dir).load()
+        corpus = OFACDataLoader(data_path=data_dir).load().corpus
+
+        assert corpus is not None
+        assert isinstance(corpus.names, MappedNames)
+        for array in (corpus.names.data, corpus.ent_nums, corpus.entities):
+            assert isinstance(array, np.memmap)
+            assert not array.flags.writeable
+
+    def test_mapped_corpus_matches_like_built_corpus(self, data_dir: Path) -> None:
+        """Matching over the mapped corpus returns the same results."""
+        built = OFACDataLoader(data_path=data_dir).load()
+        mapped = OFACDataLoader(data_path=data_dir).load()
+
+        for query in ["BANCO NACIONAL DE CUBA", "AL QAEDA", "PASDARAN"]:
+            assert [m.model_dump() for m in EntityMatcher(mapped).match(query)] == [
+                m.model_dump() for m in EntityMatcher(built).match(query)
+            ]
+
+    def test_mapped_corpus_pickles_by_reference(self, data_dir: Path) -> None:
+        """Pickling a mapped corpus maps the same files when unpickled."""
+        OFACDataLoader(data_path=data_dir).load()
+        corpus = OFACDataLoader(data_path=data_dir).load().corpus
+        assert corpus is not None
+
+        restored = pickle.loads(pickle.dumps(corpus))
+
+        assert isinstance(restored.names.data, np.memmap)
+        assert restored.names.data.filename == corpus.names.data.filename
+        assert list(restored.names) == list(corpus.names)
+        assert np.array_equal(restored.entities, corpus.entities)
+
+    def test_pickled_corpus_survives_snapshot_rebuild(self, data_dir: Path) -> None:
+        """A corpus pickled before a rebuild still maps its own names."""
+        OFACDataLoader(data_path=data_dir).load()
+        corpus = OFACDataLoader(data_path=data_dir).load().corpus
+        assert corpus is not None
+        names = list(corpus.names)
+        pickled = pickle.dumps(corpus)
+
+        _add_alias(data_dir, "A NAME LONGER THAN ANY OTHER IN THE CORPUS")
+        rebuilt = OFACDataLoader(data_path=data_dir).load().corpus
+        assert rebuilt is not None and list(rebuilt.names) != names
+
+        restored = pickle.loads(pickled)
+
+        assert list(restored.names) == names
+        assert np.array_equal(restored.ent_nums, corpus.ent_nums)
+
+    def test_pickled_corpus_of_pruned_version_fails(self, data_dir: Path) -> None:
+        """Unpickling a corpus whose files were removed fails loudly."""
+        OFACDataLoader(data_path=data_dir).load()
+        corpus = OFACDataLoader(data_path=data_dir).load().corpus
+        pickled = pickle.dumps(corpus)
+
+        shutil.rmtree(_current_version(data_dir))
+
+        with pytest.raises(FileNotFoundError):
+            pickle.loads(pickled)
+
+    def test_inconsistent_corpus_falls_back_to_csv(self, data_dir: Path) -> None:
+        """Truncated corpus arrays invalidate the snapshot."""
+        OFACDataLoader(data_path=data_dir).load()
+        np.save(_current_version(data_dir) / "corpus_kinds.npy", np.zeros(1, np.int8))
+
+        data = OFACDataLoader(data_path=data_dir).load()
+
+        assert data.corpus is not None
+        assert not isinstance(data.corpus.names, MappedNames)
+
+
+class TestWorkerMemory:
+    """Measure what a worker shares and what it holds privately."""
+
+    def test_mapped_arrays_shared_but_decoded_names_private(
+        self, tmp_path: Path
+    ) -> None:
+        """Mapping costs little, decoding costs more than the whole buffer.
+
+        Per-worker memory stays O(corpus): only the mapped arrays are
+        shared, the decoded names are a private copy in every process.
+        """
+        count = 50_000
+        names = MappedNames.encode([f"SYNTHETIC NAME {i:06d}" for i in range(count)])
+        ids = np.arange(count, dtype=np.int64)
+        empty = pd.DataFrame()
+        corpus = NameCorpus(names, ids, np.zeros(count, np.int8), ids)
+        assert write_snapshot(
+            tmp_path, OFACSnapshot(empty, empty, empty, {}, {}, "hash", corpus)
+        )
+        shared_bytes = names.data.nbytes + names.offsets.nbytes + ids.nbytes * 2 + count
+
+        tracemalloc.start()
+        try:
+            snapshot = read_snapshot(tmp_path, "hash")
+            mapped_bytes = tracemalloc.get_traced_memory()[0]
+            assert snapshot is not None and snapshot.corpus is not None
+            decoded = snapshot.corpus.names.decoded()
+            decoded_bytes = tracemalloc.get_traced_memory()[0] - mapped_bytes
+        finally:
+            tracemalloc.stop()
+
+        assert len(decoded) == count
+        assert mapped_bytes < shared_bytes / 10
+        assert decoded_bytes > names.data.nbytes * 2
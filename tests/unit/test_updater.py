@@ -9,7 +9,7 @@ import httpx
 import pytest
 
 from ofac.core.exceptions import OFACDownloadError, OFACIntegrityError
-from ofac.data.updater import OFACUpdater, OFAC_BASE_URL, SDN_FILES
+from ofac.data.updater import CONSOLIDATED_FILES, OFACUpdater, OFAC_BASE_URL, SDN_FILES
 
 
 @pytest.fixture
@@ -85,6 +85,30 @@ class TestDownloadSDNFiles:
         assert result["files_downloaded"] == ["sdn.csv", "alt.csv", "add.csv"]
         assert "download_date" in result
 
+    @patch("httpx.Client")
+    def test_download_consolidated_files(
+        self, mock_client_class: MagicMock, updater: OFACUpdater
+    ) -> None:
+        """download_consolidated_files() swaps in the Consolidated triplet."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.content = b"test,csv,content\n1,2,3"
+        mock_response.headers = {}
+
+        mock_client = Mock()
+        mock_client.__enter__ = Mock(return_value=mock_client)
+        mock_client.__exit__ = Mock(return_value=None)
+        mock_client.get.return_value = mock_response
+        mock_client_class.return_value = mock_client
+
+        result = updater.download_consolidated_files()
+
+        for filename in CONSOLIDATED_FILES:
+            assert (updater.data_path / filename).exists()
+        assert result["files_downloaded"] == list(CONSOLIDATED_FILES)
+        # version.json tracks the SDN files only
+        assert not (updater.data_path / "version.json").exists()
+
     @patch("httpx.Client")
     def test_download_http_error(self, mock_client_class: MagicMock, updater: OFACUpdater) -> None:
         """download_sdn_files() raises OFACDownloadError on HTTP error."""